@@ -0,0 +1,102 @@
+"""Benchmark JSON text framing vs. CMAT array attachments for bulk results.
+
+Builds a ~10 MB band structure + projected DOS result and measures encode and
+decode time plus bytes on the wire for:
+
+    text         Content-Length framing, arrays as JSON lists (legacy path)
+    attachments  CMAT MSG_JSON_ATTACHMENTS, arrays as raw little-endian blobs
+
+Usage:
+    python benchmarks/bench_ipc_framing.py [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from crystalmath.server.framing import (
+    HEADER_SIZE,
+    MSG_JSON_ATTACHMENTS,
+    AttachmentCollector,
+    decode_payload,
+    json_default,
+    pack_frame,
+    unpack_header,
+)
+
+
+def build_result() -> dict[str, Any]:
+    """A spin-polarized band structure and 16-channel PDOS (~10 MB of float64)."""
+    rng = np.random.default_rng(42)
+    return {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "result": {
+            "efermi": 5.4321,
+            "kpoints": rng.random((1000, 3)),
+            "bands": rng.normal(scale=5.0, size=(2, 1000, 460)),
+            "dos_energies": np.linspace(-20.0, 20.0, 20000),
+            "pdos": rng.random((20000, 16)),
+        },
+    }
+
+
+def encode_text(message: dict[str, Any]) -> bytes:
+    payload = json.dumps(message, default=json_default).encode("utf-8")
+    return f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload
+
+
+def decode_text(frame: bytes) -> Any:
+    _, _, body = frame.partition(b"\r\n\r\n")
+    return json.loads(body)
+
+
+def encode_attachments(message: dict[str, Any]) -> bytes:
+    collector = AttachmentCollector()
+    text = json.dumps(message, default=collector.default)
+    return pack_frame(collector.encode_payload(text), MSG_JSON_ATTACHMENTS)
+
+
+def decode_attachments(frame: bytes) -> Any:
+    _, msg_type = unpack_header(frame[:HEADER_SIZE])
+    return decode_payload(frame[HEADER_SIZE:], msg_type)
+
+
+def best_of(fn: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (best kept)")
+    args = parser.parse_args()
+
+    message = build_result()
+    raw_bytes = sum(v.nbytes for v in message["result"].values() if isinstance(v, np.ndarray))
+    print(f"Raw array data: {raw_bytes / 1e6:.1f} MB\n")
+    print(f"{'mode':<12} {'encode ms':>10} {'decode ms':>10} {'wire MB':>9}")
+
+    for name, encode, decode in (
+        ("text", encode_text, decode_text),
+        ("attachments", encode_attachments, decode_attachments),
+    ):
+        frame = encode(message)
+        encode_s = best_of(lambda encode=encode: encode(message), args.repeat)
+        decode_s = best_of(lambda decode=decode, frame=frame: decode(frame), args.repeat)
+        print(
+            f"{name:<12} {encode_s * 1e3:>10.1f} {decode_s * 1e3:>10.1f} {len(frame) / 1e6:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
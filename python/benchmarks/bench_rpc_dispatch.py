@@ -0,0 +1,127 @@
+"""Benchmark JSON-RPC round-trip latency for large job listings.
+
+Seeds 10k quacc jobs and 10k SQLite jobs. It then times full socket round
+trips through JsonRpcServer for:
+
+    jobs.list    HANDLER_REGISTRY handler (native dict result)
+    fetch_jobs   CrystalController.call via the RPC registry
+
+Each method is timed with the stdlib encoder and, when installed, orjson
+(see :mod:`crystalmath.server.codec`). For reference it also times the
+legacy in-process string path, ``CrystalController.dispatch``. That path
+parses the request, dumps the jobs, parses them back and dumps the envelope.
+
+Usage:
+    python benchmarks/bench_rpc_dispatch.py [--jobs N] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# The socket helpers live with the tests
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from crystalmath.api import CrystalController  # noqa: E402
+from crystalmath.quacc.store import JobMetadata, JobStatus, JobStore  # noqa: E402
+from crystalmath.server import codec  # noqa: E402
+from tests.rpc_socket import receive, running_server, send  # noqa: E402
+
+
+def seed_quacc_jobs(count: int) -> None:
+    """Fill the default JobStore (under $HOME) with ``count`` jobs."""
+    store = JobStore()
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    statuses = list(JobStatus)
+    for i in range(count):
+        created = start + timedelta(seconds=i)
+        store.save_job(
+            JobMetadata(
+                id=str(uuid.uuid4()),
+                recipe="quacc.recipes.vasp.core.relax_job",
+                status=statuses[i % len(statuses)],
+                created_at=created,
+                updated_at=created,
+                cluster="bench",
+                work_dir=Path(f"/scratch/bench/{i}"),
+                results_summary={"energy": -10.0 - i * 1e-3, "converged": True},
+            )
+        )
+    store.close()
+
+
+def seed_controller_jobs(controller: CrystalController, work_root: Path, count: int) -> None:
+    db = controller._backend._db
+    for i in range(count):
+        db.create_job(f"job-{i}", str(work_root / str(i)), "input")
+
+
+async def time_round_trips(
+    controller: CrystalController, method: str, params: dict, repeat: int
+) -> list[float]:
+    timings = []
+    async with running_server(controller) as (reader, writer):
+        for i in range(repeat):
+            start = time.perf_counter()
+            await send(writer, {"jsonrpc": "2.0", "method": method, "params": params, "id": i})
+            response = await receive(reader)
+            timings.append(time.perf_counter() - start)
+            assert "result" in response, response
+    return timings
+
+
+def time_legacy_dispatch(controller: CrystalController, params: dict, repeat: int) -> list[float]:
+    request = json.dumps({"jsonrpc": "2.0", "method": "fetch_jobs", "params": params, "id": 1})
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        json.loads(controller.dispatch(request))
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(label: str, timings: list[float]) -> None:
+    print(
+        f"{label:<28} median {statistics.median(timings) * 1e3:8.2f} ms"
+        f"   best {min(timings) * 1e3:8.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20, help="round trips per measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["HOME"] = tmp
+        seed_quacc_jobs(args.jobs)
+        controller = CrystalController(use_aiida=False, db_path=str(Path(tmp) / "bench.db"))
+        seed_controller_jobs(controller, Path(tmp) / "work", args.jobs)
+        params = {"limit": args.jobs}
+
+        print(f"{args.jobs} jobs, {args.repeat} round trips each (orjson: {codec.HAS_ORJSON})\n")
+        backends = [("stdlib", False)] + ([("orjson", True)] if codec.HAS_ORJSON else [])
+        for name, use_orjson in backends:
+            codec.HAS_ORJSON = use_orjson
+            for method in ("jobs.list", "fetch_jobs"):
+                timings = asyncio.run(time_round_trips(controller, method, params, args.repeat))
+                report(f"{method} [{name}]", timings)
+
+        report(
+            "fetch_jobs legacy dispatch()", time_legacy_dispatch(controller, params, args.repeat)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark repeated SLURM queue refreshes: per-call SSH vs. warm sessions.
+
+Starts a local asyncssh server that answers ``squeue`` and times N calls of
+``get_slurm_queue_json`` through:
+
+    per-call   fresh ConnectionManager + asyncio.run per refresh (old path)
+    sessions   the process-wide SSHSessionService (warm pooled session)
+
+The local server has no network latency, so the per-call numbers are a lower
+bound: on a real cluster every refresh also pays several round trips for the
+TCP and SSH handshakes.
+
+Usage:
+    python benchmarks/bench_ssh_sessions.py [--refreshes N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# The fake SLURM server lives with the tests
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from crystalmath.api import CrystalController  # noqa: E402
+from crystalmath.ssh_sessions import get_session_service  # noqa: E402
+from tests.ssh_server import FakeSlurmServer, fake_slurm_server  # noqa: E402
+
+
+def per_call_refresh(controller: CrystalController, cluster_id: int) -> None:
+    """The pre-session path: connect, query and tear down on every call."""
+    from crystalmath._vendor.core.connection_manager import ConnectionManager
+    from crystalmath._vendor.runners.slurm_runner import SLURMRunner
+    from crystalmath.ssh_sessions import _connection_settings
+
+    async def _run() -> None:
+        cluster = controller._get_cluster_config(cluster_id)
+        manager = ConnectionManager()
+        manager.register_cluster(cluster_id=cluster_id, **_connection_settings(cluster))
+        try:
+            runner = SLURMRunner(connection_manager=manager, cluster_id=cluster_id)
+            await runner.get_queue_status(user_only=False)
+        finally:
+            await manager.stop()
+
+    asyncio.run(_run())
+
+
+def time_calls(fn: Callable[[], object], count: int) -> list[float]:
+    timings = []
+    for _ in range(count):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(label: str, timings: list[float], server: FakeSlurmServer, before: int) -> None:
+    print(
+        f"{label:<10} median {statistics.median(timings) * 1e3:7.2f} ms"
+        f"   first {timings[0] * 1e3:7.2f} ms"
+        f"   total {sum(timings):6.2f} s"
+        f"   ssh connections {server.connections - before}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--refreshes", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, fake_slurm_server(Path(tmp)) as server:
+        controller = CrystalController(use_aiida=False, db_path=str(Path(tmp) / "bench.db"))
+        cluster_id = controller._db.create_cluster(
+            name="bench",
+            type="slurm",
+            hostname="127.0.0.1",
+            port=server.port,
+            username="bench",
+            connection_config=server.connection_config(),
+        )
+
+        print(f"{args.refreshes} queue refreshes against a local SSH server")
+
+        before = server.connections
+        timings = time_calls(lambda: per_call_refresh(controller, cluster_id), args.refreshes)
+        report("per-call", timings, server, before)
+
+        before = server.connections
+        timings = time_calls(lambda: controller.get_slurm_queue_json(cluster_id), args.refreshes)
+        report("sessions", timings, server, before)
+
+        get_session_service().close()
+
+
+if __name__ == "__main__":
+    main()
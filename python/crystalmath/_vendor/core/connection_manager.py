@@ -5,6 +5,8 @@ Provides a robust connection management system with:
 - Connection pooling for reusable SSH connections
 - Multiple authentication methods (key-based, password, agent)
 - Automatic connection health checks and recycling
+- Channel multiplexing: one SSH session serves several concurrent commands
+- Keepalive-based liveness, probing only connections that have been idle
 - Secure credential storage using keyring
 - Thread-safe connection sharing
 """
@@ -52,7 +54,8 @@ class ConnectionConfig:
     key_file: Path | None = None
     use_agent: bool = True
     timeout: int = 30
-    keepalive_interval: int = 60
+    keepalive_interval: int = 30
+    keepalive_count_max: int = 3
     known_hosts_file: Path | None = None
     strict_host_key_checking: bool = True
 
@@ -65,17 +68,36 @@ class PooledConnection:
     cluster_id: int
     created_at: float = field(default_factory=time.time)
     last_used: float = field(default_factory=time.time)
-    in_use: bool = False
+    last_success: float = field(default_factory=time.time)
+    channels: int = 0
     health_check_failures: int = 0
 
+    @property
+    def in_use(self) -> bool:
+        """Whether any caller currently holds a channel on this connection."""
+        return self.channels > 0
+
     def mark_used(self) -> None:
         """Mark connection as used, updating timestamp."""
         self.last_used = time.time()
-        self.in_use = True
+        self.channels += 1
 
     def mark_available(self) -> None:
-        """Mark connection as available for reuse."""
-        self.in_use = False
+        """Release one channel on the connection."""
+        self.channels = max(0, self.channels - 1)
+
+    def mark_success(self) -> None:
+        """Record that the connection just carried a successful exchange."""
+        self.last_success = time.time()
+        self.health_check_failures = 0
+
+    def is_closed(self) -> bool:
+        """Whether the transport is gone (e.g. keepalives went unanswered)."""
+        return self.connection.is_closed() is True
+
+    def needs_probe(self, idle_threshold: float) -> bool:
+        """Check if liveness is unproven for longer than ``idle_threshold``."""
+        return time.time() - self.last_success > idle_threshold
 
     def is_stale(self, max_age: float) -> bool:
         """Check if connection is too old to be reused."""
@@ -96,18 +118,35 @@ class ConnectionManager:
     MAX_CONNECTION_AGE = 3600  # 1 hour
     MAX_IDLE_TIME = 300  # 5 minutes
     MAX_HEALTH_CHECK_FAILURES = 3
+    # Concurrent channels per SSH session; OpenSSH's default MaxSessions is 10
+    MAX_CHANNELS_PER_CONNECTION = 8
+    # An idle connection is only probed with a remote command once it has gone
+    # this long without a successful exchange; keepalives cover the rest
+    PROBE_IDLE_THRESHOLD = 60.0
 
-    def __init__(self, pool_size: int = MAX_POOL_SIZE):
+    def __init__(
+        self,
+        pool_size: int = MAX_POOL_SIZE,
+        max_channels: int = MAX_CHANNELS_PER_CONNECTION,
+    ):
         """
         Initialize the connection manager.
 
         Args:
             pool_size: Maximum number of connections per cluster
+            max_channels: Maximum concurrent users of a single connection
         """
         self.pool_size = pool_size
+        self.max_channels = max_channels
         self._pools: dict[int, list[PooledConnection]] = {}
         self._configs: dict[int, ConnectionConfig] = {}
         self._lock = asyncio.Lock()
+        # Per-cluster waiters for a free channel, sharing self._lock
+        self._available: dict[int, asyncio.Condition] = {}
+        # Connections being opened outside the lock, counted against pool_size
+        self._connecting: dict[int, int] = {}
+        # Callers currently waiting on self._available
+        self._waiting: dict[int, int] = {}
         self._health_check_task: asyncio.Task | None = None
 
     async def start(self) -> None:
@@ -313,6 +352,7 @@ class ConnectionManager:
             "username": config.username,
             "known_hosts": known_hosts,
             "keepalive_interval": config.keepalive_interval,
+            "keepalive_count_max": config.keepalive_count_max,
             "config": [ssh_config_path] if ssh_config_path.exists() else [],
         }
 
@@ -464,13 +504,16 @@ class ConnectionManager:
             cluster_id: Cluster identifier
 
         Yields:
-            SSH connection from the pool
+            SSH connection from the pool. It may be shared with other callers
+            running commands concurrently on their own channels.
         """
         pooled_conn = await self._acquire_connection(cluster_id)
+        succeeded = False
         try:
             yield pooled_conn.connection
+            succeeded = True
         finally:
-            await self._release_connection(pooled_conn)
+            await self._release_connection(pooled_conn, succeeded)
 
     async def test_connection(self, cluster_id: int) -> bool:
         """
@@ -516,6 +559,7 @@ class ConnectionManager:
                 "total_connections": total,
                 "in_use": in_use,
                 "available": total - in_use,
+                "active_channels": sum(pc.channels for pc in pool),
                 "avg_age_seconds": avg_age,
                 "avg_idle_seconds": avg_idle,
             }
@@ -524,79 +568,136 @@ class ConnectionManager:
 
     async def _acquire_connection(self, cluster_id: int) -> PooledConnection:
         """
-        Acquire a connection from the pool, creating one if needed.
+        Acquire a channel on a pooled connection, creating one if needed.
+
+        The least-loaded live connection with a free channel is reused without
+        a round trip unless it has been idle past PROBE_IDLE_THRESHOLD. When
+        every connection is saturated and the pool is full, the caller waits
+        on the cluster's condition until a channel is released.
 
         This method uses fine-grained locking to prevent contention:
         - Lock held only for state checks and updates (microseconds)
-        - SSH connection created outside lock (can take seconds)
+        - SSH connection created and probed outside lock (can take seconds)
         """
-        # Step 1: Quick check under lock for available connection
-        async with self._lock:
-            # Initialize pool if needed
-            if cluster_id not in self._pools:
-                self._pools[cluster_id] = []
-
-            pool = self._pools[cluster_id]
-
-            # Try to find an available connection
-            for pooled_conn in pool:
-                if not pooled_conn.in_use and not pooled_conn.is_stale(self.MAX_CONNECTION_AGE):
-                    # Mark as in_use immediately to prevent double-acquisition
-                    pooled_conn.mark_used()
-                    # Store reference for potential rollback
-                    candidate = pooled_conn
-                    break
-            else:
-                candidate = None
-
-            # Check if we can create a new connection
-            can_create_new = candidate is None and len(pool) < self.pool_size
-
-        # Step 2: Health check outside lock (can take time)
-        if candidate is not None:
-            if await self._health_check(candidate):
-                logger.debug(f"Reusing connection from pool for cluster {cluster_id}")
-                return candidate
-            else:
-                # Unhealthy - mark available and remove
+        while True:
+            # Step 1: Pick a connection or reserve a slot under lock
+            async with self._lock:
+                pool = self._pools.setdefault(cluster_id, [])
+                dead = self._prune_locked(pool)
+                candidate = self._least_loaded_locked(pool)
+                connecting = self._connecting.get(cluster_id, 0)
+                # Channels of connections being opened not yet claimed by waiters
+                incoming = connecting * (self.max_channels - 1) - self._waiting.get(cluster_id, 0)
+                if candidate is not None:
+                    probe = not candidate.in_use and candidate.needs_probe(
+                        self.PROBE_IDLE_THRESHOLD
+                    )
+                    candidate.mark_used()
+                elif incoming <= 0 and len(pool) + connecting < self.pool_size:
+                    self._connecting[cluster_id] = connecting + 1
+                else:
+                    logger.debug(f"No free channel for cluster {cluster_id}, waiting")
+                    self._waiting[cluster_id] = self._waiting.get(cluster_id, 0) + 1
+                    try:
+                        await self._condition(cluster_id).wait()
+                    finally:
+                        self._waiting[cluster_id] -= 1
+                    continue
+
+            for pooled_conn in dead:
+                await self._remove_connection(pooled_conn)
+
+            # Step 2: Reuse, probing only connections of unproven liveness
+            if candidate is not None:
+                if not probe or await self._health_check(candidate):
+                    logger.debug(f"Reusing connection from pool for cluster {cluster_id}")
+                    return candidate
                 async with self._lock:
                     candidate.mark_available()
-                    await self._remove_connection(candidate)
-                # Retry acquisition
-                return await self._acquire_connection(cluster_id)
+                    self._discard_locked(candidate)
+                await self._remove_connection(candidate)
+                continue
 
-        # Step 3: Create new connection outside lock (can take seconds)
-        if can_create_new:
+            # Step 3: Create new connection outside lock (can take seconds)
             try:
                 connection = await self.connect(cluster_id)
-            except Exception:
-                # Connection failed - let it propagate
+            except BaseException:
+                async with self._lock:
+                    self._connecting[cluster_id] -= 1
+                    # Callers counting on this connection must open their own
+                    self._condition(cluster_id).notify_all()
                 raise
 
-            # Add to pool under lock
             async with self._lock:
-                pool = self._pools.get(cluster_id, [])
+                self._connecting[cluster_id] -= 1
                 pooled_conn = PooledConnection(connection=connection, cluster_id=cluster_id)
                 pooled_conn.mark_used()
-                pool.append(pooled_conn)
-                self._pools[cluster_id] = pool
+                self._pools.setdefault(cluster_id, []).append(pooled_conn)
+                # The new connection's spare channels can serve other waiters
+                self._condition(cluster_id).notify(self.max_channels - 1)
                 logger.debug(f"Created new pooled connection for cluster {cluster_id}")
                 return pooled_conn
 
-        # Pool is full - wait and retry
-        logger.warning(f"Pool full for cluster {cluster_id}, waiting for available connection")
-        await asyncio.sleep(0.5)
-        return await self._acquire_connection(cluster_id)
-
-    async def _release_connection(self, pooled_conn: PooledConnection) -> None:
-        """Release a connection back to the pool."""
+    async def _release_connection(
+        self, pooled_conn: PooledConnection, succeeded: bool = True
+    ) -> None:
+        """Release a channel back to the pool."""
         async with self._lock:
             pooled_conn.mark_available()
+            if succeeded:
+                pooled_conn.mark_success()
+            closed = not pooled_conn.in_use and pooled_conn.is_closed()
+            if closed:
+                self._discard_locked(pooled_conn)
+            else:
+                self._condition(pooled_conn.cluster_id).notify()
             logger.debug(f"Released connection for cluster {pooled_conn.cluster_id}")
 
+        if closed:
+            await self._remove_connection(pooled_conn)
+
+    def _condition(self, cluster_id: int) -> asyncio.Condition:
+        """The cluster's channel-available condition (caller holds self._lock)."""
+        condition = self._available.get(cluster_id)
+        if condition is None:
+            condition = asyncio.Condition(self._lock)
+            self._available[cluster_id] = condition
+        return condition
+
+    def _least_loaded_locked(self, pool: list[PooledConnection]) -> PooledConnection | None:
+        """The live connection with the fewest active channels, if any is free."""
+        best = None
+        for pooled_conn in pool:
+            if pooled_conn.channels >= self.max_channels:
+                continue
+            if pooled_conn.is_stale(self.MAX_CONNECTION_AGE) or pooled_conn.is_closed():
+                continue
+            if best is None or pooled_conn.channels < best.channels:
+                best = pooled_conn
+        return best
+
+    def _prune_locked(self, pool: list[PooledConnection]) -> list[PooledConnection]:
+        """Take idle closed or stale connections out of ``pool`` for closing."""
+        dead = [
+            pooled_conn
+            for pooled_conn in pool
+            if not pooled_conn.in_use
+            and (pooled_conn.is_closed() or pooled_conn.is_stale(self.MAX_CONNECTION_AGE))
+        ]
+        for pooled_conn in dead:
+            self._discard_locked(pooled_conn)
+        return dead
+
+    def _discard_locked(self, pooled_conn: PooledConnection) -> None:
+        """Drop a connection from its pool and wake a waiter to use the slot."""
+        pool = self._pools.get(pooled_conn.cluster_id)
+        if pool and pooled_conn in pool:
+            pool.remove(pooled_conn)
+        self._condition(pooled_conn.cluster_id).notify()
+
     async def _health_check(self, pooled_conn: PooledConnection) -> bool:
         """
-        Check if a connection is healthy.
+        Probe a connection with a remote no-op command.
 
         Args:
             pooled_conn: Connection to check
@@ -611,7 +712,7 @@ class ConnectionManager:
             is_healthy = result.exit_status == 0
 
             if is_healthy:
-                pooled_conn.health_check_failures = 0
+                pooled_conn.mark_success()
             else:
                 pooled_conn.health_check_failures += 1
 
@@ -653,23 +754,27 @@ class ConnectionManager:
                             if pooled_conn.in_use:
                                 continue
 
-                            # Check if connection is stale or idle too long
-                            if pooled_conn.is_stale(
-                                self.MAX_CONNECTION_AGE
-                            ) or pooled_conn.is_idle_too_long(self.MAX_IDLE_TIME):
+                            # Check if connection is closed, stale or idle too long
+                            if (
+                                pooled_conn.is_closed()
+                                or pooled_conn.is_stale(self.MAX_CONNECTION_AGE)
+                                or pooled_conn.is_idle_too_long(self.MAX_IDLE_TIME)
+                            ):
                                 logger.info(
                                     f"Removing stale/idle connection for cluster {cluster_id}"
                                 )
                                 connections_to_remove_stale.append((cluster_id, pooled_conn))
-                            else:
+                            elif pooled_conn.needs_probe(self.PROBE_IDLE_THRESHOLD):
                                 # Queue for health check
                                 connections_to_check.append((cluster_id, pooled_conn))
 
                 # Step 2: Remove stale connections (fast, under lock)
                 if connections_to_remove_stale:
                     async with self._lock:
-                        for cluster_id, pooled_conn in connections_to_remove_stale:
-                            await self._remove_connection(pooled_conn)
+                        for _, pooled_conn in connections_to_remove_stale:
+                            self._discard_locked(pooled_conn)
+                    for _, pooled_conn in connections_to_remove_stale:
+                        await self._remove_connection(pooled_conn)
 
                 # Step 3: Perform health checks in parallel (slow, lock-free)
                 if connections_to_check:
@@ -707,7 +812,7 @@ class ConnectionManager:
                             cluster_id, pooled_conn, is_healthy, error = result
 
                             if is_healthy:
-                                pooled_conn.health_check_failures = 0
+                                pooled_conn.mark_success()
                                 healthy_count += 1
                             else:
                                 pooled_conn.health_check_failures += 1
@@ -731,7 +836,9 @@ class ConnectionManager:
                     if connections_to_remove_unhealthy:
                         async with self._lock:
                             for pooled_conn in connections_to_remove_unhealthy:
-                                await self._remove_connection(pooled_conn)
+                                self._discard_locked(pooled_conn)
+                        for pooled_conn in connections_to_remove_unhealthy:
+                            await self._remove_connection(pooled_conn)
 
                     # Log iteration completion
                     elapsed = time.time() - start_time
@@ -802,3 +909,5 @@ class ConnectionManager:
             await self._remove_connection(pooled_conn)
 
         del self._pools[cluster_id]
+        # Waiters re-check and open fresh connections
+        self._condition(cluster_id).notify_all()
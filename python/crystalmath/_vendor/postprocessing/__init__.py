@@ -0,0 +1,7 @@
+"""Vendored ``postprocessing`` namespace (ADR-006, crystalmath-xi1).
+
+Intentionally empty: unlike the original ``tui/src/postprocessing/__init__.py``
+this does not re-export submodules, so only the numpy-based output readers
+(``vasp_text``, ``vasprun``, ``cache``) are vendored and nothing imports the
+plotting stack.
+"""
@@ -0,0 +1,196 @@
+"""
+Vectorized readers for VASP's plain-text outputs: DOSCAR, EIGENVAL, PROCAR.
+
+All three files are fixed-layout blocks of numbers. Instead of splitting and
+converting every line in Python, each reader slices out the lines of a block
+(or picks them with one regular expression over the whole file) and converts
+them with a single NumPy call. Parsed arrays are cached in an ``.npz``
+sidecar (see :mod:`.cache`), so re-opening an unchanged run skips parsing.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from .cache import cached_arrays
+from .vasprun import _parse_rows
+
+# Orbital columns for LORBIT=10 (s, p, d[, f]) and LORBIT=11 (lm-resolved)
+_ORBITAL_LABELS = {
+    3: ["s", "p", "d"],
+    4: ["s", "p", "d", "f"],
+    9: ["s", "py", "pz", "px", "dxy", "dyz", "dz2", "dxz", "dx2"],
+    16: ["s", "py", "pz", "px", "dxy", "dyz", "dz2", "dxz", "dx2"]
+    + ["fy3x2", "fxyz", "fyz2", "fz3", "fxz2", "fzx2", "fx3"],
+}
+
+
+def orbital_labels(norbitals: int) -> list[str]:
+    """Labels of the projected DOS/PROCAR orbital columns."""
+    return _ORBITAL_LABELS.get(norbitals, [f"orb{i}" for i in range(norbitals)])
+
+
+def _read_lines(path: Path) -> list[str]:
+    with open(path, "rb") as f:
+        return f.read().decode("ascii", errors="replace").splitlines()
+
+
+# DOSCAR
+
+
+def _parse_doscar(path: Path) -> dict[str, np.ndarray]:
+    lines = _read_lines(path)
+
+    # Line 6: EMAX EMIN NEDOS EFERMI
+    header = lines[5].split()
+    nedos = int(header[2])
+    total = _parse_rows(lines[6 : 6 + nedos])
+
+    # Per-site blocks (LORBIT >= 10): a header like line 6, then NEDOS rows
+    start = 6 + nedos
+    nsites = (len(lines) - start) // (nedos + 1)
+    if nsites:
+        rows = lines[start : start + nsites * (nedos + 1)]
+        del rows[:: nedos + 1]
+        partial = _parse_rows(rows).reshape(nsites, nedos, -1)
+    else:
+        partial = np.empty((0, nedos, 0))
+
+    return {
+        "header": np.array([float(header[0]), float(header[1]), nedos, float(header[3])]),
+        "total": total,
+        "partial": partial,
+    }
+
+
+def read_doscar(path: Path, cache: bool = True) -> dict[str, np.ndarray]:
+    """Read a DOSCAR into arrays.
+
+    Returns:
+        ``header`` [emax, emin, nedos, efermi], ``total`` (nedos, ncols) and
+        ``partial`` (nsites, nedos, ncols), empty without per-site blocks.
+    """
+    return cached_arrays(Path(path), "doscar", _parse_doscar, cache)
+
+
+# EIGENVAL
+
+
+def _parse_eigenval(path: Path) -> dict[str, np.ndarray]:
+    lines = _read_lines(path)
+    ispin = int(lines[0].split()[3])
+    nkpts, nbands = (int(x) for x in lines[5].split()[1:3])
+
+    # From line 8, each k-point block is: k-point line, NBANDS rows, blank line
+    block = nbands + 2
+    kpoint_rows = [lines[7 + k * block] for k in range(nkpts)]
+    band_rows = [row for k in range(nkpts) for row in lines[8 + k * block : 8 + k * block + nbands]]
+
+    return {
+        "ispin": np.array(ispin),
+        "kpoints": _parse_rows(kpoint_rows),
+        "bands": _parse_rows(band_rows).reshape(nkpts, nbands, -1),
+    }
+
+
+def read_eigenval(path: Path, cache: bool = True) -> dict[str, np.ndarray]:
+    """Read an EIGENVAL into arrays.
+
+    Returns:
+        ``ispin``, ``kpoints`` (nkpts, 4: k-vector and weight) and ``bands``
+        (nkpts, nbands, ncols) with columns index, energies per spin and,
+        for VASP >= 5.4, occupations per spin.
+    """
+    return cached_arrays(Path(path), "eigenval", _parse_eigenval, cache)
+
+
+# PROCAR
+
+
+@dataclass
+class ProcarData:
+    """Band- and site-projected wavefunction characters from PROCAR."""
+
+    kpoints: np.ndarray  # (nkpts, 3)
+    weights: np.ndarray  # (nkpts,)
+    eigenvalues: np.ndarray  # (nspin, nkpts, nbands)
+    occupations: np.ndarray  # (nspin, nkpts, nbands)
+    projections: np.ndarray  # (nspin, nkpts, nbands, nions, norbitals)
+    orbitals: list[str] = field(default_factory=list)
+
+    @property
+    def nspin(self) -> int:
+        return self.projections.shape[0]
+
+    @property
+    def nions(self) -> int:
+        return self.projections.shape[3]
+
+
+_PROCAR_SIZES = re.compile(r"# of k-points:\s*(\d+)\s+# of bands:\s*(\d+)\s+# of ions:\s*(\d+)")
+_PROCAR_KPOINT = re.compile(r"^\s*k-point\s+\d+\s*:(.*?)weight\s*=\s*(\S+)", re.MULTILINE)
+_PROCAR_BAND = re.compile(r"^band\s+\d+\s*#\s*energy\s+(\S+)\s*#\s*occ\.\s*(\S+)", re.MULTILINE)
+# Site rows are the only lines starting with an integer (the ion index)
+_PROCAR_ION_ROW = re.compile(r"^\s*\d+\s+(.*\S)", re.MULTILINE)
+_PROCAR_HEADER = re.compile(r"^ion\s+(.*?)\s+tot\s*$", re.MULTILINE)
+# k-point coordinates may run together (0.50000000-0.25000000)
+_FLOAT = re.compile(r"-?\d+\.\d+(?:[eE][-+]?\d+)?")
+
+
+def _parse_procar(path: Path) -> dict[str, np.ndarray]:
+    with open(path, "rb") as f:
+        text = f.read().decode("ascii", errors="replace")
+    if "phase" in text[: text.find("\n")]:
+        raise ValueError("PROCAR with phase factors (LORBIT=12) is not supported")
+
+    sizes = _PROCAR_SIZES.findall(text)
+    if not sizes:
+        raise ValueError(f"Not a PROCAR file: {path}")
+    nkpts, nbands, nions = (int(x) for x in sizes[0])
+    nspin = len(sizes)
+
+    kpoints = _PROCAR_KPOINT.findall(text)[:nkpts]
+    coords = np.array([[float(x) for x in _FLOAT.findall(k)[:3]] for k, _ in kpoints])
+    weights = np.array([float(w) for _, w in kpoints])
+
+    bands = np.array(_PROCAR_BAND.findall(text), dtype=float).reshape(nspin, nkpts, nbands, 2)
+
+    rows = _parse_rows(_PROCAR_ION_ROW.findall(text))  # orbitals..., tot
+    # Non-collinear runs repeat the site block for mx, my, mz; keep the total
+    ncomponents = len(rows) // (nspin * nkpts * nbands * nions)
+    rows = rows.reshape(nspin, nkpts, nbands, ncomponents, nions, -1)[:, :, :, 0, :, :-1]
+
+    header = _PROCAR_HEADER.search(text)
+    return {
+        "kpoints": coords,
+        "weights": weights,
+        "eigenvalues": bands[..., 0],
+        "occupations": bands[..., 1],
+        "projections": np.ascontiguousarray(rows),
+        "orbitals": np.array(header.group(1).split() if header else []),
+    }
+
+
+def read_procar(path: Path, cache: bool = True) -> ProcarData:
+    """Read a PROCAR (LORBIT=10 or 11).
+
+    Args:
+        path: Path to PROCAR.
+        cache: Reuse/write the ``.PROCAR.npz`` sidecar.
+
+    Returns:
+        ProcarData with energies, occupations and per-site projections.
+    """
+    arrays = cached_arrays(Path(path), "procar", _parse_procar, cache)
+    return ProcarData(
+        kpoints=arrays["kpoints"],
+        weights=arrays["weights"],
+        eigenvalues=arrays["eigenvalues"],
+        occupations=arrays["occupations"],
+        projections=arrays["projections"],
+        orbitals=[str(label) for label in arrays["orbitals"]],
+    )
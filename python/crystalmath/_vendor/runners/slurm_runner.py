@@ -12,6 +12,7 @@ It handles:
 """
 
 import asyncio
+import json
 import logging
 import re
 import shlex
@@ -92,6 +93,346 @@ class SLURMValidationError(SLURMRunnerError):
     pass
 
 
+# Terminal SLURM states: the job will not change state again
+TERMINAL_STATES = frozenset(
+    {
+        SLURMJobState.COMPLETED,
+        SLURMJobState.FAILED,
+        SLURMJobState.CANCELLED,
+        SLURMJobState.TIMEOUT,
+        SLURMJobState.NODE_FAIL,
+        SLURMJobState.OUT_OF_MEMORY,
+    }
+)
+
+_STATE_MAP = {
+    "PENDING": SLURMJobState.PENDING,
+    "PD": SLURMJobState.PENDING,
+    "RUNNING": SLURMJobState.RUNNING,
+    "R": SLURMJobState.RUNNING,
+    "COMPLETED": SLURMJobState.COMPLETED,
+    "CD": SLURMJobState.COMPLETED,
+    "FAILED": SLURMJobState.FAILED,
+    "F": SLURMJobState.FAILED,
+    "CANCELLED": SLURMJobState.CANCELLED,
+    "CA": SLURMJobState.CANCELLED,
+    "TIMEOUT": SLURMJobState.TIMEOUT,
+    "TO": SLURMJobState.TIMEOUT,
+    "NODE_FAIL": SLURMJobState.NODE_FAIL,
+    "NF": SLURMJobState.NODE_FAIL,
+    "OUT_OF_MEMORY": SLURMJobState.OUT_OF_MEMORY,
+    "OOM": SLURMJobState.OUT_OF_MEMORY,
+}
+
+
+def parse_slurm_state(state_str: str) -> SLURMJobState:
+    """
+    Parse a SLURM state string (squeue/sacct, long or short form) to SLURMJobState.
+
+    sacct decorations such as ``CANCELLED by 1000`` are ignored.
+    """
+    parts = state_str.upper().split()
+    return _STATE_MAP.get(parts[0], SLURMJobState.UNKNOWN) if parts else SLURMJobState.UNKNOWN
+
+
+@dataclass
+class _StatusEntry:
+    """Last known status of one SLURM job."""
+
+    state: SLURMJobState
+    reason: str | None
+    checked_at: float
+
+
+class SLURMStatusAggregator:
+    """
+    Batched status polling for all tracked SLURM jobs on one cluster.
+
+    Instead of one ``squeue -j`` (plus often one ``sacct -j``) SSH command per
+    job per poll, each refresh runs a single ``squeue --me --json`` and a single
+    ``sacct`` for the tracked jobs that have left the queue. Concurrent callers
+    share one in-flight refresh, and results younger than ``min_interval`` are
+    served from cache.
+
+    Watched jobs (``watch()``) are refreshed by a background task whose interval
+    adapts to job state:
+
+    - ``min_interval`` right after a state change or while a job is unresolved
+    - ``poll_interval`` while any watched job is running
+    - doubling up to ``max_interval`` while every watched job is pending
+
+    Monitors call ``wait_for_update()`` to be woken after each refresh instead
+    of sleeping on their own timers.
+    """
+
+    def __init__(
+        self,
+        connection_manager: ConnectionManager,
+        cluster_id: int,
+        poll_interval: float = 30,
+        min_interval: float | None = None,
+        max_interval: float | None = None,
+    ):
+        """
+        Initialize the aggregator.
+
+        Args:
+            connection_manager: ConnectionManager instance for SSH
+            cluster_id: Database ID of the cluster
+            poll_interval: Refresh interval while jobs are running
+            min_interval: Fastest refresh interval (default: poll_interval / 3)
+            max_interval: Slowest refresh interval (default: poll_interval * 4)
+        """
+        self.connection_manager = connection_manager
+        self.cluster_id = cluster_id
+        self.poll_interval = poll_interval
+        self.min_interval = poll_interval / 3 if min_interval is None else min_interval
+        self.max_interval = poll_interval * 4 if max_interval is None else max_interval
+
+        self._results: dict[str, _StatusEntry] = {}
+        self._watched: dict[str, int] = {}  # SLURM job ID -> number of watchers
+        self._requested: set = set()  # IDs to include in the next refresh
+        self._inflight: asyncio.Future | None = None
+        self._task: asyncio.Task | None = None
+        self._updated = asyncio.Condition()
+        self._tick = 0
+        self._last_refresh = float("-inf")
+        self._changed = False
+        self._pending_ticks = 0
+        self._json_supported = True
+
+    # -- public API -----------------------------------------------------------
+
+    def watch(self, slurm_job_id: str) -> None:
+        """Include a job in background refreshes until ``unwatch()``."""
+        self._watched[slurm_job_id] = self._watched.get(slurm_job_id, 0) + 1
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"slurm_status_{self.cluster_id}")
+
+    def unwatch(self, slurm_job_id: str) -> None:
+        """Stop background refreshes for a job once its last watcher is gone."""
+        count = self._watched.get(slurm_job_id, 0) - 1
+        if count > 0:
+            self._watched[slurm_job_id] = count
+            return
+        self._watched.pop(slurm_job_id, None)
+        self._results.pop(slurm_job_id, None)
+        if not self._watched and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def get_status(
+        self, slurm_job_id: str, connection=None
+    ) -> tuple[SLURMJobState, str | None]:
+        """
+        Return the state and reason for a job, refreshing if the cache is stale.
+
+        Args:
+            slurm_job_id: SLURM job ID
+            connection: Optional SSH connection to use if a refresh is needed
+
+        Returns:
+            Tuple of (SLURMJobState, reason string)
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._results.get(slurm_job_id)
+        if entry is not None and loop.time() - entry.checked_at < self.min_interval:
+            return entry.state, entry.reason
+
+        started = loop.time()
+        self._requested.add(slurm_job_id)
+        # An in-flight refresh may have been started without this job; at most
+        # one more refresh is then needed to pick it up.
+        for _ in range(2):
+            await self.refresh(connection)
+            entry = self._results.get(slurm_job_id)
+            if entry is not None and entry.checked_at >= started:
+                return entry.state, entry.reason
+            self._requested.add(slurm_job_id)
+        return SLURMJobState.UNKNOWN, "Job status not available"
+
+    async def wait_for_update(self, timeout: float | None = None) -> bool:
+        """
+        Wait until the next background refresh completes.
+
+        Args:
+            timeout: Maximum seconds to wait (default: twice max_interval)
+
+        Returns:
+            True if a refresh completed, False on timeout
+        """
+        tick = self._tick
+        try:
+            async with self._updated:
+                await asyncio.wait_for(
+                    self._updated.wait_for(lambda: self._tick != tick),
+                    timeout if timeout is not None else 2 * self.max_interval,
+                )
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def refresh(self, connection=None) -> None:
+        """Query all watched and requested jobs, sharing any refresh in flight."""
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._refresh(connection))
+        await asyncio.shield(self._inflight)
+
+    def current_interval(self) -> float:
+        """Seconds until the next background refresh, based on watched job states."""
+        entries = [self._results.get(job_id) for job_id in self._watched]
+        if self._changed or any(
+            entry is None or entry.state == SLURMJobState.UNKNOWN for entry in entries
+        ):
+            return self.min_interval
+        if all(entry.state == SLURMJobState.PENDING for entry in entries):
+            return min(self.max_interval, self.poll_interval * 2**self._pending_ticks)
+        return self.poll_interval
+
+    async def close(self) -> None:
+        """Stop background refreshes and drop all cached results."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        self._watched.clear()
+        self._results.clear()
+        self._requested.clear()
+
+    # -- internals ------------------------------------------------------------
+
+    async def _run(self) -> None:
+        """Background refresh loop; runs while any job is watched."""
+        loop = asyncio.get_running_loop()
+        while self._watched:
+            delay = self._last_refresh + self.current_interval() - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self.refresh()
+
+    async def _refresh(self, connection) -> None:
+        try:
+            job_ids = set(self._watched) | self._requested
+            self._requested = set()
+            if job_ids:
+                if connection is not None:
+                    statuses = await self._query(connection, job_ids)
+                else:
+                    async with self.connection_manager.get_connection(self.cluster_id) as conn:
+                        statuses = await self._query(conn, job_ids)
+            else:
+                statuses = {}
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to check SLURM job status on cluster {self.cluster_id}: {e}")
+            statuses = {job_id: (SLURMJobState.UNKNOWN, str(e)) for job_id in job_ids}
+        finally:
+            self._inflight = None
+
+        now = asyncio.get_running_loop().time()
+        changed = False
+        for job_id, (state, reason) in statuses.items():
+            previous = self._results.get(job_id)
+            if job_id in self._watched and (previous is None or previous.state != state):
+                changed = True
+            self._results[job_id] = _StatusEntry(state, reason, now)
+
+        watched = [self._results[j].state for j in self._watched if j in self._results]
+        if not changed and watched and all(s == SLURMJobState.PENDING for s in watched):
+            self._pending_ticks += 1
+        else:
+            self._pending_ticks = 0
+        self._changed = changed
+        self._last_refresh = now
+
+        async with self._updated:
+            self._tick += 1
+            self._updated.notify_all()
+
+    async def _query(self, connection, job_ids: set) -> dict[str, tuple[SLURMJobState, str | None]]:
+        """Run one squeue for the user's queue and one sacct for the rest."""
+        queued = await self._query_squeue(connection)
+        statuses = {job_id: queued[job_id] for job_id in job_ids if job_id in queued}
+
+        missing = sorted(job_ids - statuses.keys())
+        if missing:
+            # -X: job allocations only, not the .batch/.extern steps
+            result = await connection.run(
+                f"sacct -j {shlex.quote(','.join(missing))} -X -n -P -o JobID,State",
+                check=False,
+            )
+            if result.exit_status == 0:
+                for line in result.stdout.splitlines():
+                    job_id, _, state_str = line.partition("|")
+                    if job_id in missing and job_id not in statuses:
+                        statuses[job_id] = (parse_slurm_state(state_str), None)
+
+        for job_id in missing:
+            statuses.setdefault(
+                job_id, (SLURMJobState.UNKNOWN, "Job not found in queue or history")
+            )
+        return statuses
+
+    async def _query_squeue(self, connection) -> dict[str, tuple[SLURMJobState, str | None]]:
+        """Return state and reason for every job in the user's queue."""
+        if self._json_supported:
+            result = await connection.run("squeue --me --json", check=False)
+            if result.exit_status == 0 and result.stdout.strip():
+                try:
+                    return self._parse_squeue_json(json.loads(result.stdout).get("jobs", []))
+                except (ValueError, AttributeError) as e:
+                    logger.warning(f"Failed to parse squeue JSON: {e}")
+            # Older SLURM (< 21.08) has no --json; stop trying it
+            self._json_supported = False
+
+        # -u "$USER" rather than --me, which needs SLURM 20.02
+        result = await connection.run("squeue -u \"$USER\" -h -o '%i|%T|%r'", check=False)
+        if result.exit_status != 0:
+            raise SLURMStatusError(f"squeue failed: {result.stderr.strip()}")
+        queued = {}
+        for line in result.stdout.splitlines():
+            parts = line.strip().split("|")
+            if len(parts) >= 2:
+                reason = parts[2] if len(parts) > 2 else ""
+                queued[parts[0]] = (parse_slurm_state(parts[1]), _clean_reason(reason))
+        return queued
+
+    @staticmethod
+    def _parse_squeue_json(jobs: list[dict]) -> dict[str, tuple[SLURMJobState, str | None]]:
+        queued = {}
+        for job in jobs:
+            state = job.get("job_state", "UNKNOWN")
+            if isinstance(state, dict):
+                state = state.get("current", ["UNKNOWN"])
+            if isinstance(state, list):
+                state = state[0] if state else "UNKNOWN"
+            status = (parse_slurm_state(str(state)), _clean_reason(job.get("state_reason")))
+
+            job_id = _json_number(job.get("job_id"))
+            if job_id is not None:
+                queued[str(job_id)] = status
+            # Array tasks also report under the parent ID that sbatch returned
+            array_job_id = _json_number(job.get("array_job_id"))
+            if array_job_id:
+                queued.setdefault(str(array_job_id), status)
+        return queued
+
+
+def _json_number(value: Any) -> int | None:
+    """Unwrap SLURM JSON numbers, which newer versions nest as {"set", "number"}."""
+    if isinstance(value, dict):
+        return value.get("number") if value.get("set", True) else None
+    return value if isinstance(value, int) else None
+
+
+def _clean_reason(reason: Any) -> str | None:
+    """Normalize squeue's placeholder reasons to None."""
+    if not reason or reason in ("None", "(null)"):
+        return None
+    return str(reason)
+
+
 class SLURMRunner(RemoteBaseRunner):
     """
     Execute DFT jobs via SLURM batch system on HPC clusters.
@@ -104,7 +445,7 @@ class SLURMRunner(RemoteBaseRunner):
     Features:
     - Generates SLURM submission scripts dynamically for any DFT code
     - Submits jobs using sbatch via SSH
-    - Polls job status with squeue
+    - Polls job status with one batched squeue/sacct per cluster (SLURMStatusAggregator)
     - Downloads results when job completes
     - Supports job arrays for parameter sweeps
     - Handles job dependencies for workflows
@@ -161,6 +502,9 @@ class SLURMRunner(RemoteBaseRunner):
         # Track slot monitor tasks: job_handle -> asyncio.Task
         self._slot_monitors: dict[str, asyncio.Task] = {}
 
+        # Batched status polling, one aggregator per cluster
+        self._status_aggregators: dict[int, SLURMStatusAggregator] = {}
+
         # Initialize template generator for SLURM scripts
         self._template_generator = SLURMTemplateGenerator(dft_code=dft_code)
 
@@ -318,7 +662,11 @@ class SLURMRunner(RemoteBaseRunner):
         MAX_CONSECUTIVE_ERRORS = 10  # Prevent infinite loops during network outages
         consecutive_errors = 0
 
+        cluster_id, slurm_job_id, _ = self._parse_job_handle(job_handle)
+        aggregator = self._status_aggregator(cluster_id)
+
         try:
+            aggregator.watch(slurm_job_id)
             # Poll until job reaches terminal state
             while True:
                 try:
@@ -347,11 +695,13 @@ class SLURMRunner(RemoteBaseRunner):
                             f"Max consecutive errors reached for {job_handle}, assuming job failed"
                         )
                         break
-                await asyncio.sleep(self.poll_interval)
+                # Woken by the cluster's next batched status refresh
+                await aggregator.wait_for_update()
         except asyncio.CancelledError:
             # Ensure cleanup happens even on cancellation
             logger.debug(f"Cleaning up cancelled monitor for {job_handle}")
         finally:
+            aggregator.unwatch(slurm_job_id)
             self._semaphore.release()
             self._slot_monitors.pop(job_handle, None)
             logger.debug(f"Released slot for SLURM job {job_handle}")
@@ -372,6 +722,11 @@ class SLURMRunner(RemoteBaseRunner):
             await asyncio.gather(*self._slot_monitors.values(), return_exceptions=True)
 
         self._slot_monitors.clear()
+
+        for aggregator in self._status_aggregators.values():
+            await aggregator.close()
+        self._status_aggregators.clear()
+
         self._slurm_job_ids.clear()
         self._job_states.clear()
         logger.info("SLURMRunner cleanup complete")
@@ -401,11 +756,11 @@ class SLURMRunner(RemoteBaseRunner):
         cluster_id, slurm_job_id, _ = self._parse_job_handle(job_handle)
 
         try:
-            async with self.connection_manager.get_connection(cluster_id) as conn:
-                slurm_state, _ = await self._check_status(conn, slurm_job_id)
+            aggregator = self._status_aggregator(cluster_id)
+            slurm_state, _ = await aggregator.get_status(slurm_job_id)
 
-                # Map SLURMJobState to JobStatus
-                return self._slurm_state_to_job_status(slurm_state)
+            # Map SLURMJobState to JobStatus
+            return self._slurm_state_to_job_status(slurm_state)
 
         except Exception as e:
             logger.error(f"Failed to get status for {job_handle}: {e}")
@@ -574,6 +929,16 @@ class SLURMRunner(RemoteBaseRunner):
         }
         return state_map.get(slurm_state, JobStatus.UNKNOWN)
 
+    def _status_aggregator(self, cluster_id: int) -> SLURMStatusAggregator:
+        """Get (or create) the batched status poller for a cluster."""
+        aggregator = self._status_aggregators.get(cluster_id)
+        if aggregator is None:
+            aggregator = SLURMStatusAggregator(
+                self.connection_manager, cluster_id, poll_interval=self.poll_interval
+            )
+            self._status_aggregators[cluster_id] = aggregator
+        return aggregator
+
     # -------------------------------------------------------------------------
     # Legacy Method (deprecated - use submit_job + get_output instead)
     # -------------------------------------------------------------------------
@@ -1595,79 +1960,56 @@ class SLURMRunner(RemoteBaseRunner):
         previous_state = SLURMJobState.PENDING
         iteration = 0
 
-        while True:
-            iteration += 1
+        aggregator = self._status_aggregator(self.cluster_id)
+        aggregator.watch(slurm_job_id)
+        try:
+            while True:
+                iteration += 1
 
-            # Query job status
-            state, reason = await self._check_status(connection, slurm_job_id)
-            self._job_states[job_id] = state
+                # Query job status
+                state, reason = await self._check_status(connection, slurm_job_id)
+                self._job_states[job_id] = state
 
-            # Report state changes
-            if state != previous_state:
-                if reason:
-                    yield f"Status: {state.value} ({reason})"
-                else:
-                    yield f"Status: {state.value}"
-                previous_state = state
-
-            # Check for terminal states
-            if state in [
-                SLURMJobState.COMPLETED,
-                SLURMJobState.FAILED,
-                SLURMJobState.CANCELLED,
-                SLURMJobState.TIMEOUT,
-                SLURMJobState.NODE_FAIL,
-                SLURMJobState.OUT_OF_MEMORY,
-            ]:
-                break
-
-            # Periodic update for long-running jobs
-            if iteration % 10 == 0:  # Every 5 minutes at 30s intervals
-                yield f"Still {state.value} (checked {iteration} times)"
-
-            # Wait before next poll
-            await asyncio.sleep(self.poll_interval)
+                # Report state changes
+                if state != previous_state:
+                    if reason:
+                        yield f"Status: {state.value} ({reason})"
+                    else:
+                        yield f"Status: {state.value}"
+                    previous_state = state
+
+                # Check for terminal states
+                if state in TERMINAL_STATES:
+                    break
+
+                # Periodic update for long-running jobs
+                if iteration % 10 == 0:  # Every ~5 minutes at 30s intervals
+                    yield f"Still {state.value} (checked {iteration} times)"
+
+                # Wait for the cluster's next batched status refresh
+                await aggregator.wait_for_update()
+        finally:
+            aggregator.unwatch(slurm_job_id)
 
     async def _check_status(
         self, connection, slurm_job_id: str
     ) -> tuple[SLURMJobState, str | None]:
         """
-        Check SLURM job status using squeue.
+        Check SLURM job status via the cluster's batched status aggregator.
+
+        The job is answered from the aggregator's last refresh if it is recent,
+        otherwise from one shared squeue/sacct round trip for all tracked jobs.
 
         Args:
-            connection: Active SSH connection
+            connection: Active SSH connection (used if a refresh is needed)
             slurm_job_id: SLURM job ID
 
         Returns:
             Tuple of (SLURMJobState, reason string)
         """
         try:
-            # Query job status with state and reason
-            result = await connection.run(
-                f"squeue -j {shlex.quote(slurm_job_id)} -h -o '%T|%r'", check=False
-            )
-
-            if result.exit_status != 0 or not result.stdout.strip():
-                # Job not in queue - check if completed or failed
-                sacct_result = await connection.run(
-                    f"sacct -j {shlex.quote(slurm_job_id)} -n -o State -P | head -n1", check=False
-                )
-
-                if sacct_result.exit_status == 0 and sacct_result.stdout.strip():
-                    state_str = sacct_result.stdout.strip()
-                    return self._parse_state(state_str), None
-                else:
-                    # Can't determine state
-                    return SLURMJobState.UNKNOWN, "Job not found in queue or history"
-
-            # Parse state and reason from squeue output
-            output = result.stdout.strip()
-            if "|" in output:
-                state_str, reason = output.split("|", 1)
-                return self._parse_state(state_str), reason
-            else:
-                return self._parse_state(output), None
-
+            aggregator = self._status_aggregator(self.cluster_id)
+            return await aggregator.get_status(slurm_job_id, connection=connection)
         except Exception as e:
             logger.error(f"Failed to check job status: {e}")
             return SLURMJobState.UNKNOWN, str(e)
@@ -1682,29 +2024,7 @@ class SLURMRunner(RemoteBaseRunner):
         Returns:
             Corresponding SLURMJobState
         """
-        state_str = state_str.upper().strip()
-
-        # Map SLURM states to our enum
-        state_map = {
-            "PENDING": SLURMJobState.PENDING,
-            "PD": SLURMJobState.PENDING,
-            "RUNNING": SLURMJobState.RUNNING,
-            "R": SLURMJobState.RUNNING,
-            "COMPLETED": SLURMJobState.COMPLETED,
-            "CD": SLURMJobState.COMPLETED,
-            "FAILED": SLURMJobState.FAILED,
-            "F": SLURMJobState.FAILED,
-            "CANCELLED": SLURMJobState.CANCELLED,
-            "CA": SLURMJobState.CANCELLED,
-            "TIMEOUT": SLURMJobState.TIMEOUT,
-            "TO": SLURMJobState.TIMEOUT,
-            "NODE_FAIL": SLURMJobState.NODE_FAIL,
-            "NF": SLURMJobState.NODE_FAIL,
-            "OUT_OF_MEMORY": SLURMJobState.OUT_OF_MEMORY,
-            "OOM": SLURMJobState.OUT_OF_MEMORY,
-        }
-
-        return state_map.get(state_str, SLURMJobState.UNKNOWN)
+        return parse_slurm_state(state_str)
 
     async def _download_results(self, connection, remote_dir: str, local_dir: Path) -> None:
         """
@@ -1715,41 +2035,21 @@ class SLURMRunner(RemoteBaseRunner):
             remote_dir: Remote directory path
             local_dir: Local destination directory
         """
-        try:
-            # Note: start_sftp_client() is a coroutine that must be awaited
-            async with await connection.start_sftp_client() as sftp:
-                # List remote files
-                remote_files = await sftp.listdir(remote_dir)
-
-                # Download important files
-                download_patterns = [
-                    "output.out",
-                    "*.f9",
-                    "*.f98",
-                    "slurm-*.out",
-                    "slurm-*.err",
-                    "*.xyz",
-                    "*.cif",
-                ]
-
-                import fnmatch
-
-                for remote_file in remote_files:
-                    # Check if file matches any pattern using proper glob matching
-                    should_download = any(
-                        fnmatch.fnmatch(remote_file, pattern) for pattern in download_patterns
-                    )
-
-                    if should_download:
-                        remote_path = f"{remote_dir}/{remote_file}"
-                        local_path = local_dir / remote_file
-
-                        try:
-                            await sftp.get(remote_path, str(local_path))
-                            logger.debug(f"Downloaded: {remote_file}")
-                        except Exception as e:
-                            logger.warning(f"Failed to download {remote_file}: {e}")
+        # Download important files
+        download_patterns = [
+            "output.out",
+            "*.f9",
+            "*.f98",
+            "slurm-*.out",
+            "slurm-*.err",
+            "*.xyz",
+            "*.cif",
+        ]
 
+        try:
+            self.last_transfer = await self.transfer_engine.download_matching(
+                connection, remote_dir, local_dir, download_patterns
+            )
         except Exception as e:
             logger.error(f"Failed to download results: {e}")
             raise SLURMRunnerError(f"Result download failed: {e}") from e
@@ -14,14 +14,17 @@ from __future__ import annotations
 import contextlib
 import json
 import logging
+import time
 from pathlib import Path
 from typing import Any
 
 from crystalmath.models import (
+    JobChanges,
     JobDetails,
     JobStatus,
     JobSubmission,
 )
+from crystalmath.tail import tail_file
 
 logger = logging.getLogger(__name__)
 
@@ -29,22 +32,34 @@ logger = logging.getLogger(__name__)
 # ========== Structured Error Response Helpers ==========
 
 
+def _ok_data(data: Any) -> dict[str, Any]:
+    """Wrap successful data in a structured response object."""
+    return {"ok": True, "data": data}
+
+
+def _error_data(code: str, message: str) -> dict[str, Any]:
+    """Create a structured error response object."""
+    return {
+        "ok": False,
+        "error": {
+            "code": code,
+            "message": message,
+        },
+    }
+
+
 def _ok_response(data: Any) -> str:
     """Wrap successful data in structured response."""
-    return json.dumps({"ok": True, "data": data})
+    return json.dumps(_ok_data(data))
 
 
 def _error_response(code: str, message: str) -> str:
     """Create structured error response JSON."""
-    return json.dumps(
-        {
-            "ok": False,
-            "error": {
-                "code": code,
-                "message": message,
-            },
-        }
-    )
+    return json.dumps(_error_data(code, message))
+
+
+# Server-side job list filters accepted by fetch_jobs / fetch_jobs_page
+_JOB_FILTER_PARAMS = ("status", "dft_code", "runner_type", "cluster_id", "workflow_id")
 
 
 # ========== JSON-RPC 2.0 Protocol Support ==========
@@ -57,6 +72,16 @@ JSONRPC_INVALID_PARAMS = -32602
 JSONRPC_INTERNAL_ERROR = -32603
 
 
+class JsonRpcError(Exception):
+    """A JSON-RPC error raised by :meth:`CrystalController.call`."""
+
+    def __init__(self, code: int, message: str, data: Any = None) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.data = data
+
+
 def _jsonrpc_error(code: int, message: str, data: Any = None, request_id: Any = None) -> str:
     """Create a JSON-RPC 2.0 error response."""
     error_obj: dict[str, Any] = {"code": code, "message": message}
@@ -130,6 +155,9 @@ class CrystalController:
         # Backward compatibility flags
         self._aiida_available = self._backend.name == "aiida"
 
+        # quacc job store, opened on first use and reused for every call
+        self._quacc_store: Any = None
+
         # Legacy attributes for advanced methods that need direct DB/AiiDA access
         if self._backend.name == "sqlite" and db_path:
             self._init_sqlite(db_path)
@@ -182,6 +210,11 @@ class CrystalController:
         Maps method names to (handler, param_names) tuples. Only methods
         explicitly listed here can be called via JSON-RPC dispatch.
 
+        Handlers return JSON-ready native objects, which the caller serializes
+        once. Hot paths (job lists, details, logs, queue snapshots) are wired
+        to their ``*_data`` / native methods. The remaining legacy ``*_json``
+        adapters return strings, which :meth:`call` parses back.
+
         Security: This whitelist prevents arbitrary method invocation.
 
         Returns:
@@ -189,22 +222,26 @@ class CrystalController:
         """
         return {
             # Job operations
-            "fetch_jobs": (self.get_jobs_json, ["limit"]),
-            "fetch_job_details": (self.get_job_details_json, ["pk"]),
+            "fetch_jobs": (self.get_jobs_data, ["limit", *_JOB_FILTER_PARAMS]),
+            "fetch_jobs_page": (
+                self.get_jobs_page_data,
+                ["limit", "cursor", *_JOB_FILTER_PARAMS],
+            ),
+            "fetch_job_details": (self.get_job_details_data, ["pk"]),
             "submit_job": (self.submit_job_json, ["json_payload"]),
             "cancel_job": (self.cancel_job, ["pk"]),
-            "fetch_job_log": (self.get_job_log_json, ["pk", "tail_lines"]),
-            "capabilities.get": (self.get_capabilities_json, []),
+            "fetch_job_log": (self.get_job_log, ["pk", "tail_lines", "offsets"]),
+            "capabilities.get": (self.get_capabilities_data, []),
             # Cluster operations
-            "fetch_clusters": (self.get_clusters_json, []),
+            "fetch_clusters": (self.get_clusters_data, []),
             "fetch_cluster": (self.get_cluster_json, ["cluster_id"]),
             "create_cluster": (self.create_cluster_json, ["json_payload"]),
             "update_cluster": (self.update_cluster_json, ["cluster_id", "json_payload"]),
             "delete_cluster": (self.delete_cluster, ["cluster_id"]),
             "test_cluster_connection": (self.test_cluster_connection_json, ["cluster_id"]),
             # SLURM operations
-            "fetch_slurm_queue": (self.get_slurm_queue_json, ["cluster_id"]),
-            "sync_remote_jobs": (self.sync_remote_jobs_json, []),
+            "fetch_slurm_queue": (self.get_slurm_queue_data, ["cluster_id"]),
+            "sync_remote_jobs": (self.sync_remote_jobs_json, ["timeout", "include_timing"]),
             "adopt_slurm_job": (self.adopt_slurm_job_json, ["cluster_id", "slurm_job_id"]),
             "cancel_slurm_job": (self.cancel_slurm_job_json, ["cluster_id", "slurm_job_id"]),
             # Materials operations
@@ -273,12 +310,65 @@ class CrystalController:
             ),
         }
 
+    def call(self, method_name: str, params: Any = None) -> Any:
+        """Invoke a registered JSON-RPC method with already-parsed params.
+
+        This is the native entry point used by the IPC server: it takes the
+        params object straight from the parsed request and returns a
+        JSON-ready result for the caller to serialize once.
+
+        Security: Only methods in _rpc_registry can be called.
+
+        Args:
+            method_name: Registered method name.
+            params: Named (dict) or positional (list) parameters.
+
+        Returns:
+            The handler's result; JSON strings from legacy ``*_json`` adapters
+            are parsed back into native objects.
+
+        Raises:
+            JsonRpcError: If the method is unknown or the params do not fit it.
+        """
+        # Security: Only allow registered methods
+        if method_name not in self._rpc_registry:
+            raise JsonRpcError(JSONRPC_METHOD_NOT_FOUND, f"Method not found: {method_name}")
+
+        handler, param_names = self._rpc_registry[method_name]
+
+        # Build kwargs from params
+        if isinstance(params, dict):
+            # Named parameters
+            kwargs = {name: params[name] for name in param_names if name in params}
+        elif isinstance(params, list):
+            # Positional parameters (convert to kwargs)
+            kwargs = dict(zip(param_names, params, strict=False))
+        else:
+            kwargs = {}
+
+        try:
+            result = handler(**kwargs)
+        except TypeError as e:
+            # Usually parameter mismatch
+            raise JsonRpcError(JSONRPC_INVALID_PARAMS, f"Invalid params: {e}") from e
+
+        # Legacy *_json adapters return a JSON string; parse it so it can be
+        # re-serialized in the JSON-RPC envelope
+        if isinstance(result, str):
+            try:
+                result = json.loads(result)
+            except json.JSONDecodeError:
+                # Keep as string if not valid JSON
+                pass
+        return result
+
     def dispatch(self, request_json: str) -> str:
         """Dispatch a JSON-RPC 2.0 request to the appropriate handler.
 
         This is the single entry point for the thin IPC bridge pattern.
         Rust sends generic JSON-RPC requests through this method instead
-        of calling individual methods directly.
+        of calling individual methods directly. Callers that already hold a
+        parsed request should use :meth:`call` instead.
 
         Protocol: JSON-RPC 2.0 (https://www.jsonrpc.org/specification)
         Request:  {"jsonrpc": "2.0", "method": "...", "params": {...}, "id": ...}
@@ -326,55 +416,11 @@ class CrystalController:
                     request_id=request_id,
                 )
 
-            # Security: Only allow registered methods
-            if method_name not in self._rpc_registry:
-                return _jsonrpc_error(
-                    JSONRPC_METHOD_NOT_FOUND,
-                    f"Method not found: {method_name}",
-                    request_id=request_id,
-                )
-
-            # Get handler and param spec
-            handler, param_names = self._rpc_registry[method_name]
-            params = request.get("params", {})
-
-            # Build kwargs from params
-            if isinstance(params, dict):
-                # Named parameters
-                kwargs = {}
-                for name in param_names:
-                    if name in params:
-                        kwargs[name] = params[name]
-            elif isinstance(params, list):
-                # Positional parameters (convert to kwargs)
-                kwargs = {}
-                for i, name in enumerate(param_names):
-                    if i < len(params):
-                        kwargs[name] = params[i]
-            else:
-                kwargs = {}
-
-            # Call the handler
-            result = handler(**kwargs)
-
-            # If result is already a JSON string from a *_json method,
-            # parse it so we can re-serialize in JSON-RPC envelope
-            if isinstance(result, str):
-                try:
-                    result = json.loads(result)
-                except json.JSONDecodeError:
-                    # Keep as string if not valid JSON
-                    pass
-
+            result = self.call(method_name, request.get("params", {}))
             return _jsonrpc_result(result, request_id)
 
-        except TypeError as e:
-            # Usually parameter mismatch
-            return _jsonrpc_error(
-                JSONRPC_INVALID_PARAMS,
-                f"Invalid params: {e}",
-                request_id=request_id,
-            )
+        except JsonRpcError as e:
+            return _jsonrpc_error(e.code, e.message, data=e.data, request_id=request_id)
         except Exception as e:
             # Log the full traceback for debugging
             import traceback
@@ -391,9 +437,41 @@ class CrystalController:
 
     # ========== Public API Methods (primary Python interface) ==========
 
-    def get_jobs(self, limit: int = 100) -> list[JobStatus]:
-        """Get list of jobs as native JobStatus objects."""
-        return self._backend.get_jobs(limit)
+    def get_jobs(self, limit: int = 100, **filters: Any) -> list[JobStatus]:
+        """Get list of jobs as native JobStatus objects.
+
+        Keyword filters (status, dft_code, runner_type, cluster_id, workflow_id)
+        are applied by the backend; see :meth:`get_jobs_page`.
+        """
+        if not filters:
+            return self._backend.get_jobs(limit)
+        jobs, _ = self.get_jobs_page(limit=limit, **filters)
+        return jobs
+
+    def get_jobs_page(
+        self,
+        limit: int = 100,
+        cursor: str | None = None,
+        status: str | None = None,
+        dft_code: str | None = None,
+        runner_type: str | None = None,
+        cluster_id: int | None = None,
+        workflow_id: str | None = None,
+    ) -> tuple[list[JobStatus], str | None]:
+        """Get one page of jobs (newest first) and the cursor for the next page."""
+        return self._backend.get_jobs_page(
+            limit=limit,
+            cursor=cursor,
+            status=status,
+            dft_code=dft_code,
+            runner_type=runner_type,
+            cluster_id=cluster_id,
+            workflow_id=workflow_id,
+        )
+
+    def get_job_changes(self, since_seq: int = 0, limit: int = 1000) -> JobChanges:
+        """Get jobs inserted, updated or deleted since a change sequence number."""
+        return self._backend.get_job_changes(since_seq, limit)
 
     def get_job_details(self, pk: int) -> JobDetails | None:
         """Get detailed job info as a JobDetails object (or None if not found)."""
@@ -403,23 +481,65 @@ class CrystalController:
         """Submit a new job from a JobSubmission object."""
         return self._backend.submit_job(submission)
 
-    def get_job_log(self, pk: int, tail_lines: int = 100) -> dict[str, list[str]]:
-        """Get job stdout/stderr log as a dict with stdout/stderr arrays."""
-        return self._backend.get_job_log(pk, tail_lines)
+    def get_job_log(
+        self, pk: int, tail_lines: int = 100, offsets: dict[str, int] | None = None
+    ) -> dict[str, Any]:
+        """Get job stdout/stderr log as a dict with stdout/stderr arrays.
+
+        Pass the returned ``offsets`` back to receive only newly written lines.
+        """
+        return self._backend.get_job_log(pk, tail_lines, offsets)
+
+    # ========== JSON-ready API (RPC registry, serialized once by the caller) ==========
+
+    def get_jobs_data(self, limit: int = 100, **filters: Any) -> list[dict[str, Any]]:
+        """Get list of jobs as JSON-ready dicts."""
+        jobs = self.get_jobs(limit, **{k: v for k, v in filters.items() if v is not None})
+        return [job.model_dump(mode="json") for job in jobs]
+
+    def get_jobs_page_data(
+        self, limit: int = 100, cursor: str | None = None, **filters: Any
+    ) -> dict[str, Any]:
+        """Get one page of jobs as a structured response with ``jobs`` and ``next_cursor``."""
+        try:
+            jobs, next_cursor = self.get_jobs_page(limit=limit, cursor=cursor, **filters)
+        except ValueError as e:
+            return _error_data("INVALID_CURSOR", str(e))
+        except NotImplementedError as e:
+            return _error_data("UNSUPPORTED_FILTER", str(e))
+        return _ok_data(
+            {
+                "jobs": [job.model_dump(mode="json") for job in jobs],
+                "next_cursor": next_cursor,
+            }
+        )
+
+    def get_job_details_data(self, pk: int) -> dict[str, Any]:
+        """Get detailed job info as a structured response."""
+        details = self.get_job_details(pk)
+        if details is None:
+            return _error_data("NOT_FOUND", f"Job with pk={pk} not found")
+        return _ok_data(details.model_dump(mode="json"))
+
+    def get_capabilities_data(self) -> dict[str, Any]:
+        """Report optional integration and backend capabilities as a structured response."""
+        return _ok_data(self.get_capabilities())
 
     # ========== Legacy JSON API (Rust compatibility) ==========
 
-    def get_jobs_json(self, limit: int = 100) -> str:
+    def get_jobs_json(self, limit: int = 100, **filters: Any) -> str:
         """Get list of jobs as JSON string (legacy)."""
-        jobs = self.get_jobs(limit)
-        return json.dumps([job.model_dump(mode="json") for job in jobs])
+        return json.dumps(self.get_jobs_data(limit, **filters))
+
+    def get_jobs_page_json(
+        self, limit: int = 100, cursor: str | None = None, **filters: Any
+    ) -> str:
+        """Get one page of jobs as structured JSON with ``jobs`` and ``next_cursor``."""
+        return json.dumps(self.get_jobs_page_data(limit=limit, cursor=cursor, **filters))
 
     def get_job_details_json(self, pk: int) -> str:
         """Get detailed job info as JSON string (legacy)."""
-        details = self.get_job_details(pk)
-        if details is None:
-            return _error_response("NOT_FOUND", f"Job with pk={pk} not found")
-        return _ok_response(details.model_dump(mode="json"))
+        return json.dumps(self.get_job_details_data(pk))
 
     def submit_job_json(self, json_payload: str) -> int:
         """Submit a new job from JSON payload (legacy)."""
@@ -441,18 +561,22 @@ class CrystalController:
         """
         return self._backend.cancel_job(pk)
 
-    def get_job_log_json(self, pk: int, tail_lines: int = 100) -> str:
+    def get_job_log_json(
+        self, pk: int, tail_lines: int = 100, offsets: dict[str, int] | None = None
+    ) -> str:
         """
         Get job stdout/stderr log as JSON.
 
         Args:
             pk: Job primary key
             tail_lines: Number of lines from end of log
+            offsets: Resume tokens ({"stdout": n, "stderr": m}) from a previous call
 
         Returns:
-            JSON object with "stdout" and "stderr" arrays
+            JSON object with "stdout" and "stderr" arrays, plus "offsets" and
+            "reset" for file-backed logs
         """
-        logs = self.get_job_log(pk, tail_lines)
+        logs = self.get_job_log(pk, tail_lines, offsets)
         return json.dumps(logs)
 
     def get_capabilities(self) -> dict[str, Any]:
@@ -468,7 +592,7 @@ class CrystalController:
 
     def get_capabilities_json(self) -> str:
         """Report optional integration and backend capabilities as structured JSON."""
-        return _ok_response(self.get_capabilities())
+        return json.dumps(self.get_capabilities_data())
 
     # ========== quacc Integration Methods ==========
 
@@ -558,10 +682,13 @@ class CrystalController:
             Dict with jobs list and total count.
         """
         try:
-            from crystalmath.quacc.store import JobStore
+            from crystalmath.quacc.store import JobStatus, JobStore
 
-            store = JobStore()
-            jobs = store.list_jobs(status=status, limit=limit)
+            if self._quacc_store is None:
+                self._quacc_store = JobStore()
+            jobs = self._quacc_store.list_jobs(
+                status=JobStatus(status) if status else None, limit=limit
+            )
 
             return {
                 "jobs": [job.model_dump() for job in jobs],
@@ -1098,7 +1225,22 @@ class CrystalController:
 
     # ========== SLURM Queue Methods ==========
 
-    def get_slurm_queue_json(self, cluster_id: int = 1) -> str:
+    def _get_cluster_config(self, cluster_id: int) -> Any:
+        """
+        Load a cluster row for SSH access.
+
+        Raises:
+            ValueError: If the database is unavailable or the cluster is unknown
+        """
+        if not hasattr(self, "_db") or not self._db:
+            raise ValueError("Database not available - cannot fetch cluster config")
+
+        cluster = self._db.get_cluster(cluster_id)
+        if not cluster:
+            raise ValueError(f"Cluster {cluster_id} not found in database")
+        return cluster
+
+    def get_slurm_queue_data(self, cluster_id: int = 1) -> dict[str, Any]:
         """
         Get SLURM queue status from remote cluster.
 
@@ -1109,7 +1251,7 @@ class CrystalController:
             cluster_id: Cluster database ID (default: 1)
 
         Returns:
-            JSON string with structure:
+            Structured response:
             - Success: {"ok": true, "data": [SlurmQueueEntry, ...]}
             - Error: {"ok": false, "error": {"code": "...", "message": "..."}}
 
@@ -1124,238 +1266,203 @@ class CrystalController:
         """
         import asyncio
 
-        async def _run() -> list[dict[str, Any]]:
-            from crystalmath._vendor.core.connection_manager import ConnectionManager
-            from crystalmath._vendor.runners.slurm_runner import SLURMRunner
-
-            # Get cluster config from database
-            if not hasattr(self, "_db") or not self._db:
-                raise ValueError("Database not available - cannot fetch cluster config")
-
-            cluster = self._db.get_cluster(cluster_id)
-            if not cluster:
-                raise ValueError(f"Cluster {cluster_id} not found in database")
+        from crystalmath.ssh_sessions import get_session_service
 
-            # Parse connection config from cluster
-            import json as json_module
+        sessions = get_session_service()
 
-            conn_config_data = (
-                json_module.loads(cluster.connection_config)
-                if isinstance(cluster.connection_config, str)
-                else cluster.connection_config
-            )
-
-            # Create connection config
-            # Note: We don't construct ConnectionConfig directly here as register_cluster handles it
-
-            # Create connection manager
-            conn_manager = ConnectionManager()
-
-            # Register cluster with proper method
-            conn_manager.register_cluster(
-                cluster_id=cluster_id,
-                host=cluster.hostname,
-                port=cluster.port,
-                username=cluster.username,
-                key_file=Path(conn_config_data.get("key_file", "~/.ssh/id_ed25519")).expanduser(),
-                strict_host_key_checking=True,  # Enable security by default
-            )
+        async def _run() -> list[dict[str, Any]]:
+            cluster = self._get_cluster_config(cluster_id)
+            runner = await sessions.slurm_runner(cluster)
 
+            # Use timeout to prevent blocking the bridge thread indefinitely
             try:
-                # Create SLURM runner and get queue
-                runner = SLURMRunner(
-                    connection_manager=conn_manager,
-                    cluster_id=cluster_id,
+                jobs = await asyncio.wait_for(
+                    runner.get_queue_status(user_only=False),
+                    timeout=15.0,  # 15 second timeout for HPC environments
                 )
+            except asyncio.TimeoutError:
+                raise ValueError("SLURM queue fetch timed out after 15 seconds")
 
-                # Use timeout to prevent blocking the bridge thread indefinitely
-                try:
-                    jobs = await asyncio.wait_for(
-                        runner.get_queue_status(user_only=False),
-                        timeout=15.0,  # 15 second timeout for HPC environments
-                    )
-                except asyncio.TimeoutError:
-                    raise ValueError("SLURM queue fetch timed out after 15 seconds")
+            # Ensure job_id is string for Rust compatibility
+            for job in jobs:
+                if "job_id" in job:
+                    job["job_id"] = str(job["job_id"])
 
-                # Ensure job_id is string for Rust compatibility
-                for job in jobs:
-                    if "job_id" in job:
-                        job["job_id"] = str(job["job_id"])
-
-                return jobs
-            finally:
-                await conn_manager.stop()
+            return jobs
 
         try:
-            data = asyncio.run(_run())
-            return _ok_response(data)
+            data = sessions.run(_run())
+            return _ok_data(data)
         except ValueError as e:
-            return _error_response("CONFIGURATION_ERROR", str(e))
+            return _error_data("CONFIGURATION_ERROR", str(e))
         except ImportError as e:
-            return _error_response("IMPORT_ERROR", f"SLURM runner not available: {e}")
+            return _error_data("IMPORT_ERROR", f"SLURM runner not available: {e}")
         except Exception as e:
             logger.error(f"SLURM queue fetch failed for cluster {cluster_id}: {e}")
-            return _error_response("SLURM_ERROR", str(e))
+            return _error_data("SLURM_ERROR", str(e))
+
+    def get_slurm_queue_json(self, cluster_id: int = 1) -> str:
+        """Get SLURM queue status as JSON (see :meth:`get_slurm_queue_data`)."""
+        return json.dumps(self.get_slurm_queue_data(cluster_id))
 
-    def sync_remote_jobs_json(self) -> str:
+    def sync_remote_jobs_json(self, timeout: float = 15.0, include_timing: bool = False) -> str:
         """
         Synchronize status of tracked remote jobs with actual SLURM state.
 
         1. Identifies active remote jobs in local DB (SUBMITTED/QUEUED/RUNNING).
         2. Groups them by cluster.
-        3. Queries squeue (for running) and sacct (for completed) on each cluster.
-        4. Updates local DB with fresh status.
+        3. Queries squeue (for running) and sacct (for completed) on all
+           clusters concurrently. A cluster that errors or exceeds ``timeout``
+           is skipped without holding up the others.
+        4. Applies every status change in one batched DB transaction.
         5. Returns updated job list (same as get_jobs_json).
 
+        Args:
+            timeout: Per-cluster time budget in seconds
+            include_timing: Return a structured response with the job list and
+                a per-cluster sync report instead of the bare job list
+
         Returns:
-            JSON string with updated job list (same format as get_jobs_json)
+            JSON string with updated job list (same format as get_jobs_json), or
+            with include_timing, {"ok": true, "data": {"jobs": [...],
+            "clusters": [{"cluster_id", "ok", "elapsed_ms", "jobs",
+            "updated", "error"}, ...]}}
         """
         import asyncio
 
-        async def _run() -> None:
-            from crystalmath._vendor.core.connection_manager import ConnectionManager
-            from crystalmath._vendor.runners.slurm_runner import SLURMRunner
+        from crystalmath.ssh_sessions import get_session_service
 
-            if not hasattr(self, "_db") or not self._db:
-                logger.warning("Database not available - cannot sync remote jobs")
-                return
+        if not hasattr(self, "_db") or not self._db:
+            logger.warning("Database not available - cannot sync remote jobs")
+            return self._sync_response([], include_timing)
+
+        async def _sync_cluster(cluster: Any, jobs: list[dict[str, Any]]) -> dict[int, str]:
+            """Fetch fresh SLURM states for one cluster's jobs: {job_id: status}."""
+            runner = await get_session_service().slurm_runner(cluster)
+            statuses: dict[int, str] = {}
 
-            # 1. Get active remote jobs
-            # Join jobs with remote_jobs to get the handle
-            cursor = self._db.conn.execute(
+            def record(job: dict[str, Any], state_str: str) -> None:
+                slurm_state = runner._parse_state(state_str)
+                # Runner statuses are lower-case values; the jobs table stores
+                # the upper-case names and has no UNKNOWN
+                new_status = runner._slurm_state_to_job_status(slurm_state).name
+                if new_status != "UNKNOWN" and new_status != job["status"]:
+                    statuses[job["id"]] = new_status
+
+            # A. Current queue (squeue)
+            queue_jobs = await runner.get_queue_status(user_only=True)
+            queue_map = {str(j["job_id"]): j["state"] for j in queue_jobs}
+
+            # B. Jobs that left the queue (potentially completed/failed)
+            missing = {}
+            for job in jobs:
+                rid = str(job["remote_job_id"])
+                if rid in queue_map:
+                    record(job, queue_map[rid])
+                else:
+                    missing[rid] = job
+
+            # C. Bulk check sacct for missing jobs
+            if missing:
+                sacct_cmd = f"sacct -j {','.join(missing)} -n -o JobID,State -P"
+                async with runner.connection_manager.get_connection(cluster.id) as conn:
+                    result = await conn.run(sacct_cmd, check=False)
+                if result.exit_status == 0:
+                    # Parse sacct output: 12345|COMPLETED
+                    for line in result.stdout.strip().splitlines():
+                        parts = line.split("|")
+                        if len(parts) >= 2 and parts[0] in missing:
+                            record(missing[parts[0]], parts[1])
+                else:
+                    logger.warning(f"sacct failed on cluster {cluster.id}: {result.stderr}")
+
+            return statuses
+
+        async def _timed(cluster_id: int, jobs: list[dict[str, Any]]) -> dict[str, Any]:
+            report: dict[str, Any] = {
+                "cluster_id": cluster_id,
+                "ok": False,
+                "elapsed_ms": 0.0,
+                "jobs": len(jobs),
+                "updated": 0,
+                "error": None,
+            }
+            started = time.perf_counter()
+            try:
+                cluster = self._db.get_cluster(cluster_id)
+                if not cluster:
+                    raise ValueError(f"Cluster {cluster_id} not found")
+                statuses = await asyncio.wait_for(_sync_cluster(cluster, jobs), timeout)
+                report.update(ok=True, statuses=statuses)
+            except asyncio.TimeoutError:
+                report["error"] = f"Timed out after {timeout:g}s"
+                logger.error(f"Timeout syncing cluster {cluster_id}")
+            except Exception as e:
+                report["error"] = str(e)
+                logger.error(f"Error syncing cluster {cluster_id}: {e}")
+            report["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            return report
+
+        # 1. Get active remote jobs
+        # Join jobs with remote_jobs to get the handle
+        with self._db.connection() as conn:
+            rows = conn.execute(
                 """
-                SELECT j.id, j.cluster_id, r.remote_handle
+                SELECT j.id, j.cluster_id, r.remote_handle, j.status
                 FROM jobs j
                 JOIN remote_jobs r ON j.id = r.job_id
                 WHERE j.status IN ('SUBMITTED', 'QUEUED', 'RUNNING')
                 AND j.runner_type = 'slurm'
                 """
+            ).fetchall()
+
+        # 2. Group by cluster
+        jobs_by_cluster: dict[int, list[dict[str, Any]]] = {}
+        for row in rows:
+            jobs_by_cluster.setdefault(row[1], []).append(
+                {"id": row[0], "remote_job_id": row[2], "status": row[3]}
             )
-            active_jobs = [
-                {"id": row[0], "cluster_id": row[1], "remote_job_id": row[2]}
-                for row in cursor.fetchall()
-            ]
-
-            if not active_jobs:
-                return
-
-            # Group by cluster
-            jobs_by_cluster: dict[int, list[dict[str, Any]]] = {}
-            for job in active_jobs:
-                cid = job["cluster_id"]
-                if cid not in jobs_by_cluster:
-                    jobs_by_cluster[cid] = []
-                jobs_by_cluster[cid].append(job)
-
-            # Process each cluster
-            conn_manager = ConnectionManager()
-            try:
-                for cluster_id, jobs in jobs_by_cluster.items():
-                    try:
-                        # Get cluster config
-                        cluster = self._db.get_cluster(cluster_id)
-                        if not cluster:
-                            logger.warning(f"Cluster {cluster_id} not found, skipping sync")
-                            continue
-
-                        # Register cluster
-                        import json as json_module
-
-                        conn_config = (
-                            json_module.loads(cluster.connection_config)
-                            if isinstance(cluster.connection_config, str)
-                            else cluster.connection_config
-                        )
-
-                        conn_manager.register_cluster(
-                            cluster_id=cluster_id,
-                            host=cluster.hostname,
-                            port=cluster.port,
-                            username=cluster.username,
-                            key_file=Path(
-                                conn_config.get("key_file", "~/.ssh/id_ed25519")
-                            ).expanduser(),
-                            strict_host_key_checking=True,
-                        )
-
-                        runner = SLURMRunner(connection_manager=conn_manager, cluster_id=cluster_id)
-
-                        async with conn_manager.get_connection(cluster_id) as conn:
-                            # A. Get current queue (squeue)
-                            # Use timeout to prevent hanging
-                            try:
-                                queue_jobs = await asyncio.wait_for(
-                                    runner.get_queue_status(user_only=True), timeout=15.0
-                                )
-                            except asyncio.TimeoutError:
-                                logger.error(f"Timeout syncing cluster {cluster_id}")
-                                continue
-
-                            # Create map of remote_id -> status string
-                            queue_map = {str(j["job_id"]): j["state"] for j in queue_jobs}
-
-                            # B. Identify missing jobs (potentially completed/failed)
-                            missing_job_ids = []
-                            for job in jobs:
-                                rid = str(job["remote_job_id"])
-                                if rid in queue_map:
-                                    # Job found in queue - update status
-                                    slurm_state_str = queue_map[rid]
-                                    slurm_state = runner._parse_state(slurm_state_str)
-                                    new_status = runner._slurm_state_to_job_status(slurm_state)
-                                    self._db.update_status(job["id"], new_status.value)
-                                else:
-                                    # Job not in squeue - check sacct
-                                    missing_job_ids.append(rid)
-
-                            # C. Bulk check sacct for missing jobs
-                            if missing_job_ids:
-                                id_list = ",".join(missing_job_ids)
-                                sacct_cmd = f"sacct -j {id_list} -n -o JobID,State -P"
-                                try:
-                                    result = await asyncio.wait_for(
-                                        conn.run(sacct_cmd, check=False), timeout=15.0
-                                    )
-                                    if result.exit_status == 0:
-                                        # Parse sacct output: 12345|COMPLETED
-                                        sacct_map = {}
-                                        for line in result.stdout.strip().splitlines():
-                                            parts = line.split("|")
-                                            if len(parts) >= 2:
-                                                jid, state = parts[0], parts[1]
-                                                if "." not in jid:
-                                                    sacct_map[jid] = state
-
-                                        # Update DB for found jobs
-                                        for job in jobs:
-                                            rid = str(job["remote_job_id"])
-                                            if rid in missing_job_ids and rid in sacct_map:
-                                                slurm_state = runner._parse_state(sacct_map[rid])
-                                                new_status = runner._slurm_state_to_job_status(
-                                                    slurm_state
-                                                )
-                                                self._db.update_status(job["id"], new_status.value)
-                                    else:
-                                        logger.warning(f"sacct failed: {result.stderr}")
-
-                                except asyncio.TimeoutError:
-                                    logger.error("sacct timed out")
-
-                    except Exception as e:
-                        logger.error(f"Error syncing cluster {cluster_id}: {e}")
 
-            finally:
-                await conn_manager.stop()
+        async def _run() -> list[dict[str, Any]]:
+            # 3. Query every cluster at once; the slowest one sets the pace
+            return list(
+                await asyncio.gather(*(_timed(cid, jobs) for cid, jobs in jobs_by_cluster.items()))
+            )
 
-        try:
-            # Run the sync process
-            asyncio.run(_run())
+        reports: list[dict[str, Any]] = []
+        if jobs_by_cluster:
+            try:
+                reports = get_session_service().run(_run())
+            except ImportError as e:
+                return _error_response("IMPORT_ERROR", f"Dependencies missing: {e}")
+            except Exception as e:
+                logger.error(f"Remote sync failed: {e}")
+                return _error_response("SYNC_FAILED", str(e))
+
+        # 4. Apply all status changes in one transaction
+        updates: dict[int, str] = {}
+        for report in reports:
+            statuses = report.pop("statuses", {})
+            report["updated"] = len(statuses)
+            updates.update(statuses)
+        if updates:
+            self._db.update_statuses_batch(updates)
+
+        for report in reports:
+            logger.debug(
+                f"Synced cluster {report['cluster_id']} in {report['elapsed_ms']} ms "
+                f"({report['updated']}/{report['jobs']} updated)"
+            )
+        return self._sync_response(reports, include_timing)
+
+    def _sync_response(self, reports: list[dict[str, Any]], include_timing: bool) -> str:
+        """Format sync_remote_jobs_json's result."""
+        if not include_timing:
             return self.get_jobs_json()
-        except ImportError as e:
-            return _error_response("IMPORT_ERROR", f"Dependencies missing: {e}")
-        except Exception as e:
-            logger.error(f"Remote sync failed: {e}")
-            return _error_response("SYNC_FAILED", str(e))
+        jobs = self.get_jobs(100)
+        return _ok_response(
+            {"jobs": [job.model_dump(mode="json") for job in jobs], "clusters": reports}
+        )
 
     def adopt_slurm_job_json(self, cluster_id: int, slurm_job_id: str) -> str:
         """
@@ -1373,95 +1480,66 @@ class CrystalController:
         Returns:
             JSON string with {"ok": true} or error.
         """
-        import asyncio
         import os
 
-        async def _run() -> None:
-            from crystalmath._vendor.core.connection_manager import ConnectionManager
-            from crystalmath._vendor.runners.slurm_runner import SLURMRunner
+        from crystalmath.ssh_sessions import get_session_service
 
-            if not hasattr(self, "_db") or not self._db:
-                raise ValueError("Database not available")
+        sessions = get_session_service()
 
-            cluster = self._db.get_cluster(cluster_id)
-            if not cluster:
-                raise ValueError(f"Cluster {cluster_id} not found")
-
-            # Initialize connection
-            import json as json_module
+        async def _run() -> None:
+            cluster = self._get_cluster_config(cluster_id)
+            runner = await sessions.slurm_runner(cluster)
 
-            conn_config = (
-                json_module.loads(cluster.connection_config)
-                if isinstance(cluster.connection_config, str)
-                else cluster.connection_config
-            )
+            # Fetch job details
+            details = await runner.get_job_details(slurm_job_id)
+            if not details:
+                raise ValueError(f"Could not fetch details for SLURM job {slurm_job_id}")
 
-            conn_manager = ConnectionManager()
-            conn_manager.register_cluster(
+            # Extract metadata
+            job_name = details.get("JobName", f"adopted_{slurm_job_id}")
+            work_dir_remote = details.get("WorkDir", "")
+            partition = details.get("Partition", "")
+
+            # Determine state
+            state_str = details.get("JobState", "UNKNOWN")
+            slurm_state = runner._parse_state(state_str)
+            job_status = runner._slurm_state_to_job_status(slurm_state)
+
+            # Create local working directory
+            # Use standard location: ~/.local/share/crystal-tui/adopted/<job_name>_<uuid>
+            # Or try to map from remote structure if it matches
+            local_base = Path(os.environ.get("CRY_SCRATCH_BASE", "/tmp/crystal_adopted"))
+            local_work_dir = local_base / f"{job_name}_{slurm_job_id}"
+            local_work_dir.mkdir(parents=True, exist_ok=True)
+
+            # Create Job record
+            job_id = self._db.create_job(
+                name=job_name,
+                work_dir=str(local_work_dir),
+                input_content="",  # Unknown at this point
                 cluster_id=cluster_id,
-                host=cluster.hostname,
-                port=cluster.port,
-                username=cluster.username,
-                key_file=Path(conn_config.get("key_file", "~/.ssh/id_ed25519")).expanduser(),
-                strict_host_key_checking=True,
+                runner_type="slurm",
+                dft_code="crystal",  # Default assumption
             )
 
-            try:
-                runner = SLURMRunner(connection_manager=conn_manager, cluster_id=cluster_id)
+            # Update status
+            self._db.update_status(job_id, job_status.value)
 
-                # Fetch job details
-                details = await runner.get_job_details(slurm_job_id)
-                if not details:
-                    raise ValueError(f"Could not fetch details for SLURM job {slurm_job_id}")
-
-                # Extract metadata
-                job_name = details.get("JobName", f"adopted_{slurm_job_id}")
-                work_dir_remote = details.get("WorkDir", "")
-                partition = details.get("Partition", "")
-
-                # Determine state
-                state_str = details.get("JobState", "UNKNOWN")
-                slurm_state = runner._parse_state(state_str)
-                job_status = runner._slurm_state_to_job_status(slurm_state)
-
-                # Create local working directory
-                # Use standard location: ~/.local/share/crystal-tui/adopted/<job_name>_<uuid>
-                # Or try to map from remote structure if it matches
-                local_base = Path(os.environ.get("CRY_SCRATCH_BASE", "/tmp/crystal_adopted"))
-                local_work_dir = local_base / f"{job_name}_{slurm_job_id}"
-                local_work_dir.mkdir(parents=True, exist_ok=True)
-
-                # Create Job record
-                job_id = self._db.create_job(
-                    name=job_name,
-                    work_dir=str(local_work_dir),
-                    input_content="",  # Unknown at this point
-                    cluster_id=cluster_id,
-                    runner_type="slurm",
-                    dft_code="crystal",  # Default assumption
-                )
-
-                # Update status
-                self._db.update_status(job_id, job_status.value)
-
-                # Create RemoteJob record
-                self._db.create_remote_job(
-                    job_id=job_id,
-                    cluster_id=cluster_id,
-                    remote_handle=slurm_job_id,
-                    working_directory=work_dir_remote,
-                    queue_name=partition,
-                    metadata=details,
-                )
-
-                logger.info(f"Adopted SLURM job {slurm_job_id} as local job {job_id}")
-                return _ok_response({"success": True, "pk": job_id})
+            # Create RemoteJob record
+            self._db.create_remote_job(
+                job_id=job_id,
+                cluster_id=cluster_id,
+                remote_handle=slurm_job_id,
+                working_directory=work_dir_remote,
+                queue_name=partition,
+                metadata=details,
+            )
 
-            finally:
-                await conn_manager.stop()
+            logger.info(f"Adopted SLURM job {slurm_job_id} as local job {job_id}")
+            return _ok_response({"success": True, "pk": job_id})
 
         try:
-            return asyncio.run(_run())
+            return sessions.run(_run())
         except ValueError as e:
             return _error_response("CONFIGURATION_ERROR", str(e))
         except Exception as e:
@@ -1487,64 +1565,29 @@ class CrystalController:
         """
         import asyncio
 
-        async def _run() -> dict[str, Any]:
-            from crystalmath._vendor.core.connection_manager import ConnectionManager
-            from crystalmath._vendor.runners.slurm_runner import SLURMRunner
+        from crystalmath.ssh_sessions import get_session_service
 
-            # Get cluster config from database
-            if not hasattr(self, "_db") or not self._db:
-                raise ValueError("Database not available - cannot fetch cluster config")
-
-            cluster = self._db.get_cluster(cluster_id)
-            if not cluster:
-                raise ValueError(f"Cluster {cluster_id} not found in database")
-
-            # Parse connection config from cluster
-            import json as json_module
-
-            conn_config_data = (
-                json_module.loads(cluster.connection_config)
-                if isinstance(cluster.connection_config, str)
-                else cluster.connection_config
-            )
-
-            # Create connection manager
-            conn_manager = ConnectionManager()
+        sessions = get_session_service()
 
-            # Register cluster with proper method
-            conn_manager.register_cluster(
-                cluster_id=cluster_id,
-                host=cluster.hostname,
-                port=cluster.port,
-                username=cluster.username,
-                key_file=Path(conn_config_data.get("key_file", "~/.ssh/id_ed25519")).expanduser(),
-                strict_host_key_checking=True,
-            )
+        async def _run() -> dict[str, Any]:
+            cluster = self._get_cluster_config(cluster_id)
+            runner = await sessions.slurm_runner(cluster)
 
+            # Use timeout to prevent blocking the bridge thread indefinitely
             try:
-                # Create SLURM runner and cancel job
-                runner = SLURMRunner(
-                    connection_manager=conn_manager,
-                    cluster_id=cluster_id,
+                success, message = await asyncio.wait_for(
+                    runner.cancel_slurm_job(slurm_job_id), timeout=15.0
                 )
+            except asyncio.TimeoutError:
+                return {
+                    "success": False,
+                    "message": "Cancel request timed out after 15 seconds",
+                }
 
-                # Use timeout to prevent blocking the bridge thread indefinitely
-                try:
-                    success, message = await asyncio.wait_for(
-                        runner.cancel_slurm_job(slurm_job_id), timeout=15.0
-                    )
-                except asyncio.TimeoutError:
-                    return {
-                        "success": False,
-                        "message": "Cancel request timed out after 15 seconds",
-                    }
-
-                return {"success": success, "message": message}
-            finally:
-                await conn_manager.stop()
+            return {"success": success, "message": message}
 
         try:
-            data = asyncio.run(_run())
+            data = sessions.run(_run())
             return _ok_response(data)
         except ValueError as e:
             return _error_response("CONFIGURATION_ERROR", str(e))
@@ -1556,12 +1599,12 @@ class CrystalController:
 
     # ========== Cluster Management Methods ==========
 
-    def get_clusters_json(self) -> str:
+    def get_clusters_data(self) -> dict[str, Any]:
         """
         Get list of all configured clusters.
 
         Returns:
-            JSON string with structure:
+            Structured response:
             - Success: {"ok": true, "data": [ClusterConfig, ...]}
             - Error: {"ok": false, "error": {"code": "...", "message": "..."}}
 
@@ -1576,7 +1619,7 @@ class CrystalController:
         """
         try:
             if not hasattr(self, "_db") or not self._db:
-                return _error_response("NO_DATABASE", "Database not available")
+                return _error_data("NO_DATABASE", "Database not available")
 
             clusters = self._db.get_all_clusters()
             results: list[dict[str, Any]] = []
@@ -1610,10 +1653,14 @@ class CrystalController:
                     }
                 )
 
-            return _ok_response(results)
+            return _ok_data(results)
         except Exception as e:
             logger.error(f"Failed to get clusters: {e}")
-            return _error_response("INTERNAL_ERROR", str(e))
+            return _error_data("INTERNAL_ERROR", str(e))
+
+    def get_clusters_json(self) -> str:
+        """Get list of all configured clusters as JSON (see :meth:`get_clusters_data`)."""
+        return json.dumps(self.get_clusters_data())
 
     def get_cluster_json(self, cluster_id: int) -> str:
         """
@@ -1755,6 +1802,10 @@ class CrystalController:
                 return _error_response("NO_DATABASE", "Database not available")
 
             self._db.delete_cluster(cluster_id)
+
+            from crystalmath.ssh_sessions import get_session_service
+
+            get_session_service().forget_cluster(cluster_id)
             return _ok_response({"success": True})
         except Exception as e:
             logger.error(f"Failed to delete cluster {cluster_id}: {e}")
@@ -2022,8 +2073,7 @@ class CrystalController:
                     out_path = work_dir / out_file
                     if out_path.exists():
                         try:
-                            content = out_path.read_text()
-                            lines = content.splitlines()[-100:]  # Last 100 lines
+                            lines = tail_file(out_path, 100).lines
                             output_parts.append(
                                 f"=== {out_file} (last 100 lines) ===\n" + "\n".join(lines)
                             )
@@ -2035,7 +2085,7 @@ class CrystalController:
                 stderr_path = work_dir / "stderr"
                 if stderr_path.exists():
                     try:
-                        stderr = stderr_path.read_text()
+                        stderr = "\n".join(tail_file(stderr_path, 200).lines)
                         if stderr.strip():
                             output_parts.append("=== STDERR ===\n" + stderr[-5000:])
                     except Exception:
@@ -21,13 +21,14 @@ Usage:
 from __future__ import annotations
 
 import logging
+import sys
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 if TYPE_CHECKING:
     from pathlib import Path
 
-    from crystalmath.models import JobDetails, JobStatus, JobSubmission
+    from crystalmath.models import JobChanges, JobDetails, JobStatus, JobSubmission
 
 logger = logging.getLogger(__name__)
 
@@ -160,6 +161,78 @@ class Backend(ABC):
         """
         ...
 
+    def get_jobs_page(
+        self,
+        limit: int = 100,
+        cursor: str | None = None,
+        status: str | None = None,
+        dft_code: str | None = None,
+        runner_type: str | None = None,
+        cluster_id: int | None = None,
+        workflow_id: str | None = None,
+    ) -> tuple[list[JobStatus], str | None]:
+        """
+        Get one page of jobs with optional filters.
+
+        The default implementation filters the output of :meth:`get_jobs` in
+        Python and uses an offset cursor. Backends with a query engine (SQLite)
+        override this to push filtering and pagination into the store.
+
+        Args:
+            limit: Maximum number of jobs to return
+            cursor: Cursor returned by the previous page (None for page 1)
+            status: Only jobs in this state (JobState value, e.g. 'RUNNING')
+            dft_code: Only jobs for this DFT code
+            runner_type: Only jobs with this runner type
+            cluster_id: Only jobs on this cluster
+            workflow_id: Only jobs belonging to this workflow
+
+        Returns:
+            Tuple of (jobs, next_cursor); next_cursor is None on the last page.
+
+        Raises:
+            ValueError: If the cursor is malformed
+            NotImplementedError: If cluster_id is given; JobStatus does not
+                carry the cluster, so only overriding backends can filter by it
+        """
+        if cluster_id is not None:
+            raise NotImplementedError(f"The {self.name} backend cannot filter jobs by cluster_id")
+
+        try:
+            offset = int(cursor) if cursor else 0
+        except ValueError:
+            raise ValueError(f"Invalid job page cursor: {cursor!r}") from None
+
+        jobs = [
+            job
+            for job in self.get_jobs(limit=sys.maxsize)
+            if (status is None or job.state.value == status.upper())
+            and (dft_code is None or job.dft_code.value == dft_code)
+            and (runner_type is None or job.runner_type.value == runner_type)
+            and (workflow_id is None or job.workflow_id == workflow_id)
+        ]
+        page = jobs[offset : offset + limit]
+        next_cursor = str(offset + limit) if offset + limit < len(jobs) else None
+        return page, next_cursor
+
+    def get_job_changes(self, since_seq: int = 0, limit: int = 1000) -> JobChanges:
+        """
+        Get jobs that changed after a change sequence number.
+
+        Backends without a change log return a full snapshot flagged with
+        ``reset=True``; SQLite overrides this with its trigger-maintained feed.
+
+        Args:
+            since_seq: Last sequence number the caller has applied
+            limit: Maximum number of changed jobs to return
+
+        Returns:
+            JobChanges delta
+        """
+        from crystalmath.models import JobChanges
+
+        return JobChanges(seq=0, jobs=self.get_jobs(limit=limit), reset=True)
+
     @abstractmethod
     def get_job_details(self, pk: int) -> JobDetails | None:
         """
@@ -203,16 +276,25 @@ class Backend(ABC):
         ...
 
     @abstractmethod
-    def get_job_log(self, pk: int, tail_lines: int = 100) -> dict[str, list[str]]:
+    def get_job_log(
+        self,
+        pk: int,
+        tail_lines: int = 100,
+        offsets: dict[str, int] | None = None,
+    ) -> dict[str, Any]:
         """
         Get job stdout/stderr logs.
 
         Args:
             pk: Job primary key
             tail_lines: Number of lines from end of log
+            offsets: Resume tokens per stream from a previous call; when given,
+                only lines written after them are returned (if supported)
 
         Returns:
-            Dict with 'stdout' and 'stderr' keys, each containing list of lines
+            Dict with 'stdout' and 'stderr' keys, each containing list of lines.
+            Backends that read files also return 'offsets' (resume tokens) and
+            'reset' (stream was truncated since the given offset).
         """
         ...
 
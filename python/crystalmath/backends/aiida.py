@@ -221,7 +221,12 @@ class AiiDABackend(Backend):
             logger.error(f"Failed to cancel job {pk}: {e}")
             return False
 
-    def get_job_log(self, pk: int, tail_lines: int = 100) -> dict[str, list[str]]:
+    def get_job_log(
+        self,
+        pk: int,
+        tail_lines: int = 100,
+        offsets: dict[str, int] | None = None,
+    ) -> dict[str, Any]:
         """Get job logs from AiiDA."""
         if not self._available or not self._orm:
             return {"stdout": [], "stderr": []}
@@ -7,6 +7,7 @@ Provides in-memory mock data without any external dependencies.
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any
 
 from crystalmath.backends import Backend
 from crystalmath.models import (
@@ -140,6 +141,11 @@ class DemoBackend(Backend):
                 return True
         return False
 
-    def get_job_log(self, pk: int, tail_lines: int = 100) -> dict[str, list[str]]:
+    def get_job_log(
+        self,
+        pk: int,
+        tail_lines: int = 100,
+        offsets: dict[str, int] | None = None,
+    ) -> dict[str, Any]:
         """Return empty logs for demo."""
         return {"stdout": [], "stderr": []}
@@ -15,12 +15,14 @@ from typing import Any
 from crystalmath.backends import Backend
 from crystalmath.models import (
     DftCode,
+    JobChanges,
     JobDetails,
     JobState,
     JobStatus,
     JobSubmission,
     RunnerType,
 )
+from crystalmath.tail import read_after, tail_file
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +36,13 @@ _STATUS_MAP = {
     "CANCELLED": JobState.CANCELLED,
 }
 
+# JobState filter values that differ from the database status strings
+_STATE_TO_DB_STATUS = {"CREATED": "PENDING"}
+
+# Log file names probed in a job's work_dir, in priority order ({name} = job name)
+STDOUT_LOG_NAMES = ("stdout.log", "output.out", "{name}.out")
+STDERR_LOG_NAMES = ("stderr.log", "error.err")
+
 
 class SQLiteBackend(Backend):
     """
@@ -72,37 +81,82 @@ class SQLiteBackend(Backend):
 
     def get_jobs(self, limit: int = 100) -> list[JobStatus]:
         """Query SQLite for job list."""
+        jobs, _ = self.get_jobs_page(limit=limit)
+        return jobs
+
+    def get_jobs_page(
+        self,
+        limit: int = 100,
+        cursor: str | None = None,
+        status: str | None = None,
+        dft_code: str | None = None,
+        runner_type: str | None = None,
+        cluster_id: int | None = None,
+        workflow_id: str | None = None,
+    ) -> tuple[list[JobStatus], str | None]:
+        """Query one keyset-paginated page of jobs, filtered in SQL."""
         if not self._db:
-            return []
-
-        jobs = self._db.get_all_jobs()[:limit]
-        results: list[JobStatus] = []
+            return [], None
+
+        db_status = None
+        if status is not None:
+            db_status = _STATE_TO_DB_STATUS.get(status.upper(), status.upper())
+
+        jobs, next_cursor = self._db.get_jobs_page(
+            limit=limit,
+            cursor=cursor,
+            status=db_status,
+            dft_code=dft_code,
+            runner_type=runner_type,
+            cluster_id=cluster_id,
+            workflow_id=workflow_id,
+        )
+        return [self._to_job_status(job) for job in jobs], next_cursor
 
-        for job in jobs:
-            created_at = None
-            if job.created_at:
-                try:
-                    created_at = datetime.fromisoformat(job.created_at)
-                except ValueError:
-                    created_at = None
-
-            results.append(
-                JobStatus(
-                    pk=job.id,
-                    uuid=str(job.id),  # SQLite doesn't have UUID
-                    name=job.name,
-                    state=_STATUS_MAP.get(job.status, JobState.CREATED),
-                    dft_code=DftCode(job.dft_code) if job.dft_code else DftCode.CRYSTAL,
-                    runner_type=(
-                        RunnerType(job.runner_type) if job.runner_type else RunnerType.LOCAL
-                    ),
-                    workflow_id=job.workflow_id,
-                    progress_percent=100.0 if job.status == "COMPLETED" else 0.0,
-                    created_at=created_at,
-                )
+    def get_job_changes(self, since_seq: int = 0, limit: int = 1000) -> JobChanges:
+        """Read the trigger-maintained change feed after ``since_seq``."""
+        if not self._db:
+            return JobChanges(seq=0, reset=True)
+
+        jobs, deleted, seq, has_more = self._db.get_job_changes(since_seq, limit)
+        if seq < since_seq:
+            # Caller's sequence comes from another database: resend from scratch.
+            jobs, deleted, seq, has_more = self._db.get_job_changes(0, limit)
+            return JobChanges(
+                seq=seq,
+                jobs=[self._to_job_status(job) for job in jobs],
+                has_more=has_more,
+                reset=True,
             )
 
-        return results
+        return JobChanges(
+            seq=seq,
+            jobs=[self._to_job_status(job) for job in jobs],
+            deleted=deleted,
+            has_more=has_more,
+        )
+
+    @staticmethod
+    def _to_job_status(job: Any) -> JobStatus:
+        """Convert a database Job row into a JobStatus."""
+        created_at = None
+        if job.created_at:
+            try:
+                created_at = datetime.fromisoformat(job.created_at)
+            except ValueError:
+                created_at = None
+
+        return JobStatus(
+            pk=job.id,
+            uuid=str(job.id),  # SQLite doesn't have UUID
+            name=job.name,
+            state=_STATUS_MAP.get(job.status, JobState.CREATED),
+            dft_code=DftCode(job.dft_code) if job.dft_code else DftCode.CRYSTAL,
+            runner_type=(RunnerType(job.runner_type) if job.runner_type else RunnerType.LOCAL),
+            workflow_id=job.workflow_id,
+            progress_percent=100.0 if job.status == "COMPLETED" else 0.0,
+            created_at=created_at,
+        )
 
     def get_job_details(self, pk: int) -> JobDetails | None:
         """Get job details from SQLite."""
@@ -263,37 +317,47 @@ class SQLiteBackend(Backend):
         except Exception:
             return False
 
-    def get_job_log(self, pk: int, tail_lines: int = 100) -> dict[str, list[str]]:
-        """Get job log from work directory."""
+    def get_job_log(
+        self,
+        pk: int,
+        tail_lines: int = 100,
+        offsets: dict[str, int] | None = None,
+    ) -> dict[str, Any]:
+        """Get job log from work directory.
+
+        Reads backwards from the end of each file instead of loading it, and
+        returns resume ``offsets``; passing them back yields only new lines.
+        """
+        empty: dict[str, Any] = {"stdout": [], "stderr": []}
         if not self._db:
-            return {"stdout": [], "stderr": []}
+            return empty
 
         try:
             job = self._db.get_job(pk)
             if not job or not job.work_dir:
-                return {"stdout": [], "stderr": []}
+                return empty
 
             work_dir = Path(job.work_dir)
-            stdout_lines: list[str] = []
-            stderr_lines: list[str] = []
-
-            # Try common output file names
-            for stdout_name in ["stdout.log", "output.out", f"{job.name}.out"]:
-                stdout_path = work_dir / stdout_name
-                if stdout_path.exists():
-                    lines = stdout_path.read_text().splitlines()
-                    stdout_lines = lines[-tail_lines:]
-                    break
-
-            for stderr_name in ["stderr.log", "error.err"]:
-                stderr_path = work_dir / stderr_name
-                if stderr_path.exists():
-                    lines = stderr_path.read_text().splitlines()
-                    stderr_lines = lines[-tail_lines:]
-                    break
-
-            return {"stdout": stdout_lines, "stderr": stderr_lines}
+            result: dict[str, Any] = {"stdout": [], "stderr": [], "offsets": {}, "reset": {}}
+
+            for stream, names in (("stdout", STDOUT_LOG_NAMES), ("stderr", STDERR_LOG_NAMES)):
+                for log_name in names:
+                    log_path = work_dir / log_name.format(name=job.name)
+                    if log_path.exists():
+                        offset = (offsets or {}).get(stream)
+                        if offset is not None:
+                            tail = read_after(log_path, offset)
+                        elif tail_lines > 0:
+                            tail = tail_file(log_path, tail_lines)
+                        else:
+                            tail = read_after(log_path, 0)
+                        result[stream] = tail.lines
+                        result["offsets"][stream] = tail.offset
+                        result["reset"][stream] = tail.reset
+                        break
+
+            return result
 
         except Exception as e:
             logger.error(f"Error getting job log for pk={pk}: {e}")
-            return {"stdout": [], "stderr": []}
+            return empty
@@ -0,0 +1,196 @@
+"""Incremental pattern scanning of growing log files.
+
+Error analysis used to read a whole OUTCAR and test every pattern against
+every line on each poll. :class:`LineScanner` instead:
+
+* searches raw bytes chunk by chunk, one regex search per pattern rather than
+  per pattern per line, and drops a pattern as soon as it has matched;
+* runs case-insensitive patterns case-folded over ``bytes.lower()`` of the
+  chunk, which keeps CPython's literal-prefix fast search (``re.IGNORECASE``
+  and alternations of several patterns both disable it);
+* remembers, per file, the byte offset of the last complete line scanned and
+  the hits found so far, so a repeated call only scans appended bytes;
+* returns the previous result untouched while the file's (size, mtime) is
+  unchanged.
+
+A file that shrinks or is replaced (different inode) is rescanned from the
+start. A trailing line without a newline is scanned on every call but not
+committed, so it is picked up again once the writer finishes it.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import BinaryIO
+
+__all__ = ["LineScanner", "ScanHit"]
+
+# Bytes read per step when catching up on new content
+CHUNK_SIZE = 8 * 1024 * 1024
+# Files whose scan state is kept (least recently used are evicted)
+MAX_TRACKED_FILES = 64
+
+
+@dataclass(frozen=True)
+class ScanHit:
+    """First line matching one pattern.
+
+    Attributes:
+        index: Position of the pattern in the scanner's pattern list.
+        line: The matching line, decoded and stripped.
+    """
+
+    index: int
+    line: str
+
+
+@dataclass
+class _FileState:
+    inode: int
+    offset: int = 0
+    hits: list[ScanHit] = field(default_factory=list)
+    # (size, mtime_ns) the cached result below was computed for
+    stamp: tuple[int, int] | None = None
+    result: list[ScanHit] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class LineScanner:
+    """Finds the first line matching each of a list of patterns in a file.
+
+    Lines are tested against the patterns in order and the first matching
+    pattern wins, so a line is attributed to at most one pattern. Each
+    pattern is reported once, for its first occurrence; hits are returned in
+    file order.
+
+    Thread-safe: handlers call :meth:`scan` from worker threads.
+
+    Args:
+        patterns: Regex sources (``str``) or compiled ``str`` patterns. They
+            are matched against single lines, so must not span newlines.
+        flags: Extra ``re`` flags applied to every pattern (compiled patterns
+            also keep their own flags).
+        max_files: Number of files whose scan state is kept.
+    """
+
+    def __init__(
+        self,
+        patterns: Sequence[str | re.Pattern[str]],
+        flags: int = 0,
+        max_files: int = MAX_TRACKED_FILES,
+    ) -> None:
+        # Exact patterns decide which one a line belongs to; finders locate
+        # candidate lines, case-folded where the pattern ignores case.
+        self._patterns: list[re.Pattern[bytes]] = []
+        self._finders: list[tuple[re.Pattern[bytes], bool]] = []
+        for pattern in patterns:
+            if isinstance(pattern, re.Pattern):
+                source, pattern_flags = pattern.pattern, pattern.flags & ~re.UNICODE
+            else:
+                source, pattern_flags = pattern, 0
+            pattern_flags |= flags
+            exact = re.compile(source.encode(), pattern_flags)
+            self._patterns.append(exact)
+            if pattern_flags & re.IGNORECASE:
+                folded = _fold_case(source).encode()
+                finder = re.compile(folded, (pattern_flags & ~re.IGNORECASE) | re.MULTILINE)
+                self._finders.append((finder, True))
+            else:
+                self._finders.append(
+                    (re.compile(exact.pattern, pattern_flags | re.MULTILINE), False)
+                )
+
+        self._max_files = max_files
+        self._files: OrderedDict[str, _FileState] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def scan(self, path: str | os.PathLike[str]) -> list[ScanHit]:
+        """Return the hits for ``path``, scanning only bytes not seen before."""
+        key = os.path.abspath(path)
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            stamp = (st.st_size, st.st_mtime_ns)
+
+            with self._lock:
+                state = self._files.get(key)
+                if state is None or state.inode != st.st_ino or st.st_size < state.offset:
+                    # New, replaced or truncated file: start over.
+                    state = self._files[key] = _FileState(inode=st.st_ino)
+                self._files.move_to_end(key)
+                while len(self._files) > self._max_files:
+                    self._files.popitem(last=False)
+
+            # Per-file lock: a long first scan does not block other files.
+            with state.lock:
+                if state.stamp != stamp:
+                    self._advance(f, state)
+                    state.stamp = stamp
+                return list(state.result)
+
+    def forget(self, path: str | os.PathLike[str]) -> None:
+        """Drop the cached state for ``path``."""
+        with self._lock:
+            self._files.pop(os.path.abspath(path), None)
+
+    def _advance(self, f: BinaryIO, state: _FileState) -> None:
+        found = {hit.index for hit in state.hits}
+        f.seek(state.offset)
+        carry = b""
+        while chunk := f.read(CHUNK_SIZE):
+            data = carry + chunk
+            cut = data.rfind(b"\n") + 1
+            if cut and len(found) < len(self._patterns):
+                state.hits.extend(self._search(data[:cut], found))
+            state.offset += cut
+            carry = data[cut:]
+
+        # The unterminated last line is reported but rescanned next time.
+        pending = self._search(carry, set(found)) if carry else []
+        state.result = state.hits + pending
+
+    def _search(self, data: bytes, found: set[int]) -> list[ScanHit]:
+        lowered: bytes | None = None
+        candidates: list[tuple[int, int, bytes]] = []
+        for index, (finder, folded) in enumerate(self._finders):
+            if index in found:
+                continue
+            if folded:
+                if lowered is None:
+                    lowered = data.lower()
+                text = lowered
+            else:
+                text = data
+            pos = 0
+            while match := finder.search(text, pos):
+                start = data.rfind(b"\n", 0, match.start()) + 1
+                end = data.find(b"\n", match.end())
+                if end < 0:
+                    end = len(data)
+                line = data[start:end]
+                # A line belongs to the first pattern (in list order) it matches.
+                if not any(p.search(line) for p in self._patterns[:index]):
+                    candidates.append((start, index, line))
+                    break
+                pos = end + 1
+
+        candidates.sort()
+        found.update(index for _, index, _ in candidates)
+        return [
+            ScanHit(index, line.decode("utf-8", errors="replace").strip())
+            for _, index, line in candidates
+        ]
+
+
+def _fold_case(source: str) -> str:
+    """Lowercase a regex source, leaving escape sequences (``\\S``, ``\\W``) intact."""
+    out = []
+    escaped = False
+    for char in source:
+        out.append(char if escaped else char.lower())
+        escaped = not escaped and char == "\\"
+    return "".join(out)
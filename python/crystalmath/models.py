@@ -214,6 +214,25 @@ class JobStatus(BaseModel):
         return map_to_job_state(v)
 
 
+class JobChanges(BaseModel):
+    """
+    Incremental job-list delta since a change sequence number.
+
+    Lets pollers fetch only jobs that changed instead of the full list.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    seq: int = Field(..., ge=0, description="Sequence to pass as since_seq on the next call")
+    jobs: list[JobStatus] = Field(default_factory=list, description="Inserted or updated jobs")
+    deleted: list[int] = Field(default_factory=list, description="Primary keys of deleted jobs")
+    has_more: bool = Field(default=False, description="More changes remain after seq")
+    reset: bool = Field(
+        default=False,
+        description="True if this is a full snapshot and the client must discard its list",
+    )
+
+
 class JobDetails(BaseModel):
     """
     Full job details for the Results view.
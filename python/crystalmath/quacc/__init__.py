@@ -34,7 +34,7 @@ from crystalmath.quacc.engines import (
 from crystalmath.quacc.mock_runner import MockRunner
 from crystalmath.quacc.potcar import get_potcar_info, get_potcar_path, validate_potcars
 from crystalmath.quacc.runner import JobRunner, JobState, get_or_create_runner, get_runner
-from crystalmath.quacc.store import JobMetadata, JobStatus, JobStore
+from crystalmath.quacc.store import JobMetadata, JobStatus, JobStore, migrate_json_store
 
 __all__ = [
     # Discovery
@@ -50,6 +50,7 @@ __all__ = [
     "JobStatus",
     "JobMetadata",
     "JobStore",
+    "migrate_json_store",
     # Runner
     "JobRunner",
     "JobState",
@@ -3,10 +3,19 @@ Job metadata storage for quacc workflows.
 
 This module provides tracking of job metadata and status for
 quacc-based workflow execution.
+
+Jobs are stored in a SQLite database (WAL mode) indexed by id, status and
+created_at, so listing and upserting stay cheap as the job count grows and
+several processes can write concurrently. The legacy ``jobs.json`` file is
+imported once by :func:`migrate_json_store`.
 """
 
 import json
 import logging
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -51,12 +60,135 @@ class JobMetadata(BaseModel):
     model_config = {"extra": "forbid"}
 
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quacc_jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL DEFAULT '',
+    updated_at TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_quacc_jobs_status_created
+    ON quacc_jobs(status, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_quacc_jobs_created
+    ON quacc_jobs(created_at DESC);
+"""
+
+# Upsert that never lets an older record overwrite a newer one, so replaying a
+# stale legacy file (or a late writer) cannot roll a job's status backwards.
+_UPSERT_SQL = """
+INSERT INTO quacc_jobs (id, status, created_at, updated_at, data)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    status = excluded.status,
+    created_at = excluded.created_at,
+    updated_at = excluded.updated_at,
+    data = excluded.data
+WHERE excluded.updated_at >= quacc_jobs.updated_at
+"""
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    """Open a store connection configured for concurrent multi-process access."""
+    conn = sqlite3.connect(
+        str(db_path),
+        timeout=30.0,
+        isolation_level=None,  # explicit transactions only
+        check_same_thread=False,
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA busy_timeout=10000")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _row_values(job_dict: dict[str, Any]) -> tuple[str, str, str, str, str]:
+    """Build the indexed column values for a serialized job dict."""
+    return (
+        str(job_dict["id"]),
+        str(job_dict.get("status", "")),
+        str(job_dict.get("created_at") or ""),
+        str(job_dict.get("updated_at") or ""),
+        json.dumps(job_dict, default=str),
+    )
+
+
+def _load_legacy_jobs(json_path: Path) -> list[dict[str, Any]]:
+    """Read job dicts from a legacy JSON store file."""
+    try:
+        with open(json_path) as f:
+            data = json.load(f)
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse legacy job store {json_path}: {e}")
+        return []
+    except OSError as e:
+        logger.error(f"Failed to read legacy job store {json_path}: {e}")
+        return []
+
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict) and "jobs" in data:
+        return data["jobs"]
+    logger.warning(f"Unexpected job store format in {json_path}")
+    return []
+
+
+def migrate_json_store(json_path: Path, db_path: Path) -> int:
+    """
+    Import a legacy ``jobs.json`` file into the SQLite job store.
+
+    The import runs in a single write transaction. On success the JSON file
+    is renamed to ``<name>.migrated`` so it is never imported twice; if
+    another process migrated it first, this is a no-op.
+
+    Args:
+        json_path: Path to the legacy JSON store file.
+        db_path: Path to the SQLite store database.
+
+    Returns:
+        Number of job rows actually written (entries the upsert guard kept
+        from overwriting newer rows are not counted).
+    """
+    if not json_path.exists():
+        return 0
+
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = _connect(db_path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Re-check under the write lock: a concurrent migrator may have won.
+            if not json_path.exists():
+                conn.execute("ROLLBACK")
+                return 0
+            rows = [
+                _row_values(job_dict)
+                for job_dict in _load_legacy_jobs(json_path)
+                if isinstance(job_dict, dict) and job_dict.get("id")
+            ]
+            before = conn.total_changes
+            conn.executemany(_UPSERT_SQL, rows)
+            imported = conn.total_changes - before
+            json_path.replace(json_path.with_name(json_path.name + ".migrated"))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        conn.close()
+
+    logger.info(f"Migrated {imported} job(s) from {json_path} to {db_path}")
+    return imported
+
+
 class JobStore:
     """
     Persistent storage for job metadata.
 
-    Stores job metadata in a JSON file, defaulting to
-    ~/.crystalmath/jobs.json.
+    Stores job metadata in a SQLite database, defaulting to
+    ~/.crystalmath/jobs.db. A legacy ``jobs.json`` next to the database is
+    imported automatically the first time the store is opened.
     """
 
     def __init__(self, store_path: Path | None = None) -> None:
@@ -64,85 +196,92 @@ class JobStore:
         Initialize the job store.
 
         Args:
-            store_path: Path to the JSON store file. Defaults to
-                ~/.crystalmath/jobs.json
+            store_path: Path to the store. Defaults to ~/.crystalmath/jobs.db.
+                A ``.json`` path is accepted for backward compatibility: the
+                database is created alongside it with a ``.db`` suffix and the
+                JSON file is migrated into it.
         """
         if store_path is None:
-            store_path = Path.home() / ".crystalmath" / "jobs.json"
+            store_path = Path.home() / ".crystalmath" / "jobs.db"
         self.store_path = store_path
+        self.db_path = store_path.with_suffix(".db")
+        self.legacy_path = store_path.with_suffix(".json")
 
         # Create parent directory if needed
         self.store_path.parent.mkdir(parents=True, exist_ok=True)
 
-    def _load_jobs(self) -> list[dict[str, Any]]:
-        """Load jobs from the store file."""
-        if not self.store_path.exists():
-            return []
+        if self.legacy_path.exists():
+            migrate_json_store(self.legacy_path, self.db_path)
 
-        try:
-            with open(self.store_path) as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    return data
-                elif isinstance(data, dict) and "jobs" in data:
-                    return data["jobs"]
-                else:
-                    logger.warning(f"Unexpected job store format in {self.store_path}")
-                    return []
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse job store: {e}")
-            return []
-        except OSError as e:
-            logger.error(f"Failed to read job store: {e}")
-            return []
-
-    def _save_jobs(self, jobs: list[dict[str, Any]]) -> None:
-        """Save jobs to the store file."""
-        try:
-            with open(self.store_path, "w") as f:
-                json.dump(jobs, f, indent=2, default=str)
-        except OSError as e:
-            logger.error(f"Failed to write job store: {e}")
-            raise
+        self._conn = _connect(self.db_path)
+        self._lock = threading.Lock()
 
-    def list_jobs(self, status: JobStatus | None = None, limit: int = 100) -> list[JobMetadata]:
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "JobStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in a write transaction serialized across processes."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    @staticmethod
+    def _parse(data: str) -> JobMetadata | None:
+        """Deserialize a stored job row into a JobMetadata."""
+        try:
+            job_dict = json.loads(data)
+            # Convert work_dir string to Path if present
+            if job_dict.get("work_dir"):
+                job_dict["work_dir"] = Path(job_dict["work_dir"])
+            return JobMetadata(**job_dict)
+        except Exception as e:
+            logger.warning(f"Skipping invalid job entry: {e}")
+            return None
+
+    def list_jobs(
+        self, status: JobStatus | None = None, limit: int | None = 100
+    ) -> list[JobMetadata]:
         """
         List jobs, optionally filtered by status.
 
         Args:
             status: Filter to only jobs with this status, or None for all.
-            limit: Maximum number of jobs to return.
+            limit: Maximum number of jobs to return, or None for all.
 
         Returns:
             List of JobMetadata objects, sorted by created_at descending.
         """
-        raw_jobs = self._load_jobs()
-
-        # Filter by status if specified
+        # SQLite treats a negative LIMIT as no limit
+        row_limit = -1 if limit is None else limit
         if status is not None:
-            raw_jobs = [j for j in raw_jobs if j.get("status") == status.value]
-
-        # Sort by created_at descending
-        raw_jobs.sort(
-            key=lambda j: j.get("created_at", ""),
-            reverse=True,
-        )
+            sql = "SELECT data FROM quacc_jobs WHERE status = ? ORDER BY created_at DESC LIMIT ?"
+            params: tuple[Any, ...] = (status.value, row_limit)
+        else:
+            sql = "SELECT data FROM quacc_jobs ORDER BY created_at DESC LIMIT ?"
+            params = (row_limit,)
 
-        # Apply limit
-        raw_jobs = raw_jobs[:limit]
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
 
-        # Parse to models
         result = []
-        for job_dict in raw_jobs:
-            try:
-                # Convert work_dir string to Path if present
-                if job_dict.get("work_dir"):
-                    job_dict["work_dir"] = Path(job_dict["work_dir"])
-                result.append(JobMetadata(**job_dict))
-            except Exception as e:
-                logger.warning(f"Skipping invalid job entry: {e}")
-                continue
-
+        for (data,) in rows:
+            job = self._parse(data)
+            if job is not None:
+                result.append(job)
         return result
 
     def get_job(self, job_id: str) -> JobMetadata | None:
@@ -155,17 +294,13 @@ class JobStore:
         Returns:
             JobMetadata if found, None otherwise.
         """
-        raw_jobs = self._load_jobs()
-        for job_dict in raw_jobs:
-            if job_dict.get("id") == job_id:
-                try:
-                    if job_dict.get("work_dir"):
-                        job_dict["work_dir"] = Path(job_dict["work_dir"])
-                    return JobMetadata(**job_dict)
-                except Exception as e:
-                    logger.error(f"Failed to parse job {job_id}: {e}")
-                    return None
-        return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM quacc_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return self._parse(row[0])
 
     def save_job(self, job: JobMetadata) -> None:
         """
@@ -177,20 +312,17 @@ class JobStore:
         Args:
             job: The job metadata to save.
         """
-        raw_jobs = self._load_jobs()
-
-        # Serialize the job
         job_dict = job.model_dump(mode="json")
-
-        # Find and update existing or append new
-        found = False
-        for i, existing in enumerate(raw_jobs):
-            if existing.get("id") == job.id:
-                raw_jobs[i] = job_dict
-                found = True
-                break
-
-        if not found:
-            raw_jobs.append(job_dict)
-
-        self._save_jobs(raw_jobs)
+        try:
+            with self._transaction() as conn:
+                conn.execute(
+                    "INSERT INTO quacc_jobs (id, status, created_at, updated_at, data) "
+                    "VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(id) DO UPDATE SET status = excluded.status, "
+                    "created_at = excluded.created_at, updated_at = excluded.updated_at, "
+                    "data = excluded.data",
+                    _row_values(job_dict),
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Failed to write job store: {e}")
+            raise
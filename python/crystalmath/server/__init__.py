@@ -15,13 +15,32 @@ Usage:
 
 Protocol:
     - Transport: Unix domain socket
-    - Framing: HTTP-style Content-Length headers (same as LSP)
+    - Framing: HTTP-style Content-Length headers (same as LSP), or CMAT binary
+      frames (see :mod:`crystalmath.server.framing`), detected per frame
     - Protocol: JSON-RPC 2.0
 
 Wire format:
     Content-Length: 47\\r\\n
     \\r\\n
     {"jsonrpc":"2.0","method":"system.ping","id":1}
+
+Concurrency:
+    Requests on one connection are handled concurrently and may be answered
+    out of order; clients match responses by ``id``. Controller calls run on
+    one of two bounded thread pools so fast local reads never queue behind
+    SSH/network-bound calls (see ``REMOTE_METHODS``). JSON-RPC batch arrays
+    are supported.
+
+Serialization:
+    Each request is parsed once. Its params go straight to the controller's
+    native ``call`` entry point. Each response is serialized once, through
+    :mod:`crystalmath.server.codec` (orjson when installed). Shutdown is
+    signalled out-of-band, so responses are never re-parsed.
+
+Subscriptions:
+    ``subscribe`` / ``unsubscribe`` register server-push topics on the calling
+    connection; events arrive as ``subscription.event`` notifications (see
+    :mod:`crystalmath.server.subscriptions`).
 """
 
 from __future__ import annotations
@@ -29,16 +48,27 @@ from __future__ import annotations
 import argparse
 import asyncio
 import contextlib
-import json
 import logging
 import os
 import signal
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from . import codec
+from .framing import (
+    HEADER_SIZE,
+    MAGIC,
+    MSG_JSON_ATTACHMENTS,
+    AttachmentCollector,
+    json_default,
+    split_payload,
+    unpack_header,
+)
 from .handlers import HANDLER_REGISTRY
+from .subscriptions import ClientConnection, SubscriptionManager
 
 __all__ = ["JsonRpcServer", "main", "get_default_socket_path"]
 
@@ -52,6 +82,37 @@ JSONRPC_INTERNAL_ERROR = -32603
 # Maximum message size (100MB, matching lsp.rs)
 MAX_MESSAGE_SIZE = 100 * 1024 * 1024
 
+# Worker pools: controller methods that block on SSH/network I/O run on their
+# own pool so cheap local calls never queue behind them.
+REMOTE_METHODS = frozenset(
+    {
+        "submit_job",
+        "cancel_job",
+        "test_cluster_connection",
+        "fetch_slurm_queue",
+        "sync_remote_jobs",
+        "adopt_slurm_job",
+        "cancel_slurm_job",
+        "search_materials",
+        "fetch_material_details",
+        "generate_d12",
+        "vasp.generate_from_mp",
+        "launch_aiida_geopt",
+        "launch_aiida_bands",
+        "ask_assistant",
+        "analyze_job_error",
+        "suggest_parameters",
+    }
+)
+DEFAULT_LOCAL_WORKERS = 8
+DEFAULT_REMOTE_WORKERS = 4
+
+# Requests a single connection may have in flight before reads pause
+MAX_INFLIGHT_PER_CONNECTION = 64
+
+# Method whose successful response, once written, stops the server
+SHUTDOWN_METHOD = "system.shutdown"
+
 # Configure logging
 logger = logging.getLogger("crystalmath.server")
 
@@ -90,18 +151,28 @@ def _jsonrpc_error(
     error: dict[str, Any] = {"code": code, "message": message}
     if data is not None:
         error["data"] = data
-    return json.dumps({"jsonrpc": "2.0", "error": error, "id": request_id})
+    return codec.dumps({"jsonrpc": "2.0", "error": error, "id": request_id})
 
 
-def _jsonrpc_result(result: Any, request_id: int | str | None) -> str:
-    """Create a JSON-RPC 2.0 success response."""
-    return json.dumps({"jsonrpc": "2.0", "result": result, "id": request_id})
+def _jsonrpc_result(
+    result: Any,
+    request_id: int | str | None,
+    collector: AttachmentCollector | None = None,
+) -> str:
+    """Create a JSON-RPC 2.0 success response.
+
+    Arrays in ``result`` become attachments when a collector is given and
+    plain JSON lists otherwise.
+    """
+    default = collector.default if collector is not None else json_default
+    return codec.dumps({"jsonrpc": "2.0", "result": result, "id": request_id}, default=default)
 
 
 class JsonRpcServer:
     """JSON-RPC 2.0 server over Unix domain socket.
 
-    Uses Content-Length framing (same as LSP protocol) for message boundaries.
+    Uses Content-Length framing (same as LSP protocol) or CMAT binary framing
+    for message boundaries, replying in whichever framing the client used.
     Delegates to CrystalController.dispatch() for most requests, with special
     handling for system.* namespace methods.
 
@@ -117,6 +188,8 @@ class JsonRpcServer:
         inactivity_timeout: int = 300,
         controller: Any | None = None,
         db_path: str | None = None,
+        local_workers: int = DEFAULT_LOCAL_WORKERS,
+        remote_workers: int = DEFAULT_REMOTE_WORKERS,
     ) -> None:
         """Initialize the server.
 
@@ -127,6 +200,8 @@ class JsonRpcServer:
             db_path: SQLite database path for the lazily-created controller. If None,
                 falls back to the CRYSTAL_TUI_DB env var, then CrystalController's own
                 default. Must resolve to the SAME .crystal_tui.db the Rust client uses.
+            local_workers: Threads for controller calls that only touch local state.
+            remote_workers: Threads for SSH/network-bound calls (``REMOTE_METHODS``).
         """
         self.socket_path = socket_path or get_default_socket_path()
         self.inactivity_timeout = inactivity_timeout
@@ -136,6 +211,13 @@ class JsonRpcServer:
         self._shutdown_event = asyncio.Event()
         self._last_activity = datetime.now(timezone.utc)
         self._active_connections = 0
+        self._subscriptions = SubscriptionManager(lambda: self.controller)
+        self._local_pool = ThreadPoolExecutor(
+            max_workers=local_workers, thread_name_prefix="rpc-local"
+        )
+        self._remote_pool = ThreadPoolExecutor(
+            max_workers=remote_workers, thread_name_prefix="rpc-remote"
+        )
 
     @property
     def controller(self) -> Any:
@@ -164,9 +246,14 @@ class JsonRpcServer:
     async def _read_content_length(
         self,
         reader: asyncio.StreamReader,
+        prefix: bytes = b"",
     ) -> int | None:
         """Read HTTP-style headers and return Content-Length.
 
+        Args:
+            reader: Stream positioned at (or, with ``prefix``, inside) the headers.
+            prefix: Header bytes already consumed while sniffing the framing.
+
         Returns:
             Content-Length value, or None if client disconnected.
 
@@ -174,12 +261,17 @@ class JsonRpcServer:
             ValueError: If Content-Length is missing or invalid.
         """
         content_length: int | None = None
+        pending = prefix
 
         while True:
-            try:
-                line = await reader.readline()
-            except asyncio.IncompleteReadError:
-                return None
+            if b"\n" in pending:
+                line, _, pending = pending.partition(b"\n")
+            else:
+                try:
+                    line = pending + await reader.readline()
+                except asyncio.IncompleteReadError:
+                    return None
+                pending = b""
 
             if not line:
                 # EOF - client disconnected
@@ -211,14 +303,113 @@ class JsonRpcServer:
 
         return content_length
 
-    async def _dispatch(self, request_json: str) -> str:
-        """Dispatch a JSON-RPC request to the appropriate handler.
+    async def _read_frame(
+        self,
+        reader: asyncio.StreamReader,
+    ) -> tuple[bytes, int | None] | None:
+        """Read one request frame in whichever framing the client used.
 
-        For system.* methods, uses HANDLER_REGISTRY directly.
-        For other methods, delegates to CrystalController.dispatch().
+        Returns:
+            (payload, msg_type) where msg_type is None for Content-Length
+            frames, or None if the client disconnected.
+
+        Raises:
+            ValueError: If the frame header is missing or invalid.
+        """
+        try:
+            # Sniffing is safe to time out: readexactly consumes nothing until
+            # all bytes are available.
+            first = await asyncio.wait_for(reader.readexactly(len(MAGIC)), timeout=60.0)
+        except asyncio.IncompleteReadError:
+            return None
+
+        if first == MAGIC:
+            header = first + await reader.readexactly(HEADER_SIZE - len(MAGIC))
+            payload_len, msg_type = unpack_header(header)
+            if payload_len > MAX_MESSAGE_SIZE:
+                raise ValueError(f"Message too large: {payload_len} bytes (max {MAX_MESSAGE_SIZE})")
+            return await reader.readexactly(payload_len), msg_type
+
+        content_length = await self._read_content_length(reader, first)
+        if content_length is None:
+            return None
+        return await reader.readexactly(content_length), None
+
+    async def _dispatch(
+        self,
+        request_json: str,
+        connection: ClientConnection | None = None,
+        collector: AttachmentCollector | None = None,
+        actions: set[str] | None = None,
+    ) -> str | None:
+        """Dispatch a JSON-RPC request or batch to the appropriate handlers.
 
         Args:
-            request_json: JSON-RPC 2.0 request string.
+            request_json: JSON-RPC 2.0 request (or batch array) string.
+            connection: Client connection the request arrived on (needed for
+                subscriptions, which push notifications back on it).
+            collector: Gathers result arrays as binary attachments when the
+                client negotiated them.
+            actions: Collects server actions (e.g. ``"shutdown"``) to run
+                once the response has been written.
+
+        Returns:
+            JSON-RPC 2.0 response string, or None for a notification (no id)
+            or a batch made up entirely of notifications.
+        """
+        try:
+            request = codec.loads(request_json)
+        except codec.JSONDecodeError as e:
+            return _jsonrpc_error(JSONRPC_PARSE_ERROR, f"Parse error: {e}")
+
+        if isinstance(request, list):
+            return await self._dispatch_batch(request, connection, collector, actions)
+        response = await self._dispatch_request(request, connection, collector, actions)
+        if isinstance(request, dict) and "id" not in request:
+            return None
+        return response
+
+    async def _dispatch_batch(
+        self,
+        requests: list[Any],
+        connection: ClientConnection | None,
+        collector: AttachmentCollector | None = None,
+        actions: set[str] | None = None,
+    ) -> str | None:
+        """Dispatch a batch concurrently; notifications (no id) get no response."""
+        if not requests:
+            return _jsonrpc_error(JSONRPC_INVALID_REQUEST, "Invalid Request: empty batch")
+
+        responses = await asyncio.gather(
+            *(self._dispatch_request(r, connection, collector, actions) for r in requests)
+        )
+        kept = [
+            response
+            for request, response in zip(requests, responses, strict=True)
+            if not isinstance(request, dict) or "id" in request
+        ]
+        if not kept:
+            return None
+        return "[" + ",".join(kept) + "]"
+
+    def _executor_for(self, method_name: str) -> ThreadPoolExecutor:
+        """Pick the worker pool for a controller method."""
+        return self._remote_pool if method_name in REMOTE_METHODS else self._local_pool
+
+    async def _dispatch_request(
+        self,
+        request: Any,
+        connection: ClientConnection | None,
+        collector: AttachmentCollector | None = None,
+        actions: set[str] | None = None,
+    ) -> str:
+        """Dispatch one parsed JSON-RPC request.
+
+        For subscribe/unsubscribe, registers topics on the calling connection.
+        For system.* methods, uses HANDLER_REGISTRY directly.
+        For other methods, hands the parsed params to CrystalController.call()
+        on the worker pool for the method's class. Controllers that only
+        implement dispatch() get the request re-encoded.
 
         Returns:
             JSON-RPC 2.0 response string.
@@ -226,11 +417,10 @@ class JsonRpcServer:
         request_id: int | str | None = None
 
         try:
-            # Parse request
-            try:
-                request = json.loads(request_json)
-            except json.JSONDecodeError as e:
-                return _jsonrpc_error(JSONRPC_PARSE_ERROR, f"Parse error: {e}")
+            if not isinstance(request, dict):
+                return _jsonrpc_error(
+                    JSONRPC_INVALID_REQUEST, "Invalid Request: expected an object"
+                )
 
             request_id = request.get("id")
 
@@ -251,26 +441,42 @@ class JsonRpcServer:
                     request_id=request_id,
                 )
 
-            params = request.get("params", {})
-            if not isinstance(params, dict):
-                params = {}
+            raw_params = request.get("params", {})
+            params = raw_params if isinstance(raw_params, dict) else {}
+
+            # Subscriptions are bound to the connection, not the controller
+            if method_name in ("subscribe", "unsubscribe"):
+                return await self._dispatch_subscription(
+                    method_name, params, connection, request_id
+                )
 
             # Check for system.* handlers first
             if method_name in HANDLER_REGISTRY:
                 handler = HANDLER_REGISTRY[method_name]
                 result = await handler(self.controller, params)
-                return _jsonrpc_result(result, request_id)
-
-            # Delegate to CrystalController.dispatch() for other methods
-            if self.controller is not None:
-                # CrystalController.dispatch() is synchronous, run in executor
-                loop = asyncio.get_event_loop()
-                response_json = await loop.run_in_executor(
-                    None,
-                    self.controller.dispatch,
-                    request_json,
-                )
-                return response_json
+                if method_name == SHUTDOWN_METHOD and actions is not None:
+                    actions.add("shutdown")
+                return _jsonrpc_result(result, request_id, collector)
+
+            # Delegate to the controller for other methods
+            controller = self.controller
+            if controller is not None:
+                # Controller calls are synchronous, run in executor
+                loop = asyncio.get_running_loop()
+                executor = self._executor_for(method_name)
+                call = getattr(controller, "call", None)
+                if call is None:
+                    return await loop.run_in_executor(
+                        executor, controller.dispatch, codec.dumps(request)
+                    )
+
+                from crystalmath.api import JsonRpcError
+
+                try:
+                    result = await loop.run_in_executor(executor, call, method_name, raw_params)
+                except JsonRpcError as e:
+                    return _jsonrpc_error(e.code, e.message, request_id=request_id, data=e.data)
+                return _jsonrpc_result(result, request_id, collector)
 
             # No controller available
             return _jsonrpc_error(
@@ -287,6 +493,38 @@ class JsonRpcServer:
                 request_id=request_id,
             )
 
+    async def _dispatch_subscription(
+        self,
+        method_name: str,
+        params: dict[str, Any],
+        connection: ClientConnection | None,
+        request_id: int | str | None,
+    ) -> str:
+        """Handle subscribe/unsubscribe for the calling connection."""
+        if connection is None:
+            return _jsonrpc_error(
+                JSONRPC_INVALID_REQUEST,
+                f"{method_name} requires a persistent connection",
+                request_id=request_id,
+            )
+
+        if method_name == "subscribe":
+            try:
+                result = await self._subscriptions.subscribe(connection, params)
+            except ValueError as e:
+                return _jsonrpc_error(JSONRPC_INVALID_PARAMS, str(e), request_id=request_id)
+            return _jsonrpc_result(result, request_id)
+
+        sub_id = params.get("subscription")
+        if not isinstance(sub_id, str):
+            return _jsonrpc_error(
+                JSONRPC_INVALID_PARAMS,
+                "unsubscribe requires a 'subscription' id",
+                request_id=request_id,
+            )
+        removed = await self._subscriptions.unsubscribe(connection, sub_id)
+        return _jsonrpc_result({"unsubscribed": removed}, request_id)
+
     async def _handle_client(
         self,
         reader: asyncio.StreamReader,
@@ -300,18 +538,25 @@ class JsonRpcServer:
         peer = writer.get_extra_info("peername") or "unknown"
         logger.debug(f"Client connected: {peer}")
         self._active_connections += 1
+        connection = ClientConnection(writer)
+        inflight: set[asyncio.Task] = set()
+        slots = asyncio.Semaphore(MAX_INFLIGHT_PER_CONNECTION)
+        # On a clean EOF the client may only have half-closed its end, so
+        # requests already read still get their responses.
+        drain = False
+
+        def _finished(task: asyncio.Task) -> None:
+            inflight.discard(task)
+            slots.release()
 
         try:
             while not self._shutdown_event.is_set():
                 # Update activity timestamp
                 self._last_activity = datetime.now(timezone.utc)
 
-                # Read Content-Length header
+                # Read one frame (Content-Length or CMAT)
                 try:
-                    content_length = await asyncio.wait_for(
-                        self._read_content_length(reader),
-                        timeout=60.0,  # 60s timeout for header read
-                    )
+                    frame = await self._read_frame(reader)
                 except asyncio.TimeoutError:
                     # Keep connection alive, just no data yet
                     continue
@@ -322,45 +567,45 @@ class JsonRpcServer:
                         JSONRPC_PARSE_ERROR,
                         str(e),
                     )
-                    await self._write_response(writer, error_response)
+                    await connection.send(error_response)
                     continue
 
-                if content_length is None:
-                    # Client disconnected
+                except asyncio.IncompleteReadError:
+                    logger.debug("Client disconnected mid-message")
+                    drain = True
+                    break
+
+                if frame is None:
+                    # Client disconnected (or half-closed its write side)
+                    drain = True
                     break
 
-                # Read message body
+                body, msg_type = frame
+                collector = None
                 try:
-                    body = await reader.readexactly(content_length)
+                    if msg_type is not None:
+                        connection.binary = True
+                    if msg_type == MSG_JSON_ATTACHMENTS:
+                        # Client can decode attachments; request blob is unused.
+                        body, _ = split_payload(body)
+                        collector = AttachmentCollector()
                     request_json = body.decode("utf-8")
-                except asyncio.IncompleteReadError:
-                    logger.debug("Client disconnected mid-message")
-                    break
-                except UnicodeDecodeError as e:
-                    logger.warning(f"Invalid UTF-8: {e}")
+                except (UnicodeDecodeError, ValueError) as e:
+                    logger.warning(f"Invalid frame payload: {e}")
                     error_response = _jsonrpc_error(
                         JSONRPC_PARSE_ERROR,
-                        f"Invalid UTF-8: {e}",
+                        f"Invalid frame payload: {e}",
                     )
-                    await self._write_response(writer, error_response)
+                    await connection.send(error_response)
                     continue
 
-                # Dispatch and respond
+                # Dispatch concurrently so a slow call does not block the next
+                # frame; responses are matched to requests by id.
                 logger.debug(f"Request: {request_json[:200]}...")
-                response_json = await self._dispatch(request_json)
-                logger.debug(f"Response: {response_json[:200]}...")
-
-                await self._write_response(writer, response_json)
-
-                # Check for shutdown request
-                try:
-                    response = json.loads(response_json)
-                    result = response.get("result", {})
-                    if isinstance(result, dict) and result.get("action") == "shutdown":
-                        logger.info("Shutdown requested via RPC")
-                        self._shutdown_event.set()
-                except json.JSONDecodeError:
-                    pass
+                await slots.acquire()
+                task = asyncio.create_task(self._respond(request_json, connection, collector))
+                inflight.add(task)
+                task.add_done_callback(_finished)
 
         except ConnectionResetError:
             logger.debug(f"Client {peer} reset connection")
@@ -368,22 +613,43 @@ class JsonRpcServer:
             logger.exception(f"Client handler error: {e}")
         finally:
             self._active_connections -= 1
+            if not drain or self._shutdown_event.is_set():
+                for task in list(inflight):
+                    task.cancel()
+            await asyncio.gather(*inflight, return_exceptions=True)
+            await self._subscriptions.close_connection(connection)
             writer.close()
             with contextlib.suppress(Exception):
                 await writer.wait_closed()
             logger.debug(f"Client disconnected: {peer}")
 
-    async def _write_response(
+    async def _respond(
         self,
-        writer: asyncio.StreamWriter,
-        response_json: str,
+        request_json: str,
+        connection: ClientConnection,
+        collector: AttachmentCollector | None = None,
     ) -> None:
-        """Write a JSON-RPC response with Content-Length framing."""
-        response_bytes = response_json.encode("utf-8")
-        header = f"Content-Length: {len(response_bytes)}\r\n\r\n"
-        writer.write(header.encode("utf-8"))
-        writer.write(response_bytes)
-        await writer.drain()
+        """Dispatch one frame, write its response, then run any server actions."""
+        actions: set[str] = set()
+        response_json = await self._dispatch(request_json, connection, collector, actions)
+        if response_json is None:
+            return
+        logger.debug(f"Response: {response_json[:200]}...")
+
+        try:
+            if collector:
+                await connection.send_frame(
+                    collector.encode_payload(response_json), MSG_JSON_ATTACHMENTS
+                )
+            else:
+                await connection.send(response_json)
+        except (ConnectionError, RuntimeError) as e:
+            logger.debug(f"Failed to send response: {e}")
+            return
+
+        if "shutdown" in actions:
+            logger.info("Shutdown requested via RPC")
+            self._shutdown_event.set()
 
     async def _inactivity_monitor(self) -> None:
         """Monitor for inactivity and trigger shutdown if timeout exceeded."""
@@ -460,6 +726,9 @@ class JsonRpcServer:
             inactivity_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await inactivity_task
+            await self._subscriptions.close()
+            self._local_pool.shutdown(wait=False, cancel_futures=True)
+            self._remote_pool.shutdown(wait=False, cancel_futures=True)
 
             # Clean up socket file
             if self.socket_path.exists():
@@ -517,6 +786,20 @@ def main() -> int:
         metavar="PATH",
         help="SQLite database path (default: $CRYSTAL_TUI_DB or controller default)",
     )
+    parser.add_argument(
+        "--local-workers",
+        type=int,
+        default=DEFAULT_LOCAL_WORKERS,
+        metavar="N",
+        help=f"Threads for local controller calls (default: {DEFAULT_LOCAL_WORKERS})",
+    )
+    parser.add_argument(
+        "--remote-workers",
+        type=int,
+        default=DEFAULT_REMOTE_WORKERS,
+        metavar="N",
+        help=f"Threads for SSH/network-bound calls (default: {DEFAULT_REMOTE_WORKERS})",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -533,6 +816,8 @@ def main() -> int:
         socket_path=args.socket,
         inactivity_timeout=args.timeout,
         db_path=args.db_path,
+        local_workers=args.local_workers,
+        remote_workers=args.remote_workers,
     )
 
     # Set up signal handlers
@@ -71,13 +71,13 @@ async def handle_system_shutdown(
     """Request graceful server shutdown.
 
     The server will stop accepting new connections and exit after
-    responding to this request.
+    responding to this request. The server recognises the method itself,
+    so the response does not need to carry any shutdown marker.
 
     Returns:
         {"acknowledged": True}
     """
-    # The server checks for this response and initiates shutdown
-    return {"acknowledged": True, "action": "shutdown"}
+    return {"acknowledged": True}
 
 
 @register_handler("system.version")
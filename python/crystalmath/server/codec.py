@@ -0,0 +1,82 @@
+"""JSON encoding for the IPC boundary.
+
+Each request is parsed once and each response serialized once. The encoder
+here does that work. It uses ``orjson`` when it is installed
+(``pip install crystalmath[ipc]``) and the standard library otherwise. Both
+produce the same wire format. orjson writes NaN and infinities as ``null``,
+so the standard library path does the same instead of emitting the
+non-JSON ``NaN``/``Infinity`` tokens.
+
+``dumps`` takes the same ``default`` hooks as ``json.dumps``. That covers
+:func:`crystalmath.server.framing.json_default` and
+:meth:`AttachmentCollector.default`, so numpy arrays still become lists or
+attachments.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+    HAS_ORJSON = False
+
+__all__ = ["HAS_ORJSON", "JSONDecodeError", "dumps", "loads"]
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except covers both
+JSONDecodeError = json.JSONDecodeError
+
+# Integer dict keys (e.g. per-k-point maps) are legal for json.dumps
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if HAS_ORJSON else 0
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse one JSON document.
+
+    Raises:
+        JSONDecodeError: If ``data`` is not valid JSON.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, default: Callable[[Any], Any] | None = None) -> str:
+    """Serialize ``obj`` to a JSON string.
+
+    If orjson cannot encode a value, the standard library encoder is used
+    instead. This happens, for example, with integers wider than 64 bits.
+    An :class:`AttachmentCollector` may then hold a few unused blobs. The
+    payload stays valid because attachment offsets are absolute.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS).decode("utf-8")
+        except TypeError:
+            pass
+    try:
+        return json.dumps(obj, default=default, allow_nan=False)
+    except ValueError:
+        pass
+    # Only payloads holding non-finite floats get here; those are rewritten,
+    # including anything ``default`` returns.
+    finite_default = None if default is None else (lambda o: _finite(default(o)))
+    return json.dumps(_finite(obj), default=finite_default, allow_nan=False)
+
+
+def _finite(obj: Any) -> Any:
+    """Copy ``obj`` with NaN and infinities replaced by None, as orjson writes them."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
@@ -1,5 +1,162 @@
+"""Binary CMAT framing shared with ``src/ipc/framing.rs``.
+
+Every CMAT frame is a 10-byte big-endian header followed by the payload:
+
+    b"CMAT" | u32 payload length | u16 message type | payload
+
+Message types:
+    MSG_JSON (1)              Payload is a UTF-8 JSON-RPC message.
+    MSG_JSON_ATTACHMENTS (2)  Payload is ``u32 json length | JSON | blob``. Bulk
+                              arrays are moved out of the JSON into the blob as
+                              raw little-endian bytes and referenced in place by
+                              ``{"$attachment": i, "dtype": "<f8", "shape": [...],
+                              "offset": o, "nbytes": n}`` (offset into the blob).
+
+Requests use the same layouts (a MSG_JSON_ATTACHMENTS request carries an
+empty blob). Sending a request as MSG_JSON_ATTACHMENTS declares the client can
+decode attachments; the server only replies with them in that case. Text
+clients (Content-Length framing) keep receiving plain JSON with arrays as lists.
+"""
+
+from __future__ import annotations
+
 import json
 import struct
+from typing import Any
+
+MAGIC = b"CMAT"
+HEADER_FORMAT = "!4sIH"  # Magic, Payload Len, Msg Type
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+MSG_JSON = 1
+MSG_JSON_ATTACHMENTS = 2
+
+ATTACHMENT_KEY = "$attachment"
+
+# Array dtypes sent as raw attachments (everything else falls back to lists)
+_ATTACHMENT_DTYPES = frozenset({"f4", "f8", "i4", "i8", "u1"})
+# Blob offsets are padded so receivers can view arrays in place without copying
+_ALIGNMENT = 8
+
+
+def pack_header(payload_len: int, msg_type: int = MSG_JSON) -> bytes:
+    """Build the 10-byte CMAT header for a payload."""
+    return struct.pack(HEADER_FORMAT, MAGIC, payload_len, msg_type)
+
+
+def pack_frame(payload: bytes, msg_type: int = MSG_JSON) -> bytes:
+    """Prefix a payload with the CMAT header."""
+    return pack_header(len(payload), msg_type) + payload
+
+
+def unpack_header(header: bytes) -> tuple[int, int]:
+    """Parse a CMAT header into (payload_len, msg_type).
+
+    Raises:
+        ValueError: If the magic bytes do not match.
+    """
+    magic, payload_len, msg_type = struct.unpack(HEADER_FORMAT, header)
+    if magic != MAGIC:
+        raise ValueError("Invalid CMAT magic header")
+    return payload_len, msg_type
+
+
+def json_default(obj: Any) -> Any:
+    """``json.dumps`` fallback that renders numpy values as plain JSON."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class AttachmentCollector:
+    """``json.dumps`` default hook that moves arrays into a binary blob.
+
+    Usage:
+        collector = AttachmentCollector()
+        text = json.dumps(message, default=collector.default)
+        payload = collector.encode_payload(text)
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._size = 0
+        self._count = 0
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def default(self, obj: Any) -> Any:
+        if isinstance(obj, (bytes, bytearray, memoryview)):
+            return self._attach(bytes(obj), "u1", [len(obj)])
+
+        dtype = getattr(obj, "dtype", None)
+        shape = getattr(obj, "shape", None)
+        if dtype is None or shape is None or shape == ():
+            return json_default(obj)
+        code = f"{dtype.kind}{dtype.itemsize}"
+        if code not in _ATTACHMENT_DTYPES:
+            return json_default(obj)
+        if dtype.byteorder == ">":
+            obj = obj.astype(dtype.newbyteorder("<"))
+        return self._attach(obj.tobytes(order="C"), code, list(shape))
+
+    def _attach(self, data: bytes, code: str, shape: list[int]) -> dict[str, Any]:
+        dtype = "|u1" if code == "u1" else f"<{code}"
+        ref = {
+            ATTACHMENT_KEY: self._count,
+            "dtype": dtype,
+            "shape": shape,
+            "offset": self._size,
+            "nbytes": len(data),
+        }
+        padding = -len(data) % _ALIGNMENT
+        self._chunks.append(data + b"\0" * padding if padding else data)
+        self._size += len(data) + padding
+        self._count += 1
+        return ref
+
+    def encode_payload(self, message_json: str) -> bytes:
+        """Build a MSG_JSON_ATTACHMENTS payload from the envelope and collected blobs."""
+        envelope = message_json.encode("utf-8")
+        return b"".join([struct.pack("!I", len(envelope)), envelope, *self._chunks])
+
+
+def split_payload(payload: bytes) -> tuple[bytes, memoryview]:
+    """Split a MSG_JSON_ATTACHMENTS payload into (JSON bytes, blob view).
+
+    Raises:
+        ValueError: If the declared JSON length overruns the payload.
+    """
+    if len(payload) < 4:
+        raise ValueError("Attachment payload too short")
+    (json_len,) = struct.unpack_from("!I", payload)
+    if 4 + json_len > len(payload):
+        raise ValueError(f"Attachment JSON length {json_len} exceeds payload")
+    view = memoryview(payload)
+    return bytes(view[4 : 4 + json_len]), view[4 + json_len :]
+
+
+def decode_payload(payload: bytes, msg_type: int = MSG_JSON) -> Any:
+    """Decode a CMAT payload, resolving attachments to numpy arrays.
+
+    ``|u1`` attachments decode to ``bytes``.
+    """
+    if msg_type != MSG_JSON_ATTACHMENTS:
+        return json.loads(payload)
+
+    envelope, blob = split_payload(payload)
+
+    def resolve(ref: dict[str, Any]) -> Any:
+        if ATTACHMENT_KEY not in ref:
+            return ref
+        data = blob[ref["offset"] : ref["offset"] + ref["nbytes"]]
+        if ref["dtype"] == "|u1":
+            return bytes(data)
+        import numpy as np
+
+        return np.frombuffer(data, dtype=ref["dtype"]).reshape(ref["shape"])
+
+    return json.loads(envelope, object_hook=resolve)
 
 
 class IPCFrameEncoder:
@@ -8,8 +165,8 @@ class IPCFrameEncoder:
     Prefixes payloads with binary headers to prevent text scanning over sockets.
     """
 
-    MAGIC = b"CMAT"
-    HEADER_FORMAT = "!4sIH"  # Magic, Payload Len, Msg Type
+    MAGIC = MAGIC
+    HEADER_FORMAT = HEADER_FORMAT
 
     @classmethod
     def encode_frame(
@@ -22,5 +179,4 @@ class IPCFrameEncoder:
             "payload": payload,
         }
         serialized = json.dumps(frame_dict, separators=(",", ":")).encode("utf-8")
-        header = struct.pack(cls.HEADER_FORMAT, cls.MAGIC, len(serialized), msg_type)
-        return header + serialized
+        return pack_frame(serialized, msg_type)
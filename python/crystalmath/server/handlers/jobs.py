@@ -5,15 +5,22 @@ This module provides handlers for:
 - jobs.submit: Submit a new job via quacc recipe
 - jobs.status: Get current status of a job
 - jobs.cancel: Cancel a running job
+- jobs.changes: Incremental job-list delta since a change sequence number
+- jobs.get_dos: Total and projected DOS arrays from a job's DOSCAR
+- jobs.get_bands: Band energies per k-point from a job's EIGENVAL
 """
 
 from __future__ import annotations
 
 import logging
+import re
+from contextlib import closing
 from datetime import datetime, timezone
 from io import StringIO
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from crystalmath.linescan import LineScanner
 from crystalmath.server.handlers import register_handler
 
 if TYPE_CHECKING:
@@ -54,19 +61,18 @@ async def handle_jobs_list(
     """
     from crystalmath.quacc.store import JobStatus, JobStore
 
-    store = JobStore()
+    with closing(JobStore()) as store:
+        # Parse params
+        status_str = params.get("status")
+        status = JobStatus(status_str) if status_str else None
+        limit = params.get("limit", 100)
 
-    # Parse params
-    status_str = params.get("status")
-    status = JobStatus(status_str) if status_str else None
-    limit = params.get("limit", 100)
+        jobs = store.list_jobs(status=status, limit=limit)
 
-    jobs = store.list_jobs(status=status, limit=limit)
-
-    return {
-        "jobs": [j.model_dump(mode="json") for j in jobs],
-        "total": len(jobs),
-    }
+        return {
+            "jobs": [j.model_dump(mode="json") for j in jobs],
+            "total": len(jobs),
+        }
 
 
 @register_handler("jobs.submit")
@@ -193,17 +199,17 @@ async def handle_jobs_submit(
         }
 
     # Store job metadata
-    store = JobStore()
-    job = JobMetadata(
-        id=job_id,
-        recipe=recipe,
-        status=JobStatus.pending,
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
-        cluster=cluster_name,
-        work_dir=None,
-    )
-    store.save_job(job)
+    with closing(JobStore()) as store:
+        job = JobMetadata(
+            id=job_id,
+            recipe=recipe,
+            status=JobStatus.pending,
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+            cluster=cluster_name,
+            work_dir=None,
+        )
+        store.save_job(job)
 
     logger.info(f"Submitted job {job_id} for recipe {recipe}")
 
@@ -240,93 +246,93 @@ async def handle_jobs_status(
     if not job_id:
         return {"error": "job_id parameter is required"}
 
-    store = JobStore()
-    job = store.get_job(job_id)
-    if job is None:
-        return {"error": f"Job not found: {job_id}"}
+    with closing(JobStore()) as store:
+        job = store.get_job(job_id)
+        if job is None:
+            return {"error": f"Job not found: {job_id}"}
+
+        # If already in terminal state, return cached status
+        if job.status in (JobStatus.completed, JobStatus.failed):
+            return {
+                "job_id": job_id,
+                "status": job.status.value,
+                "error": job.error_message,
+                "result": job.results_summary,
+            }
 
-    # If already in terminal state, return cached status
-    if job.status in (JobStatus.completed, JobStatus.failed):
-        return {
-            "job_id": job_id,
-            "status": job.status.value,
-            "error": job.error_message,
-            "result": job.results_summary,
-        }
+        # Poll live status from runner
+        engine = get_workflow_engine()
+        if engine is None:
+            # No engine - return stored status
+            return {
+                "job_id": job_id,
+                "status": job.status.value,
+                "error": job.error_message,
+                "result": job.results_summary,
+            }
 
-    # Poll live status from runner
-    engine = get_workflow_engine()
-    if engine is None:
-        # No engine - return stored status
-        return {
-            "job_id": job_id,
-            "status": job.status.value,
-            "error": job.error_message,
-            "result": job.results_summary,
-        }
+        try:
+            runner = get_or_create_runner(engine)
+            current_state = runner.get_status(job_id)
+        except KeyError:
+            # Job not in runner (orphaned on restart)
+            return {
+                "job_id": job_id,
+                "status": job.status.value,
+                "error": "Job tracking lost (server restart?)",
+                "result": job.results_summary,
+            }
+        except Exception as e:
+            logger.warning(f"Error polling job {job_id}: {e}")
+            return {
+                "job_id": job_id,
+                "status": job.status.value,
+                "error": str(e),
+                "result": job.results_summary,
+            }
 
-    try:
-        runner = get_or_create_runner(engine)
-        current_state = runner.get_status(job_id)
-    except KeyError:
-        # Job not in runner (orphaned on restart)
-        return {
-            "job_id": job_id,
-            "status": job.status.value,
-            "error": "Job tracking lost (server restart?)",
-            "result": job.results_summary,
+        # Map JobState to JobStatus
+        status_map = {
+            JobState.PENDING: JobStatus.pending,
+            JobState.RUNNING: JobStatus.running,
+            JobState.COMPLETED: JobStatus.completed,
+            JobState.FAILED: JobStatus.failed,
+            JobState.CANCELLED: JobStatus.cancelled,
         }
-    except Exception as e:
-        logger.warning(f"Error polling job {job_id}: {e}")
+        new_status = status_map.get(current_state, JobStatus.pending)
+
+        # Update if status changed
+        if new_status != job.status:
+            job.status = new_status
+            job.updated_at = datetime.now(timezone.utc)
+
+            # Fetch result if complete
+            if current_state == JobState.COMPLETED:
+                try:
+                    result = runner.get_result(job_id)
+                    if result:
+                        job.results_summary = _summarize_result(result)
+                except Exception as e:
+                    logger.warning(f"Failed to get result for {job_id}: {e}")
+
+            # Fetch error if failed
+            elif current_state == JobState.FAILED:
+                try:
+                    result = runner.get_result(job_id)
+                    if result and "error" in result:
+                        job.error_message = result["error"]
+                except Exception as e:
+                    logger.warning(f"Failed to get error for {job_id}: {e}")
+
+            store.save_job(job)
+
         return {
             "job_id": job_id,
             "status": job.status.value,
-            "error": str(e),
+            "error": job.error_message,
             "result": job.results_summary,
         }
 
-    # Map JobState to JobStatus
-    status_map = {
-        JobState.PENDING: JobStatus.pending,
-        JobState.RUNNING: JobStatus.running,
-        JobState.COMPLETED: JobStatus.completed,
-        JobState.FAILED: JobStatus.failed,
-        JobState.CANCELLED: JobStatus.cancelled,
-    }
-    new_status = status_map.get(current_state, JobStatus.pending)
-
-    # Update if status changed
-    if new_status != job.status:
-        job.status = new_status
-        job.updated_at = datetime.now(timezone.utc)
-
-        # Fetch result if complete
-        if current_state == JobState.COMPLETED:
-            try:
-                result = runner.get_result(job_id)
-                if result:
-                    job.results_summary = _summarize_result(result)
-            except Exception as e:
-                logger.warning(f"Failed to get result for {job_id}: {e}")
-
-        # Fetch error if failed
-        elif current_state == JobState.FAILED:
-            try:
-                result = runner.get_result(job_id)
-                if result and "error" in result:
-                    job.error_message = result["error"]
-            except Exception as e:
-                logger.warning(f"Failed to get error for {job_id}: {e}")
-
-        store.save_job(job)
-
-    return {
-        "job_id": job_id,
-        "status": job.status.value,
-        "error": job.error_message,
-        "result": job.results_summary,
-    }
-
 
 @register_handler("jobs.cancel")
 async def handle_jobs_cancel(
@@ -353,56 +359,100 @@ async def handle_jobs_cancel(
     if not job_id:
         return {"error": "job_id parameter is required"}
 
-    store = JobStore()
-    job = store.get_job(job_id)
-    if job is None:
-        return {"error": f"Job not found: {job_id}"}
+    with closing(JobStore()) as store:
+        job = store.get_job(job_id)
+        if job is None:
+            return {"error": f"Job not found: {job_id}"}
+
+        # Check if already in terminal state
+        if job.status in (JobStatus.completed, JobStatus.failed, JobStatus.cancelled):
+            return {
+                "job_id": job_id,
+                "cancelled": False,
+                "error": f"Job already in terminal state: {job.status.value}",
+            }
+
+        # Get engine and runner
+        engine = get_workflow_engine()
+        if engine is None:
+            return {
+                "job_id": job_id,
+                "cancelled": False,
+                "error": "No workflow engine configured",
+            }
+
+        try:
+            runner = get_or_create_runner(engine)
+            cancelled = runner.cancel(job_id)
+        except KeyError:
+            return {
+                "job_id": job_id,
+                "cancelled": False,
+                "error": "Job not found in runner (may have been orphaned)",
+            }
+        except Exception as e:
+            logger.error(f"Error cancelling job {job_id}: {e}")
+            return {
+                "job_id": job_id,
+                "cancelled": False,
+                "error": str(e),
+            }
+
+        if cancelled:
+            job.status = JobStatus.cancelled
+            job.updated_at = datetime.now(timezone.utc)
+            store.save_job(job)
+            logger.info(f"Cancelled job {job_id}")
 
-    # Check if already in terminal state
-    if job.status in (JobStatus.completed, JobStatus.failed, JobStatus.cancelled):
         return {
             "job_id": job_id,
-            "cancelled": False,
-            "error": f"Job already in terminal state: {job.status.value}",
+            "cancelled": cancelled,
+            "error": None,
         }
 
-    # Get engine and runner
-    engine = get_workflow_engine()
-    if engine is None:
-        return {
-            "job_id": job_id,
-            "cancelled": False,
-            "error": "No workflow engine configured",
+
+@register_handler("jobs.changes")
+async def handle_jobs_changes(
+    controller: CrystalController | None,
+    params: dict[str, Any],
+) -> dict[str, Any]:
+    """Return only the jobs that changed since a change sequence number.
+
+    Params:
+        since_seq (int, optional): Last sequence the client applied (default 0)
+        limit (int, optional): Max changed jobs to return (default 1000)
+
+    Returns:
+        {
+            "ok": true,
+            "data": {
+                "seq": 1234,
+                "jobs": [ {JobStatus}, ... ],
+                "deleted": [12, 13],
+                "has_more": false,
+                "reset": false
+            }
         }
+    """
+    import asyncio
+
+    since_seq = params.get("since_seq", 0)
+    limit = params.get("limit", 1000)
+    if not isinstance(since_seq, int) or since_seq < 0:
+        return {"ok": False, "error": {"message": "since_seq must be a non-negative integer"}}
+    if not isinstance(limit, int) or limit <= 0:
+        return {"ok": False, "error": {"message": "limit must be a positive integer"}}
+
+    if controller is None:
+        return {"ok": False, "error": {"message": "Controller not available"}}
 
     try:
-        runner = get_or_create_runner(engine)
-        cancelled = runner.cancel(job_id)
-    except KeyError:
-        return {
-            "job_id": job_id,
-            "cancelled": False,
-            "error": "Job not found in runner (may have been orphaned)",
-        }
+        changes = await asyncio.to_thread(controller.get_job_changes, since_seq, limit)
     except Exception as e:
-        logger.error(f"Error cancelling job {job_id}: {e}")
-        return {
-            "job_id": job_id,
-            "cancelled": False,
-            "error": str(e),
-        }
+        logger.exception("Failed to read job changes since %s", since_seq)
+        return {"ok": False, "error": {"message": f"Failed to read job changes: {e}"}}
 
-    if cancelled:
-        job.status = JobStatus.cancelled
-        job.updated_at = datetime.now(timezone.utc)
-        store.save_job(job)
-        logger.info(f"Cancelled job {job_id}")
-
-    return {
-        "job_id": job_id,
-        "cancelled": cancelled,
-        "error": None,
-    }
+    return {"ok": True, "data": changes.model_dump(mode="json")}
 
 
 def _parse_structure(structure_data: str | dict) -> Any:
@@ -549,8 +599,6 @@ def _analyze_vasp_errors_fallback(content: str) -> list[dict[str, Any]]:
     Returns:
         List of error dictionaries
     """
-    import re
-
     errors = []
     seen_codes: set[str] = set()
 
@@ -618,43 +666,132 @@ def _analyze_vasp_errors(content: str) -> list[dict[str, Any]]:
         return _analyze_vasp_errors_fallback(content)
 
 
-def _read_file_with_tail(file_path: str, tail_lines: int | None) -> dict[str, Any]:
-    """Read file content with optional tail limiting.
+_outcar_scanner: tuple[LineScanner, list[dict[str, Any]]] | None = None
+
+
+def _get_outcar_scanner() -> tuple[LineScanner, list[dict[str, Any]]]:
+    """Build (once) the OUTCAR scanner and the error record for each pattern.
+
+    Uses the VASPErrorHandler patterns when available, else the inline fallback.
+    """
+    global _outcar_scanner
+    if _outcar_scanner is not None:
+        return _outcar_scanner
+
+    try:
+        from crystalmath._vendor.runners.vasp_errors import VASP_ERROR_PATTERNS
+
+        patterns = [entry[0] for entry in VASP_ERROR_PATTERNS]
+        records = [
+            {
+                "code": code,
+                "severity": severity.value,
+                "message": message,
+                "suggestions": suggestions,
+                "incar_changes": incar_changes,
+            }
+            for _, code, severity, message, suggestions, incar_changes in VASP_ERROR_PATTERNS
+        ]
+        scanner = LineScanner(patterns)
+    except ImportError:
+        logger.debug("VASPErrorHandler not available, using fallback patterns")
+        patterns = [entry[0] for entry in _VASP_ERROR_PATTERNS_FALLBACK]
+        records = [
+            {
+                "code": code,
+                "severity": severity,
+                "message": message,
+                "suggestions": suggestions,
+                "incar_changes": incar_changes,
+            }
+            for _, code, severity, message, suggestions, incar_changes in (
+                _VASP_ERROR_PATTERNS_FALLBACK
+            )
+        ]
+        scanner = LineScanner(patterns, flags=re.IGNORECASE)
+
+    _outcar_scanner = (scanner, records)
+    return _outcar_scanner
+
+
+def _analyze_outcar_file(outcar_path: str) -> list[dict[str, Any]]:
+    """Analyze an OUTCAR on disk, scanning only bytes added since the last call.
+
+    Results are cached per file and reused while its size and mtime are
+    unchanged, so polling a multi-GB OUTCAR is cheap after the first scan.
+
+    Args:
+        outcar_path: Path to the OUTCAR file
+
+    Returns:
+        List of error dictionaries (same shape as _analyze_vasp_errors)
+    """
+    scanner, records = _get_outcar_scanner()
+    errors = []
+    for hit in scanner.scan(outcar_path):
+        record = records[hit.index]
+        errors.append(
+            {
+                **record,
+                "line_content": hit.line,
+                "suggestions": list(record["suggestions"]),
+                "incar_changes": dict(record["incar_changes"]),
+            }
+        )
+    return errors
+
+
+def _read_file_with_tail(
+    file_path: str,
+    tail_lines: int | None,
+    after_offset: int | None = None,
+) -> dict[str, Any]:
+    """Read file content with optional tail limiting or offset resume.
 
-    Uses memory-efficient streaming with deque when tail_lines is specified.
+    Tails seek backwards from the end of the file, so their cost does not grow
+    with file size; ``total_lines`` is therefore only reported when the whole
+    file was read (it is None for a truncated tail).
 
     Args:
         file_path: Path to the file to read
         tail_lines: If specified, return only the last N lines
+        after_offset: Resume token from a previous call; return only the
+            complete lines written after it (takes precedence over tail_lines)
 
     Returns:
-        Dict with content, truncated flag, and total_lines count
+        Dict with content, truncated flag, total_lines count, offset (resume
+        token) and reset (file was truncated since after_offset)
     """
-    from collections import deque
-
-    total_lines = 0
-    truncated = False
-
-    if tail_lines is not None and tail_lines > 0:
-        # Use deque for memory-efficient tail reading
-        dq: deque[str] = deque(maxlen=tail_lines)
-        with open(file_path, encoding="utf-8", errors="replace") as f:
-            for line in f:
-                total_lines += 1
-                dq.append(line)
-        lines = list(dq)
-        truncated = total_lines > tail_lines
+    from crystalmath.tail import read_after, tail_file
+
+    if after_offset is not None:
+        tail = read_after(file_path, after_offset)
+        truncated = tail.has_more
+        total_lines = None
+    elif tail_lines is not None and tail_lines > 0:
+        tail = tail_file(file_path, tail_lines)
+        truncated = tail.truncated
+        total_lines = None if truncated else len(tail.lines)
     else:
         # Read entire file
-        with open(file_path, encoding="utf-8", errors="replace") as f:
-            lines = f.readlines()
-        total_lines = len(lines)
+        with open(file_path, "rb") as f:
+            data = f.read()
+        content = data.decode("utf-8", errors="replace")
+        return {
+            "content": content,
+            "truncated": False,
+            "total_lines": len(content.splitlines()),
+            "offset": data.rfind(b"\n") + 1,
+            "reset": False,
+        }
 
-    content = "".join(lines)
+    content = "".join(f"{line}\n" for line in tail.lines)
     return {
         "content": content,
         "truncated": truncated,
         "total_lines": total_lines,
+        "offset": tail.offset,
+        "reset": tail.reset,
     }
 
 
@@ -725,20 +862,13 @@ async def handle_jobs_analyze_errors(
             },
         }
 
-    # Read OUTCAR content (async for non-blocking)
-    def _read_outcar() -> str:
-        with open(outcar_path, encoding="utf-8", errors="replace") as f:
-            return f.read()
-
+    # Scan OUTCAR incrementally in a thread (non-blocking)
     try:
-        content = await asyncio.to_thread(_read_outcar)
+        errors = await asyncio.to_thread(_analyze_outcar_file, str(outcar_path))
     except Exception as e:
         logger.exception("Failed to read OUTCAR for job %s", job_pk)
         return {"ok": False, "error": {"message": f"Failed to read OUTCAR: {e}"}}
 
-    # Analyze for errors
-    errors = _analyze_vasp_errors(content)
-
     # Build summary
     if not errors:
         summary = "No errors detected in OUTCAR"
@@ -778,6 +908,8 @@ async def handle_jobs_get_output_file(
         job_pk (int): Job primary key
         file_type (str): Output file name ("OUTCAR", "vasprun.xml", "OSZICAR", etc.)
         tail_lines (int, optional): Return only last N lines (default: all)
+        after_offset (int, optional): Resume token from a previous response;
+            return only lines written since (overrides tail_lines)
 
     Returns:
         {
@@ -785,7 +917,9 @@ async def handle_jobs_get_output_file(
             "data": {
                 "content": "file contents as string",
                 "truncated": false,
-                "total_lines": 1234
+                "total_lines": 1234,  # null for a truncated tail
+                "offset": 56789,  # pass back as after_offset
+                "reset": false
             }
         }
     """
@@ -806,6 +940,13 @@ async def handle_jobs_get_output_file(
         if tail_lines < 0:
             return {"ok": False, "error": {"message": "tail_lines must be non-negative"}}
 
+    after_offset = params.get("after_offset")
+    if after_offset is not None:
+        if not isinstance(after_offset, int):
+            return {"ok": False, "error": {"message": "after_offset must be an integer"}}
+        if after_offset < 0:
+            return {"ok": False, "error": {"message": "after_offset must be non-negative"}}
+
     # Get job details to find work directory
     if controller is None:
         return {"ok": False, "error": {"message": "Controller not available"}}
@@ -845,13 +986,149 @@ async def handle_jobs_get_output_file(
 
     # Read file content in a thread to avoid blocking the event loop
     try:
-        result = await asyncio.to_thread(_read_file_with_tail, str(file_path), tail_lines)
+        result = await asyncio.to_thread(
+            _read_file_with_tail, str(file_path), tail_lines, after_offset
+        )
         return {"ok": True, "data": result}
     except Exception as e:
         logger.exception("Failed to read file %s", file_path)
         return {"ok": False, "error": {"message": f"Failed to read file: {e}"}}
 
 
+def _job_output_path(
+    controller: CrystalController | None, job_pk: Any, name: str
+) -> tuple[Path | None, dict[str, Any] | None]:
+    """Locate an output file in a job's work directory.
+
+    Returns:
+        (path, None) if the file exists, else (None, error response).
+    """
+    if job_pk is None:
+        return None, {"ok": False, "error": {"message": "job_pk is required"}}
+    if controller is None:
+        return None, {"ok": False, "error": {"message": "Controller not available"}}
+
+    try:
+        job_details = controller.get_job_details(job_pk)
+    except Exception as e:
+        logger.exception("Failed to get job details for pk=%s", job_pk)
+        return None, {"ok": False, "error": {"message": f"Failed to get job details: {e}"}}
+    if job_details is None:
+        return None, {"ok": False, "error": {"message": f"Job {job_pk} not found"}}
+
+    work_dir = getattr(job_details, "work_dir", None)
+    if not work_dir:
+        return None, {"ok": False, "error": {"message": f"Job {job_pk} has no work directory"}}
+
+    path = Path(work_dir) / name
+    if not path.is_file():
+        return None, {"ok": False, "error": {"message": f"File not found: {name}"}}
+    return path, None
+
+
+@register_handler("jobs.get_dos")
+async def handle_jobs_get_dos(
+    controller: CrystalController | None,
+    params: dict[str, Any],
+) -> dict[str, Any]:
+    """Read the density of states of a VASP job from its DOSCAR.
+
+    The arrays are numpy arrays: CMAT clients that negotiate attachments
+    receive them as raw little-endian blobs, text clients as nested lists.
+
+    Params:
+        job_pk (int): Job primary key
+
+    Returns:
+        {
+            "ok": true,
+            "data": {
+                "job_pk": 1,
+                "efermi": 5.12,
+                "total": <float64 (nedos, ncols)>,  # energy, DOS, integrated DOS per spin
+                "partial": <float64 (nsites, nedos, ncols)>  # empty without LORBIT
+            }
+        }
+    """
+    import asyncio
+
+    job_pk = params.get("job_pk")
+    path, error = _job_output_path(controller, job_pk, "DOSCAR")
+    if error is not None:
+        return error
+
+    try:
+        from crystalmath._vendor.postprocessing.vasp_text import read_doscar
+
+        arrays = await asyncio.to_thread(read_doscar, path)
+    except ImportError:
+        return {"ok": False, "error": {"message": "Reading DOSCAR requires numpy"}}
+    except Exception as e:
+        logger.exception("Failed to read DOSCAR for job %s", job_pk)
+        return {"ok": False, "error": {"message": f"Failed to read DOSCAR: {e}"}}
+
+    return {
+        "ok": True,
+        "data": {
+            "job_pk": job_pk,
+            "efermi": float(arrays["header"][3]),
+            "total": arrays["total"],
+            "partial": arrays["partial"],
+        },
+    }
+
+
+@register_handler("jobs.get_bands")
+async def handle_jobs_get_bands(
+    controller: CrystalController | None,
+    params: dict[str, Any],
+) -> dict[str, Any]:
+    """Read the band energies of a VASP job from its EIGENVAL.
+
+    Arrays are returned as in ``jobs.get_dos``.
+
+    Params:
+        job_pk (int): Job primary key
+
+    Returns:
+        {
+            "ok": true,
+            "data": {
+                "job_pk": 1,
+                "ispin": 1,
+                "kpoints": <float64 (nkpts, 4)>,  # k-vector and weight
+                "bands": <float64 (nkpts, nbands, ncols)>  # index, energies, occupations
+            }
+        }
+    """
+    import asyncio
+
+    job_pk = params.get("job_pk")
+    path, error = _job_output_path(controller, job_pk, "EIGENVAL")
+    if error is not None:
+        return error
+
+    try:
+        from crystalmath._vendor.postprocessing.vasp_text import read_eigenval
+
+        arrays = await asyncio.to_thread(read_eigenval, path)
+    except ImportError:
+        return {"ok": False, "error": {"message": "Reading EIGENVAL requires numpy"}}
+    except Exception as e:
+        logger.exception("Failed to read EIGENVAL for job %s", job_pk)
+        return {"ok": False, "error": {"message": f"Failed to read EIGENVAL: {e}"}}
+
+    return {
+        "ok": True,
+        "data": {
+            "job_pk": job_pk,
+            "ispin": int(arrays["ispin"]),
+            "kpoints": arrays["kpoints"],
+            "bands": arrays["bands"],
+        },
+    }
+
+
 def _summarize_result(result: dict) -> dict:
     """Extract key values from quacc result schema.
 
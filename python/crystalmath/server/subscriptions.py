@@ -0,0 +1,552 @@
+"""Server-push subscriptions for the JSON-RPC server.
+
+Clients call ``subscribe`` with a topic and receive JSON-RPC notifications on
+the same connection instead of polling:
+
+    --> {"jsonrpc": "2.0", "method": "subscribe",
+         "params": {"topic": "jobs.state"}, "id": 7}
+    <-- {"jsonrpc": "2.0", "result": {"subscription": "s1", "topic": "jobs.state"}, "id": 7}
+    <-- {"jsonrpc": "2.0", "method": "subscription.event",
+         "params": {"subscription": "s1", "topic": "jobs.state",
+                    "events": [{"pk": 3, "state": "RUNNING", "previous_state": "QUEUED"}],
+                    "dropped": 0}}
+
+Topics:
+    jobs.state   Job state transitions (optional ``job_pks`` filter).
+    jobs.log     New log lines for one job (``job_pk``, ``stream``, optional ``offset``).
+    slurm.queue  SLURM queue snapshots for one cluster (``cluster_id``).
+
+Each topic has one shared source task that polls once for all subscribers and
+stops when the last subscriber leaves. Log sources do not poll: they sleep on
+the shared local file watcher (inotify on Linux) and wake only when the log
+is appended to. Every subscription owns a bounded
+:class:`EventBuffer`: while a slow consumer is blocked on socket backpressure,
+keyed events (job states, queue snapshots) are coalesced to the latest value
+and unkeyed events (log lines) drop the oldest entries, reporting how many
+were lost in ``dropped``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+import logging
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Any
+
+from crystalmath._vendor.runners.file_watch import FileSubscription, FileUpdate, shared_watcher
+
+from . import codec
+from .framing import MSG_JSON, pack_header
+
+logger = logging.getLogger("crystalmath.server.subscriptions")
+
+__all__ = [
+    "NOTIFICATION_METHOD",
+    "TOPICS",
+    "ClientConnection",
+    "EventBuffer",
+    "SubscriptionManager",
+]
+
+NOTIFICATION_METHOD = "subscription.event"
+
+TOPIC_JOB_STATE = "jobs.state"
+TOPIC_JOB_LOG = "jobs.log"
+TOPIC_SLURM_QUEUE = "slurm.queue"
+TOPICS = (TOPIC_JOB_STATE, TOPIC_JOB_LOG, TOPIC_SLURM_QUEUE)
+
+# Default per-subscription buffer bound and source poll intervals (seconds)
+DEFAULT_MAX_EVENTS = 1000
+JOB_STATE_INTERVAL = 0.5
+JOB_LOG_INTERVAL = 0.5
+SLURM_QUEUE_INTERVAL = 15.0
+
+# Upper bound on log bytes read per tick so a burst cannot stall the loop
+_MAX_LOG_READ = 1024 * 1024
+
+
+class EventBuffer:
+    """Bounded, coalescing event buffer for one subscription.
+
+    Events put with a key replace any pending event with the same key, so a
+    consumer that falls behind only sees the latest value. Unkeyed events are
+    appended. When the buffer is full the oldest event is dropped and counted.
+    """
+
+    def __init__(self, max_events: int = DEFAULT_MAX_EVENTS) -> None:
+        self.max_events = max_events
+        self._events: OrderedDict[Hashable, Any] = OrderedDict()
+        self._counter = itertools.count()
+        self._dropped = 0
+        self._ready = asyncio.Event()
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def put(self, event: Any, key: Hashable | None = None) -> None:
+        """Queue an event, coalescing by key when one is given."""
+        if self._closed:
+            return
+        if key is None:
+            key = ("_seq", next(self._counter))
+        else:
+            self._events.pop(key, None)
+        self._events[key] = event
+        while len(self._events) > self.max_events:
+            self._events.popitem(last=False)
+            self._dropped += 1
+        self._ready.set()
+
+    async def drain(self) -> tuple[list[Any], int]:
+        """Wait for events and return (events, dropped_count), clearing the buffer.
+
+        Returns an empty list once the buffer is closed and empty.
+        """
+        while not self._events and not self._closed:
+            self._ready.clear()
+            await self._ready.wait()
+        events = list(self._events.values())
+        dropped = self._dropped
+        self._events.clear()
+        self._dropped = 0
+        return events, dropped
+
+    def close(self) -> None:
+        """Stop accepting events and wake any waiting consumer."""
+        self._closed = True
+        self._ready.set()
+
+
+class ClientConnection:
+    """One client socket: serializes responses and notifications onto the writer.
+
+    Messages use Content-Length framing unless the client has spoken CMAT
+    binary framing, in which case ``binary`` is set and replies follow suit.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self.writer = writer
+        self.binary = False
+        self.subscriptions: dict[str, _Subscription] = {}
+        self._write_lock = asyncio.Lock()
+
+    async def send(self, message: str) -> None:
+        """Write one JSON message in the connection's framing."""
+        payload = message.encode("utf-8")
+        if self.binary:
+            await self.send_frame(payload, MSG_JSON)
+            return
+        header = f"Content-Length: {len(payload)}\r\n\r\n".encode()
+        async with self._write_lock:
+            self.writer.write(header)
+            self.writer.write(payload)
+            await self.writer.drain()
+
+    async def send_frame(self, payload: bytes, msg_type: int) -> None:
+        """Write one CMAT frame, waiting for socket backpressure."""
+        async with self._write_lock:
+            self.writer.write(pack_header(len(payload), msg_type))
+            self.writer.write(payload)
+            await self.writer.drain()
+
+
+class _Subscription:
+    """A client's subscription to one source."""
+
+    def __init__(
+        self,
+        sub_id: str,
+        topic: str,
+        connection: ClientConnection,
+        accepts: Callable[[dict[str, Any]], bool] | None,
+        max_events: int,
+    ) -> None:
+        self.id = sub_id
+        self.topic = topic
+        self.connection = connection
+        self.accepts = accepts
+        self.buffer = EventBuffer(max_events)
+        self.source: _Source | None = None
+        self.task: asyncio.Task | None = None
+
+    async def pump(self) -> None:
+        """Forward buffered events to the client as notifications until closed."""
+        while True:
+            events, dropped = await self.buffer.drain()
+            if not events and not dropped:
+                return
+            notification = {
+                "jsonrpc": "2.0",
+                "method": NOTIFICATION_METHOD,
+                "params": {
+                    "subscription": self.id,
+                    "topic": self.topic,
+                    "events": events,
+                    "dropped": dropped,
+                },
+            }
+            try:
+                await self.connection.send(codec.dumps(notification))
+            except (ConnectionError, RuntimeError) as e:
+                logger.debug(f"Subscription {self.id} send failed: {e}")
+                return
+
+
+class _Source:
+    """Shared producer for one (topic, params) key, fanned out to subscribers."""
+
+    interval = 1.0
+
+    def __init__(self, key: tuple[Any, ...], get_controller: Callable[[], Any]) -> None:
+        self.key = key
+        self._get_controller = get_controller
+        self.subscribers: set[_Subscription] = set()
+        self.task: asyncio.Task | None = None
+        self.ready = asyncio.Event()
+
+    def publish(self, event: dict[str, Any], key: Hashable | None = None) -> None:
+        for sub in self.subscribers:
+            if sub.accepts is None or sub.accepts(event):
+                sub.buffer.put(event, key)
+
+    async def run(self) -> None:
+        try:
+            await self.prime()
+        except Exception as e:
+            logger.warning(f"Subscription source {self.key} prime failed: {e}")
+        finally:
+            self.ready.set()
+        while True:
+            try:
+                await self.poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Subscription source {self.key} poll failed: {e}")
+            await self.wait()
+
+    async def prime(self) -> None:
+        """Capture initial state so the first poll only reports new changes."""
+
+    async def poll(self) -> None:
+        raise NotImplementedError
+
+    async def wait(self) -> None:
+        """Wait until the next poll is due."""
+        await asyncio.sleep(self.interval)
+
+    def close(self) -> None:
+        """Release resources held by the source once its task is stopped."""
+
+
+class _JobStateSource(_Source):
+    """Emits job state transitions from the database change feed."""
+
+    interval = JOB_STATE_INTERVAL
+
+    def __init__(self, key: tuple[Any, ...], get_controller: Callable[[], Any]) -> None:
+        super().__init__(key, get_controller)
+        self._seq = 0
+        self._states: dict[int, str] = {}
+
+    async def _read_changes(self) -> Any:
+        controller = self._get_controller()
+        if controller is None:
+            return None
+        return await asyncio.to_thread(controller.get_job_changes, self._seq, 1000)
+
+    async def prime(self) -> None:
+        while True:
+            changes = await self._read_changes()
+            if changes is None:
+                return
+            for job in changes.jobs:
+                self._states[job.pk] = job.state.value
+            self._seq = changes.seq
+            if not changes.has_more:
+                return
+
+    async def poll(self) -> None:
+        while True:
+            changes = await self._read_changes()
+            if changes is None:
+                return
+            if changes.reset:
+                self._states.clear()
+            for job in changes.jobs:
+                previous = self._states.get(job.pk)
+                state = job.state.value
+                self._states[job.pk] = state
+                if state != previous:
+                    self.publish(
+                        {
+                            "pk": job.pk,
+                            "name": job.name,
+                            "state": state,
+                            "previous_state": previous,
+                        },
+                        key=job.pk,
+                    )
+            for pk in changes.deleted:
+                previous = self._states.pop(pk, None)
+                self.publish(
+                    {"pk": pk, "state": None, "previous_state": previous, "deleted": True},
+                    key=pk,
+                )
+            self._seq = changes.seq
+            if not changes.has_more:
+                return
+
+
+class _JobLogSource(_Source):
+    """Emits newly appended lines of one job's stdout/stderr log."""
+
+    interval = JOB_LOG_INTERVAL
+
+    def __init__(
+        self,
+        key: tuple[Any, ...],
+        get_controller: Callable[[], Any],
+        job_pk: int,
+        stream: str,
+        offset: int | None,
+    ) -> None:
+        super().__init__(key, get_controller)
+        self.job_pk = job_pk
+        self.stream = stream
+        self._offset = offset
+        self._watch: FileSubscription | None = None
+        self._has_more = False
+        self._primed = False
+
+    def _resolve_path(self) -> Path | None:
+        from crystalmath.backends.sqlite import STDERR_LOG_NAMES, STDOUT_LOG_NAMES
+
+        controller = self._get_controller()
+        if controller is None:
+            return None
+        details = controller.get_job_details(self.job_pk)
+        if details is None or not details.work_dir:
+            return None
+        names = STDOUT_LOG_NAMES if self.stream == "stdout" else STDERR_LOG_NAMES
+        work_dir = Path(details.work_dir)
+        for name in names:
+            candidate = work_dir / name.format(name=details.name)
+            if candidate.exists():
+                return candidate
+        return None
+
+    def _locate(self, at_subscribe: bool) -> tuple[Path, int] | None:
+        """The log and the offset to read it from, or None if it does not exist yet."""
+        path = self._resolve_path()
+        if path is None:
+            return None
+        if self._offset is not None:
+            return path, self._offset
+        # A log that exists at subscribe time is followed from its current end;
+        # one created later holds only new output and is read from the start.
+        return path, path.stat().st_size if at_subscribe else 0
+
+    async def _read_new(self) -> FileUpdate | None:
+        if self._watch is None:
+            located = await asyncio.to_thread(self._locate, not self._primed)
+            if located is None:
+                return None
+            path, offset = located
+            # One descriptor and watch per log, shared with other local readers
+            self._watch = shared_watcher().subscribe(path, offset)
+
+        update = await asyncio.to_thread(self._watch.read_lines, _MAX_LOG_READ)
+        self._offset = update.offset
+        self._has_more = update.has_more
+        return update
+
+    async def prime(self) -> None:
+        # Pins the start offset (or replays from a resume offset) before the ack.
+        await self.poll()
+        self._primed = True
+
+    async def poll(self) -> None:
+        update = await self._read_new()
+        if update is None or not update.lines:
+            return
+        self.publish(
+            {
+                "job_pk": self.job_pk,
+                "stream": self.stream,
+                "lines": update.lines,
+                "offset": update.offset,
+                "reset": update.reset,
+            }
+        )
+
+    async def wait(self) -> None:
+        if self._watch is None:
+            # Log not created yet: look for it again after the interval
+            await asyncio.sleep(self.interval)
+        elif not self._has_more:
+            await self._watch.wait()
+
+    def close(self) -> None:
+        if self._watch is not None:
+            self._watch.close()
+            self._watch = None
+
+
+class _SlurmQueueSource(_Source):
+    """Emits SLURM queue snapshots for one cluster when they change."""
+
+    interval = SLURM_QUEUE_INTERVAL
+
+    def __init__(
+        self, key: tuple[Any, ...], get_controller: Callable[[], Any], cluster_id: int
+    ) -> None:
+        super().__init__(key, get_controller)
+        self.cluster_id = cluster_id
+        self._last: Any = None
+
+    async def poll(self) -> None:
+        controller = self._get_controller()
+        if controller is None:
+            return
+        response = await asyncio.to_thread(controller.get_slurm_queue_data, self.cluster_id)
+        if response != self._last:
+            self._last = response
+            # Only the newest snapshot matters to a slow consumer.
+            self.publish({"cluster_id": self.cluster_id, "queue": response}, key="snapshot")
+
+
+class SubscriptionManager:
+    """Creates subscriptions, shares sources between them and tears both down."""
+
+    def __init__(
+        self,
+        get_controller: Callable[[], Any],
+        max_events: int = DEFAULT_MAX_EVENTS,
+    ) -> None:
+        """Initialize the manager.
+
+        Args:
+            get_controller: Callable returning the CrystalController (may be None).
+            max_events: Per-subscription buffer bound before events are dropped.
+        """
+        self._get_controller = get_controller
+        self.max_events = max_events
+        self._sources: dict[tuple[Any, ...], _Source] = {}
+        self._ids = itertools.count(1)
+
+    def _build_source(self, topic: str, params: dict[str, Any]) -> _Source:
+        if topic == TOPIC_JOB_STATE:
+            key: tuple[Any, ...] = (topic,)
+            return self._sources.get(key) or _JobStateSource(key, self._get_controller)
+
+        if topic == TOPIC_JOB_LOG:
+            job_pk = params.get("job_pk")
+            stream = params.get("stream", "stdout")
+            offset = params.get("offset")
+            if not isinstance(job_pk, int):
+                raise ValueError("jobs.log requires an integer job_pk")
+            if stream not in ("stdout", "stderr"):
+                raise ValueError("stream must be 'stdout' or 'stderr'")
+            if offset is not None and (not isinstance(offset, int) or offset < 0):
+                raise ValueError("offset must be a non-negative integer")
+            # A resume offset needs its own reader; live tails share one per job/stream.
+            key = (topic, job_pk, stream, offset)
+            return self._sources.get(key) or _JobLogSource(
+                key, self._get_controller, job_pk, stream, offset
+            )
+
+        if topic == TOPIC_SLURM_QUEUE:
+            cluster_id = params.get("cluster_id")
+            if not isinstance(cluster_id, int):
+                raise ValueError("slurm.queue requires an integer cluster_id")
+            key = (topic, cluster_id)
+            return self._sources.get(key) or _SlurmQueueSource(
+                key, self._get_controller, cluster_id
+            )
+
+        raise ValueError(f"Unknown topic: {topic!r} (expected one of {', '.join(TOPICS)})")
+
+    async def subscribe(
+        self, connection: ClientConnection, params: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Register a subscription for ``params["topic"]`` on a connection.
+
+        Returns once the topic's source has captured its baseline, so every
+        change after the acknowledgement is delivered.
+
+        Raises:
+            ValueError: If the topic or its parameters are invalid.
+        """
+        topic = params.get("topic")
+        if not isinstance(topic, str):
+            raise ValueError("subscribe requires a 'topic' string")
+        source = self._build_source(topic, params)
+
+        accepts = None
+        job_pks = params.get("job_pks")
+        if topic == TOPIC_JOB_STATE and job_pks is not None:
+            if not isinstance(job_pks, list) or not all(
+                isinstance(pk, int) and not isinstance(pk, bool) for pk in job_pks
+            ):
+                raise ValueError("job_pks must be a list of integer job pks")
+            wanted = set(job_pks)
+            accepts = lambda event: event["pk"] in wanted  # noqa: E731
+
+        sub = _Subscription(f"s{next(self._ids)}", topic, connection, accepts, self.max_events)
+        sub.source = source
+        source.subscribers.add(sub)
+        connection.subscriptions[sub.id] = sub
+        sub.task = asyncio.create_task(sub.pump())
+
+        if source.task is None:
+            self._sources[source.key] = source
+            source.task = asyncio.create_task(source.run())
+
+        await source.ready.wait()
+        logger.debug(f"Subscribed {sub.id} to {source.key}")
+        return {"subscription": sub.id, "topic": topic}
+
+    async def unsubscribe(self, connection: ClientConnection, sub_id: str) -> bool:
+        """Remove one subscription; returns False if it does not exist."""
+        sub = connection.subscriptions.pop(sub_id, None)
+        if sub is None:
+            return False
+        await self._release(sub)
+        return True
+
+    async def close_connection(self, connection: ClientConnection) -> None:
+        """Drop every subscription owned by a disconnected client."""
+        for sub_id in list(connection.subscriptions):
+            await self.unsubscribe(connection, sub_id)
+
+    async def close(self) -> None:
+        """Stop all sources (server shutdown)."""
+        for source in list(self._sources.values()):
+            for sub in list(source.subscribers):
+                sub.connection.subscriptions.pop(sub.id, None)
+                await self._release(sub)
+
+    async def _release(self, sub: _Subscription) -> None:
+        sub.buffer.close()
+        if sub.task is not None:
+            sub.task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await sub.task
+
+        source = sub.source
+        if source is None:
+            return
+        source.subscribers.discard(sub)
+        if not source.subscribers and source.task is not None:
+            self._sources.pop(source.key, None)
+            source.task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await source.task
+            source.task = None
+            source.close()
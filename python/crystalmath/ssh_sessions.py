@@ -0,0 +1,196 @@
+"""Process-wide warm SSH sessions for synchronous callers.
+
+``CrystalController``'s SLURM methods are synchronous (they run on the Rust
+bridge thread or a JSON-RPC worker thread). They used to build a fresh
+``ConnectionManager`` under ``asyncio.run`` on every call, paying a full key
+exchange and authentication per queue refresh. :class:`SSHSessionService`
+instead owns:
+
+* one event loop on a daemon thread, which synchronous code submits
+  coroutines to with :meth:`SSHSessionService.run`;
+* one ``ConnectionManager`` on that loop, whose pooled ``asyncssh``
+  connections outlive individual calls (idle ones are closed by the
+  manager's health-check loop);
+* one ``SLURMRunner`` per cluster, so per-runner caches survive too.
+
+Clusters are registered from their ``clusters`` table row on first use and
+re-registered, closing their old sessions, when the row's connection settings
+change. :func:`get_session_service` returns the process-wide instance.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import threading
+from collections.abc import Coroutine
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from crystalmath._vendor.core.connection_manager import ConnectionManager
+    from crystalmath._vendor.core.database import Cluster
+    from crystalmath._vendor.runners.slurm_runner import SLURMRunner
+
+__all__ = ["SSHSessionService", "get_session_service"]
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Key used when a cluster's connection_config does not name one
+DEFAULT_KEY_FILE = "~/.ssh/id_ed25519"
+
+
+def _connection_settings(cluster: Cluster) -> dict[str, Any]:
+    """``register_cluster`` arguments for a ``clusters`` row."""
+    config = cluster.connection_config or {}
+    if isinstance(config, str):
+        import json
+
+        config = json.loads(config)
+
+    known_hosts = config.get("known_hosts_file")
+    return {
+        "host": cluster.hostname,
+        "port": cluster.port,
+        "username": cluster.username,
+        "key_file": Path(config.get("key_file") or DEFAULT_KEY_FILE).expanduser(),
+        "known_hosts_file": Path(known_hosts).expanduser() if known_hosts else None,
+        "strict_host_key_checking": config.get("strict_host_key_checking", True),
+    }
+
+
+class SSHSessionService:
+    """Keeps SSH sessions to clusters warm across synchronous calls.
+
+    All session state lives on the service's own event loop; public methods
+    other than :meth:`run`, :meth:`forget_cluster` and :meth:`close` are
+    coroutines meant to be awaited inside a coroutine passed to :meth:`run`.
+    """
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+        # Loop-thread state
+        self._manager: ConnectionManager | None = None
+        self._settings: dict[int, dict[str, Any]] = {}
+        self._runners: dict[int, SLURMRunner] = {}
+
+    # ------------------------------------------------------------------
+    # Synchronous interface
+    # ------------------------------------------------------------------
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run ``coro`` on the service loop and block until it finishes.
+
+        Raises:
+            RuntimeError: If called from the service loop itself.
+        """
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("SSHSessionService.run() called from its own event loop")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def forget_cluster(self, cluster_id: int) -> None:
+        """Close a cluster's sessions so the next call re-reads its settings."""
+        if self._loop is None:
+            return
+        self.run(self._forget(cluster_id))
+
+    def close(self) -> None:
+        """Close every session and stop the service loop."""
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or thread is None:
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=10)
+            except Exception as e:
+                logger.warning(f"Error closing SSH sessions: {e}")
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            self._loop = self._thread = None
+
+    # ------------------------------------------------------------------
+    # Loop-side interface
+    # ------------------------------------------------------------------
+
+    async def connection_manager(self, cluster: Cluster) -> ConnectionManager:
+        """The shared manager, with ``cluster`` registered from its current row."""
+        manager = await self._get_manager()
+        settings = _connection_settings(cluster)
+        if self._settings.get(cluster.id) != settings:
+            if cluster.id in self._settings:
+                logger.info(f"Connection settings changed for cluster {cluster.id}")
+                await self._forget(cluster.id)
+            manager.register_cluster(cluster_id=cluster.id, **settings)
+            self._settings[cluster.id] = settings
+        return manager
+
+    async def slurm_runner(self, cluster: Cluster) -> SLURMRunner:
+        """The cluster's long-lived SLURM runner."""
+        from crystalmath._vendor.runners.slurm_runner import SLURMRunner
+
+        manager = await self.connection_manager(cluster)
+        runner = self._runners.get(cluster.id)
+        if runner is None:
+            runner = SLURMRunner(connection_manager=manager, cluster_id=cluster.id)
+            self._runners[cluster.id] = runner
+        return runner
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="ssh-sessions", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    async def _get_manager(self) -> ConnectionManager:
+        if self._manager is None:
+            from crystalmath._vendor.core.connection_manager import ConnectionManager
+
+            self._manager = ConnectionManager()
+            await self._manager.start()
+        return self._manager
+
+    async def _forget(self, cluster_id: int) -> None:
+        self._settings.pop(cluster_id, None)
+        runner = self._runners.pop(cluster_id, None)
+        if runner is not None:
+            await runner.cleanup_all()
+        if self._manager is not None:
+            await self._manager.disconnect(cluster_id)
+
+    async def _shutdown(self) -> None:
+        for runner in self._runners.values():
+            await runner.cleanup_all()
+        self._runners.clear()
+        self._settings.clear()
+        if self._manager is not None:
+            await self._manager.stop()
+            self._manager = None
+
+
+_service: SSHSessionService | None = None
+_service_lock = threading.Lock()
+
+
+def get_session_service() -> SSHSessionService:
+    """Return the process-wide :class:`SSHSessionService`."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = SSHSessionService()
+            atexit.register(_service.close)
+        return _service
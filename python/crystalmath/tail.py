@@ -0,0 +1,127 @@
+"""Seek-based log tailing shared by the API, backends and server handlers.
+
+Reading the last lines of a multi-GB CRYSTAL/VASP output must not scan the
+whole file. :func:`tail_file` seeks to the end and reads backwards in blocks
+until it has enough lines; :func:`read_after` returns the complete lines
+written after a byte offset.
+
+Both return a :class:`LogTail` whose ``offset`` is a resume token: pass it to
+:func:`read_after` to receive only lines appended since. The token always
+points just past the last *complete* line, so a trailing line that is still
+being written is delivered again once it is finished.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+
+__all__ = ["LogTail", "read_after", "tail_file", "tail_text"]
+
+# Bytes read per backwards seek step
+BLOCK_SIZE = 64 * 1024
+# Upper bound on bytes returned by one read_after call
+MAX_READ_BYTES = 4 * 1024 * 1024
+
+
+@dataclass
+class LogTail:
+    """Lines read from a log file plus the offset to resume from.
+
+    Attributes:
+        lines: Decoded lines, without line terminators.
+        offset: Byte offset just past the last complete line returned.
+        truncated: True if earlier lines exist that were not returned.
+        has_more: True if read_after stopped at its byte cap before EOF.
+        reset: True if the file shrank below the requested offset (rotated or
+            truncated) and reading restarted from the beginning.
+    """
+
+    lines: list[str] = field(default_factory=list)
+    offset: int = 0
+    truncated: bool = False
+    has_more: bool = False
+    reset: bool = False
+
+
+def _decode(raw: list[bytes]) -> list[str]:
+    return [line.decode("utf-8", errors="replace").rstrip("\r") for line in raw]
+
+
+def tail_file(
+    path: str | os.PathLike[str], max_lines: int, block_size: int = BLOCK_SIZE
+) -> LogTail:
+    """Return the last ``max_lines`` lines of a file without reading all of it.
+
+    A trailing line without a newline is included (it is what a user expects
+    to see) but not consumed: ``offset`` points at its start.
+    """
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        if max_lines <= 0 or end == 0:
+            return LogTail(offset=end, truncated=end > 0)
+
+        pos = end
+        chunks: list[bytes] = []
+        newlines = 0
+        # max_lines + 1 newlines bound max_lines complete lines on both sides.
+        while pos > 0 and newlines <= max_lines:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+
+    data = b"".join(reversed(chunks))
+    raw = data.split(b"\n")
+    if pos > 0:
+        # First piece started mid-line.
+        raw = raw[1:]
+    partial = raw.pop()
+    resume = end - len(partial)
+    if partial:
+        raw.append(partial)
+
+    truncated = pos > 0 or len(raw) > max_lines
+    return LogTail(lines=_decode(raw[-max_lines:]), offset=resume, truncated=truncated)
+
+
+def read_after(
+    path: str | os.PathLike[str],
+    offset: int,
+    max_bytes: int = MAX_READ_BYTES,
+) -> LogTail:
+    """Return complete lines written after byte ``offset``.
+
+    Reads at most ``max_bytes``; ``has_more`` is set when the cap was hit. If
+    the file is now shorter than ``offset`` it was truncated or rotated, so
+    reading restarts at 0 and ``reset`` is set.
+    """
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        reset = offset > end
+        if reset or offset < 0:
+            offset = 0
+        f.seek(offset)
+        data = f.read(min(end - offset, max_bytes))
+
+    cut = data.rfind(b"\n") + 1
+    if cut == 0 and len(data) == max_bytes:
+        # A single line longer than the cap: deliver it rather than stall.
+        cut = len(data)
+    raw = data[:cut].split(b"\n")
+    if raw and raw[-1] == b"":
+        raw.pop()
+
+    return LogTail(
+        lines=_decode(raw),
+        offset=offset + cut,
+        has_more=offset + len(data) < end,
+        reset=reset,
+    )
+
+
+def tail_text(path: str | os.PathLike[str], max_lines: int) -> str:
+    """Convenience wrapper returning the last lines of a file joined by newlines."""
+    return "\n".join(tail_file(path, max_lines).lines)
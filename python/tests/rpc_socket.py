@@ -0,0 +1,72 @@
+"""Helpers for talking to a JsonRpcServer over a real Unix socket in tests."""
+
+import asyncio
+import contextlib
+import json
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from crystalmath.server import JsonRpcServer
+from crystalmath.server.framing import (
+    HEADER_SIZE,
+    MSG_JSON_ATTACHMENTS,
+    AttachmentCollector,
+    pack_frame,
+    unpack_header,
+)
+
+
+@contextlib.asynccontextmanager
+async def running_server(controller: Any, **server_kwargs: Any):
+    """Serve on a short socket path (AF_UNIX paths are length-limited)."""
+    with tempfile.TemporaryDirectory(prefix="cm") as tmp:
+        server = JsonRpcServer(
+            socket_path=Path(tmp) / "s.sock",
+            inactivity_timeout=0,
+            controller=controller,
+            **server_kwargs,
+        )
+        task = asyncio.create_task(server.serve_forever())
+        for _ in range(100):
+            if server.socket_path.exists():
+                break
+            await asyncio.sleep(0.01)
+        reader, writer = await asyncio.open_unix_connection(str(server.socket_path))
+        try:
+            yield reader, writer
+        finally:
+            writer.close()
+            server.shutdown()
+            await asyncio.wait_for(task, timeout=5)
+
+
+async def send(writer: asyncio.StreamWriter, message: Any) -> None:
+    """Write one Content-Length framed message."""
+    payload = json.dumps(message).encode()
+    writer.write(f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload)
+    await writer.drain()
+
+
+async def receive(reader: asyncio.StreamReader) -> Any:
+    """Read one Content-Length framed message."""
+    length = 0
+    while line := (await asyncio.wait_for(reader.readline(), timeout=5)).strip():
+        length = int(line.split(b":")[1])
+    return json.loads(await reader.readexactly(length))
+
+
+async def send_frame(writer: asyncio.StreamWriter, message: Any, msg_type: int) -> None:
+    """Write one CMAT frame; MSG_JSON_ATTACHMENTS requests carry an empty blob."""
+    payload = json.dumps(message).encode()
+    if msg_type == MSG_JSON_ATTACHMENTS:
+        payload = AttachmentCollector().encode_payload(payload.decode())
+    writer.write(pack_frame(payload, msg_type))
+    await writer.drain()
+
+
+async def receive_frame(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    """Read one CMAT frame as (msg_type, payload)."""
+    header = await asyncio.wait_for(reader.readexactly(HEADER_SIZE), timeout=5)
+    payload_len, msg_type = unpack_header(header)
+    return msg_type, await reader.readexactly(payload_len)
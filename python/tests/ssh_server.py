@@ -0,0 +1,106 @@
+"""A local asyncssh server that answers SLURM commands, for SSH tests."""
+
+import asyncio
+import contextlib
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+import asyncssh
+
+SQUEUE_JOBS = [
+    {"job_id": 101, "name": "relax", "user_name": "alice", "job_state": ["RUNNING"]},
+    {"job_id": 102, "name": "bands", "user_name": "alice", "job_state": ["PENDING"]},
+]
+
+
+class FakeSlurmServer:
+    """SSH server on 127.0.0.1 whose commands mimic squeue/sacct/scancel.
+
+    Runs on its own event loop thread so synchronous code under test can
+    connect to it. Counts accepted connections and records commands.
+    ``sacct_states`` maps job IDs to the state sacct reports, and ``delay``
+    holds every command back to simulate a slow login node.
+    """
+
+    def __init__(self, workdir: Path) -> None:
+        self.workdir = workdir
+        self.connections = 0
+        self.commands: list[str] = []
+        self.sacct_states = {"101": "COMPLETED"}
+        self.delay = 0.0
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._server: asyncssh.SSHAcceptor | None = None
+        self.port = 0
+
+        host_key = asyncssh.generate_private_key("ssh-ed25519")
+        client_key = asyncssh.generate_private_key("ssh-ed25519")
+        self.key_file = workdir / "id_ed25519"
+        client_key.write_private_key(str(self.key_file))
+        self._host_key = host_key
+        self._authorized = asyncssh.import_authorized_keys(client_key.export_public_key().decode())
+
+    def connection_config(self) -> dict[str, Any]:
+        """connection_config for a clusters row pointing at this server."""
+        return {"key_file": str(self.key_file), "known_hosts_file": str(self.known_hosts)}
+
+    def start(self) -> None:
+        self._thread.start()
+        self._server = asyncio.run_coroutine_threadsafe(self._listen(), self._loop).result()
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.known_hosts = self.workdir / "known_hosts"
+        public = self._host_key.export_public_key().decode().strip()
+        self.known_hosts.write_text(f"[127.0.0.1]:{self.port} {public}\n")
+
+    def stop(self) -> None:
+        async def _close() -> None:
+            self._server.close()
+            await self._server.wait_closed()
+            # Drop commands still held back by ``delay``
+            for task in asyncio.all_tasks():
+                if task is not asyncio.current_task():
+                    task.cancel()
+
+        asyncio.run_coroutine_threadsafe(_close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+    async def _listen(self) -> asyncssh.SSHAcceptor:
+        server = self
+
+        class _Server(asyncssh.SSHServer):
+            def connection_made(self, conn: asyncssh.SSHServerConnection) -> None:
+                server.connections += 1
+
+        return await asyncssh.create_server(
+            _Server,
+            "127.0.0.1",
+            0,
+            server_host_keys=[self._host_key],
+            authorized_client_keys=self._authorized,
+            process_factory=self._handle,
+        )
+
+    async def _handle(self, process: asyncssh.SSHServerProcess) -> None:
+        command = process.command or ""
+        self.commands.append(command)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if command.startswith("squeue") and "--json" in command:
+            process.stdout.write(json.dumps({"jobs": SQUEUE_JOBS}))
+        elif command.startswith("sacct"):
+            for job_id, state in self.sacct_states.items():
+                process.stdout.write(f"{job_id}|{state}\n")
+        process.exit(0)
+
+
+@contextlib.contextmanager
+def fake_slurm_server(workdir: Path):
+    server = FakeSlurmServer(workdir)
+    server.start()
+    try:
+        yield server
+    finally:
+        server.stop()
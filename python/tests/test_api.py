@@ -314,6 +314,69 @@ class TestJobStatusParsing:
         assert isinstance(details.state, JobState)
 
 
+class TestJobPagination:
+    """Tests for paginated, filtered job listing."""
+
+    def test_sqlite_pages_walk_all_jobs(self, tmp_path):
+        """SQLite backend pages through jobs with a keyset cursor."""
+        controller = CrystalController(use_aiida=False, db_path=str(tmp_path / "jobs.db"))
+        db = controller._backend._db
+        for i in range(5):
+            db.create_job(f"job_{i}", str(tmp_path / f"job_{i}"), "input", dft_code="vasp")
+
+        response = json.loads(controller.get_jobs_page_json(limit=2))
+        assert response["ok"] is True
+        first = response["data"]
+        assert len(first["jobs"]) == 2
+        assert first["next_cursor"] is not None
+
+        names = [j["name"] for j in first["jobs"]]
+        cursor = first["next_cursor"]
+        while cursor:
+            page = json.loads(controller.get_jobs_page_json(limit=2, cursor=cursor))["data"]
+            names.extend(j["name"] for j in page["jobs"])
+            cursor = page["next_cursor"]
+
+        assert names == [f"job_{i}" for i in reversed(range(5))]
+
+    def test_sqlite_filters_by_state(self, tmp_path):
+        """JobState filters map onto database statuses."""
+        controller = CrystalController(use_aiida=False, db_path=str(tmp_path / "jobs.db"))
+        db = controller._backend._db
+        pending = db.create_job("pending", str(tmp_path / "p"), "input")
+        running = db.create_job("running", str(tmp_path / "r"), "input")
+        db.update_status(running, "RUNNING")
+
+        assert [j.pk for j in controller.get_jobs(status="CREATED")] == [pending]
+        assert [j.pk for j in controller.get_jobs(status="RUNNING")] == [running]
+
+    def test_invalid_cursor_is_structured_error(self, tmp_path):
+        """A malformed cursor returns a structured error."""
+        controller = CrystalController(use_aiida=False, db_path=str(tmp_path / "jobs.db"))
+        response = json.loads(controller.get_jobs_page_json(cursor="bogus"))
+        assert response["ok"] is False
+        assert response["error"]["code"] == "INVALID_CURSOR"
+
+    def test_demo_backend_default_pagination(self):
+        """Backends without a query engine paginate in Python."""
+        controller = CrystalController(use_aiida=False)
+        all_jobs = controller.get_jobs()
+        page, cursor = controller.get_jobs_page(limit=1)
+        assert [j.pk for j in page] == [all_jobs[0].pk]
+        assert cursor == "1"
+
+    def test_demo_backend_rejects_cluster_filter(self):
+        """A cluster filter the backend cannot apply is an error, not ignored."""
+        controller = CrystalController(use_aiida=False)
+
+        with pytest.raises(NotImplementedError):
+            controller.get_jobs_page(cluster_id=1)
+
+        response = json.loads(controller.get_jobs_page_json(cluster_id=1))
+        assert response["ok"] is False
+        assert response["error"]["code"] == "UNSUPPORTED_FILTER"
+
+
 class TestJobLogRetrieval:
     """Tests for log retrieval."""
 
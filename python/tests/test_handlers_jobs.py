@@ -0,0 +1,177 @@
+"""Tests for the SQLite-backed jobs.* RPC handlers.
+
+Covers the jobs.changes delta feed used by the TUI instead of full list refreshes.
+"""
+
+from pathlib import Path
+
+import pytest
+from crystalmath.api import CrystalController
+
+
+@pytest.fixture
+def controller(tmp_path: Path) -> CrystalController:
+    """Controller backed by a fresh SQLite database."""
+    return CrystalController(use_aiida=False, db_path=str(tmp_path / "jobs.db"))
+
+
+class TestJobsChangesHandler:
+    """Tests for jobs.changes."""
+
+    @pytest.mark.asyncio
+    async def test_changes_from_zero_returns_all_jobs(
+        self, controller: CrystalController, tmp_path: Path
+    ) -> None:
+        """since_seq=0 returns every job and the head sequence."""
+        from crystalmath.server.handlers import HANDLER_REGISTRY
+
+        db = controller._backend._db
+        db.create_job("a", str(tmp_path / "a"), "input")
+        db.create_job("b", str(tmp_path / "b"), "input")
+
+        result = await HANDLER_REGISTRY["jobs.changes"](controller, {})
+
+        assert result["ok"] is True
+        data = result["data"]
+        assert {j["name"] for j in data["jobs"]} == {"a", "b"}
+        assert data["seq"] == db.get_change_seq()
+        assert data["reset"] is False
+
+    @pytest.mark.asyncio
+    async def test_changes_only_returns_updated_and_deleted(
+        self, controller: CrystalController, tmp_path: Path
+    ) -> None:
+        """Only jobs touched after since_seq are returned."""
+        from crystalmath.server.handlers import HANDLER_REGISTRY
+
+        db = controller._backend._db
+        a = db.create_job("a", str(tmp_path / "a"), "input")
+        b = db.create_job("b", str(tmp_path / "b"), "input")
+        db.create_job("c", str(tmp_path / "c"), "input")
+        since = db.get_change_seq()
+
+        db.update_status(a, "RUNNING")
+        with db.connection() as conn, conn:
+            conn.execute("DELETE FROM jobs WHERE id = ?", (b,))
+
+        handler = HANDLER_REGISTRY["jobs.changes"]
+        data = (await handler(controller, {"since_seq": since}))["data"]
+
+        assert [j["pk"] for j in data["jobs"]] == [a]
+        assert data["jobs"][0]["state"] == "RUNNING"
+        assert data["deleted"] == [b]
+
+        idle = (await handler(controller, {"since_seq": data["seq"]}))["data"]
+        assert idle["jobs"] == []
+        assert idle["deleted"] == []
+
+    @pytest.mark.asyncio
+    async def test_changes_limit_sets_has_more(
+        self, controller: CrystalController, tmp_path: Path
+    ) -> None:
+        """A limited page reports has_more and resumes from its seq."""
+        from crystalmath.server.handlers import HANDLER_REGISTRY
+
+        db = controller._backend._db
+        for name in ("a", "b", "c"):
+            db.create_job(name, str(tmp_path / name), "input")
+
+        handler = HANDLER_REGISTRY["jobs.changes"]
+        first = (await handler(controller, {"limit": 2}))["data"]
+        assert len(first["jobs"]) == 2
+        assert first["has_more"] is True
+
+        rest = (await handler(controller, {"since_seq": first["seq"]}))["data"]
+        assert [j["name"] for j in rest["jobs"]] == ["c"]
+        assert rest["has_more"] is False
+
+    @pytest.mark.asyncio
+    async def test_changes_future_seq_resets(
+        self, controller: CrystalController, tmp_path: Path
+    ) -> None:
+        """A sequence ahead of the database triggers a full reset snapshot."""
+        from crystalmath.server.handlers import HANDLER_REGISTRY
+
+        controller._backend._db.create_job("a", str(tmp_path / "a"), "input")
+
+        data = (await HANDLER_REGISTRY["jobs.changes"](controller, {"since_seq": 10_000}))["data"]
+        assert data["reset"] is True
+        assert [j["name"] for j in data["jobs"]] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_changes_rejects_bad_params(self, controller: CrystalController) -> None:
+        """Negative since_seq is rejected."""
+        from crystalmath.server.handlers import HANDLER_REGISTRY
+
+        result = await HANDLER_REGISTRY["jobs.changes"](controller, {"since_seq": -1})
+        assert result["ok"] is False
+
+
+class TestJobsGetOutputFileHandler:
+    """Tests for jobs.get_output_file tailing and offset resume."""
+
+    @pytest.mark.asyncio
+    async def test_tail_then_resume_from_offset(
+        self, controller: CrystalController, tmp_path: Path
+    ) -> None:
+        """A tail response's offset returns only lines appended since."""
+        from crystalmath.server.handlers import HANDLER_REGISTRY
+
+        work_dir = tmp_path / "job"
+        work_dir.mkdir()
+        outcar = work_dir / "OUTCAR"
+        outcar.write_text("".join(f"step {i}\n" for i in range(500)))
+        pk = controller._backend._db.create_job("relax", str(work_dir), "input")
+
+        handler = HANDLER_REGISTRY["jobs.get_output_file"]
+        tail = (await handler(controller, {"job_pk": pk, "tail_lines": 2}))["data"]
+        assert tail["content"] == "step 498\nstep 499\n"
+        assert tail["truncated"] is True
+        assert tail["offset"] == outcar.stat().st_size
+
+        with outcar.open("a") as f:
+            f.write("step 500\n")
+        params = {"job_pk": pk, "after_offset": tail["offset"]}
+        after = (await handler(controller, params))["data"]
+        assert after["content"] == "step 500\n"
+        assert after["reset"] is False
+
+    @pytest.mark.asyncio
+    async def test_rejects_negative_offset(self, controller: CrystalController) -> None:
+        """Negative after_offset is rejected before touching the job."""
+        from crystalmath.server.handlers import HANDLER_REGISTRY
+
+        params = {"job_pk": 1, "after_offset": -5}
+        result = await HANDLER_REGISTRY["jobs.get_output_file"](controller, params)
+        assert result["ok"] is False
+
+
+class TestJobsAnalyzeErrorsHandler:
+    """Tests for jobs.analyze_errors."""
+
+    @pytest.mark.asyncio
+    async def test_picks_up_errors_appended_between_calls(
+        self, controller: CrystalController, tmp_path: Path
+    ) -> None:
+        """Polling reports errors written after the previous call."""
+        from crystalmath.server.handlers import HANDLER_REGISTRY
+
+        work_dir = tmp_path / "job"
+        work_dir.mkdir()
+        outcar = work_dir / "OUTCAR"
+        outcar.write_text(" running on 4 nodes\n")
+        pk = controller._backend._db.create_job("relax", str(work_dir), "input")
+
+        handler = HANDLER_REGISTRY["jobs.analyze_errors"]
+        first = (await handler(controller, {"job_pk": pk}))["data"]
+        assert first["has_errors"] is False
+
+        with outcar.open("a") as f:
+            f.write(" ZBRENT: fatal error in bracketing\n")
+        second = (await handler(controller, {"job_pk": pk}))["data"]
+
+        assert [e["code"] for e in second["errors"]] == ["ZBRENT"]
+        error = second["errors"][0]
+        assert error["severity"] == "recoverable"
+        assert error["line_content"] == "ZBRENT: fatal error in bracketing"
+        assert error["incar_changes"]["POTIM"] == "0.1"
@@ -0,0 +1,380 @@
+"""Tests for concurrent, pipelined and batched handling in JsonRpcServer."""
+
+import asyncio
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from crystalmath.api import JSONRPC_METHOD_NOT_FOUND, JsonRpcError
+from crystalmath.server import JsonRpcServer
+from crystalmath.server.framing import (
+    MSG_JSON,
+    MSG_JSON_ATTACHMENTS,
+    AttachmentCollector,
+    decode_payload,
+    split_payload,
+)
+from crystalmath.server.handlers import HANDLER_REGISTRY
+
+from tests.rpc_socket import receive, receive_frame, running_server, send, send_frame
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+requires_numpy = pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+
+
+class SlowRemoteController:
+    """Controller stub whose remote call blocks until released."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.threads: dict[str, str] = {}
+
+    def dispatch(self, request_json: str) -> str:
+        request = json.loads(request_json)
+        method = request["method"]
+        self.threads[method] = threading.current_thread().name
+        if method == "sync_remote_jobs":
+            self.release.wait(timeout=5)
+        return json.dumps({"jsonrpc": "2.0", "result": method, "id": request.get("id")})
+
+
+class NativeController:
+    """Controller stub exposing only the native ``call`` entry point."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, object]] = []
+
+    def call(self, method_name: str, params: object = None) -> object:
+        self.calls.append((method_name, params))
+        if method_name == "missing":
+            raise JsonRpcError(JSONRPC_METHOD_NOT_FOUND, f"Method not found: {method_name}")
+        return {"jobs": [{"pk": 1}], "params": params}
+
+
+class RecordingConnection:
+    """Stands in for ClientConnection; records what the server writes."""
+
+    binary = False
+
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+
+    async def send(self, message: str) -> None:
+        self.sent.append(message)
+
+
+class TestNativeDispatch:
+    """Parsed params go to controller.call and results are encoded once."""
+
+    @pytest.mark.asyncio
+    async def test_call_receives_parsed_params(self) -> None:
+        """Params arrive as the parsed object, positional lists included."""
+        controller = NativeController()
+
+        async with running_server(controller) as (reader, writer):
+            await send(
+                writer,
+                {"jsonrpc": "2.0", "method": "fetch_jobs", "params": {"limit": 5}, "id": 1},
+            )
+            named = await receive(reader)
+            await send(writer, {"jsonrpc": "2.0", "method": "fetch_jobs", "params": [5], "id": 2})
+            positional = await receive(reader)
+
+        assert named["result"] == {"jobs": [{"pk": 1}], "params": {"limit": 5}}
+        assert positional["result"]["params"] == [5]
+        assert controller.calls == [("fetch_jobs", {"limit": 5}), ("fetch_jobs", [5])]
+
+    @pytest.mark.asyncio
+    async def test_call_errors_become_jsonrpc_errors(self) -> None:
+        """JsonRpcError from the controller keeps its code and the request id."""
+        async with running_server(NativeController()) as (reader, writer):
+            await send(writer, {"jsonrpc": "2.0", "method": "missing", "id": 7})
+            response = await receive(reader)
+
+        assert response["id"] == 7
+        assert response["error"]["code"] == JSONRPC_METHOD_NOT_FOUND
+
+    @pytest.mark.asyncio
+    async def test_shutdown_is_signalled_out_of_band(self, tmp_path) -> None:
+        """system.shutdown stops the server after its response is written."""
+        server = JsonRpcServer(socket_path=tmp_path / "s.sock", controller=NativeController())
+        connection = RecordingConnection()
+
+        await server._respond(
+            json.dumps({"jsonrpc": "2.0", "method": "system.ping", "id": 1}), connection
+        )
+        assert not server._shutdown_event.is_set()
+
+        await server._respond(
+            json.dumps({"jsonrpc": "2.0", "method": "system.shutdown", "id": 2}), connection
+        )
+        assert server._shutdown_event.is_set()
+        assert json.loads(connection.sent[-1])["result"] == {"acknowledged": True}
+
+
+class TestPipelining:
+    """Requests on one connection do not wait for earlier slow ones."""
+
+    @pytest.mark.asyncio
+    async def test_fast_call_answers_before_slow_call(self) -> None:
+        """A cheap call sent after an SSH-bound one is answered first."""
+        controller = SlowRemoteController()
+
+        async with running_server(controller) as (reader, writer):
+            await send(writer, {"jsonrpc": "2.0", "method": "sync_remote_jobs", "id": 1})
+            await send(writer, {"jsonrpc": "2.0", "method": "fetch_jobs", "id": 2})
+
+            start = time.monotonic()
+            first = await receive(reader)
+            assert first["id"] == 2
+            assert time.monotonic() - start < 1
+
+            controller.release.set()
+            second = await receive(reader)
+            assert second["id"] == 1
+
+        assert controller.threads["sync_remote_jobs"].startswith("rpc-remote")
+        assert controller.threads["fetch_jobs"].startswith("rpc-local")
+
+    @pytest.mark.asyncio
+    async def test_half_close_drains_pending_responses(self) -> None:
+        """A client that shuts down its write side still gets its answers."""
+        controller = SlowRemoteController()
+
+        async with running_server(controller) as (reader, writer):
+            await send(writer, {"jsonrpc": "2.0", "method": "sync_remote_jobs", "id": 1})
+            writer.write_eof()
+            await asyncio.sleep(0.1)
+            controller.release.set()
+            response = await receive(reader)
+
+        assert response == {"jsonrpc": "2.0", "result": "sync_remote_jobs", "id": 1}
+
+
+class TestBatch:
+    """JSON-RPC batch arrays."""
+
+    @pytest.mark.asyncio
+    async def test_batch_returns_responses_for_requests_only(self) -> None:
+        """Each request gets a response; notifications are skipped."""
+        controller = SlowRemoteController()
+        controller.release.set()
+
+        async with running_server(controller) as (reader, writer):
+            await send(
+                writer,
+                [
+                    {"jsonrpc": "2.0", "method": "fetch_jobs", "id": 1},
+                    {"jsonrpc": "2.0", "method": "fetch_clusters"},
+                    {"jsonrpc": "2.0", "method": "system.ping", "id": 2},
+                    42,
+                ],
+            )
+            response = await receive(reader)
+
+        assert [r["id"] for r in response] == [1, 2, None]
+        assert response[0]["result"] == "fetch_jobs"
+        assert response[1]["result"]["pong"] is True
+        assert response[2]["error"]["code"] == -32600
+
+    @pytest.mark.asyncio
+    async def test_single_notification_gets_no_response(self) -> None:
+        """A request without an id is answered with nothing, even on error."""
+        controller = SlowRemoteController()
+        controller.release.set()
+
+        async with running_server(controller) as (reader, writer):
+            await send(writer, {"jsonrpc": "2.0", "method": "fetch_clusters"})
+            await send(writer, {"jsonrpc": "2.0", "method": "system.nope"})
+            await send(writer, {"jsonrpc": "2.0", "method": "system.ping", "id": 3})
+            response = await receive(reader)
+
+        assert response["id"] == 3
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_is_invalid(self) -> None:
+        """An empty array is an invalid request."""
+        async with running_server(SlowRemoteController()) as (reader, writer):
+            await send(writer, [])
+            response = await receive(reader)
+
+        assert response["error"]["code"] == -32600
+
+
+@requires_numpy
+class TestAttachments:
+    """Array attachments in the CMAT framing helpers."""
+
+    def test_round_trip_preserves_arrays(self) -> None:
+        """Arrays come back with dtype and shape; scalars stay inline."""
+        dos = np.linspace(-10, 10, 12).reshape(3, 4)
+        counts = np.arange(5, dtype=np.int32)
+        collector = AttachmentCollector()
+        text = json.dumps(
+            {"dos": dos, "counts": counts, "efermi": np.float64(1.5)}, default=collector.default
+        )
+
+        decoded = decode_payload(collector.encode_payload(text), MSG_JSON_ATTACHMENTS)
+
+        np.testing.assert_array_equal(decoded["dos"], dos)
+        np.testing.assert_array_equal(decoded["counts"], counts)
+        assert decoded["efermi"] == 1.5
+
+    def test_big_endian_arrays_are_sent_little_endian(self) -> None:
+        """Non-native byte order is normalized on the wire."""
+        values = np.array([1.0, 2.0], dtype=">f8")
+        collector = AttachmentCollector()
+        text = json.dumps({"v": values}, default=collector.default)
+
+        assert json.loads(text)["v"]["dtype"] == "<f8"
+        decoded = decode_payload(collector.encode_payload(text), MSG_JSON_ATTACHMENTS)
+        np.testing.assert_array_equal(decoded["v"], values)
+
+
+class TestBinaryFraming:
+    """CMAT frames over the socket."""
+
+    @pytest.fixture
+    def bands_handler(self, monkeypatch: pytest.MonkeyPatch) -> "np.ndarray":
+        """Register a handler that returns a numpy result."""
+        bands = np.random.default_rng(0).normal(size=(40, 16))
+
+        async def handler(controller, params):
+            return {"ok": True, "data": {"bands": bands}}
+
+        monkeypatch.setitem(HANDLER_REGISTRY, "test.bands", handler)
+        return bands
+
+    @pytest.mark.asyncio
+    async def test_cmat_request_gets_cmat_response(self) -> None:
+        """The server replies in the framing the client used."""
+        async with running_server(SlowRemoteController()) as (reader, writer):
+            await send_frame(writer, {"jsonrpc": "2.0", "method": "system.ping", "id": 1}, MSG_JSON)
+            msg_type, payload = await receive_frame(reader)
+
+        assert msg_type == MSG_JSON
+        assert json.loads(payload)["result"]["pong"] is True
+
+    @requires_numpy
+    @pytest.mark.asyncio
+    async def test_arrays_sent_as_attachments_when_negotiated(
+        self, bands_handler: "np.ndarray"
+    ) -> None:
+        """Attachment-capable clients get raw arrays, text clients get lists."""
+        request = {"jsonrpc": "2.0", "method": "test.bands", "id": 1}
+
+        async with running_server(SlowRemoteController()) as (reader, writer):
+            await send_frame(writer, request, MSG_JSON_ATTACHMENTS)
+            msg_type, payload = await receive_frame(reader)
+
+        assert msg_type == MSG_JSON_ATTACHMENTS
+        decoded = decode_payload(payload, msg_type)
+        np.testing.assert_array_equal(decoded["result"]["data"]["bands"], bands_handler)
+
+        async with running_server(SlowRemoteController()) as (reader, writer):
+            await send(writer, request)
+            response = await receive(reader)
+
+        assert response["result"]["data"]["bands"] == bands_handler.tolist()
+
+
+def write_doscar(path: Path, energies: "np.ndarray", dos: "np.ndarray", efermi: float) -> None:
+    """Write a DOSCAR with a total block and one per-site block."""
+    header = f"{energies[-1]:12.8f}{energies[0]:12.8f}{len(energies):6d}{efermi:12.8f}{1.0:12.8f}"
+    lines = ["   1   1   1   0", "  0.1E+02", "  1.0E-09", "  CAR ", " test", header]
+    lines += [f"{e:12.8f}{d:12.8f}{d:12.8f}" for e, d in zip(energies, dos, strict=True)]
+    lines.append(header)
+    lines += [f"{e:12.8f}{d / 2:12.8f}{d / 2:12.8f}" for e, d in zip(energies, dos, strict=True)]
+    path.write_text("\n".join(lines) + "\n")
+
+
+@requires_numpy
+class TestBulkDataHandlers:
+    """DOS and band arrays reach CMAT clients as attachments, end to end."""
+
+    @pytest.fixture
+    def controller(self, tmp_path: Path) -> Any:
+        from crystalmath.api import CrystalController
+
+        return CrystalController(use_aiida=False, db_path=str(tmp_path / "jobs.db"))
+
+    @pytest.fixture
+    def work_dir(self, tmp_path: Path) -> Path:
+        work_dir = tmp_path / "job"
+        work_dir.mkdir()
+        return work_dir
+
+    @pytest.mark.asyncio
+    async def test_dos_sent_as_attachments(self, controller: Any, work_dir: Path) -> None:
+        """jobs.get_dos returns raw arrays to CMAT clients and lists to text clients."""
+        energies = np.linspace(-5.0, 5.0, 301)
+        dos = np.exp(-(energies**2))
+        write_doscar(work_dir / "DOSCAR", energies, dos, efermi=0.5)
+        pk = controller._backend._db.create_job("dos", str(work_dir), "input")
+        request = {"jsonrpc": "2.0", "method": "jobs.get_dos", "params": {"job_pk": pk}, "id": 1}
+
+        async with running_server(controller) as (reader, writer):
+            await send_frame(writer, request, MSG_JSON_ATTACHMENTS)
+            msg_type, payload = await receive_frame(reader)
+
+        assert msg_type == MSG_JSON_ATTACHMENTS
+        envelope, blob = split_payload(payload)
+        refs = json.loads(envelope)["result"]["data"]
+        assert refs["total"]["$attachment"] == 0
+        assert refs["total"]["shape"] == [301, 3]
+        assert len(blob) >= 301 * 3 * 8
+
+        data = decode_payload(payload, msg_type)["result"]["data"]
+        assert data["efermi"] == 0.5
+        np.testing.assert_allclose(data["total"][:, 0], energies, atol=1e-8)
+        np.testing.assert_allclose(data["total"][:, 1], dos, atol=1e-8)
+        assert data["partial"].shape == (1, 301, 3)
+
+        async with running_server(controller) as (reader, writer):
+            await send(writer, request)
+            response = await receive(reader)
+
+        assert response["result"]["data"]["total"][0] == data["total"][0].tolist()
+
+    @pytest.mark.asyncio
+    async def test_bands_sent_as_attachments(self, controller: Any, work_dir: Path) -> None:
+        """jobs.get_bands returns the EIGENVAL arrays as attachments."""
+        lines = ["    2    2    1    1", "  0.1E+02", "  1.0E-09", "  CAR ", " test"]
+        lines += ["     8  2  3", ""]
+        for k in range(2):
+            lines.append(f"  {0.5 * k:.8f}  0.00000000  0.00000000  0.50000000")
+            lines += [f"    {b + 1}  {b - 1.0 + k:.8f}  1.000000" for b in range(3)]
+            lines.append("")
+        (work_dir / "EIGENVAL").write_text("\n".join(lines) + "\n")
+        pk = controller._backend._db.create_job("bands", str(work_dir), "input")
+        request = {"jsonrpc": "2.0", "method": "jobs.get_bands", "params": {"job_pk": pk}, "id": 1}
+
+        async with running_server(controller) as (reader, writer):
+            await send_frame(writer, request, MSG_JSON_ATTACHMENTS)
+            msg_type, payload = await receive_frame(reader)
+
+        data = decode_payload(payload, msg_type)["result"]["data"]
+        assert data["ispin"] == 1
+        assert data["bands"].shape == (2, 3, 3)
+        np.testing.assert_allclose(data["bands"][1, :, 1], [0.0, 1.0, 2.0])
+        np.testing.assert_allclose(data["kpoints"][1], [0.5, 0.0, 0.0, 0.5])
+
+    @pytest.mark.asyncio
+    async def test_missing_doscar_is_an_error(self, controller: Any, work_dir: Path) -> None:
+        pk = controller._backend._db.create_job("empty", str(work_dir), "input")
+        request = {"jsonrpc": "2.0", "method": "jobs.get_dos", "params": {"job_pk": pk}, "id": 1}
+
+        async with running_server(controller) as (reader, writer):
+            await send(writer, request)
+            response = await receive(reader)
+
+        assert response["result"] == {"ok": False, "error": {"message": "File not found: DOSCAR"}}
@@ -0,0 +1,130 @@
+"""Tests for incremental pattern scanning (crystalmath.linescan)."""
+
+import os
+import re
+from pathlib import Path
+
+import pytest
+from crystalmath import linescan
+from crystalmath.linescan import LineScanner, ScanHit
+
+PATTERNS = [
+    re.compile(r"ZBRENT: fatal error", re.IGNORECASE),
+    re.compile(r"Error EDDDAV", re.IGNORECASE),
+    re.compile(r"BRMIX.*internal error", re.IGNORECASE),
+]
+
+
+@pytest.fixture
+def scanner() -> LineScanner:
+    return LineScanner(PATTERNS)
+
+
+class TestLineScanner:
+    """Tests for LineScanner."""
+
+    def test_first_hit_per_pattern_in_file_order(
+        self, scanner: LineScanner, tmp_path: Path
+    ) -> None:
+        """Each pattern is reported once, for its first line, in file order."""
+        log = tmp_path / "OUTCAR"
+        log.write_text(
+            "ok\n"
+            " BRMIX: very serious problems ... internal error\n"
+            " error EDDDAV: call to ZHEGV failed (first)\n"
+            " Error EDDDAV: call to ZHEGV failed (second)\n"
+        )
+
+        hits = scanner.scan(log)
+
+        assert hits == [
+            ScanHit(2, "BRMIX: very serious problems ... internal error"),
+            ScanHit(1, "error EDDDAV: call to ZHEGV failed (first)"),
+        ]
+
+    def test_first_pattern_wins_on_shared_line(self, scanner: LineScanner, tmp_path: Path) -> None:
+        """A line matching several patterns is attributed to the earliest one."""
+        log = tmp_path / "OUTCAR"
+        log.write_text("Error EDDDAV then ZBRENT: fatal error\n")
+
+        assert [hit.index for hit in scanner.scan(log)] == [0]
+
+    def test_only_new_bytes_are_scanned(
+        self, scanner: LineScanner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A repeated call resumes from the last offset and keeps earlier hits."""
+        log = tmp_path / "OUTCAR"
+        log.write_text("ZBRENT: fatal error in bracketing\n" + "filler\n" * 100)
+        scanner.scan(log)
+
+        searched: list[bytes] = []
+        original = LineScanner._search
+
+        def spy(self, data, found):
+            searched.append(data)
+            return original(self, data, found)
+
+        monkeypatch.setattr(LineScanner, "_search", spy)
+        with log.open("a") as f:
+            f.write("Error EDDDAV\n")
+
+        hits = scanner.scan(log)
+
+        assert [hit.index for hit in hits] == [0, 1]
+        assert searched == [b"Error EDDDAV\n"]
+
+    def test_unchanged_file_uses_cached_result(
+        self, scanner: LineScanner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Same size and mtime returns the cached hits without reading."""
+        log = tmp_path / "OUTCAR"
+        log.write_text("Error EDDDAV\n")
+        first = scanner.scan(log)
+
+        monkeypatch.setattr(LineScanner, "_advance", None)
+
+        assert scanner.scan(log) == first
+
+    def test_partial_line_is_rescanned_when_complete(
+        self, scanner: LineScanner, tmp_path: Path
+    ) -> None:
+        """An unterminated last line is reported but not committed."""
+        log = tmp_path / "OUTCAR"
+        log.write_text("Error EDD")
+        assert scanner.scan(log) == []
+
+        with log.open("a") as f:
+            f.write("DAV\n")
+
+        assert scanner.scan(log) == [ScanHit(1, "Error EDDDAV")]
+
+    def test_truncated_file_is_rescanned(self, scanner: LineScanner, tmp_path: Path) -> None:
+        """A file shorter than the committed offset starts over."""
+        log = tmp_path / "OUTCAR"
+        log.write_text("ZBRENT: fatal error\n" + "x" * 100 + "\n")
+        scanner.scan(log)
+
+        log.write_text("Error EDDDAV\n")
+        os.utime(log, ns=(1, 1))
+
+        assert [hit.index for hit in scanner.scan(log)] == [1]
+
+    def test_lines_split_across_chunks(
+        self, scanner: LineScanner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Matches straddling a chunk boundary are still found."""
+        monkeypatch.setattr(linescan, "CHUNK_SIZE", 5)
+        log = tmp_path / "OUTCAR"
+        log.write_text("aaaaaaa\n  BRMIX: internal error\nbb\n")
+
+        assert scanner.scan(log) == [ScanHit(2, "BRMIX: internal error")]
+
+    def test_str_patterns_with_flags(self, tmp_path: Path) -> None:
+        """Plain string patterns take the scanner-wide flags."""
+        log = tmp_path / "OUTCAR"
+        log.write_text("very bad news\n")
+
+        assert LineScanner([r"VERY BAD NEWS"]).scan(log) == []
+        assert LineScanner([r"VERY BAD NEWS"], flags=re.IGNORECASE).scan(log) == [
+            ScanHit(0, "very bad news")
+        ]
@@ -7,6 +7,7 @@ and job store functionality.
 
 import json
 import logging
+import sqlite3
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -22,7 +23,7 @@ from crystalmath.quacc.engines import (
     get_installed_engines,
     get_workflow_engine,
 )
-from crystalmath.quacc.store import JobMetadata, JobStatus, JobStore
+from crystalmath.quacc.store import JobMetadata, JobStatus, JobStore, migrate_json_store
 
 # =============================================================================
 # Discovery Tests
@@ -575,3 +576,141 @@ class TestJobStore:
         JobStore(store_path=store_path)
 
         assert store_path.parent.exists()
+
+    def test_job_store_save_job_updates_existing(self, tmp_path: Path) -> None:
+        """Saving an existing ID updates it in place."""
+        store = JobStore(store_path=tmp_path / "jobs.db")
+        job = JobMetadata(
+            id="job1",
+            recipe="recipe1",
+            status=JobStatus.pending,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+        store.save_job(job)
+        store.save_job(job.model_copy(update={"status": JobStatus.completed}))
+
+        jobs = store.list_jobs()
+        assert len(jobs) == 1
+        assert jobs[0].status == JobStatus.completed
+
+    def test_job_store_list_jobs_sorted_and_limited(self, tmp_path: Path) -> None:
+        """Lists newest jobs first and honours the limit."""
+        store = JobStore(store_path=tmp_path / "jobs.db")
+        for i in range(5):
+            created = datetime(2026, 1, 1 + i)
+            store.save_job(
+                JobMetadata(
+                    id=f"job{i}",
+                    recipe="recipe",
+                    status=JobStatus.pending,
+                    created_at=created,
+                    updated_at=created,
+                )
+            )
+
+        result = store.list_jobs(limit=2)
+        assert [j.id for j in result] == ["job4", "job3"]
+
+    def test_job_store_shared_between_instances(self, tmp_path: Path) -> None:
+        """Writes from one store instance are visible to another."""
+        writer = JobStore(store_path=tmp_path / "jobs.db")
+        reader = JobStore(store_path=tmp_path / "jobs.db")
+        writer.save_job(
+            JobMetadata(
+                id="shared",
+                recipe="recipe",
+                status=JobStatus.running,
+                created_at=datetime.now(),
+                updated_at=datetime.now(),
+            )
+        )
+
+        loaded = reader.get_job("shared")
+        assert loaded is not None
+        assert loaded.status == JobStatus.running
+
+    def test_job_store_migrates_legacy_json_once(self, tmp_path: Path) -> None:
+        """Legacy jobs.json is imported once and renamed."""
+        store_path = tmp_path / "jobs.json"
+        now = datetime.now().isoformat()
+        store_path.write_text(
+            json.dumps(
+                {
+                    "jobs": [
+                        {
+                            "id": "legacy",
+                            "recipe": "recipe",
+                            "status": "completed",
+                            "created_at": now,
+                            "updated_at": now,
+                        }
+                    ]
+                }
+            )
+        )
+
+        store = JobStore(store_path=store_path)
+
+        assert not store_path.exists()
+        assert (tmp_path / "jobs.json.migrated").exists()
+        assert store.db_path == tmp_path / "jobs.db"
+        assert store.get_job("legacy") is not None
+        assert migrate_json_store(store_path, store.db_path) == 0
+
+    def test_migrate_does_not_overwrite_newer_jobs(self, tmp_path: Path) -> None:
+        """A stale legacy entry never rolls back a newer stored job."""
+        store = JobStore(store_path=tmp_path / "jobs.db")
+        store.save_job(
+            JobMetadata(
+                id="job1",
+                recipe="recipe",
+                status=JobStatus.completed,
+                created_at=datetime(2026, 1, 1),
+                updated_at=datetime(2026, 1, 2),
+            )
+        )
+        legacy = tmp_path / "jobs.json"
+        legacy.write_text(
+            json.dumps(
+                [
+                    {
+                        "id": "job1",
+                        "recipe": "recipe",
+                        "status": "pending",
+                        "created_at": "2026-01-01T00:00:00",
+                        "updated_at": "2026-01-01T00:00:00",
+                    }
+                ]
+            )
+        )
+
+        # The skipped stale entry is not counted as imported
+        assert migrate_json_store(legacy, store.db_path) == 0
+        loaded = store.get_job("job1")
+        assert loaded is not None
+        assert loaded.status == JobStatus.completed
+
+    def test_list_jobs_without_limit(self, tmp_path: Path) -> None:
+        """limit=None returns every job."""
+        store = JobStore(store_path=tmp_path / "jobs.db")
+        for i in range(3):
+            store.save_job(
+                JobMetadata(
+                    id=f"job{i}",
+                    recipe="recipe",
+                    status=JobStatus.pending,
+                    created_at=datetime(2026, 1, 1 + i),
+                    updated_at=datetime(2026, 1, 1 + i),
+                )
+            )
+
+        assert len(store.list_jobs(limit=None)) == 3
+
+    def test_job_store_context_manager_closes(self, tmp_path: Path) -> None:
+        """Leaving the with block closes the connection."""
+        with JobStore(store_path=tmp_path / "jobs.db") as store:
+            assert store.list_jobs() == []
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            store.list_jobs()
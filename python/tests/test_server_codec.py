@@ -0,0 +1,38 @@
+"""Tests for the JSON codec used on the IPC boundary."""
+
+import json
+import math
+
+import pytest
+from crystalmath.server import codec
+
+
+@pytest.fixture(params=[False, True], ids=["stdlib", "orjson"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    """Run each test against the stdlib encoder and, if installed, orjson."""
+    if request.param and not codec.HAS_ORJSON:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(codec, "HAS_ORJSON", request.param)
+    return request.param
+
+
+class TestDumps:
+    """Both encoders produce the same wire format."""
+
+    def test_non_finite_floats_become_null(self, backend: bool) -> None:
+        payload = {"energy": math.nan, "bounds": [-math.inf, 1.5, math.inf]}
+
+        assert json.loads(codec.dumps(payload)) == {"energy": None, "bounds": [None, 1.5, None]}
+
+    def test_non_finite_floats_from_default_become_null(self, backend: bool) -> None:
+        class Series:
+            values = (0.5, math.nan)
+
+        encoded = codec.dumps({"series": Series()}, default=lambda o: list(o.values))
+
+        assert json.loads(encoded) == {"series": [0.5, None]}
+
+    def test_finite_payload_round_trips(self, backend: bool) -> None:
+        payload = {"id": 1, "values": [0.1, -2.0], "name": "job", "ok": True, "none": None}
+
+        assert codec.loads(codec.dumps(payload)) == payload
@@ -0,0 +1,232 @@
+"""Tests for server-push subscriptions over the JSON-RPC socket."""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+from crystalmath.api import CrystalController
+from crystalmath.server import subscriptions
+from crystalmath.server.subscriptions import NOTIFICATION_METHOD, EventBuffer
+
+from tests.rpc_socket import receive, running_server, send
+
+
+@pytest.fixture
+def controller(tmp_path: Path) -> CrystalController:
+    """Controller backed by a fresh SQLite database."""
+    return CrystalController(use_aiida=False, db_path=str(tmp_path / "jobs.db"))
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Poll sources quickly so tests do not wait on production intervals."""
+    monkeypatch.setattr(subscriptions._JobStateSource, "interval", 0.02)
+    monkeypatch.setattr(subscriptions._JobLogSource, "interval", 0.02)
+
+
+async def receive_events(reader: asyncio.StreamReader, count: int) -> list[dict]:
+    events: list[dict] = []
+    while len(events) < count:
+        message = await receive(reader)
+        assert message["method"] == NOTIFICATION_METHOD
+        events.extend(message["params"]["events"])
+    return events
+
+
+class TestEventBuffer:
+    """Tests for per-subscription buffering."""
+
+    @pytest.mark.asyncio
+    async def test_keyed_events_coalesce_to_latest(self) -> None:
+        """Pending events with the same key are replaced, not queued."""
+        buffer = EventBuffer()
+        buffer.put({"pk": 1, "state": "QUEUED"}, key=1)
+        buffer.put({"pk": 2, "state": "QUEUED"}, key=2)
+        buffer.put({"pk": 1, "state": "RUNNING"}, key=1)
+
+        events, dropped = await buffer.drain()
+
+        assert events == [{"pk": 2, "state": "QUEUED"}, {"pk": 1, "state": "RUNNING"}]
+        assert dropped == 0
+
+    @pytest.mark.asyncio
+    async def test_overflow_drops_oldest_and_counts(self) -> None:
+        """A full buffer drops the oldest unkeyed events and reports the count."""
+        buffer = EventBuffer(max_events=3)
+        for i in range(5):
+            buffer.put(i)
+
+        events, dropped = await buffer.drain()
+
+        assert events == [2, 3, 4]
+        assert dropped == 2
+
+    @pytest.mark.asyncio
+    async def test_close_wakes_waiting_consumer(self) -> None:
+        """Closing an empty buffer ends a pending drain."""
+        buffer = EventBuffer()
+        waiter = asyncio.create_task(buffer.drain())
+        await asyncio.sleep(0)
+        buffer.close()
+
+        assert await asyncio.wait_for(waiter, timeout=1) == ([], 0)
+
+
+class TestSubscriptionsOverSocket:
+    """End-to-end subscription tests over a real Unix socket."""
+
+    @pytest.mark.asyncio
+    async def test_job_state_transitions_are_pushed(
+        self, controller: CrystalController, tmp_path: Path
+    ) -> None:
+        """State changes arrive as notifications without polling."""
+        db = controller._backend._db
+        existing = db.create_job("existing", str(tmp_path / "e"), "input")
+
+        async with running_server(controller) as (reader, writer):
+            await send(
+                writer,
+                {
+                    "jsonrpc": "2.0",
+                    "method": "subscribe",
+                    "params": {"topic": "jobs.state"},
+                    "id": 1,
+                },
+            )
+            response = await receive(reader)
+            assert response["result"]["topic"] == "jobs.state"
+            sub_id = response["result"]["subscription"]
+
+            await asyncio.to_thread(db.update_status, existing, "RUNNING")
+            (event,) = await receive_events(reader, 1)
+            assert event["pk"] == existing
+            assert event["state"] == "RUNNING"
+            assert event["previous_state"] == "CREATED"
+
+            await send(
+                writer,
+                {
+                    "jsonrpc": "2.0",
+                    "method": "unsubscribe",
+                    "params": {"subscription": sub_id},
+                    "id": 2,
+                },
+            )
+            assert (await receive(reader))["result"] == {"unsubscribed": True}
+
+    @pytest.mark.asyncio
+    async def test_job_log_lines_are_pushed(
+        self, controller: CrystalController, tmp_path: Path
+    ) -> None:
+        """Appended log lines stream to the subscriber with resume offsets."""
+        work_dir = tmp_path / "job"
+        work_dir.mkdir()
+        log = work_dir / "stdout.log"
+        log.write_text("before subscribe\n")
+        pk = controller._backend._db.create_job("job", str(work_dir), "input")
+
+        async with running_server(controller) as (reader, writer):
+            await send(
+                writer,
+                {
+                    "jsonrpc": "2.0",
+                    "method": "subscribe",
+                    "params": {"topic": "jobs.log", "job_pk": pk},
+                    "id": 1,
+                },
+            )
+            assert "result" in await receive(reader)
+
+            with log.open("a") as f:
+                f.write("line 1\nline 2\npart")
+            (event,) = await receive_events(reader, 1)
+
+            assert event["lines"] == ["line 1", "line 2"]
+            assert event["offset"] == log.stat().st_size - len("part")
+
+    @pytest.mark.asyncio
+    async def test_job_log_created_after_subscribe_is_read_from_start(
+        self, controller: CrystalController, tmp_path: Path
+    ) -> None:
+        """Lines written before a late-created log is found are not dropped."""
+        work_dir = tmp_path / "job"
+        work_dir.mkdir()
+        log = work_dir / "stdout.log"
+        pk = controller._backend._db.create_job("job", str(work_dir), "input")
+
+        async with running_server(controller) as (reader, writer):
+            await send(
+                writer,
+                {
+                    "jsonrpc": "2.0",
+                    "method": "subscribe",
+                    "params": {"topic": "jobs.log", "job_pk": pk},
+                    "id": 1,
+                },
+            )
+            assert "result" in await receive(reader)
+
+            log.write_text("first\nsecond\n")
+            (event,) = await asyncio.wait_for(receive_events(reader, 1), 5)
+
+            assert event["lines"] == ["first", "second"]
+            assert event["offset"] == len("first\nsecond\n")
+
+    @pytest.mark.asyncio
+    async def test_job_log_waits_on_file_changes_not_interval(
+        self, controller: CrystalController, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Appends are pushed by the file watcher, not the next poll tick."""
+        monkeypatch.setattr(subscriptions._JobLogSource, "interval", 60.0)
+        work_dir = tmp_path / "job"
+        work_dir.mkdir()
+        log = work_dir / "stdout.log"
+        log.write_text("")
+        pk = controller._backend._db.create_job("job", str(work_dir), "input")
+
+        async with running_server(controller) as (reader, writer):
+            await send(
+                writer,
+                {
+                    "jsonrpc": "2.0",
+                    "method": "subscribe",
+                    "params": {"topic": "jobs.log", "job_pk": pk},
+                    "id": 1,
+                },
+            )
+            assert "result" in await receive(reader)
+
+            for i in range(3):
+                with log.open("a") as f:
+                    f.write(f"step {i}\n")
+                (event,) = await asyncio.wait_for(receive_events(reader, 1), 5)
+                assert event["lines"] == [f"step {i}"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_topic_is_rejected(self, controller: CrystalController) -> None:
+        """Unknown topics return INVALID_PARAMS."""
+        async with running_server(controller) as (reader, writer):
+            await send(
+                writer,
+                {"jsonrpc": "2.0", "method": "subscribe", "params": {"topic": "nope"}, "id": 1},
+            )
+            response = await receive(reader)
+
+        assert response["error"]["code"] == -32602
+
+    @pytest.mark.asyncio
+    async def test_non_list_job_pks_is_rejected(self, controller: CrystalController) -> None:
+        """A job_pks filter that is not a list of ints returns INVALID_PARAMS."""
+        async with running_server(controller) as (reader, writer):
+            await send(
+                writer,
+                {
+                    "jsonrpc": "2.0",
+                    "method": "subscribe",
+                    "params": {"topic": "jobs.state", "job_pks": 5},
+                    "id": 1,
+                },
+            )
+            response = await receive(reader)
+
+        assert response["error"]["code"] == -32602
@@ -0,0 +1,197 @@
+"""Tests for the process-wide SSH session service (crystalmath.ssh_sessions)."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+asyncssh = pytest.importorskip("asyncssh")
+
+from crystalmath.api import CrystalController  # noqa: E402
+from crystalmath.ssh_sessions import SSHSessionService  # noqa: E402
+
+from tests.ssh_server import fake_slurm_server  # noqa: E402
+
+
+@pytest.fixture
+def slurm_server(tmp_path: Path):
+    with fake_slurm_server(tmp_path) as server:
+        yield server
+
+
+@pytest.fixture
+def sessions(monkeypatch: pytest.MonkeyPatch):
+    service = SSHSessionService()
+    monkeypatch.setattr("crystalmath.ssh_sessions.get_session_service", lambda: service)
+    yield service
+    service.close()
+
+
+@pytest.fixture
+def controller(tmp_path: Path, slurm_server, sessions) -> tuple[CrystalController, int]:
+    ctrl = CrystalController(use_aiida=False, db_path=str(tmp_path / "jobs.db"))
+    cluster_id = ctrl._db.create_cluster(
+        name="local",
+        type="slurm",
+        hostname="127.0.0.1",
+        port=slurm_server.port,
+        username="alice",
+        connection_config=slurm_server.connection_config(),
+    )
+    return ctrl, cluster_id
+
+
+class TestSSHSessionService:
+    """Tests for SSHSessionService."""
+
+    def test_run_executes_on_background_loop(self, sessions: SSHSessionService) -> None:
+        """Coroutines run on the service thread and return their result."""
+        import threading
+
+        async def where() -> str:
+            return threading.current_thread().name
+
+        assert sessions.run(where()) == "ssh-sessions"
+
+    def test_queue_refreshes_reuse_one_session(self, controller, slurm_server) -> None:
+        """Repeated queue refreshes share one SSH connection."""
+        ctrl, cluster_id = controller
+
+        for _ in range(3):
+            response = json.loads(ctrl.get_slurm_queue_json(cluster_id))
+            assert response["ok"] is True
+            assert [job["job_id"] for job in response["data"]] == ["101", "102"]
+
+        assert slurm_server.connections == 1
+
+    def test_cancel_uses_the_same_session(self, controller, slurm_server) -> None:
+        """Different SLURM calls on one cluster share the warm session."""
+        ctrl, cluster_id = controller
+
+        ctrl.get_slurm_queue_json(cluster_id)
+        response = json.loads(ctrl.cancel_slurm_job_json(cluster_id, "101"))
+
+        assert response["data"]["success"] is True
+        assert "scancel 101" in slurm_server.commands
+        assert slurm_server.connections == 1
+
+    def test_concurrent_commands_multiplex_one_session(
+        self, controller, slurm_server, sessions: SSHSessionService
+    ) -> None:
+        """Parallel commands run as channels of a single SSH connection."""
+        import asyncio
+
+        ctrl, cluster_id = controller
+        cluster = ctrl._get_cluster_config(cluster_id)
+
+        async def run_all() -> list[int]:
+            manager = await sessions.connection_manager(cluster)
+
+            async def one(i: int) -> int:
+                async with manager.get_connection(cluster_id) as conn:
+                    return (await conn.run(f"echo {i}", check=False)).exit_status
+
+            return await asyncio.gather(*(one(i) for i in range(6)))
+
+        slurm_server.delay = 0.2
+        assert sessions.run(run_all()) == [0] * 6
+        assert slurm_server.connections == 1
+
+    def test_changed_settings_reconnect(self, controller, slurm_server) -> None:
+        """Editing a cluster's connection settings replaces its sessions."""
+        ctrl, cluster_id = controller
+        ctrl.get_slurm_queue_json(cluster_id)
+
+        config = dict(slurm_server.connection_config(), strict_host_key_checking=True)
+        ctrl._db.update_cluster(cluster_id, username="bob", connection_config=config)
+        response = json.loads(ctrl.get_slurm_queue_json(cluster_id))
+
+        assert response["ok"] is True
+        assert slurm_server.connections == 2
+
+    def test_unknown_cluster_is_configuration_error(self, controller) -> None:
+        """A missing cluster row is reported without touching SSH."""
+        ctrl, _ = controller
+
+        response = json.loads(ctrl.get_slurm_queue_json(999))
+
+        assert response["ok"] is False
+        assert response["error"]["code"] == "CONFIGURATION_ERROR"
+
+
+def _track_remote_job(ctrl: CrystalController, cluster_id: int, handle: str, status: str) -> int:
+    """Create a SLURM job row in ``status`` with a remote_jobs handle."""
+    job_id = ctrl._db.create_job(
+        name=f"job-{handle}",
+        work_dir=f"/scratch/{cluster_id}/{handle}",
+        input_content="",
+        cluster_id=cluster_id,
+        runner_type="slurm",
+    )
+    ctrl._db.update_status(job_id, status)
+    ctrl._db.create_remote_job(job_id, cluster_id, handle, f"/scratch/{handle}")
+    return job_id
+
+
+class TestSyncRemoteJobs:
+    """Tests for CrystalController.sync_remote_jobs_json."""
+
+    def test_updates_from_squeue_and_sacct(self, controller, slurm_server) -> None:
+        """Queued jobs take squeue's state; departed jobs take sacct's."""
+        ctrl, cluster_id = controller
+        started = _track_remote_job(ctrl, cluster_id, "101", "QUEUED")
+        pending = _track_remote_job(ctrl, cluster_id, "102", "QUEUED")
+        gone = _track_remote_job(ctrl, cluster_id, "103", "RUNNING")
+        slurm_server.sacct_states = {"103": "FAILED"}
+
+        response = json.loads(ctrl.sync_remote_jobs_json(include_timing=True))
+
+        statuses = {job["pk"]: job["state"] for job in response["data"]["jobs"]}
+        assert statuses[started] == "RUNNING"
+        assert statuses[pending] == "QUEUED"
+        assert statuses[gone] == "FAILED"
+        [report] = response["data"]["clusters"]
+        assert report["ok"] is True
+        assert report["jobs"] == 3
+        assert report["updated"] == 2
+        assert report["elapsed_ms"] > 0
+        assert sum(c.startswith("sacct -j 103 ") for c in slurm_server.commands) == 1
+
+    def test_default_response_is_job_list(self, controller) -> None:
+        """Without include_timing the response keeps the get_jobs_json shape."""
+        ctrl, cluster_id = controller
+        _track_remote_job(ctrl, cluster_id, "101", "QUEUED")
+
+        response = json.loads(ctrl.sync_remote_jobs_json())
+
+        assert isinstance(response, list)
+        assert response[0]["state"] == "RUNNING"
+
+    def test_slow_cluster_does_not_block_others(
+        self, controller, slurm_server, tmp_path: Path
+    ) -> None:
+        """Clusters sync concurrently; a timed-out one leaves its jobs as they were."""
+        ctrl, fast_id = controller
+        (tmp_path / "slow").mkdir()
+        with fake_slurm_server(tmp_path / "slow") as slow_server:
+            slow_server.delay = 1.0
+            slow_id = ctrl._db.create_cluster(
+                name="slow",
+                type="slurm",
+                hostname="127.0.0.1",
+                port=slow_server.port,
+                username="alice",
+                connection_config=slow_server.connection_config(),
+            )
+            fast_job = _track_remote_job(ctrl, fast_id, "101", "QUEUED")
+            slow_job = _track_remote_job(ctrl, slow_id, "101", "QUEUED")
+
+            response = json.loads(ctrl.sync_remote_jobs_json(timeout=0.5, include_timing=True))
+
+        reports = {r["cluster_id"]: r for r in response["data"]["clusters"]}
+        assert reports[fast_id]["ok"] is True
+        assert reports[slow_id]["ok"] is False
+        assert "Timed out" in reports[slow_id]["error"]
+        statuses = {job["pk"]: job["state"] for job in response["data"]["jobs"]}
+        assert statuses[fast_job] == "RUNNING"
+        assert statuses[slow_job] == "QUEUED"
@@ -0,0 +1,124 @@
+"""Tests for seek-based log tailing (crystalmath.tail)."""
+
+from pathlib import Path
+
+from crystalmath.tail import read_after, tail_file, tail_text
+
+
+def _write(path: Path, data: bytes) -> Path:
+    path.write_bytes(data)
+    return path
+
+
+class TestTailFile:
+    """Tests for tail_file."""
+
+    def test_returns_last_lines(self, tmp_path: Path) -> None:
+        """Only the requested number of trailing lines is returned."""
+        log = _write(tmp_path / "out.log", b"".join(b"line %d\n" % i for i in range(1000)))
+
+        tail = tail_file(log, 3)
+
+        assert tail.lines == ["line 997", "line 998", "line 999"]
+        assert tail.offset == log.stat().st_size
+        assert tail.truncated is True
+
+    def test_small_blocks_cross_boundaries(self, tmp_path: Path) -> None:
+        """Lines split across read blocks are reassembled."""
+        log = _write(tmp_path / "out.log", b"".join(b"row-%04d\n" % i for i in range(50)))
+
+        tail = tail_file(log, 5, block_size=7)
+
+        assert tail.lines == [f"row-{i:04d}" for i in range(45, 50)]
+
+    def test_whole_file_not_truncated(self, tmp_path: Path) -> None:
+        """A file shorter than max_lines is returned whole."""
+        log = _write(tmp_path / "out.log", b"a\r\nb\n")
+
+        tail = tail_file(log, 10)
+
+        assert tail.lines == ["a", "b"]
+        assert tail.truncated is False
+
+    def test_partial_line_shown_but_not_consumed(self, tmp_path: Path) -> None:
+        """A trailing unterminated line is returned; the offset points at its start."""
+        log = _write(tmp_path / "out.log", b"done\nwriting")
+
+        tail = tail_file(log, 10)
+
+        assert tail.lines == ["done", "writing"]
+        assert tail.offset == len(b"done\n")
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        """An empty file yields no lines."""
+        log = _write(tmp_path / "out.log", b"")
+
+        tail = tail_file(log, 10)
+
+        assert tail.lines == []
+        assert tail.offset == 0
+        assert tail.truncated is False
+
+    def test_tail_text_joins_lines(self, tmp_path: Path) -> None:
+        """tail_text returns the trailing lines as one string."""
+        log = _write(tmp_path / "out.log", b"x\ny\nz\n")
+
+        assert tail_text(log, 2) == "y\nz"
+
+
+class TestReadAfter:
+    """Tests for read_after."""
+
+    def test_resumes_from_tail_offset(self, tmp_path: Path) -> None:
+        """Lines appended after a tail are returned once complete."""
+        log = _write(tmp_path / "out.log", b"one\ntwo\npart")
+        offset = tail_file(log, 10).offset
+
+        with log.open("ab") as f:
+            f.write(b"ial\nthree\n")
+        after = read_after(log, offset)
+
+        assert after.lines == ["partial", "three"]
+        assert after.offset == log.stat().st_size
+        assert after.has_more is False
+        assert after.reset is False
+
+    def test_incomplete_line_is_held_back(self, tmp_path: Path) -> None:
+        """An unterminated line is not returned and the offset does not pass it."""
+        log = _write(tmp_path / "out.log", b"one\ntw")
+
+        after = read_after(log, 0)
+
+        assert after.lines == ["one"]
+        assert after.offset == len(b"one\n")
+
+    def test_reset_when_file_shrinks(self, tmp_path: Path) -> None:
+        """An offset past EOF restarts from the beginning."""
+        log = _write(tmp_path / "out.log", b"fresh\n")
+
+        after = read_after(log, 10_000)
+
+        assert after.reset is True
+        assert after.lines == ["fresh"]
+
+    def test_byte_cap_sets_has_more(self, tmp_path: Path) -> None:
+        """Reads stop at max_bytes on a line boundary and report has_more."""
+        log = _write(tmp_path / "out.log", b"aaaa\nbbbb\ncccc\n")
+
+        first = read_after(log, 0, max_bytes=12)
+        rest = read_after(log, first.offset, max_bytes=12)
+
+        assert first.lines == ["aaaa", "bbbb"]
+        assert first.has_more is True
+        assert rest.lines == ["cccc"]
+        assert rest.has_more is False
+
+    def test_overlong_line_is_delivered(self, tmp_path: Path) -> None:
+        """A single line longer than the cap is returned rather than stalling."""
+        log = _write(tmp_path / "out.log", b"x" * 20 + b"\n")
+
+        after = read_after(log, 0, max_bytes=8)
+
+        assert after.lines == ["x" * 8]
+        assert after.offset == 8
+        assert after.has_more is True
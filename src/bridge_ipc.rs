@@ -18,6 +18,11 @@
 //! The worker owns one [`IpcClient`] and processes requests strictly serially
 //! (one outstanding request per connection), which matches the client's
 //! sequential request/response contract.
+//!
+//! Requests go out as CMAT frames that opt in to binary attachments, so bulk
+//! numeric results (DOS, band eigenvalues) cross the socket as raw arrays; the
+//! client inlines them before [`crate::bridge::route_rpc_response`] sees the
+//! response, so routing is unchanged.
 
 use std::path::PathBuf;
 use std::sync::mpsc::{self, Receiver, SyncSender, TrySendError};
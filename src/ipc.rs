@@ -16,7 +16,7 @@
 //!
 //! # Protocol
 //!
-//! Messages use HTTP-style Content-Length framing (same as LSP):
+//! The server accepts HTTP-style Content-Length framing (same as LSP):
 //!
 //! ```text
 //! Content-Length: 47\r\n
@@ -24,6 +24,10 @@
 //! {"jsonrpc":"2.0","method":"system.ping","id":1}
 //! ```
 //!
+//! `IpcClient` uses the binary CMAT framing instead (see `framing`), which
+//! lets large numeric results travel as raw little-endian array attachments
+//! rather than stringified floats. The server replies in the client's framing.
+//!
 //! # Usage
 //!
 //! ```ignore
@@ -41,4 +45,4 @@ pub use client::{
     default_socket_path, ensure_server_running, shutdown_spawned_server, shutdown_spawned_servers,
     IpcClient, IpcError,
 };
-pub use framing::{read_message, write_message};
+pub use framing::{read_frame, read_message, write_message, MSG_JSON, MSG_JSON_ATTACHMENTS};
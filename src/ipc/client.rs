@@ -25,7 +25,10 @@ use tokio::net::UnixStream;
 use tokio::time::timeout;
 
 use crate::bridge::{JsonRpcError, JsonRpcRequest, JsonRpcResponse};
-use crate::ipc::framing::{read_message, write_message};
+use crate::ipc::framing::{
+    decode_attachment_payload, encode_attachment_payload, read_frame, write_message,
+    MSG_JSON_ATTACHMENTS,
+};
 
 /// Default request timeout in seconds.
 const DEFAULT_TIMEOUT_SECS: u64 = 30;
@@ -602,19 +605,27 @@ impl IpcClient {
         let request_json = serde_json::to_string(request)
             .map_err(|e| IpcError::Protocol(format!("Failed to serialize request: {}", e)))?;
 
-        // Send with framing
-        write_message(&mut self.writer, request_json.as_bytes(), 1)
+        // Send with framing. The attachment message type lets the server move
+        // bulk arrays (DOS, bands, ...) out of the JSON as raw binary.
+        let payload = encode_attachment_payload(request_json.as_bytes());
+        write_message(&mut self.writer, &payload, MSG_JSON_ATTACHMENTS)
             .await
             .map_err(|e| IpcError::Protocol(format!("Failed to send request: {}", e)))?;
 
         // Read response
-        let response_json = read_message(&mut self.reader)
+        let (message_type, response_payload) = read_frame(&mut self.reader)
             .await
             .map_err(|e| IpcError::Protocol(format!("Failed to read response: {}", e)))?;
 
         // Deserialize response
-        let response: JsonRpcResponse = serde_json::from_slice(&response_json)
-            .map_err(|e| IpcError::Protocol(format!("Failed to parse response: {}", e)))?;
+        let response: JsonRpcResponse = if message_type == MSG_JSON_ATTACHMENTS {
+            let value = decode_attachment_payload(&response_payload)
+                .map_err(|e| IpcError::Protocol(format!("Failed to decode response: {}", e)))?;
+            serde_json::from_value(value)
+        } else {
+            serde_json::from_slice(&response_payload)
+        }
+        .map_err(|e| IpcError::Protocol(format!("Failed to parse response: {}", e)))?;
 
         Ok(response)
     }
@@ -715,4 +726,50 @@ mod tests {
             _ => panic!("Expected ServerError"),
         }
     }
+
+    #[tokio::test]
+    async fn test_call_inlines_attachment_response() {
+        let (client_end, mut server_end) = UnixStream::pair().unwrap();
+        let (read_half, write_half) = client_end.into_split();
+        let mut client = IpcClient {
+            reader: BufReader::new(read_half),
+            writer: write_half,
+            request_id: AtomicU64::new(1),
+            timeout: Duration::from_secs(5),
+        };
+
+        let server = tokio::spawn(async move {
+            let (message_type, payload) = read_frame(&mut server_end).await.unwrap();
+            assert_eq!(message_type, MSG_JSON_ATTACHMENTS);
+            let request = decode_attachment_payload(&payload).unwrap();
+            assert_eq!(request["method"], "jobs.get_dos");
+
+            let envelope = serde_json::json!({
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "result": {"total": {
+                    "$attachment": 0, "dtype": "<f8", "shape": [2, 2],
+                    "offset": 0, "nbytes": 32
+                }}
+            });
+            let mut reply = encode_attachment_payload(envelope.to_string().as_bytes());
+            for v in [-1.0f64, 0.5, 1.0, 0.25] {
+                reply.extend_from_slice(&v.to_le_bytes());
+            }
+            write_message(&mut server_end, &reply, MSG_JSON_ATTACHMENTS)
+                .await
+                .unwrap();
+        });
+
+        let result = client
+            .call("jobs.get_dos", serde_json::json!({"job_pk": 1}))
+            .await
+            .unwrap();
+        server.await.unwrap();
+
+        assert_eq!(
+            result["total"],
+            serde_json::json!([[-1.0, 0.5], [1.0, 0.25]])
+        );
+    }
 }
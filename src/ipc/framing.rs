@@ -1,8 +1,30 @@
 #![allow(dead_code)]
+//! CMAT binary framing shared with `python/crystalmath/server/framing.py`.
+//!
+//! Frame layout: `b"CMAT" | u32 BE payload length | u16 BE message type | payload`.
+//!
+//! - [`MSG_JSON`]: the payload is a UTF-8 JSON-RPC message.
+//! - [`MSG_JSON_ATTACHMENTS`]: the payload is `u32 BE json length | JSON | blob`.
+//!   Bulk arrays live in the blob as raw little-endian bytes and are referenced
+//!   from the JSON by `{"$attachment": i, "dtype": "<f8", "shape": [..],
+//!   "offset": o, "nbytes": n}`. Sending a request with this type (and an
+//!   empty blob) tells the server the client can decode attachments.
 use serde::{Deserialize, Serialize};
+use serde_json::{Map, Number, Value};
 use std::io::{Error as IoError, ErrorKind, Result as IoResult};
 use tokio::io::{AsyncRead, AsyncReadExt, AsyncWrite, AsyncWriteExt};
 
+/// Plain JSON payload.
+pub const MSG_JSON: u16 = 1;
+/// JSON envelope followed by a blob of binary array attachments.
+pub const MSG_JSON_ATTACHMENTS: u16 = 2;
+
+/// Key marking an attachment reference inside the JSON envelope.
+const ATTACHMENT_KEY: &str = "$attachment";
+
+/// Largest payload accepted from the peer (100MB, matching the Python server).
+const MAX_PAYLOAD_LEN: usize = 100 * 1024 * 1024;
+
 /// Header defining the payload length to allow predictable buffer allocations.
 #[derive(Serialize, Deserialize, Debug, Clone, Copy, PartialEq, Eq)]
 #[repr(C)]
@@ -34,7 +56,12 @@ impl<'a> ZeroCopyFrame<'a> {
 }
 
 /// Reads a fixed message frame asynchronously from a Tokio stream.
-pub async fn read_message<R: AsyncRead + Unpin>(mut stream: R) -> IoResult<Vec<u8>> {
+pub async fn read_message<R: AsyncRead + Unpin>(stream: R) -> IoResult<Vec<u8>> {
+    read_frame(stream).await.map(|(_, payload)| payload)
+}
+
+/// Reads one frame, returning its message type alongside the payload.
+pub async fn read_frame<R: AsyncRead + Unpin>(mut stream: R) -> IoResult<(u16, Vec<u8>)> {
     let mut header_buf = [0u8; 10]; // 4 (magic) + 4 (u32 len) + 2 (u16 type)
     stream.read_exact(&mut header_buf).await?;
 
@@ -47,11 +74,175 @@ pub async fn read_message<R: AsyncRead + Unpin>(mut stream: R) -> IoResult<Vec<u
 
     let payload_len =
         u32::from_be_bytes([header_buf[4], header_buf[5], header_buf[6], header_buf[7]]) as usize;
+    let message_type = u16::from_be_bytes([header_buf[8], header_buf[9]]);
+
+    if payload_len > MAX_PAYLOAD_LEN {
+        return Err(IoError::new(
+            ErrorKind::InvalidData,
+            format!("Frame too large: {} bytes", payload_len),
+        ));
+    }
 
     let mut payload_buf = vec![0u8; payload_len];
     stream.read_exact(&mut payload_buf).await?;
 
-    Ok(payload_buf)
+    Ok((message_type, payload_buf))
+}
+
+/// Wraps a JSON message as a `MSG_JSON_ATTACHMENTS` payload with an empty blob.
+pub fn encode_attachment_payload(json: &[u8]) -> Vec<u8> {
+    let mut payload = Vec::with_capacity(4 + json.len());
+    payload.extend_from_slice(&(json.len() as u32).to_be_bytes());
+    payload.extend_from_slice(json);
+    payload
+}
+
+/// Decodes a `MSG_JSON_ATTACHMENTS` payload, inlining every attachment as a
+/// (nested) JSON array so callers see the same shape a text response has.
+pub fn decode_attachment_payload(payload: &[u8]) -> IoResult<Value> {
+    let invalid = |msg: String| IoError::new(ErrorKind::InvalidData, msg);
+
+    if payload.len() < 4 {
+        return Err(invalid("Attachment payload too short".to_string()));
+    }
+    let json_len = u32::from_be_bytes([payload[0], payload[1], payload[2], payload[3]]) as usize;
+    let json_end = 4usize
+        .checked_add(json_len)
+        .filter(|end| *end <= payload.len())
+        .ok_or_else(|| {
+            invalid(format!(
+                "Attachment JSON length {} exceeds payload",
+                json_len
+            ))
+        })?;
+
+    let mut value: Value = serde_json::from_slice(&payload[4..json_end])
+        .map_err(|e| invalid(format!("Invalid attachment envelope: {}", e)))?;
+    resolve_attachments(&mut value, &payload[json_end..]).map_err(invalid)?;
+    Ok(value)
+}
+
+/// Replaces attachment references in `value` with arrays decoded from `blob`.
+fn resolve_attachments(value: &mut Value, blob: &[u8]) -> Result<(), String> {
+    match value {
+        Value::Object(map) if map.contains_key(ATTACHMENT_KEY) => {
+            *value = attachment_to_value(map, blob)?;
+        }
+        Value::Object(map) => {
+            for child in map.values_mut() {
+                resolve_attachments(child, blob)?;
+            }
+        }
+        Value::Array(items) => {
+            for child in items.iter_mut() {
+                resolve_attachments(child, blob)?;
+            }
+        }
+        _ => {}
+    }
+    Ok(())
+}
+
+fn attachment_to_value(desc: &Map<String, Value>, blob: &[u8]) -> Result<Value, String> {
+    let field = |name: &str| {
+        desc.get(name)
+            .and_then(Value::as_u64)
+            .map(|v| v as usize)
+            .ok_or_else(|| format!("Attachment missing '{}'", name))
+    };
+    let offset = field("offset")?;
+    let nbytes = field("nbytes")?;
+    let dtype = desc
+        .get("dtype")
+        .and_then(Value::as_str)
+        .ok_or("Attachment missing 'dtype'")?;
+    let shape: Vec<usize> = desc
+        .get("shape")
+        .and_then(Value::as_array)
+        .ok_or("Attachment missing 'shape'")?
+        .iter()
+        .map(|d| {
+            d.as_u64()
+                .map(|v| v as usize)
+                .ok_or("Invalid attachment shape")
+        })
+        .collect::<Result<_, _>>()?;
+
+    let data = offset
+        .checked_add(nbytes)
+        .and_then(|end| blob.get(offset..end))
+        .ok_or_else(|| format!("Attachment range {}+{} outside blob", offset, nbytes))?;
+
+    let float = |v: f64| {
+        Number::from_f64(v)
+            .map(Value::Number)
+            .unwrap_or(Value::Null)
+    };
+    let flat: Vec<Value> = match dtype {
+        "<f8" => data
+            .chunks_exact(8)
+            .map(|c| float(f64::from_le_bytes(c.try_into().unwrap())))
+            .collect(),
+        "<f4" => data
+            .chunks_exact(4)
+            .map(|c| float(f32::from_le_bytes(c.try_into().unwrap()) as f64))
+            .collect(),
+        "<i8" => data
+            .chunks_exact(8)
+            .map(|c| Value::from(i64::from_le_bytes(c.try_into().unwrap())))
+            .collect(),
+        "<i4" => data
+            .chunks_exact(4)
+            .map(|c| Value::from(i32::from_le_bytes(c.try_into().unwrap())))
+            .collect(),
+        "|u1" => data.iter().map(|b| Value::from(*b)).collect(),
+        other => return Err(format!("Unsupported attachment dtype '{}'", other)),
+    };
+
+    let expected = shape
+        .iter()
+        .try_fold(1usize, |acc, &d| acc.checked_mul(d))
+        .ok_or_else(|| format!("Attachment shape {:?} overflows", shape))?;
+    if expected == 0 {
+        // Empty arrays still nest: [3, 0] is three empty rows. Bound the
+        // containers built before the zero dimension like a payload.
+        shape
+            .iter()
+            .take_while(|&&d| d != 0)
+            .try_fold(1usize, |acc, &d| acc.checked_mul(d))
+            .filter(|&n| n <= MAX_PAYLOAD_LEN)
+            .ok_or_else(|| format!("Attachment shape {:?} is too large", shape))?;
+    }
+    if flat.len() != expected {
+        return Err(format!(
+            "Attachment has {} elements, shape {:?} needs {}",
+            flat.len(),
+            shape,
+            expected
+        ));
+    }
+    Ok(reshape(flat, &shape))
+}
+
+/// Folds a flat row-major vector into nested arrays following `shape`.
+///
+/// `flat` must hold exactly the product of `shape` elements. A zero
+/// dimension yields that many empty arrays at its level, e.g. `[2, 0]`
+/// gives `[[], []]`.
+fn reshape(flat: Vec<Value>, shape: &[usize]) -> Value {
+    if shape.len() <= 1 {
+        return Value::Array(flat);
+    }
+    let mut iter = flat.into_iter();
+    nest(&mut iter, shape)
+}
+
+fn nest(iter: &mut std::vec::IntoIter<Value>, shape: &[usize]) -> Value {
+    match shape {
+        [] => Value::Array(Vec::new()),
+        [dim] => Value::Array(iter.by_ref().take(*dim).collect()),
+        [dim, inner @ ..] => Value::Array((0..*dim).map(|_| nest(iter, inner)).collect()),
+    }
 }
 
 /// Writes a fixed message frame asynchronously over a Tokio stream.
@@ -103,3 +294,81 @@ impl ZeroCopyRingBuffer {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use serde_json::json;
+
+    fn attachment_payload(envelope: &Value, blob: &[u8]) -> Vec<u8> {
+        let mut payload = encode_attachment_payload(envelope.to_string().as_bytes());
+        payload.extend_from_slice(blob);
+        payload
+    }
+
+    #[test]
+    fn test_decode_inlines_f64_matrix() {
+        let values = [1.0f64, 2.0, 3.0, 4.0, 5.0, 6.0];
+        let blob: Vec<u8> = values.iter().flat_map(|v| v.to_le_bytes()).collect();
+        let envelope = json!({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "result": {"energies": {
+                "$attachment": 0, "dtype": "<f8", "shape": [2, 3],
+                "offset": 0, "nbytes": 48
+            }}
+        });
+
+        let decoded = decode_attachment_payload(&attachment_payload(&envelope, &blob)).unwrap();
+
+        assert_eq!(
+            decoded["result"]["energies"],
+            json!([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        );
+        assert_eq!(decoded["id"], json!(1));
+    }
+
+    #[test]
+    fn test_reshape_keeps_zero_inner_dimension() {
+        assert_eq!(reshape(Vec::new(), &[3, 0]), json!([[], [], []]));
+        assert_eq!(reshape(Vec::new(), &[2, 0, 4]), json!([[], []]));
+        assert_eq!(reshape(Vec::new(), &[0, 5]), json!([]));
+        assert_eq!(
+            reshape((1..=4).map(Value::from).collect(), &[2, 1, 2]),
+            json!([[[1, 2]], [[3, 4]]])
+        );
+    }
+
+    #[test]
+    fn test_decode_rejects_oversized_empty_shape() {
+        let envelope = json!({"result": {
+            "$attachment": 0, "dtype": "<f8", "shape": [MAX_PAYLOAD_LEN + 1, 0],
+            "offset": 0, "nbytes": 0
+        }});
+        assert!(decode_attachment_payload(&attachment_payload(&envelope, &[])).is_err());
+    }
+
+    #[test]
+    fn test_decode_rejects_out_of_range_attachment() {
+        let envelope = json!({"result": {
+            "$attachment": 0, "dtype": "<f8", "shape": [4], "offset": 0, "nbytes": 32
+        }});
+
+        let err = decode_attachment_payload(&attachment_payload(&envelope, &[0u8; 8])).unwrap_err();
+
+        assert_eq!(err.kind(), ErrorKind::InvalidData);
+    }
+
+    #[tokio::test]
+    async fn test_frame_round_trip_keeps_message_type() {
+        let mut wire = Vec::new();
+        write_message(&mut wire, b"{}", MSG_JSON_ATTACHMENTS)
+            .await
+            .unwrap();
+
+        let (message_type, payload) = read_frame(wire.as_slice()).await.unwrap();
+
+        assert_eq!(message_type, MSG_JSON_ATTACHMENTS);
+        assert_eq!(payload, b"{}");
+    }
+}
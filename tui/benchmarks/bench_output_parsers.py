@@ -0,0 +1,164 @@
+"""Benchmark the QE and VASP fallback parsers on a synthetic 1 GB output.
+
+Writes a pw.x relax output and an OUTCAR of ``--size-mb`` each. For each one
+it times, in a fresh process, and reports wall time and peak RSS growth for:
+
+    read_text   the old whole-file path: read_text(), an upper() copy and a
+                findall for the last energy (a lower bound on the old parse)
+    streaming   parse_sync, one chunked pass with rolling state
+    tail        parse_tail_sync, final energy and convergence from the end
+
+Usage:
+    python benchmarks/bench_output_parsers.py [--size-mb N] [--keep DIR]
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.core.codes.parsers.quantum_espresso import QuantumEspressoParser  # noqa: E402
+from src.core.codes.parsers.vasp import VASPParser  # noqa: E402
+
+QE_STEP = """
+     iteration #  1     ecut=    60.00 Ry     beta= 0.70
+     Davidson diagonalization with overlap
+     ethr =  1.00E-02,  avg # of iterations =  3.0
+     total energy              =     -65.40000000 Ry
+     estimated scf accuracy    <       0.00012345 Ry
+     iteration #  2     ecut=    60.00 Ry     beta= 0.70
+     Davidson diagonalization with overlap
+     ethr =  5.23E-04,  avg # of iterations =  2.0
+!    total energy              =     -65.45000000 Ry
+     convergence has been achieved in   2 iterations
+
+     Forces acting on atoms (cartesian axes, Ry/au):
+     atom    1 type  1   force =     0.00012345    0.00023456   -0.00034567
+     atom    2 type  1   force =    -0.00012345   -0.00023456    0.00034567
+     Total force =     0.000691
+
+     number of scf cycles    =   1
+     number of bfgs steps    =   0
+"""
+
+QE_FOOTER = """
+!    total energy              =     -65.45703298 Ry
+     convergence has been achieved in   3 iterations
+     bfgs converged in  99 scf cycles and  98 bfgs steps
+     End of BFGS Geometry Optimization
+
+     JOB DONE.
+"""
+
+OUTCAR_STEP = """
+   FREE ENERGIE OF THE ION-ELECTRON SYSTEM (eV)
+   ---------------------------------------------------
+       1       -10.12345       0.12E-02
+       2       -10.45678       0.45E-03
+
+------------------------ aborting loop because EDIFF is reached ----------------------
+
+  free  energy   TOTEN  =       -85.50000000 eV
+  energy  without entropy =       -85.49000000  energy(sigma->0) =  -85.49500000
+
+     POTLOK:  cpu time    1.5000: real time    1.6000
+     SETDIJ:  cpu time    0.2000: real time    0.2100
+     EDDIAG:  cpu time    3.1000: real time    3.2000
+      LOOP:  cpu time    9.0000: real time    9.5000
+  TOTAL-FORCE (eV/Angst)
+  total drift  RMS 0.0123
+     LOOP+:  cpu time   12.0000: real time   13.0000
+"""
+
+OUTCAR_HEADER = """ running on    64 total cores
+ IBRION = 2
+ NSW = 100000
+   NPAR = 8
+"""
+
+OUTCAR_FOOTER = """
+  free  energy   TOTEN  =       -85.54234987 eV
+ reached required accuracy - stopping structural energy minimisation
+
+ General timing and accounting informance:
+
+  Total CPU time used (sec):    12345.678
+  Elapsed time (sec):      234.567
+"""
+
+
+def write_output(path: Path, header: str, step: str, footer: str, size: int) -> None:
+    block = step * max(1, (1024 * 1024) // len(step))
+    with open(path, "w") as f:
+        f.write(header)
+        written = len(header)
+        while written < size:
+            f.write(block)
+            written += len(block)
+        f.write(footer)
+
+
+def read_text_baseline(path: Path) -> float:
+    content = path.read_text()
+    content_upper = content.upper()
+    matches = QuantumEspressoParser.ENERGY_PATTERN.findall(content)
+    matches += VASPParser.TOTEN_PATTERN.findall(content)
+    assert "JOB DONE" in content_upper or "GENERAL TIMING" in content_upper
+    return float(matches[-1])
+
+
+def measure(mode: str, parser_name: str, path: str) -> tuple[float, float, float | None]:
+    """Run one parse; returns (seconds, peak RSS growth in MB, final energy)."""
+    parser = QuantumEspressoParser() if parser_name == "qe" else VASPParser()
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if mode == "read_text":
+        energy = read_text_baseline(Path(path))
+    elif mode == "streaming":
+        energy = parser.parse_sync(Path(path)).final_energy
+    else:
+        energy = parser.parse_tail_sync(Path(path)).final_energy
+    elapsed = time.perf_counter() - start
+    after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return elapsed, (after - before) / 1024.0, energy
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--keep", type=Path, help="write outputs here instead of a temp dir")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = args.keep or Path(tmp)
+        root.mkdir(parents=True, exist_ok=True)
+        size = args.size_mb * 1024 * 1024
+        outputs = {
+            "qe": (root / "pw.out", "", QE_STEP, QE_FOOTER),
+            "vasp": (root / "OUTCAR", OUTCAR_HEADER, OUTCAR_STEP, OUTCAR_FOOTER),
+        }
+
+        # Fresh process per measurement so peak RSS reflects that parse alone
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(1, maxtasksperchild=1) as pool:
+            for name, (path, header, step, footer) in outputs.items():
+                if not path.exists():
+                    write_output(path, header, step, footer, size)
+                print(f"{name}: {path.stat().st_size / 2**20:.0f} MB")
+                for mode in ("read_text", "streaming", "tail"):
+                    elapsed, rss_mb, energy = pool.apply(measure, (mode, name, str(path)))
+                    print(
+                        f"  {mode:<10} {elapsed:8.2f} s   peak RSS +{rss_mb:8.1f} MB"
+                        f"   final energy {energy}"
+                    )
+
+
+if __name__ == "__main__":
+    main()
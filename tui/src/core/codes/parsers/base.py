@@ -7,12 +7,14 @@ feed downstream workflows and UI components.
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ..base import DFTCode
+from .streaming import DEFAULT_TAIL_BYTES
 
 
 @dataclass
@@ -31,12 +33,56 @@ class ParsingResult:
 
 
 class OutputParser(ABC):
-    """Abstract interface for code-specific output parsers."""
+    """Abstract interface for code-specific output parsers.
+
+    Subclasses implement the blocking `parse_sync`. The inherited `parse`
+    runs it through the shared parse executor, which works off the event
+    loop, in a worker process for large outputs, and caches results. Bump
+    `version` whenever parsing changes what is extracted; this invalidates
+    cached results. `parse_tail` answers final-energy and convergence
+    queries from the end of the output when it can.
+    """
+
+    version: str = "1"
 
-    @abstractmethod
     async def parse(self, output_file: Path) -> ParsingResult:
         """Parse a code output file into a structured `ParsingResult`."""
 
+        from .executor import get_parse_executor
+
+        return await get_parse_executor().parse(self, output_file)
+
+    @abstractmethod
+    def parse_sync(self, output_file: Path) -> ParsingResult:
+        """Parse a code output file, blocking; runs in a parse worker."""
+
+    async def parse_tail(
+        self, output_file: Path, tail_bytes: int = DEFAULT_TAIL_BYTES
+    ) -> ParsingResult:
+        """Final energy and convergence, read from the end of the output if possible."""
+
+        return await asyncio.to_thread(self.parse_tail_sync, Path(output_file), tail_bytes)
+
+    def parse_tail_sync(
+        self, output_file: Path, tail_bytes: int = DEFAULT_TAIL_BYTES
+    ) -> ParsingResult:
+        """Blocking tail-first parse for final-energy and convergence queries.
+
+        When the last ``tail_bytes`` settle both, the result carries only
+        `final_energy` and `convergence_status`, with
+        ``metadata["tail_only"]`` set; its `success` means they were found,
+        not that the run succeeded, since errors printed earlier are not
+        seen. Otherwise this is the full `parse_sync` result. Parsers without
+        a tail mode always parse the whole file.
+        """
+
+        return self.parse_sync(output_file)
+
+    def resolve_output_file(self, output_file: Path) -> Path:
+        """Map the path callers pass to the file actually parsed (for caching)."""
+
+        return output_file
+
     @abstractmethod
     def get_energy_unit(self) -> str:
         """Return the energy unit the parser reports (e.g., Hartree, eV)."""
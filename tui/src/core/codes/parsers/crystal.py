@@ -20,7 +20,7 @@ class CrystalOutputParser(OutputParser):
     def get_energy_unit(self) -> str:
         return "Hartree"
 
-    async def parse(self, output_file: Path) -> ParsingResult:
+    def parse_sync(self, output_file: Path) -> ParsingResult:
         """Parse CRYSTAL output file.
 
         Tries CRYSTALpytools first, falls back to regex parsing.
@@ -28,7 +28,7 @@ class CrystalOutputParser(OutputParser):
 
         # Try CRYSTALpytools first
         try:
-            return await self._parse_with_crystalpytools(output_file)
+            return self._parse_with_crystalpytools(output_file)
         except ImportError:
             pass
         except Exception:
@@ -36,9 +36,9 @@ class CrystalOutputParser(OutputParser):
             pass
 
         # Fallback to regex parsing
-        return await self._parse_with_regex(output_file)
+        return self._parse_with_regex(output_file)
 
-    async def _parse_with_crystalpytools(self, output_file: Path) -> ParsingResult:
+    def _parse_with_crystalpytools(self, output_file: Path) -> ParsingResult:
         """Parse using CRYSTALpytools library."""
 
         from CRYSTALpytools.crystal_io import Crystal_output
@@ -59,7 +59,7 @@ class CrystalOutputParser(OutputParser):
             metadata={"parser": "CRYSTALpytools"},
         )
 
-    async def _parse_with_regex(self, output_file: Path) -> ParsingResult:
+    def _parse_with_regex(self, output_file: Path) -> ParsingResult:
         """Parse using regex patterns (fallback)."""
 
         content = output_file.read_text()
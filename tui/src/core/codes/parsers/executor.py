@@ -0,0 +1,313 @@
+"""
+Off-loop execution and caching of DFT output parsing.
+
+Parsing a multi-GB output is blocking file I/O plus CPU-heavy regex scans.
+Done inline in ``async def parse`` it froze the event loop, and with it the
+JSON-RPC server and the orchestrator's monitor, for the whole parse.
+ParseExecutor runs ``OutputParser.parse_sync`` off the loop instead:
+
+- outputs of at least ``process_threshold`` bytes go to a bounded
+  ProcessPoolExecutor, so completions handled concurrently (e.g. all jobs
+  the workflow monitor finds finished in one poll) parse on all cores;
+- smaller outputs go to a thread pool. That costs far less than sending
+  them to a process, and the GIL is held only briefly.
+
+Results are memoized in an LRU keyed by (path, inode, size, mtime, parser,
+parser version). Concurrent requests for the same key share one parse. When
+a database and job id are supplied, results are also persisted in
+``job_results.parse_cache`` and reused after a restart for as long as the
+output file is unchanged.
+
+Usage::
+
+    result = await get_parse_executor().parse(get_parser(code), output_file)
+    result = await get_parse_executor().parse(parser, output_file, job.id, database)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+import multiprocessing
+import os
+import stat
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from .base import OutputParser, ParsingResult
+
+if TYPE_CHECKING:
+    from ...database import Database
+
+logger = logging.getLogger(__name__)
+
+# Outputs at least this large are parsed in a worker process
+DEFAULT_PROCESS_THRESHOLD = 1024 * 1024
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_THREAD_WORKERS = 4
+
+# (path, inode, size, mtime_ns, parser class, parser version)
+ParseKey = Tuple[str, int, int, int, str, str]
+
+
+def _parser_name(parser: OutputParser) -> str:
+    cls = type(parser)
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _cache_key(parser: OutputParser, output_file: Path) -> Tuple[Optional[ParseKey], int]:
+    """Identify a regular output file's current contents, or (None, 0) if uncacheable."""
+    try:
+        st = output_file.stat()
+    except OSError:
+        return None, 0
+    if not stat.S_ISREG(st.st_mode):
+        return None, 0
+    key = (
+        str(output_file.resolve()),
+        st.st_ino,
+        st.st_size,
+        st.st_mtime_ns,
+        _parser_name(parser),
+        str(parser.version),
+    )
+    return key, st.st_size
+
+
+def _run_parser(parser: OutputParser, output_file: str) -> ParsingResult:
+    """Worker entry point (module level so it pickles for the process pool)."""
+    return parser.parse_sync(Path(output_file))
+
+
+def _key_to_dict(key: ParseKey) -> Dict[str, Any]:
+    path, inode, size, mtime_ns, parser, version = key
+    return {
+        "path": path,
+        "inode": inode,
+        "size": size,
+        "mtime_ns": mtime_ns,
+        "parser": parser,
+        "version": version,
+    }
+
+
+class ParseExecutor:
+    """Runs output parsers off the event loop with a shared result cache."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        process_threshold: int = DEFAULT_PROCESS_THRESHOLD,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        thread_workers: int = DEFAULT_THREAD_WORKERS,
+    ) -> None:
+        """
+        Args:
+            max_workers: Worker processes for large outputs (default: CPU count).
+            process_threshold: Outputs of at least this many bytes are parsed in
+                a worker process; smaller ones on a thread.
+            cache_size: Parse results kept in memory (least recently used evicted).
+            thread_workers: Threads for small outputs.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.process_threshold = process_threshold
+        self.cache_size = cache_size
+        self._thread_workers = thread_workers
+        self._cache: "OrderedDict[ParseKey, ParsingResult]" = OrderedDict()
+        self._inflight: Dict[ParseKey, Future] = {}
+        self._lock = threading.Lock()
+        self._processes: Optional[ProcessPoolExecutor] = None
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def parse(
+        self,
+        parser: OutputParser,
+        output_file: Path,
+        job_id: Optional[int] = None,
+        database: Optional["Database"] = None,
+    ) -> ParsingResult:
+        """
+        Parse an output file off the event loop, reusing cached results.
+
+        Args:
+            parser: Parser to run (its ``parse_sync`` does the work).
+            output_file: Output file to parse.
+            job_id: Job the output belongs to; with ``database``, the result is
+                looked up in and persisted to ``job_results``.
+            database: Database for persisted results.
+
+        Returns:
+            A private copy of the ParsingResult, safe to mutate.
+        """
+        output_file = parser.resolve_output_file(Path(output_file))
+        key, size = _cache_key(parser, output_file)
+        if key is None:
+            # Missing or special file: let the parser report it, uncached.
+            return await asyncio.to_thread(parser.parse_sync, output_file)
+
+        cached = self._lookup(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        persist = job_id is not None and database is not None
+        if persist:
+            stored = await asyncio.to_thread(self._load_persisted, database, job_id, key)
+            if stored is not None:
+                self._remember(key, stored)
+                return copy.deepcopy(stored)
+
+        future = self._start(parser, output_file, key, size)
+        try:
+            result = await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); parse this one on a thread.
+            logger.warning(f"Parse worker pool broke while parsing {output_file}, retrying inline")
+            result = await asyncio.to_thread(parser.parse_sync, output_file)
+            self._remember(key, result)
+
+        if persist:
+            await asyncio.to_thread(self._persist, database, job_id, key, result)
+        return copy.deepcopy(result)
+
+    def clear_cache(self) -> None:
+        """Forget all in-memory parse results."""
+        with self._lock:
+            self._cache.clear()
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the worker pools; pending parses are cancelled."""
+        with self._lock:
+            self._closed = True
+            processes, self._processes = self._processes, None
+            threads, self._threads = self._threads, None
+        if processes is not None:
+            processes.shutdown(wait=wait, cancel_futures=True)
+        if threads is not None:
+            threads.shutdown(wait=wait, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _lookup(self, key: ParseKey) -> Optional[ParsingResult]:
+        with self._lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+            return result
+
+    def _remember(self, key: ParseKey, result: ParsingResult) -> None:
+        with self._lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _start(self, parser: OutputParser, output_file: Path, key: ParseKey, size: int) -> Future:
+        """Join the in-flight parse for ``key`` or submit a new one."""
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future
+            if self._closed:
+                raise RuntimeError("ParseExecutor has been shut down")
+            if size >= self.process_threshold:
+                if self._processes is None:
+                    # spawn: forking a process that runs asyncio and DB threads is unsafe
+                    self._processes = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                future = self._processes.submit(_run_parser, parser, str(output_file))
+            else:
+                if self._threads is None:
+                    self._threads = ThreadPoolExecutor(
+                        max_workers=self._thread_workers, thread_name_prefix="parse"
+                    )
+                future = self._threads.submit(parser.parse_sync, output_file)
+            self._inflight[key] = future
+
+        future.add_done_callback(lambda done: self._finished(key, done))
+        return future
+
+    def _finished(self, key: ParseKey, future: Future) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is None:
+            self._remember(key, future.result())
+        elif isinstance(error, BrokenProcessPool):
+            with self._lock:
+                # Drop the broken pool; the next large parse starts a fresh one.
+                self._processes = None
+
+    @staticmethod
+    def _load_persisted(
+        database: "Database", job_id: int, key: ParseKey
+    ) -> Optional[ParsingResult]:
+        try:
+            entry = database.get_parse_cache(job_id)
+        except Exception as e:
+            logger.warning(f"Failed to read parse cache for job {job_id}: {e}")
+            return None
+        if not entry or entry.get("key") != _key_to_dict(key):
+            return None
+        try:
+            return ParsingResult(**entry["result"])
+        except (KeyError, TypeError):
+            return None
+
+    @staticmethod
+    def _persist(database: "Database", job_id: int, key: ParseKey, result: ParsingResult) -> None:
+        try:
+            database.save_parse_cache(
+                job_id,
+                {"key": _key_to_dict(key), "result": asdict(result)},
+                convergence_status=result.convergence_status,
+                scf_cycles=result.scf_cycles,
+            )
+        except Exception as e:
+            # Unserializable metadata or a locked DB only costs a re-parse later
+            logger.warning(f"Failed to persist parse result for job {job_id}: {e}")
+
+
+_shared: Optional[ParseExecutor] = None
+_shared_lock = threading.Lock()
+
+
+def get_parse_executor() -> ParseExecutor:
+    """The ParseExecutor shared by every parser in this process."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = ParseExecutor()
+        return _shared
+
+
+def set_parse_executor(executor: Optional[ParseExecutor]) -> Optional[ParseExecutor]:
+    """Replace the shared ParseExecutor (None resets to lazy default); returns the old one."""
+    global _shared
+    with _shared_lock:
+        previous, _shared = _shared, executor
+        return previous
+
+
+__all__ = [
+    "DEFAULT_PROCESS_THRESHOLD",
+    "ParseExecutor",
+    "get_parse_executor",
+    "set_parse_executor",
+]
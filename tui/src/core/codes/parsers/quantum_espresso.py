@@ -2,16 +2,35 @@
 
 Parses pw.x, ph.x, and other QE executable output files to extract
 energy, convergence status, and other calculation results.
+
+Without aiida-quantumespresso the output is streamed in chunks (see
+:mod:`.streaming`) rather than read whole, so multi-GB relax and MD outputs
+parse in bounded memory. ``parse_tail_sync`` answers final-energy and
+convergence queries from the end of the file when it can.
 """
 
 from __future__ import annotations
 
+import importlib.util
 import re
 from pathlib import Path
-from typing import Optional, List
+from typing import List, Optional
 
 from ..base import DFTCode
 from .base import OutputParser, ParsingResult, register_parser
+from .streaming import (
+    DEFAULT_TAIL_BYTES,
+    bytes_pattern,
+    decode_line,
+    iter_lines_with,
+    last_match,
+    scan_file,
+    scan_tail,
+    to_number,
+)
+
+# Errors and warnings reported per result
+MAX_REPORTED = 5
 
 
 class QuantumEspressoParser(OutputParser):
@@ -20,6 +39,8 @@ class QuantumEspressoParser(OutputParser):
     Supports pw.x (SCF, relax, vc-relax), ph.x (phonon), and other QE outputs.
     """
 
+    version = "2"
+
     # Regex patterns for QE output parsing
     # Total energy: "!    total energy              =     -65.45703298 Ry"
     ENERGY_PATTERN = re.compile(r"!\s+total energy\s+=\s+([-\d.]+)\s+Ry", re.IGNORECASE)
@@ -36,7 +57,7 @@ class QuantumEspressoParser(OutputParser):
         re.compile(r"DEPRECATED.*", re.IGNORECASE),
     ]
 
-    async def parse(self, output_file: Path) -> ParsingResult:
+    def parse_sync(self, output_file: Path) -> ParsingResult:
         """Parse a QE output file into a structured ParsingResult.
 
         Args:
@@ -46,92 +67,103 @@ class QuantumEspressoParser(OutputParser):
             ParsingResult with extracted energy, convergence, and metadata.
         """
         if not output_file.exists():
-            return ParsingResult(
-                success=False,
-                final_energy=None,
-                energy_unit=self.get_energy_unit(),
-                convergence_status="UNKNOWN",
-                errors=[f"Output file not found: {output_file}"],
-            )
+            return self._failure(f"Output file not found: {output_file}")
+
+        # Try aiida-quantumespresso parser first; it needs the whole text
+        if importlib.util.find_spec("aiida_quantumespresso") is not None:
+            try:
+                content = output_file.read_text()
+            except Exception as e:
+                return self._failure(f"Failed to read output file: {e}")
+            aiida_result = self._parse_with_aiida_qe(content)
+            if aiida_result:
+                return aiida_result
 
         try:
-            content = output_file.read_text()
-        except Exception as e:
-            return ParsingResult(
-                success=False,
-                final_energy=None,
-                energy_unit=self.get_energy_unit(),
-                convergence_status="UNKNOWN",
-                errors=[f"Failed to read output file: {e}"],
-            )
+            with open(output_file, "rb") as f:
+                scan = scan_file(f, _PwScan())
+        except OSError as e:
+            return self._failure(f"Failed to read output file: {e}")
+        return self._build_result(scan)
+
+    def parse_tail_sync(
+        self, output_file: Path, tail_bytes: int = DEFAULT_TAIL_BYTES
+    ) -> ParsingResult:
+        """Final energy and convergence of a QE run, from the end of the output.
+
+        The tail settles both when it holds the last ``!    total energy``
+        line and a "convergence has been achieved" message, which the full
+        parse reports as CONVERGED wherever it appears. Any other tail could
+        be contradicted by earlier output, so the whole file is parsed
+        instead (as it is when aiida-quantumespresso is installed, to keep
+        its energies).
+
+        Args:
+            output_file: Path to the QE output file.
+            tail_bytes: Size of the window read from the end.
+
+        Returns:
+            A ``metadata["tail_only"]`` result holding only the final energy
+            and convergence status, or the full parse_sync result.
+        """
+        if not output_file.exists():
+            return self._failure(f"Output file not found: {output_file}")
+        if importlib.util.find_spec("aiida_quantumespresso") is not None:
+            return self.parse_sync(output_file)
+
+        try:
+            with open(output_file, "rb") as f:
+                scan, start = scan_tail(f, _PwScan(), tail_bytes)
+        except OSError as e:
+            return self._failure(f"Failed to read output file: {e}")
+        if start == 0:
+            return self._build_result(scan)
+        if scan.energy is None or not scan.converged:
+            return self.parse_sync(output_file)
+        return ParsingResult(
+            success=True,
+            final_energy=to_number(float, scan.energy),
+            energy_unit=self.get_energy_unit(),
+            convergence_status="CONVERGED",
+            metadata={"parser": "quantum_espresso", "tail_only": True},
+        )
 
-        # Try aiida-quantumespresso parser first
-        aiida_result = self._parse_with_aiida_qe(content)
-        if aiida_result:
-            return aiida_result
+    def _failure(self, message: str) -> ParsingResult:
+        return ParsingResult(
+            success=False,
+            final_energy=None,
+            energy_unit=self.get_energy_unit(),
+            convergence_status="UNKNOWN",
+            errors=[message],
+        )
 
+    def _build_result(self, scan: "_PwScan") -> ParsingResult:
+        """Assemble a ParsingResult from a finished scan."""
         errors: List[str] = []
-        warnings: List[str] = []
-        content_upper = content.upper()
-
-        # Check for errors
-        if "ERROR" in content_upper and "NO ERROR" not in content_upper:
-            # Extract error lines
-            for line in content.split("\n"):
-                if "error" in line.lower() and "no error" not in line.lower():
-                    errors.append(line.strip())
-                    if len(errors) >= 5:
-                        break
-
-        if "CONVERGENCE NOT ACHIEVED" in content_upper:
+        if not scan.no_error:
+            errors = [decode_line(line) for line in scan.error_lines]
+        if scan.not_converged:
             errors.append("SCF convergence not achieved")
 
-        # Extract final energy - get the last occurrence
-        final_energy: Optional[float] = None
-        energy_matches = self.ENERGY_PATTERN.findall(content)
-        if energy_matches:
-            try:
-                final_energy = float(energy_matches[-1])
-            except ValueError:
-                pass
-
-        # Extract SCF cycles - count iterations
-        scf_cycles: Optional[int] = None
-        cycle_matches = self.SCF_CYCLE_PATTERN.findall(content)
-        if cycle_matches:
-            try:
-                scf_cycles = int(cycle_matches[-1])
-            except ValueError:
-                pass
-
         # Check for geometry convergence (for relax/vc-relax)
         geometry_converged: Optional[bool] = None
-        if "BFGS" in content or "GEOMETRY OPTIMIZATION" in content_upper:
-            if (
-                "BFGS CONVERGED" in content_upper
-                or "GEOMETRY OPTIMIZATION CONVERGED" in content_upper
-            ):
+        if scan.optimization:
+            if scan.geometry_converged:
                 geometry_converged = True
-            elif "MAXIMUM NUMBER OF ITERATIONS REACHED" in content_upper:
+            elif scan.max_iterations:
                 geometry_converged = False
 
-        # Extract warnings
-        for pattern in self.WARNING_PATTERNS:
-            for match in pattern.finditer(content):
-                warnings.append(match.group(0).strip())
-                if len(warnings) >= 10:
-                    break
+        warnings = [decode_line(match) for found in scan.warnings for match in found]
 
         # Determine success - QE ends with "JOB DONE." on success
-        job_done = "JOB DONE" in content_upper
-        success = job_done and len(errors) == 0
+        success = scan.job_done and len(errors) == 0
 
         # Determine convergence status
-        if "CONVERGENCE HAS BEEN ACHIEVED" in content_upper:
+        if scan.converged:
             convergence_status = "CONVERGED"
-        elif "CONVERGENCE NOT ACHIEVED" in content_upper:
+        elif scan.not_converged:
             convergence_status = "NOT_CONVERGED"
-        elif job_done:
+        elif scan.job_done:
             convergence_status = "COMPLETED"
         else:
             convergence_status = "UNKNOWN"
@@ -139,26 +171,23 @@ class QuantumEspressoParser(OutputParser):
         # Build metadata
         metadata = {
             "parser": "quantum_espresso",
-            "job_done": job_done,
+            "job_done": scan.job_done,
         }
 
-        # Try to extract total force for geometry optimizations
-        force_matches = self.FORCES_PATTERN.findall(content)
-        if force_matches:
-            try:
-                metadata["total_force"] = float(force_matches[-1])
-            except ValueError:
-                pass
+        # Total force for geometry optimizations
+        total_force = to_number(float, scan.force)
+        if total_force is not None:
+            metadata["total_force"] = total_force
 
         return ParsingResult(
             success=success,
-            final_energy=final_energy,
+            final_energy=to_number(float, scan.energy),
             energy_unit=self.get_energy_unit(),
             convergence_status=convergence_status,
-            scf_cycles=scf_cycles,
+            scf_cycles=to_number(int, scan.cycle),
             geometry_converged=geometry_converged,
-            errors=errors[:5],
-            warnings=warnings[:5],
+            errors=errors[:MAX_REPORTED],
+            warnings=warnings[:MAX_REPORTED],
             metadata=metadata,
         )
 
@@ -252,112 +281,83 @@ class QuantumEspressoParser(OutputParser):
         except Exception:
             return None
 
-        try:
-            content = output_file.read_text()
-        except Exception as e:
-            return ParsingResult(
-                success=False,
-                final_energy=None,
-                energy_unit=self.get_energy_unit(),
-                convergence_status="UNKNOWN",
-                errors=[f"Failed to read output file: {e}"],
-            )
-
-        errors: List[str] = []
-        warnings: List[str] = []
-        content_upper = content.upper()
-
-        # Check for errors
-        if "ERROR" in content_upper and "NO ERROR" not in content_upper:
-            # Extract error lines
-            for line in content.split("\n"):
-                if "error" in line.lower() and "no error" not in line.lower():
-                    errors.append(line.strip())
-                    if len(errors) >= 5:
-                        break
-
-        if "CONVERGENCE NOT ACHIEVED" in content_upper:
-            errors.append("SCF convergence not achieved")
-
-        # Extract final energy - get the last occurrence
-        final_energy: Optional[float] = None
-        energy_matches = self.ENERGY_PATTERN.findall(content)
-        if energy_matches:
-            try:
-                final_energy = float(energy_matches[-1])
-            except ValueError:
-                pass
-
-        # Extract SCF cycles - count iterations
-        scf_cycles: Optional[int] = None
-        cycle_matches = self.SCF_CYCLE_PATTERN.findall(content)
-        if cycle_matches:
-            try:
-                scf_cycles = int(cycle_matches[-1])
-            except ValueError:
-                pass
+    def get_energy_unit(self) -> str:
+        """Return the energy unit (Rydberg for QE)."""
+        return "Ry"
 
-        # Check for geometry convergence (for relax/vc-relax)
-        geometry_converged: Optional[bool] = None
-        if "BFGS" in content or "GEOMETRY OPTIMIZATION" in content_upper:
-            if (
-                "BFGS CONVERGED" in content_upper
-                or "GEOMETRY OPTIMIZATION CONVERGED" in content_upper
-            ):
-                geometry_converged = True
-            elif "MAXIMUM NUMBER OF ITERATIONS REACHED" in content_upper:
-                geometry_converged = False
 
-        # Extract warnings
-        for pattern in self.WARNING_PATTERNS:
-            for match in pattern.finditer(content):
-                warnings.append(match.group(0).strip())
-                if len(warnings) >= 10:
-                    break
+# Case-insensitive regexes have no literal fast path, so the IGNORECASE
+# patterns above are matched in upper case against the upper-cased chunk.
+_ENERGY_UPPER = re.compile(rb"!\s+TOTAL ENERGY\s+=\s+([-\d.]+)\s+RY")
+_WARNINGS_UPPER = [re.compile(rb"WARNING.*"), re.compile(rb"DEPRECATED.*")]
+_SCF_CYCLE = bytes_pattern(QuantumEspressoParser.SCF_CYCLE_PATTERN)
+_FORCES = bytes_pattern(QuantumEspressoParser.FORCES_PATTERN)
 
-        # Determine success - QE ends with "JOB DONE." on success
-        job_done = "JOB DONE" in content_upper
-        success = job_done and len(errors) == 0
 
-        # Determine convergence status
-        if "CONVERGENCE HAS BEEN ACHIEVED" in content_upper:
-            convergence_status = "CONVERGED"
-        elif "CONVERGENCE NOT ACHIEVED" in content_upper:
-            convergence_status = "NOT_CONVERGED"
-        elif job_done:
-            convergence_status = "COMPLETED"
-        else:
-            convergence_status = "UNKNOWN"
+class _PwScan:
+    """Rolling state for one streaming pass over (part of) a QE output.
 
-        # Build metadata
-        metadata = {
-            "parser": "quantum_espresso",
-            "job_done": job_done,
-        }
+    Keeps the last energy, SCF iteration and force, the first few error and
+    warning lines, and flags for the status messages; nothing else.
+    """
 
-        # Try to extract total force for geometry optimizations
-        force_matches = self.FORCES_PATTERN.findall(content)
-        if force_matches:
-            try:
-                metadata["total_force"] = float(force_matches[-1])
-            except ValueError:
-                pass
+    def __init__(self) -> None:
+        self.error_lines: List[bytes] = []
+        # Any "no error" line means no line is reported as an error
+        self.no_error = False
+        self.converged = False
+        self.not_converged = False
+        self.job_done = False
+        self.optimization = False
+        self.geometry_converged = False
+        self.max_iterations = False
+        self.energy: Optional[bytes] = None
+        self.cycle: Optional[bytes] = None
+        self.force: Optional[bytes] = None
+        self.warnings: List[List[bytes]] = [[] for _ in _WARNINGS_UPPER]
+
+    def feed(self, chunk: bytes, offset: int) -> None:
+        upper = chunk.upper()
+
+        if not self.no_error and b"NO ERROR" in upper:
+            self.no_error = True
+        if not self.no_error and len(self.error_lines) < MAX_REPORTED:
+            for start, end in iter_lines_with(upper, b"ERROR"):
+                self.error_lines.append(chunk[start:end])
+                if len(self.error_lines) >= MAX_REPORTED:
+                    break
 
-        return ParsingResult(
-            success=success,
-            final_energy=final_energy,
-            energy_unit=self.get_energy_unit(),
-            convergence_status=convergence_status,
-            scf_cycles=scf_cycles,
-            geometry_converged=geometry_converged,
-            errors=errors[:5],
-            warnings=warnings[:5],
-            metadata=metadata,
+        self.converged = self.converged or b"CONVERGENCE HAS BEEN ACHIEVED" in upper
+        self.not_converged = self.not_converged or b"CONVERGENCE NOT ACHIEVED" in upper
+        self.job_done = self.job_done or b"JOB DONE" in upper
+        self.optimization = (
+            self.optimization or b"BFGS" in chunk or b"GEOMETRY OPTIMIZATION" in upper
+        )
+        self.geometry_converged = (
+            self.geometry_converged
+            or b"BFGS CONVERGED" in upper
+            or b"GEOMETRY OPTIMIZATION CONVERGED" in upper
+        )
+        self.max_iterations = (
+            self.max_iterations or b"MAXIMUM NUMBER OF ITERATIONS REACHED" in upper
         )
 
-    def get_energy_unit(self) -> str:
-        """Return the energy unit (Rydberg for QE)."""
-        return "Ry"
+        for pattern, text, attr in (
+            (_ENERGY_UPPER, upper, "energy"),
+            (_SCF_CYCLE, chunk, "cycle"),
+            (_FORCES, chunk, "force"),
+        ):
+            match = last_match(pattern, text)
+            if match is not None:
+                setattr(self, attr, chunk[match.start(1) : match.end(1)])
+
+        for pattern, found in zip(_WARNINGS_UPPER, self.warnings, strict=True):
+            if len(found) >= MAX_REPORTED:
+                continue
+            for match in pattern.finditer(upper):
+                found.append(chunk[match.start() : match.end()])
+                if len(found) >= MAX_REPORTED:
+                    break
 
 
 # Singleton instance
@@ -0,0 +1,167 @@
+"""
+Bounded-memory scanning of large text outputs.
+
+Reading a multi-GB output with ``read_text()`` and searching an ``upper()``
+copy of it holds the file in memory about three times over. The fallback
+parsers scan a stream of newline-aligned byte chunks instead, keeping only
+the rolling state they need, so peak memory stays at a few chunks whatever
+the file size. Markers and regexes match on raw bytes; only the lines that
+end up in a result are decoded.
+
+A scan is any object with a ``feed(chunk, offset)`` method, where ``offset``
+is the chunk's absolute position in the file. Scans that need a region
+again (e.g. the last ionic step) record offsets and re-read just that span.
+
+``scan_tail`` feeds a scan only the end of the file. The final energy and
+convergence messages of a calculation are printed last, so the tail usually
+answers those two questions. It cannot tell whether the run failed, because
+errors may be printed anywhere, so parsers use it only for final-energy and
+convergence queries and scan the whole file when the tail is inconclusive.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections import deque
+from typing import BinaryIO, Callable, Iterator, Optional, Tuple, TypeVar
+
+# Bytes read per chunk when streaming a whole file
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Tail window for final-energy and convergence queries; final results sit in
+# the last ~100 KB of an output
+DEFAULT_TAIL_BYTES = 100 * 1024
+
+# First window searched back from the end of a chunk by last_match
+_LAST_MATCH_WINDOW = 64 * 1024
+
+ScanT = TypeVar("ScanT")
+NumT = TypeVar("NumT")
+
+
+def bytes_pattern(pattern: "re.Pattern[str]") -> "re.Pattern[bytes]":
+    """Compile a str regex for matching raw output bytes (ASCII semantics)."""
+    return re.compile(pattern.pattern.encode("ascii"), pattern.flags & ~re.UNICODE)
+
+
+def iter_chunks(
+    f: BinaryIO, start: int = 0, chunk_size: Optional[int] = None
+) -> Iterator[Tuple[int, bytes]]:
+    """Yield ``(offset, chunk)`` pairs from ``start`` to EOF.
+
+    Every chunk except possibly the last ends with a newline, so no line is
+    split across chunks. ``chunk_size`` defaults to DEFAULT_CHUNK_SIZE.
+    """
+    chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+    f.seek(start)
+    offset = start
+    pending = b""
+    while True:
+        block = f.read(chunk_size)
+        if not block:
+            break
+        data = pending + block if pending else block
+        cut = data.rfind(b"\n") + 1
+        if cut == 0:
+            # One line longer than a chunk; keep reading until it ends
+            pending = data
+            continue
+        pending = data[cut:]
+        yield offset, data[:cut]
+        offset += cut
+    if pending:
+        yield offset, pending
+
+
+def line_start(f: BinaryIO, offset: int) -> int:
+    """Offset of the first complete line at or after ``offset``."""
+    if offset <= 0:
+        return 0
+    f.seek(offset - 1)
+    f.readline()
+    return f.tell()
+
+
+def read_span(f: BinaryIO, start: int, end: int) -> bytes:
+    """Read bytes ``[start, end)`` of the file."""
+    f.seek(start)
+    return f.read(max(end - start, 0))
+
+
+def iter_lines_with(upper: bytes, marker: bytes) -> Iterator[Tuple[int, int]]:
+    """Yield ``(start, end)`` of each line of ``upper`` containing ``marker``."""
+    pos = upper.find(marker)
+    while pos >= 0:
+        start = upper.rfind(b"\n", 0, pos) + 1
+        end = upper.find(b"\n", pos)
+        if end < 0:
+            end = len(upper)
+        yield start, end
+        pos = upper.find(marker, end)
+
+
+def last_match(pattern: "re.Pattern[bytes]", data: bytes) -> "Optional[re.Match[bytes]]":
+    """Last match of a single-line ``pattern`` in ``data``.
+
+    Searches line-aligned windows growing back from the end, so a match near
+    the end is found without visiting every earlier one.
+    """
+    end = len(data)
+    window = _LAST_MATCH_WINDOW
+    while True:
+        start = data.rfind(b"\n", 0, end - window) + 1 if window < end else 0
+        last = deque(pattern.finditer(data, start), maxlen=1)
+        if last or start == 0:
+            return last[0] if last else None
+        window *= 4
+
+
+def to_number(convert: Callable[[bytes], NumT], raw: Optional[bytes]) -> Optional[NumT]:
+    """Convert a captured number with ``int``/``float``; None if absent or malformed."""
+    if raw is None:
+        return None
+    try:
+        return convert(raw)
+    except ValueError:
+        return None
+
+
+def decode_line(line: bytes) -> str:
+    """Decode an output line for reporting, tolerating stray bytes."""
+    return line.decode("utf-8", errors="replace").strip()
+
+
+def scan_file(f: BinaryIO, scan: ScanT, start: int = 0) -> ScanT:
+    """Feed the file from ``start`` to EOF through ``scan``."""
+    for offset, chunk in iter_chunks(f, start):
+        scan.feed(chunk, offset)  # type: ignore[attr-defined]
+    return scan
+
+
+def scan_tail(f: BinaryIO, scan: ScanT, tail_bytes: int = DEFAULT_TAIL_BYTES) -> tuple[ScanT, int]:
+    """Feed the last ``tail_bytes`` of the file, from a line start, through ``scan``.
+
+    Returns:
+        The scan and the offset it started from; 0 means the window covered
+        the whole file.
+    """
+    size = os.fstat(f.fileno()).st_size
+    start = line_start(f, size - tail_bytes) if tail_bytes < size else 0
+    return scan_file(f, scan, start), start
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "DEFAULT_TAIL_BYTES",
+    "bytes_pattern",
+    "decode_line",
+    "iter_chunks",
+    "iter_lines_with",
+    "last_match",
+    "line_start",
+    "read_span",
+    "scan_file",
+    "scan_tail",
+    "to_number",
+]
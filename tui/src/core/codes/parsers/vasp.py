@@ -2,17 +2,37 @@
 
 Parses VASP OUTCAR files to extract energy, convergence status,
 forces, benchmark timing data, and other calculation results.
+
+Without parsevasp the OUTCAR is streamed in chunks (see :mod:`.streaming`)
+rather than read whole, so multi-GB MD and relaxation outputs parse in
+bounded memory. ``parse_tail_sync`` answers final-energy and convergence
+queries from the end of the file when it can.
 """
 
 from __future__ import annotations
 
+import importlib.util
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 
 from ..base import DFTCode
 from .base import OutputParser, ParsingResult, register_parser
+from .streaming import (
+    DEFAULT_TAIL_BYTES,
+    bytes_pattern,
+    decode_line,
+    iter_lines_with,
+    last_match,
+    read_span,
+    scan_file,
+    scan_tail,
+    to_number,
+)
+
+# Errors and warnings reported per result
+MAX_REPORTED = 5
 
 
 @dataclass
@@ -120,6 +140,8 @@ class VASPParser(OutputParser):
     Extracts comprehensive benchmark timing data for performance analysis.
     """
 
+    version = "2"
+
     # Regex patterns for VASP OUTCAR parsing
     # Free energy: "  free  energy   TOTEN  =       -85.54234987 eV"
     TOTEN_PATTERN = re.compile(r"free\s+energy\s+TOTEN\s*=\s*([-\d.]+)\s*eV", re.IGNORECASE)
@@ -341,7 +363,13 @@ class VASPParser(OutputParser):
             metadata=metadata,
         )
 
-    async def parse(self, output_file: Path) -> ParsingResult:
+    def resolve_output_file(self, output_file: Path) -> Path:
+        """Directories resolve to the OUTCAR inside them."""
+        if output_file.is_dir():
+            return output_file / "OUTCAR"
+        return output_file
+
+    def parse_sync(self, output_file: Path) -> ParsingResult:
         """Parse a VASP OUTCAR file into a structured ParsingResult.
 
         Args:
@@ -351,21 +379,13 @@ class VASPParser(OutputParser):
             ParsingResult with extracted energy, convergence, and metadata.
         """
         # VASP outputs to OUTCAR in the current directory
-        # If output_file is a directory, look for OUTCAR
-        if output_file.is_dir():
-            output_file = output_file / "OUTCAR"
+        output_file = self.resolve_output_file(output_file)
 
         if not output_file.exists():
             # Check if vasprun.xml exists even if OUTCAR doesn't (unlikely but possible)
             vasprun_path = output_file.parent / "vasprun.xml"
             if not vasprun_path.exists():
-                return ParsingResult(
-                    success=False,
-                    final_energy=None,
-                    energy_unit=self.get_energy_unit(),
-                    convergence_status="UNKNOWN",
-                    errors=[f"OUTCAR/vasprun.xml file not found in: {output_file.parent}"],
-                )
+                return self._failure(f"OUTCAR/vasprun.xml file not found in: {output_file.parent}")
 
         # Try to parse using parsevasp (from aiida-vasp) first
         try:
@@ -380,107 +400,106 @@ class VASPParser(OutputParser):
             pass
 
         try:
-            content = output_file.read_text()
-        except Exception as e:
-            return ParsingResult(
-                success=False,
-                final_energy=None,
-                energy_unit=self.get_energy_unit(),
-                convergence_status="UNKNOWN",
-                errors=[f"Failed to read OUTCAR: {e}"],
-            )
+            with open(output_file, "rb") as f:
+                scan = scan_file(f, _OutcarScan())
+                return self._build_result(scan, f)
+        except OSError as e:
+            return self._failure(f"Failed to read OUTCAR: {e}")
+
+    def parse_tail_sync(
+        self, output_file: Path, tail_bytes: int = DEFAULT_TAIL_BYTES
+    ) -> ParsingResult:
+        """Final energy and convergence of a VASP run, from the end of the OUTCAR.
+
+        The tail settles both when it holds the last TOTEN and the "reached
+        required accuracy" message, which the full parse reports as CONVERGED
+        wherever it appears. Any other tail could be contradicted by earlier
+        output, so the whole file is parsed instead (as it is when parsevasp
+        is installed, since the full parse prefers its results).
 
-        errors: List[str] = []
-        warnings: List[str] = []
-        content_upper = content.upper()
-
-        # Check for errors (exclude lines that are warnings)
-        if "ERROR" in content_upper and "NO ERROR" not in content_upper:
-            for line in content.split("\n"):
-                line_lower = line.lower().strip()
-                # Skip lines that are warnings (contain "error" as part of message but are warnings)
-                if line_lower.startswith("warning"):
-                    continue
-                if "error" in line_lower and "no error" not in line_lower:
-                    errors.append(line.strip())
-                    if len(errors) >= 5:
-                        break
+        Args:
+            output_file: Path to the OUTCAR file or directory containing it.
+            tail_bytes: Size of the window read from the end.
 
-        if "VERY BAD NEWS" in content_upper:
-            errors.append("VASP reported very bad news - check input/output")
+        Returns:
+            A ``metadata["tail_only"]`` result holding only the final energy
+            and convergence status, or the full parse_sync result.
+        """
+        output_file = self.resolve_output_file(output_file)
+        if not output_file.exists() or importlib.util.find_spec("parsevasp") is not None:
+            return self.parse_sync(output_file)
 
-        # Extract warnings
-        for pattern in self.WARNING_PATTERNS:
-            for match in pattern.finditer(content):
-                warn_text = match.group(0).strip()
-                if warn_text not in warnings:
-                    warnings.append(warn_text)
-                if len(warnings) >= 10:
-                    break
+        try:
+            with open(output_file, "rb") as f:
+                scan, start = scan_tail(f, _OutcarScan(), tail_bytes)
+                if start == 0:
+                    return self._build_result(scan, f)
+        except OSError as e:
+            return self._failure(f"Failed to read OUTCAR: {e}")
+        if scan.toten is None or not scan.reached_accuracy:
+            return self.parse_sync(output_file)
+        return ParsingResult(
+            success=True,
+            final_energy=to_number(float, scan.toten),
+            energy_unit=self.get_energy_unit(),
+            convergence_status="CONVERGED",
+            metadata={"parser": "vasp", "tail_only": True},
+        )
 
-        # Extract final energy - prefer TOTEN, fall back to energy without entropy
-        final_energy: Optional[float] = None
-        toten_matches = self.TOTEN_PATTERN.findall(content)
-        if toten_matches:
-            try:
-                final_energy = float(toten_matches[-1])
-            except ValueError:
-                pass
+    def _failure(self, message: str) -> ParsingResult:
+        return ParsingResult(
+            success=False,
+            final_energy=None,
+            energy_unit=self.get_energy_unit(),
+            convergence_status="UNKNOWN",
+            errors=[message],
+        )
+
+    def _build_result(self, scan: "_OutcarScan", f: BinaryIO) -> ParsingResult:
+        """Assemble a ParsingResult from a finished scan.
+
+        ``f`` is the scanned OUTCAR, used to re-read the last ionic step and
+        the force block whose offsets the scan recorded.
+        """
+        errors: List[str] = []
+        if not scan.no_error:
+            errors = [decode_line(line) for line in scan.error_lines]
+        if scan.very_bad_news:
+            errors.append("VASP reported very bad news - check input/output")
 
+        warnings = [text for found in scan.warnings for text in found]
+
+        # Final energy - prefer TOTEN, fall back to energy without entropy
+        final_energy = to_number(float, scan.toten)
         if final_energy is None:
-            e0_matches = self.E0_PATTERN.findall(content)
-            if e0_matches:
-                try:
-                    final_energy = float(e0_matches[-1])
-                except ValueError:
-                    pass
+            final_energy = to_number(float, scan.e0)
 
-        # Count SCF cycles (electronic steps in final ionic step)
+        # Count SCF cycles (electronic steps in the last ionic step before EDIFF was reached)
         scf_cycles: Optional[int] = None
-        # Find the last EDIFF block and count electronic steps
-        ediff_blocks = self.IONIC_STEP_PATTERN.findall(content)
-        if ediff_blocks:
-            # Get content after last ionic step header
-            last_block_pos = content.rfind("aborting loop because EDIFF is reached")
-            if last_block_pos > 0:
-                # Count electronic iterations before this
-                block_content = content[:last_block_pos]
-                last_ionic = block_content.rfind("FREE ENERGIE OF THE ION-ELECTRON SYSTEM")
-                if last_ionic > 0:
-                    recent_content = block_content[last_ionic:]
-                    steps = self.ELECTRONIC_STEP_PATTERN.findall(recent_content)
-                    if steps:
-                        try:
-                            scf_cycles = int(steps[-1][0])
-                        except (ValueError, IndexError):
-                            pass
+        if scan.ediff_marker and scan.scf_span is not None:
+            header, abort = scan.scf_span
+            if header is not None and header > 0 and abort > 0:
+                steps = last_match(_ELECTRONIC_STEP, read_span(f, header, abort))
+                if steps is not None:
+                    scf_cycles = to_number(int, steps.group(1))
 
         # Check for geometry convergence (for relaxation calculations)
         geometry_converged: Optional[bool] = None
-        if "IBRION" in content:  # This is a relaxation calculation
-            if "REACHED REQUIRED ACCURACY" in content_upper:
+        if scan.relaxation:
+            if scan.reached_accuracy:
                 geometry_converged = True
-            elif "NSW" in content:
+            elif scan.nsw is not None:
                 # Check if max ionic steps reached
-                nsw_match = re.search(r"NSW\s*=\s*(\d+)", content)
-                if nsw_match:
-                    max_steps = int(nsw_match.group(1))
-                    ionic_count = len(
-                        re.findall(r"FREE ENERGIE OF THE ION-ELECTRON SYSTEM", content)
-                    )
-                    if ionic_count >= max_steps:
-                        geometry_converged = False
+                if scan.ionic_count >= int(scan.nsw):
+                    geometry_converged = False
 
         # Determine success - VASP typically ends with timing info
-        has_timing = (
-            "TOTAL CPU TIME" in content_upper or "GENERAL TIMING AND ACCOUNTING" in content_upper
-        )
-        success = has_timing and len(errors) == 0
+        success = scan.has_timing and len(errors) == 0
 
         # Determine convergence status
-        if "REACHED REQUIRED ACCURACY" in content_upper:
+        if scan.reached_accuracy:
             convergence_status = "CONVERGED"
-        elif has_timing and len(errors) == 0:
+        elif scan.has_timing and len(errors) == 0:
             convergence_status = "COMPLETED"
         elif errors:
             convergence_status = "FAILED"
@@ -490,21 +509,19 @@ class VASPParser(OutputParser):
         # Build metadata
         metadata = {
             "parser": "vasp",
-            "has_timing_info": has_timing,
+            "has_timing_info": scan.has_timing,
         }
 
-        # Try to extract max force for geometry optimizations
-        max_force_section = re.search(r"TOTAL-FORCE.*?LOOP\+", content, re.DOTALL)
-        if max_force_section:
-            rms_matches = self.MAX_FORCE_PATTERN.findall(max_force_section.group(0))
-            if rms_matches:
-                try:
-                    metadata["rms_force"] = float(rms_matches[-1])
-                except ValueError:
-                    pass
+        # RMS force from the first TOTAL-FORCE block
+        if scan.force_span is not None:
+            rms = last_match(_MAX_FORCE, read_span(f, *scan.force_span))
+            if rms is not None:
+                rms_force = to_number(float, rms.group(1))
+                if rms_force is not None:
+                    metadata["rms_force"] = rms_force
 
-        # Extract benchmark/timing data
-        benchmark_metrics = self._extract_benchmark_data(content)
+        # Benchmark/timing data
+        benchmark_metrics = scan.timing.to_dict()
         if benchmark_metrics:
             metadata["benchmark"] = benchmark_metrics
 
@@ -515,8 +532,8 @@ class VASPParser(OutputParser):
             convergence_status=convergence_status,
             scf_cycles=scf_cycles,
             geometry_converged=geometry_converged,
-            errors=errors[:5],
-            warnings=warnings[:5],
+            errors=errors[:MAX_REPORTED],
+            warnings=warnings[:MAX_REPORTED],
             metadata=metadata,
         )
 
@@ -528,7 +545,7 @@ class VASPParser(OutputParser):
         """Extract comprehensive timing and parallelization data for benchmarking.
 
         Parses the OUTCAR file to extract:
-        - Total wall time and CPU time
+        - Total wall and CPU time
         - SCF iteration timing (LOOP)
         - Ionic step timing (LOOP+)
         - Per-routine timing breakdown (POTLOK, SETDIJ, CHARGE, etc.)
@@ -541,152 +558,9 @@ class VASPParser(OutputParser):
         Returns:
             Dictionary with benchmark metrics suitable for JSON serialization.
         """
-        metrics = VASPBenchmarkMetrics()
-
-        # Extract total CPU time
-        cpu_match = self.TOTAL_CPU_PATTERN.search(content)
-        if cpu_match:
-            try:
-                metrics.total_cpu_time_sec = float(cpu_match.group(1))
-            except ValueError:
-                pass
-
-        # Extract elapsed (wall) time
-        elapsed_match = self.ELAPSED_TIME_PATTERN.search(content)
-        if elapsed_match:
-            try:
-                metrics.elapsed_time_sec = float(elapsed_match.group(1))
-            except ValueError:
-                pass
-
-        # Extract LOOP timing (SCF iterations - sum of all)
-        loop_matches = self.LOOP_TIME_PATTERN.findall(content)
-        if loop_matches:
-            try:
-                metrics.loop_cpu_time_sec = sum(float(m[0]) for m in loop_matches)
-                metrics.loop_real_time_sec = sum(float(m[1]) for m in loop_matches)
-                metrics.loop_count = len(loop_matches)
-            except (ValueError, IndexError):
-                pass
-
-        # Extract LOOP+ timing (ionic steps - sum of all)
-        loop_plus_matches = self.LOOP_PLUS_TIME_PATTERN.findall(content)
-        if loop_plus_matches:
-            try:
-                metrics.loop_plus_cpu_time_sec = sum(float(m[0]) for m in loop_plus_matches)
-                metrics.loop_plus_real_time_sec = sum(float(m[1]) for m in loop_plus_matches)
-                metrics.loop_plus_count = len(loop_plus_matches)
-            except (ValueError, IndexError):
-                pass
-
-        # Extract per-routine timing breakdown
-        metrics.routine_timings = self._extract_routine_timings(content)
-
-        # Extract memory usage
-        memory_match = self.MEMORY_RANK0_PATTERN.search(content)
-        if memory_match:
-            try:
-                # Convert kBytes to MB
-                kb = float(memory_match.group(1))
-                metrics.memory_per_core_mb = kb / 1024.0
-            except ValueError:
-                pass
-
-        max_mem_match = self.MAX_MEMORY_PATTERN.search(content)
-        if max_mem_match:
-            try:
-                # Convert kb to MB
-                kb = float(max_mem_match.group(1))
-                metrics.maximum_memory_used_mb = kb / 1024.0
-            except ValueError:
-                pass
-
-        # Extract number of cores
-        cores_match = self.NUM_CORES_PATTERN.search(content)
-        if cores_match:
-            try:
-                metrics.num_cores = int(cores_match.group(1))
-            except ValueError:
-                pass
-
-        # Extract parallelization settings
-        npar_match = self.NPAR_PATTERN.search(content)
-        if npar_match:
-            try:
-                metrics.npar = int(npar_match.group(1))
-            except ValueError:
-                pass
-
-        ncore_match = self.NCORE_PATTERN.search(content)
-        if ncore_match:
-            try:
-                metrics.ncore = int(ncore_match.group(1))
-            except ValueError:
-                pass
-
-        kpar_match = self.KPAR_PATTERN.search(content)
-        if kpar_match:
-            try:
-                metrics.kpar = int(kpar_match.group(1))
-            except ValueError:
-                pass
-
-        # Calculate efficiency metrics
-        if metrics.total_cpu_time_sec is not None and metrics.elapsed_time_sec is not None:
-            if metrics.elapsed_time_sec > 0:
-                metrics.cpu_to_wall_ratio = metrics.total_cpu_time_sec / metrics.elapsed_time_sec
-
-                # Calculate parallel efficiency if we know the number of cores
-                if metrics.num_cores is not None and metrics.num_cores > 0:
-                    # Parallel efficiency = CPU time / (wall time * num_cores)
-                    metrics.parallel_efficiency = metrics.total_cpu_time_sec / (
-                        metrics.elapsed_time_sec * metrics.num_cores
-                    )
-
-        return metrics.to_dict()
-
-    def _extract_routine_timings(self, content: str) -> Dict[str, Dict[str, float]]:
-        """Extract per-routine timing breakdown from OUTCAR.
-
-        Parses timing lines like:
-            POTLOK:  cpu time   1.23: real time   1.45
-            SETDIJ:  cpu time   0.56: real time   0.78
-
-        Aggregates timings across all iterations.
-
-        Args:
-            content: OUTCAR file content.
-
-        Returns:
-            Dictionary mapping routine name to timing dict with 'cpu_sec',
-            'real_sec', and 'count' keys.
-        """
-        routine_timings: Dict[str, Dict[str, float]] = {}
-
-        # Find all routine timing lines
-        for match in self.ROUTINE_TIME_PATTERN.finditer(content):
-            routine_name = match.group(1).upper()
-
-            # Only track known routines to avoid noise
-            # But be flexible - track anything that looks like a routine
-            try:
-                cpu_time = float(match.group(2))
-                real_time = float(match.group(3))
-            except ValueError:
-                continue
-
-            if routine_name not in routine_timings:
-                routine_timings[routine_name] = {
-                    "cpu_sec": 0.0,
-                    "real_sec": 0.0,
-                    "count": 0,
-                }
-
-            routine_timings[routine_name]["cpu_sec"] += cpu_time
-            routine_timings[routine_name]["real_sec"] += real_time
-            routine_timings[routine_name]["count"] += 1
-
-        return routine_timings
+        timing = _TimingScan()
+        timing.feed(content.encode("utf-8", errors="replace"))
+        return timing.to_dict()
 
     def extract_timing_data(self, content: str) -> Dict[str, Any]:
         """Public method to extract timing data from OUTCAR content.
@@ -724,6 +598,224 @@ class VASPParser(OutputParser):
         return self._extract_benchmark_data(content)
 
 
+# Case-insensitive regexes have no literal fast path, so the IGNORECASE
+# patterns on VASPParser are matched in upper case against the upper-cased chunk.
+_TOTEN_UPPER = re.compile(rb"FREE\s+ENERGY\s+TOTEN\s*=\s*([-\d.]+)\s*EV")
+_WARNINGS_UPPER = [re.compile(rb"WARNING.*"), re.compile(rb"VERY BAD NEWS.*")]
+_MEMORY_RANK0_UPPER = re.compile(rb"TOTAL AMOUNT OF MEMORY USED BY VASP.*?(\d+\.?\d*)\s*KBYTES")
+_E0 = bytes_pattern(VASPParser.E0_PATTERN)
+_ELECTRONIC_STEP = bytes_pattern(VASPParser.ELECTRONIC_STEP_PATTERN)
+_IONIC_STEP = bytes_pattern(VASPParser.IONIC_STEP_PATTERN)
+_MAX_FORCE = bytes_pattern(VASPParser.MAX_FORCE_PATTERN)
+_LOOP_TIME = bytes_pattern(VASPParser.LOOP_TIME_PATTERN)
+_LOOP_PLUS_TIME = bytes_pattern(VASPParser.LOOP_PLUS_TIME_PATTERN)
+_NSW = re.compile(rb"NSW\s*=\s*(\d+)")
+# ROUTINE_TIME_PATTERN with "^" spelled as a newline, which scans much faster;
+# chunks are searched with a newline prepended so the first line still counts
+_ROUTINE_TIME_LINE = re.compile(rb"\n\s*(\w+):\s+cpu time\s+([\d.]+):\s+real time\s+([\d.]+)")
+
+# Single-valued metrics: the first match in the OUTCAR wins.
+# (name, pattern, matched against the upper-cased chunk)
+_FIRST_MATCH_METRICS = [
+    ("total_cpu_time_sec", bytes_pattern(VASPParser.TOTAL_CPU_PATTERN), False),
+    ("elapsed_time_sec", bytes_pattern(VASPParser.ELAPSED_TIME_PATTERN), False),
+    ("memory_per_core_mb", _MEMORY_RANK0_UPPER, True),
+    ("maximum_memory_used_mb", bytes_pattern(VASPParser.MAX_MEMORY_PATTERN), False),
+    ("num_cores", bytes_pattern(VASPParser.NUM_CORES_PATTERN), False),
+    ("npar", bytes_pattern(VASPParser.NPAR_PATTERN), False),
+    ("ncore", bytes_pattern(VASPParser.NCORE_PATTERN), False),
+    ("kpar", bytes_pattern(VASPParser.KPAR_PATTERN), False),
+]
+_INT_METRICS = {"num_cores", "npar", "ncore", "kpar"}
+_KB_METRICS = {"memory_per_core_mb", "maximum_memory_used_mb"}
+
+_ION_ELECTRON = b"FREE ENERGIE OF THE ION-ELECTRON SYSTEM"
+_EDIFF_REACHED = b"aborting loop because EDIFF is reached"
+
+
+class _TimingScan:
+    """Accumulates VASPBenchmarkMetrics over a stream of OUTCAR chunks."""
+
+    def __init__(self) -> None:
+        self.first: Dict[str, Optional[bytes]] = {}
+        # [cpu seconds, real seconds, count]; None once a value fails to parse
+        self.loop: Optional[List[float]] = [0.0, 0.0, 0]
+        self.loop_plus: Optional[List[float]] = [0.0, 0.0, 0]
+        self.routines: Dict[str, Dict[str, float]] = {}
+        # Raw routine name -> its entry in routines
+        self._by_name: Dict[bytes, Dict[str, float]] = {}
+
+    def feed(self, chunk: bytes, upper: Optional[bytes] = None) -> None:
+        if upper is None:
+            upper = chunk.upper()
+        for name, pattern, on_upper in _FIRST_MATCH_METRICS:
+            if name not in self.first:
+                match = pattern.search(upper if on_upper else chunk)
+                if match is not None:
+                    self.first[name] = chunk[match.start(1) : match.end(1)]
+
+        for name, cpu_time, real_time in _ROUTINE_TIME_LINE.findall(b"\n" + chunk):
+            try:
+                cpu_sec, real_sec = float(cpu_time), float(real_time)
+            except ValueError:
+                continue
+            routine = self._by_name.get(name)
+            if routine is None:
+                key = name.upper().decode("ascii")
+                routine = self.routines.setdefault(
+                    key, {"cpu_sec": 0.0, "real_sec": 0.0, "count": 0}
+                )
+                self._by_name[name] = routine
+            routine["cpu_sec"] += cpu_sec
+            routine["real_sec"] += real_sec
+            routine["count"] += 1
+
+        for pattern, attr in ((_LOOP_TIME, "loop"), (_LOOP_PLUS_TIME, "loop_plus")):
+            totals = getattr(self, attr)
+            if totals is None:
+                continue
+            for cpu_time, real_time in pattern.findall(chunk):
+                try:
+                    totals[0] += float(cpu_time)
+                    totals[1] += float(real_time)
+                    totals[2] += 1
+                except ValueError:
+                    setattr(self, attr, None)
+                    break
+
+    def to_dict(self) -> Dict[str, Any]:
+        metrics = VASPBenchmarkMetrics()
+
+        for name, raw in self.first.items():
+            value = to_number(int if name in _INT_METRICS else float, raw)
+            if value is not None and name in _KB_METRICS:
+                # Convert kB to MB
+                value = value / 1024.0
+            setattr(metrics, name, value)
+
+        if self.loop is not None and self.loop[2]:
+            metrics.loop_cpu_time_sec, metrics.loop_real_time_sec, metrics.loop_count = self.loop
+        if self.loop_plus is not None and self.loop_plus[2]:
+            (
+                metrics.loop_plus_cpu_time_sec,
+                metrics.loop_plus_real_time_sec,
+                metrics.loop_plus_count,
+            ) = self.loop_plus
+
+        metrics.routine_timings = self.routines
+
+        # Calculate efficiency metrics
+        if metrics.total_cpu_time_sec is not None and metrics.elapsed_time_sec is not None:
+            if metrics.elapsed_time_sec > 0:
+                metrics.cpu_to_wall_ratio = metrics.total_cpu_time_sec / metrics.elapsed_time_sec
+
+                # Calculate parallel efficiency if we know the number of cores
+                if metrics.num_cores is not None and metrics.num_cores > 0:
+                    # Parallel efficiency = CPU time / (wall time * num_cores)
+                    metrics.parallel_efficiency = metrics.total_cpu_time_sec / (
+                        metrics.elapsed_time_sec * metrics.num_cores
+                    )
+
+        return metrics.to_dict()
+
+
+class _OutcarScan:
+    """Rolling state for one streaming pass over an OUTCAR.
+
+    Keeps the last energies, the first few error and warning lines, status
+    flags, and the offsets of the regions read again when the result is
+    built: the last ionic step before EDIFF was reached and the first force
+    block.
+    """
+
+    def __init__(self) -> None:
+        self.error_lines: List[bytes] = []
+        # Any "no error" line means no line is reported as an error
+        self.no_error = False
+        self.very_bad_news = False
+        self.warnings: List[List[str]] = [[] for _ in _WARNINGS_UPPER]
+        self.toten: Optional[bytes] = None
+        self.e0: Optional[bytes] = None
+        self.ediff_marker = False
+        # Offset of the last ionic step header, and (header, abort) for the last abort
+        self.ionic_header: Optional[int] = None
+        self.scf_span: Optional[Tuple[Optional[int], int]] = None
+        self.ionic_count = 0
+        self.relaxation = False
+        self.nsw: Optional[bytes] = None
+        self.reached_accuracy = False
+        self.has_timing = False
+        self.force_start: Optional[int] = None
+        self.force_span: Optional[Tuple[int, int]] = None
+        self.timing = _TimingScan()
+
+    def feed(self, chunk: bytes, offset: int) -> None:
+        upper = chunk.upper()
+
+        if not self.no_error and b"NO ERROR" in upper:
+            self.no_error = True
+        if not self.no_error and len(self.error_lines) < MAX_REPORTED:
+            for start, end in iter_lines_with(upper, b"ERROR"):
+                # Skip lines that are warnings (contain "error" as part of message)
+                if upper[start:end].strip().startswith(b"WARNING"):
+                    continue
+                self.error_lines.append(chunk[start:end])
+                if len(self.error_lines) >= MAX_REPORTED:
+                    break
+        self.very_bad_news = self.very_bad_news or b"VERY BAD NEWS" in upper
+
+        for pattern, found in zip(_WARNINGS_UPPER, self.warnings, strict=True):
+            if len(found) >= MAX_REPORTED:
+                continue
+            for match in pattern.finditer(upper):
+                text = decode_line(chunk[match.start() : match.end()])
+                if text not in found:
+                    found.append(text)
+                    if len(found) >= MAX_REPORTED:
+                        break
+
+        for pattern, text, attr in ((_TOTEN_UPPER, upper, "toten"), (_E0, chunk, "e0")):
+            match = last_match(pattern, text)
+            if match is not None:
+                setattr(self, attr, chunk[match.start(1) : match.end(1)])
+
+        self.ediff_marker = self.ediff_marker or _IONIC_STEP.search(chunk) is not None
+        abort = chunk.rfind(_EDIFF_REACHED)
+        if abort >= 0:
+            header = chunk.rfind(_ION_ELECTRON, 0, abort)
+            self.scf_span = (offset + header if header >= 0 else self.ionic_header, offset + abort)
+        header = chunk.rfind(_ION_ELECTRON)
+        if header >= 0:
+            self.ionic_header = offset + header
+        self.ionic_count += chunk.count(_ION_ELECTRON)
+
+        self.reached_accuracy = self.reached_accuracy or b"REACHED REQUIRED ACCURACY" in upper
+        self.has_timing = (
+            self.has_timing
+            or b"TOTAL CPU TIME" in upper
+            or b"GENERAL TIMING AND ACCOUNTING" in upper
+        )
+
+        self.relaxation = self.relaxation or b"IBRION" in chunk
+        if self.nsw is None:
+            match = _NSW.search(chunk)
+            if match is not None:
+                self.nsw = match.group(1)
+
+        # First TOTAL-FORCE block, up to the LOOP+ line that closes it
+        if self.force_span is None:
+            if self.force_start is None:
+                start = chunk.find(b"TOTAL-FORCE")
+                if start >= 0:
+                    self.force_start = offset + start
+            if self.force_start is not None:
+                end = chunk.find(b"LOOP+", max(self.force_start - offset, 0))
+                if end >= 0:
+                    self.force_span = (self.force_start, offset + end + len(b"LOOP+"))
+
+        self.timing.feed(chunk, upper)
+
+
 # Singleton instance
 _parser = VASPParser()
 
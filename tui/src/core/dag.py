@@ -0,0 +1,179 @@
+"""
+Ready-queue scheduling for DAGs of named nodes.
+
+Finding runnable nodes by scanning every node and re-checking all of its
+dependencies costs O(nodes x dependencies) per completion, which turns
+quadratic for parameter sweeps with thousands of nodes. DAGScheduler
+precomputes, once:
+
+- a counter of unfinished dependencies per node (its in-degree);
+- a reverse adjacency list from each node to the nodes that depend on it.
+
+Completing a node then decrements the counters of its dependents and pushes
+those that reach zero onto a ready heap, in O(out-degree). Failing a node
+blocks its transitive dependents in O(descendants).
+
+The ready heap pops nodes by descending priority, then declaration order.
+``critical_path_priorities`` gives each node the length of the longest
+path from it to a sink, so nodes that gate the most downstream work start
+first.
+
+Usage::
+
+    scheduler = DAGScheduler({"a": [], "b": ["a"], "c": ["a"]})
+    node_id = scheduler.pop_ready()       # "a"
+    scheduler.complete(node_id)           # ["b", "c"] become ready
+"""
+
+import heapq
+from collections import deque
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from .dependency_utils import CircularDependencyError
+
+
+def _reverse_adjacency(dependencies: Mapping[str, Iterable[str]]) -> Dict[str, List[str]]:
+    """Map each node to the nodes that depend on it (unknown dependencies ignored)."""
+    dependents: Dict[str, List[str]] = {node_id: [] for node_id in dependencies}
+    for node_id, deps in dependencies.items():
+        for dep in dict.fromkeys(deps):
+            if dep in dependents:
+                dependents[dep].append(node_id)
+    return dependents
+
+
+def critical_path_priorities(
+    dependencies: Mapping[str, Iterable[str]],
+    weights: Optional[Mapping[str, float]] = None,
+) -> Dict[str, float]:
+    """
+    Priority of each node: the weight of the heaviest path from it to a sink.
+
+    Args:
+        dependencies: Node ID -> IDs of the nodes it depends on
+        weights: Optional cost per node (default 1.0, i.e. path length)
+
+    Returns:
+        Dictionary mapping node_id -> priority (own weight included)
+
+    Raises:
+        CircularDependencyError: If the graph has a cycle
+    """
+    dependents = _reverse_adjacency(dependencies)
+    remaining = {node_id: len(children) for node_id, children in dependents.items()}
+
+    # Settle nodes sinks-first so every dependent is known before its dependencies
+    queue = deque(node_id for node_id, count in remaining.items() if count == 0)
+    priorities: Dict[str, float] = {}
+    while queue:
+        node_id = queue.popleft()
+        weight = weights.get(node_id, 1.0) if weights else 1.0
+        priorities[node_id] = weight + max(
+            (priorities[child] for child in dependents[node_id]), default=0.0
+        )
+        for dep in dict.fromkeys(dependencies[node_id]):
+            if dep in remaining:
+                remaining[dep] -= 1
+                if remaining[dep] == 0:
+                    queue.append(dep)
+
+    if len(priorities) != len(dependents):
+        raise CircularDependencyError("Circular dependency detected: cannot compute critical path")
+
+    return priorities
+
+
+class DAGScheduler:
+    """
+    Tracks which nodes of a DAG are ready to run as nodes finish.
+
+    A node is ready once every dependency has completed. Dependencies that
+    are not nodes of the graph never complete, so their dependents never
+    become ready. The scheduler only tracks readiness; callers run the
+    nodes and report back with ``complete``, ``fail`` or ``retry``.
+    """
+
+    def __init__(
+        self,
+        dependencies: Mapping[str, Iterable[str]],
+        priorities: Optional[Mapping[str, float]] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            dependencies: Node ID -> IDs of the nodes it depends on,
+                          in declaration order
+            priorities: Optional node ID -> priority; higher runs first
+        """
+        self._index = {node_id: i for i, node_id in enumerate(dependencies)}
+        self._dependents = _reverse_adjacency(dependencies)
+        self._waiting: Dict[str, int] = {
+            node_id: len(set(deps)) for node_id, deps in dependencies.items()
+        }
+        self._priorities = priorities or {}
+        self._ready: List[Tuple[float, int, str]] = []
+        self._blocked: Set[str] = set()
+
+        for node_id, count in self._waiting.items():
+            if count == 0:
+                self._push(node_id)
+
+    def _push(self, node_id: str) -> None:
+        priority = self._priorities.get(node_id, 0.0)
+        heapq.heappush(self._ready, (-priority, self._index[node_id], node_id))
+
+    @property
+    def ready_count(self) -> int:
+        """Number of nodes waiting in the ready queue."""
+        return len(self._ready)
+
+    def pop_ready(self) -> Optional[str]:
+        """Remove and return the highest-priority ready node, or None if none is ready."""
+        if not self._ready:
+            return None
+        return heapq.heappop(self._ready)[2]
+
+    def complete(self, node_id: str) -> List[str]:
+        """
+        Record a node as completed.
+
+        Returns:
+            Dependents that became ready, in the order they were queued
+        """
+        newly_ready = []
+        for child in self._dependents.get(node_id, ()):
+            self._waiting[child] -= 1
+            if self._waiting[child] == 0 and child not in self._blocked:
+                self._push(child)
+                newly_ready.append(child)
+        return newly_ready
+
+    def fail(self, node_id: str) -> List[str]:
+        """
+        Record a node as failed for good, blocking everything downstream of it.
+
+        Returns:
+            Transitive dependents that were newly blocked, nearest first
+        """
+        blocked = []
+        queue = deque(self._dependents.get(node_id, ()))
+        while queue:
+            child = queue.popleft()
+            if child in self._blocked:
+                continue
+            self._blocked.add(child)
+            blocked.append(child)
+            queue.extend(self._dependents[child])
+        return blocked
+
+    def retry(self, node_id: str) -> None:
+        """Put a node that will be re-run back on the ready queue."""
+        if node_id not in self._blocked:
+            self._push(node_id)
+
+
+__all__ = [
+    "DAGScheduler",
+    "critical_path_priorities",
+]
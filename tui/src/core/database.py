@@ -123,6 +123,17 @@ class JobDependency:
     dependency_type: str
 
 
+@dataclass
+class StagedObject:
+    """Represents an input file held in a cluster's content-addressed store."""
+
+    cluster_id: int
+    digest: str  # SHA-256 of the file contents
+    size: int
+    created_at: Optional[str] = None
+    last_used_at: Optional[str] = None
+
+
 @dataclass
 class JobResult:
     """Represents detailed job results (normalized from jobs table)."""
@@ -142,7 +153,7 @@ class Database:
 
     # Schema version for migrations
     # Note: Must match the highest version after all migrations are applied
-    SCHEMA_VERSION = 9
+    SCHEMA_VERSION = 13
 
     # Base schema (version 1 - Phase 1)
     # Note: CANCELLED added in v4, but included here for new databases
@@ -363,6 +374,105 @@ class Database:
     ALTER TABLE jobs ADD COLUMN workflow_id TEXT;
     """
 
+    # Migration to version 10 (Keyset pagination indexes for job listing)
+    # (created_at, id) is the page ordering; the leading filter column lets
+    # SQLite walk one index range per page instead of sorting the whole table.
+    MIGRATION_V9_TO_V10 = """
+    CREATE INDEX IF NOT EXISTS idx_jobs_created_id ON jobs (created_at DESC, id DESC);
+    CREATE INDEX IF NOT EXISTS idx_jobs_status_created_id ON jobs (status, created_at DESC, id DESC);
+    CREATE INDEX IF NOT EXISTS idx_jobs_cluster_created_id ON jobs (cluster_id, created_at DESC, id DESC);
+    CREATE INDEX IF NOT EXISTS idx_jobs_workflow_created_id ON jobs (workflow_id, created_at DESC, id DESC);
+    """
+
+    # Migration to version 11 (Job change feed)
+    # Every write to jobs/job_results bumps a global sequence and records it
+    # against the job id (one row per job, so the feed stays bounded). Kept as
+    # a statement list because trigger bodies contain semicolons.
+    MIGRATION_V10_TO_V11 = (
+        """
+        CREATE TABLE IF NOT EXISTS job_change_seq (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            value INTEGER NOT NULL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS job_changes (
+            job_id INTEGER PRIMARY KEY,
+            seq INTEGER NOT NULL,
+            deleted INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_job_changes_seq ON job_changes (seq)",
+        "INSERT OR IGNORE INTO job_changes (job_id, seq, deleted) SELECT id, id, 0 FROM jobs",
+        """
+        INSERT OR IGNORE INTO job_change_seq (id, value)
+        VALUES (1, (SELECT COALESCE(MAX(seq), 0) FROM job_changes))
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_jobs_change_insert AFTER INSERT ON jobs
+        BEGIN
+            UPDATE job_change_seq SET value = value + 1 WHERE id = 1;
+            INSERT OR REPLACE INTO job_changes (job_id, seq, deleted)
+            VALUES (NEW.id, (SELECT value FROM job_change_seq WHERE id = 1), 0);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_jobs_change_update AFTER UPDATE ON jobs
+        BEGIN
+            UPDATE job_change_seq SET value = value + 1 WHERE id = 1;
+            INSERT OR REPLACE INTO job_changes (job_id, seq, deleted)
+            VALUES (NEW.id, (SELECT value FROM job_change_seq WHERE id = 1), 0);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_jobs_change_delete AFTER DELETE ON jobs
+        BEGIN
+            UPDATE job_change_seq SET value = value + 1 WHERE id = 1;
+            INSERT OR REPLACE INTO job_changes (job_id, seq, deleted)
+            VALUES (OLD.id, (SELECT value FROM job_change_seq WHERE id = 1), 1);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_job_results_change_insert AFTER INSERT ON job_results
+        BEGIN
+            UPDATE job_change_seq SET value = value + 1 WHERE id = 1;
+            INSERT OR REPLACE INTO job_changes (job_id, seq, deleted)
+            VALUES (NEW.job_id, (SELECT value FROM job_change_seq WHERE id = 1), 0);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_job_results_change_update AFTER UPDATE ON job_results
+        BEGIN
+            UPDATE job_change_seq SET value = value + 1 WHERE id = 1;
+            INSERT OR REPLACE INTO job_changes (job_id, seq, deleted)
+            VALUES (NEW.job_id, (SELECT value FROM job_change_seq WHERE id = 1), 0);
+        END
+        """,
+    )
+
+    # Migration to version 12 (Remote input staging cache index)
+    # One row per file content stored under a cluster's object directory;
+    # last_used_at drives LRU/age-based garbage collection.
+    MIGRATION_V11_TO_V12 = """
+    CREATE TABLE IF NOT EXISTS staged_objects (
+        cluster_id INTEGER NOT NULL,
+        digest TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        last_used_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (cluster_id, digest),
+        FOREIGN KEY (cluster_id) REFERENCES clusters(id) ON DELETE CASCADE
+    );
+    CREATE INDEX IF NOT EXISTS idx_staged_objects_lru ON staged_objects (cluster_id, last_used_at);
+    """
+
+    # Migration to version 13 (Persisted output parse cache)
+    # Parsed output results keyed by output file identity and parser version,
+    # so completed jobs are not re-parsed after a restart.
+    MIGRATION_V12_TO_V13 = """
+    ALTER TABLE job_results ADD COLUMN parse_cache TEXT
+    """
+
     def __init__(self, db_path: Path, pool_size: int = 4):
         """
         Initialize database with connection pooling for concurrent access.
@@ -501,6 +611,18 @@ class Database:
         if current_version < 9:
             self._migrate_v8_to_v9(conn)
 
+        if current_version < 10:
+            self._migrate_v9_to_v10(conn)
+
+        if current_version < 11:
+            self._migrate_v10_to_v11(conn)
+
+        if current_version < 12:
+            self._migrate_v11_to_v12(conn)
+
+        if current_version < 13:
+            self._migrate_v12_to_v13(conn)
+
     def _get_schema_version(self, conn: sqlite3.Connection) -> int:
         """Get current schema version."""
         try:
@@ -783,6 +905,63 @@ class Database:
             if "duplicate column name" not in str(e).lower():
                 raise
 
+    def _migrate_v9_to_v10(self, conn: sqlite3.Connection) -> None:
+        """Migrate from version 9 to version 10 (job list pagination indexes)."""
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            statements = [
+                stmt.strip() for stmt in self.MIGRATION_V9_TO_V10.split(";") if stmt.strip()
+            ]
+            for stmt in statements:
+                conn.execute(stmt)
+            conn.execute("INSERT INTO schema_version (version) VALUES (?)", (10,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _migrate_v10_to_v11(self, conn: sqlite3.Connection) -> None:
+        """Migrate from version 10 to version 11 (job change feed triggers)."""
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            for stmt in self.MIGRATION_V10_TO_V11:
+                conn.execute(stmt)
+            conn.execute("INSERT INTO schema_version (version) VALUES (?)", (11,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _migrate_v11_to_v12(self, conn: sqlite3.Connection) -> None:
+        """Migrate from version 11 to version 12 (staging cache index)."""
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            statements = [
+                stmt.strip() for stmt in self.MIGRATION_V11_TO_V12.split(";") if stmt.strip()
+            ]
+            for stmt in statements:
+                conn.execute(stmt)
+            conn.execute("INSERT INTO schema_version (version) VALUES (?)", (12,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _migrate_v12_to_v13(self, conn: sqlite3.Connection) -> None:
+        """Migrate from version 12 to version 13 (persisted parse cache)."""
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            try:
+                conn.execute(self.MIGRATION_V12_TO_V13.strip())
+            except sqlite3.OperationalError as e:
+                if "duplicate column name" not in str(e).lower():
+                    raise
+            conn.execute("INSERT INTO schema_version (version) VALUES (?)", (13,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
     def get_schema_version(self) -> int:
         """Public method to get current schema version."""
         with self.connection() as conn:
@@ -844,6 +1023,133 @@ class Database:
 
             return [self._row_to_job(row) for row in rows]
 
+    def get_jobs_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        dft_code: Optional[str] = None,
+        runner_type: Optional[str] = None,
+        cluster_id: Optional[int] = None,
+        workflow_id: Optional[str] = None,
+    ) -> Tuple[List[Job], Optional[str]]:
+        """
+        Get one page of jobs, newest first, using keyset pagination.
+
+        Filtering, ordering and the page limit all run in SQL against the
+        (created_at, id) indexes, so the cost of a page depends on its size
+        rather than on the number of rows in the table.
+
+        Args:
+            limit: Maximum number of jobs to return
+            cursor: Opaque cursor returned by the previous page (None for page 1)
+            status: Only jobs with this status (e.g. 'RUNNING')
+            dft_code: Only jobs for this DFT code (e.g. 'vasp')
+            runner_type: Only jobs with this runner type (e.g. 'slurm')
+            cluster_id: Only jobs assigned to this cluster
+            workflow_id: Only jobs belonging to this workflow
+
+        Returns:
+            Tuple of (jobs, next_cursor); next_cursor is None on the last page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        clauses: List[Any] = []
+        params: List[Any] = []
+        for column, value in (
+            ("status", status),
+            ("dft_code", dft_code),
+            ("runner_type", runner_type),
+            ("cluster_id", cluster_id),
+            ("workflow_id", workflow_id),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+
+        if cursor:
+            created_at, sep, last_id = cursor.rpartition("|")
+            if not sep or not last_id.isdigit():
+                raise ValueError(f"Invalid job page cursor: {cursor!r}")
+            clauses.append("(created_at < ? OR (created_at = ? AND id < ?))")
+            params.extend([created_at, created_at, int(last_id)])
+
+        sql = "SELECT * FROM jobs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        # Fetch one extra row to learn whether another page exists.
+        sql += " ORDER BY created_at DESC, id DESC LIMIT ?"
+        params.append(limit + 1)
+
+        with self.connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = f"{last['created_at']}|{last['id']}"
+
+        return [self._row_to_job(row) for row in rows], next_cursor
+
+    def get_change_seq(self) -> int:
+        """Get the current job change sequence number (0 for an empty database)."""
+        with self.connection() as conn:
+            row = conn.execute("SELECT value FROM job_change_seq WHERE id = 1").fetchone()
+            return row[0] if row else 0
+
+    def get_job_changes(
+        self, since_seq: int = 0, limit: int = 1000
+    ) -> Tuple[List[Job], List[int], int, bool]:
+        """
+        Get jobs inserted, updated or deleted after a change sequence number.
+
+        The sequence is maintained by triggers on ``jobs`` and ``job_results``,
+        so every writer is covered. Each job appears at most once, at its most
+        recent change.
+
+        Args:
+            since_seq: Last sequence number the caller has seen (0 for everything)
+            limit: Maximum number of changed jobs to return
+
+        Returns:
+            Tuple of (changed_jobs, deleted_job_ids, seq, has_more). ``seq`` is
+            the sequence to pass as ``since_seq`` next time; when ``has_more`` is
+            True it is the last change returned rather than the head. A ``seq``
+            lower than ``since_seq`` means the caller's view belongs to another
+            database and must be rebuilt from 0.
+        """
+        with self.connection() as conn:
+            head_row = conn.execute("SELECT value FROM job_change_seq WHERE id = 1").fetchone()
+            head = head_row[0] if head_row else 0
+            rows = conn.execute(
+                """
+                SELECT c.seq AS change_seq, c.job_id AS change_job_id,
+                       c.deleted AS change_deleted, j.*
+                FROM job_changes c
+                LEFT JOIN jobs j ON j.id = c.job_id
+                WHERE c.seq > ?
+                ORDER BY c.seq
+                LIMIT ?
+                """,
+                (since_seq, limit + 1),
+            ).fetchall()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        changed: List[Job] = []
+        deleted: List[int] = []
+        for row in rows:
+            if row["change_deleted"] or row["id"] is None:
+                deleted.append(row["change_job_id"])
+            else:
+                changed.append(self._row_to_job(row))
+
+        seq = rows[-1]["change_seq"] if has_more else head
+        return changed, deleted, seq, has_more
+
     def get_job_statuses_batch(self, job_ids: List[int]) -> Dict[int, str]:
         """
         Get statuses for multiple jobs in a single batch query.
@@ -934,6 +1240,52 @@ class Database:
                         "UPDATE jobs SET status = ?, pid = ? WHERE id = ?", (status, pid, job_id)
                     )
 
+    def update_statuses_batch(self, statuses: Dict[int, str]) -> int:
+        """
+        Apply many status changes in a single transaction.
+
+        Rows already in the requested status are left untouched, so their
+        started_at/completed_at timestamps are not reset. PIDs are not
+        modified.
+
+        Args:
+            statuses: Dictionary mapping job_id -> new status string
+
+        Returns:
+            Number of jobs whose status changed
+        """
+        if not statuses:
+            return 0
+
+        # One statement per timestamp column, matching update_status()
+        grouped: Dict[str, List[Tuple[str, int, str]]] = {
+            "started_at": [],
+            "completed_at": [],
+            "": [],
+        }
+        for job_id, status in statuses.items():
+            if status == "RUNNING":
+                field = "started_at"
+            elif status in ("COMPLETED", "FAILED", "CANCELLED"):
+                field = "completed_at"
+            else:
+                field = ""
+            grouped[field].append((status, job_id, status))
+
+        changed = 0
+        with self.connection() as conn:
+            with conn:
+                for field, params in grouped.items():
+                    if not params:
+                        continue
+                    timestamp = f", {field} = CURRENT_TIMESTAMP" if field else ""
+                    cursor = conn.executemany(
+                        f"UPDATE jobs SET status = ?{timestamp} WHERE id = ? AND status != ?",
+                        params,
+                    )
+                    changed += cursor.rowcount
+        return changed
+
     def update_results(
         self,
         job_id: int,
@@ -1443,6 +1795,135 @@ class Database:
             created_at=row["created_at"],
         )
 
+    # ==================== Parse Cache Methods ====================
+
+    def get_parse_cache(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """Get the persisted output parse result for a job, if any."""
+        with self.connection() as conn:
+            row = conn.execute(
+                "SELECT parse_cache FROM job_results WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if not row or not row[0]:
+            return None
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            return None
+
+    def save_parse_cache(
+        self,
+        job_id: int,
+        entry: Dict[str, Any],
+        convergence_status: Optional[str] = None,
+        scf_cycles: Optional[int] = None,
+    ) -> None:
+        """
+        Persist an output parse result for a job.
+
+        Fills convergence_status and scf_cycles on the job_results row without
+        touching key_results, which belongs to the caller that saved the job.
+
+        Args:
+            job_id: Job the output belongs to
+            entry: JSON-serializable cache entry (output identity and result)
+            convergence_status: Parsed convergence status
+            scf_cycles: Parsed SCF cycle count
+        """
+        with self.connection() as conn:
+            with conn:
+                conn.execute(
+                    """
+                    INSERT INTO job_results (job_id, parse_cache, convergence_status, scf_cycles)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(job_id) DO UPDATE SET
+                        parse_cache = excluded.parse_cache,
+                        convergence_status = excluded.convergence_status,
+                        scf_cycles = excluded.scf_cycles
+                    """,
+                    (job_id, json.dumps(entry), convergence_status, scf_cycles),
+                )
+
+    # ==================== Staging Cache Methods ====================
+
+    def get_staged_objects(self, cluster_id: int, digests: List[str]) -> Dict[str, int]:
+        """
+        Look up which file digests are indexed in a cluster's object store.
+
+        Args:
+            cluster_id: Cluster the objects live on
+            digests: SHA-256 digests to look up
+
+        Returns:
+            Dictionary mapping digest -> size for the indexed digests
+        """
+        if not digests:
+            return {}
+
+        with self.connection() as conn:
+            digests_list = list(digests)
+            placeholders = ",".join("?" * len(digests_list))
+            cursor = conn.execute(
+                f"SELECT digest, size FROM staged_objects "
+                f"WHERE cluster_id = ? AND digest IN ({placeholders})",
+                (cluster_id, *digests_list),
+            )
+            return {row[0]: row[1] for row in cursor.fetchall()}
+
+    def record_staged_objects(self, cluster_id: int, objects: Dict[str, int]) -> None:
+        """
+        Index objects newly stored on a cluster, or mark existing ones as used.
+
+        Args:
+            cluster_id: Cluster the objects live on
+            objects: Dictionary mapping digest -> size in bytes
+        """
+        if not objects:
+            return
+
+        with self.connection() as conn:
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT INTO staged_objects (cluster_id, digest, size)
+                    VALUES (?, ?, ?)
+                    ON CONFLICT (cluster_id, digest)
+                    DO UPDATE SET last_used_at = CURRENT_TIMESTAMP
+                    """,
+                    [(cluster_id, digest, size) for digest, size in objects.items()],
+                )
+
+    def list_staged_objects(self, cluster_id: int) -> List[StagedObject]:
+        """Get all indexed objects of a cluster, least recently used first."""
+        with self.connection() as conn:
+            rows = conn.execute(
+                "SELECT * FROM staged_objects WHERE cluster_id = ? "
+                "ORDER BY last_used_at ASC, created_at ASC",
+                (cluster_id,),
+            ).fetchall()
+
+            return [
+                StagedObject(
+                    cluster_id=row["cluster_id"],
+                    digest=row["digest"],
+                    size=row["size"],
+                    created_at=row["created_at"],
+                    last_used_at=row["last_used_at"],
+                )
+                for row in rows
+            ]
+
+    def delete_staged_objects(self, cluster_id: int, digests: List[str]) -> None:
+        """Remove objects from a cluster's staging index."""
+        if not digests:
+            return
+
+        with self.connection() as conn:
+            with conn:
+                conn.executemany(
+                    "DELETE FROM staged_objects WHERE cluster_id = ? AND digest = ?",
+                    [(cluster_id, digest) for digest in digests],
+                )
+
     # ==================== Utility Methods ====================
 
     def close(self) -> None:
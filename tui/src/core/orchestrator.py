@@ -19,7 +19,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Callable, Set
+from typing import Dict, Iterable, List, Optional, Any, Callable, Set, Tuple
 from jinja2 import Template, TemplateSyntaxError
 from jinja2.sandbox import SandboxedEnvironment
 
@@ -52,6 +52,8 @@ def _sanitize_path_component(value: str) -> str:
     return sanitized.strip("_") or "unknown"
 
 
+from .codes import DFTCode, ParsingResult, get_parser
+from .codes.parsers.executor import get_parse_executor
 from .database import Database, Job
 from .dependency_utils import (
     assert_acyclic,
@@ -346,6 +348,7 @@ class WorkflowOrchestrator:
         queue_manager: Any,  # Will be QueueManager when implemented
         event_callback: Optional[Callable[[WorkflowEvent], None]] = None,
         scratch_base: Optional[Path] = None,
+        monitor_interval: float = 5.0,
     ):
         """
         Initialize the orchestrator.
@@ -356,10 +359,12 @@ class WorkflowOrchestrator:
             event_callback: Optional callback for workflow events
             scratch_base: Optional base directory for workflow scratch space.
                          If not provided, uses CRY_SCRATCH_BASE, CRY23_SCRDIR, or tempfile.gettempdir()
+            monitor_interval: Seconds between monitor polls when nothing wakes it
         """
         self.database = database
         self.queue_manager = queue_manager
         self.event_callback = event_callback
+        self.monitor_interval = monitor_interval
 
         # Configure scratch base directory with proper fallback chain
         self._scratch_base = scratch_base or self._get_scratch_base()
@@ -381,6 +386,14 @@ class WorkflowOrchestrator:
         # Background monitoring task
         self._monitor_task: Optional[asyncio.Task] = None
         self._running = False
+        self._wakeup = asyncio.Event()
+
+        # Job IDs whose completion is being processed (monitor or callback)
+        self._completions_in_flight: Set[int] = set()
+
+        # Nodes being submitted, per workflow, so concurrent completions
+        # cannot submit the same newly ready node twice
+        self._submitting: Dict[int, Set[str]] = {}
 
         # SECURITY: Use sandboxed Jinja2 environment to prevent code execution attacks
         # SandboxedEnvironment restricts access to dangerous Python builtins and attributes
@@ -409,6 +422,10 @@ class WorkflowOrchestrator:
         """Update job status in database without blocking the event loop."""
         await asyncio.to_thread(self.database.update_status, job_id, status)
 
+    async def _db_get_job_statuses(self, job_ids: List[int]) -> Dict[int, str]:
+        """Get statuses for many jobs in one query without blocking the event loop."""
+        return await asyncio.to_thread(self.database.get_job_statuses_batch, job_ids)
+
     def register_parser(self, name: str, parser_func: Callable[[Path], Dict[str, Any]]) -> None:
         """
         Register a custom output parser.
@@ -1041,14 +1058,20 @@ class WorkflowOrchestrator:
         if state.status not in (WorkflowStatus.RUNNING,):
             return
 
+        submitting = self._submitting.setdefault(workflow_id, set())
+
         for node in workflow.nodes:
-            # Skip if already processed
-            if node.status != NodeStatus.PENDING:
+            # Skip if already processed or being submitted by a concurrent completion
+            if node.status != NodeStatus.PENDING or node.node_id in submitting:
                 continue
 
             # Check if dependencies are met
             if self._dependencies_met(workflow_id, node):
-                await self._submit_node(workflow_id, node)
+                submitting.add(node.node_id)
+                try:
+                    await self._submit_node(workflow_id, node)
+                finally:
+                    submitting.discard(node.node_id)
 
     def _dependencies_met(self, workflow_id: int, node: WorkflowNode) -> bool:
         """
@@ -1158,6 +1181,8 @@ class WorkflowOrchestrator:
             # This creates a callback that will be invoked when the job reaches terminal status
             async def job_completion_callback(completed_job_id: int, status: str) -> None:
                 """Callback invoked by queue manager when job completes."""
+                # Jobs finishing in the same burst are picked up by the woken monitor
+                self._notify_monitor()
                 await self._on_node_complete(workflow_id, node, status)
 
             self.queue_manager.register_callback(job_id, job_completion_callback)
@@ -1192,15 +1217,20 @@ class WorkflowOrchestrator:
             node: The workflow node that completed
             job_status: Status of the completed job ("COMPLETED" or "FAILED")
         """
-        if not node.job_id:
+        job_id = node.job_id
+        if not job_id or job_id in self._completions_in_flight:
             return
 
-        if job_status == "COMPLETED":
-            await self.process_node_completion(workflow_id, node.node_id, node.job_id)
-        elif job_status == "FAILED":
-            await self._handle_node_failure(
-                workflow_id, node.node_id, node.job_id, "Job execution failed"
-            )
+        self._completions_in_flight.add(job_id)
+        try:
+            if job_status == "COMPLETED":
+                await self.process_node_completion(workflow_id, node.node_id, job_id)
+            elif job_status == "FAILED":
+                await self._handle_node_failure(
+                    workflow_id, node.node_id, job_id, "Job execution failed"
+                )
+        finally:
+            self._completions_in_flight.discard(job_id)
 
     async def _resolve_parameters(self, workflow_id: int, node: WorkflowNode) -> Dict[str, Any]:
         """
@@ -1293,6 +1323,14 @@ class WorkflowOrchestrator:
         if job.final_energy is not None:
             results["final_energy"] = job.final_energy
 
+        parsed = await self._parse_job_output(job)
+        if parsed is not None:
+            if parsed.final_energy is not None:
+                results.setdefault("final_energy", parsed.final_energy)
+            results.setdefault("convergence_status", parsed.convergence_status)
+            if parsed.scf_cycles is not None:
+                results.setdefault("scf_cycles", parsed.scf_cycles)
+
         # Apply custom output parsers if specified
         if node.output_parsers:
             work_dir = Path(job.work_dir)
@@ -1317,6 +1355,34 @@ class WorkflowOrchestrator:
 
         return results
 
+    async def _parse_job_output(self, job: Job) -> Optional[ParsingResult]:
+        """
+        Parse a completed job's output with the parser for its DFT code.
+
+        Parses run on the shared parse executor, so the completions found in
+        one monitor poll parse concurrently across its worker pool. Results
+        are persisted in job_results and reused while the output is unchanged.
+
+        Args:
+            job: Completed job
+
+        Returns:
+            ParsingResult, or None if there is no local output to parse
+        """
+        work_dir = Path(job.work_dir)
+        try:
+            parser = get_parser(DFTCode(job.dft_code))
+            output_file = parser.resolve_output_file(work_dir)
+            if not output_file.is_file():
+                output_file = self._find_output_file(work_dir)
+            if output_file is None:
+                return None
+            return await get_parse_executor().parse(parser, output_file, job.id, self.database)
+        except Exception as e:
+            # Log error but don't fail the workflow
+            logger.warning(f"Failed to parse output of job {job.id}: {e}")
+            return None
+
     async def _handle_node_failure(
         self, workflow_id: int, node_id: str, job_id: int, error: str
     ) -> None:
@@ -1506,59 +1572,101 @@ class WorkflowOrchestrator:
                 workflow_id,
             )
 
+    def notify_job_status_changed(self) -> None:
+        """
+        Wake the monitor after a job status changes.
+
+        Call this from code that records job completions outside the queue
+        manager callbacks (e.g. a runner) so dependent nodes are submitted
+        without waiting for the next poll.
+        """
+        self._notify_monitor()
+
+    def _notify_monitor(self) -> None:
+        """Wake the background monitor for an immediate poll."""
+        self._wakeup.set()
+
     async def _monitor_workflows(self) -> None:
         """
         Background task that monitors active workflows.
 
-        This task runs continuously and:
-        - Polls database for job status updates
-        - Processes completed jobs
-        - Triggers dependent nodes
-        - Updates workflow state
+        Each poll checks the running jobs of every active workflow with a
+        single batched status query and processes the finished ones
+        concurrently. Between polls the task sleeps until a completion wakes
+        it, or at most ``monitor_interval`` seconds. Wakeups that arrive
+        during a poll are coalesced into one more poll.
         """
         while self._running:
+            self._wakeup.clear()
             try:
-                # Get all active workflows
-                active_workflows = [
-                    wf_id
-                    for wf_id, state in self._workflow_states.items()
-                    if state.status == WorkflowStatus.RUNNING
-                ]
-
-                # Process each workflow
-                for workflow_id in active_workflows:
-                    await self._process_workflow_updates(workflow_id)
-
-                # Sleep before next check
-                await asyncio.sleep(5.0)
-
+                await self._process_workflow_updates()
             except Exception as e:
                 # Log error but continue monitoring
                 logger.error(f"Error in workflow monitor: {e}")
-                await asyncio.sleep(5.0)
 
-    async def _process_workflow_updates(self, workflow_id: int) -> None:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.monitor_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _process_workflow_updates(self, workflow_ids: Optional[Iterable[int]] = None) -> None:
         """
-        Process job status updates for a single workflow.
+        Process job status updates for running workflows.
 
         Args:
-            workflow_id: Workflow to process
+            workflow_ids: Workflows to check (default: all running workflows)
         """
-        if workflow_id not in self._workflows:
+        if workflow_ids is None:
+            workflow_ids = list(self._workflow_states)
+
+        # Collect running jobs across workflows: job_id -> (workflow_id, node_id)
+        running: Dict[int, Tuple[int, str]] = {}
+        for workflow_id in workflow_ids:
+            state = self._workflow_states.get(workflow_id)
+            if (
+                workflow_id not in self._workflows
+                or state is None
+                or state.status != WorkflowStatus.RUNNING
+            ):
+                continue
+
+            nodes = self._node_lookup[workflow_id]
+            for node_id in state.running_nodes:
+                node = nodes.get(node_id)
+                if node and node.job_id and node.job_id not in self._completions_in_flight:
+                    running[node.job_id] = (workflow_id, node_id)
+
+        if not running:
             return
 
-        state = self._workflow_states[workflow_id]
+        # One query for every running job instead of one per node
+        statuses = await self._db_get_job_statuses(list(running))
+        finished = [
+            (workflow_id, node_id, job_id)
+            for job_id, (workflow_id, node_id) in running.items()
+            if statuses.get(job_id) in ("COMPLETED", "FAILED")
+        ]
 
-        # Check running nodes
-        for node_id in list(state.running_nodes):
-            node = self._node_lookup[workflow_id][node_id]
+        results = await asyncio.gather(
+            *(self._dispatch_completion(*args) for args in finished), return_exceptions=True
+        )
+        for (workflow_id, node_id, job_id), result in zip(finished, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Error processing completion of job {job_id} "
+                    f"(workflow {workflow_id}, node {node_id}): {result}"
+                )
 
-            if node.job_id:
-                job = await self._db_get_job(node.job_id)
+    async def _dispatch_completion(self, workflow_id: int, node_id: str, job_id: int) -> None:
+        """Process a finished job once, even if the monitor and a callback both see it."""
+        if job_id in self._completions_in_flight:
+            return
 
-                if job and job.status in ("COMPLETED", "FAILED"):
-                    # Process completion
-                    await self.process_node_completion(workflow_id, node_id, node.job_id)
+        self._completions_in_flight.add(job_id)
+        try:
+            await self.process_node_completion(workflow_id, node_id, job_id)
+        finally:
+            self._completions_in_flight.discard(job_id)
 
     def _emit_event(self, event: WorkflowEvent) -> None:
         """
@@ -2110,6 +2218,7 @@ class WorkflowOrchestrator:
         self._workflows.pop(workflow_id, None)
         self._workflow_states.pop(workflow_id, None)
         self._node_lookup.pop(workflow_id, None)
+        self._submitting.pop(workflow_id, None)
 
         # Clean up callback tracking for this workflow's jobs
         callbacks_to_remove = [
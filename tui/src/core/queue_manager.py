@@ -9,9 +9,17 @@ This module provides a sophisticated queue management system for CRYSTAL calcula
 - Fair scheduling across users
 - Persistent queue state
 - Resource-aware scheduling
+
+Scheduling is incremental: jobs whose dependencies are met sit in per-cluster
+priority heaps, blocked jobs are indexed by the dependencies they still wait
+for, and the background worker only wakes up on queue events (or after
+``scheduling_interval`` as a fallback). Dequeuing costs O(log n) in the queue
+size instead of a rescan of every queued job.
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 import time
 from collections import defaultdict
@@ -29,9 +37,14 @@ from .dependency_utils import (
 )
 from .constants import JobStatus
 
-
 logger = logging.getLogger(__name__)
 
+# Reference point for the time-invariant part of scheduling scores
+_SCORE_EPOCH = datetime(2000, 1, 1)
+
+# Ready entries per heap whose statuses are fetched with each dequeue candidate
+_STATUS_PREFETCH = 32
+
 
 class Priority(IntEnum):
     """Job priority levels (lower number = higher priority)."""
@@ -130,7 +143,7 @@ class QueueManager:
     - Background scheduling worker
 
     Architecture:
-    - Uses asyncio.Queue for in-memory priority queue
+    - Per-cluster heaps of ready jobs; blocked jobs indexed by dependency
     - Database as source of truth for persistence
     - Supports distributed deployment (future)
 
@@ -181,6 +194,26 @@ class QueueManager:
         # Dependency graph (job_id -> set of dependent job_ids)
         self._dependents: Dict[int, Set[int]] = defaultdict(set)
 
+        # Incremental scheduling index:
+        # - ready jobs live in heaps keyed by runner type, then (cluster, user);
+        #   entries are [-base_score, seq, job_id] and job_id is set to None
+        #   when the entry is superseded (lazy deletion)
+        # - blocked jobs map to the dependencies they still wait for, and each
+        #   outstanding dependency maps back to the jobs it blocks
+        self._ready: Dict[str, Dict[Tuple[int, Optional[str]], List[list]]] = defaultdict(dict)
+        self._heap_entries: Dict[int, list] = {}
+        self._unmet: Dict[int, Set[int]] = {}
+        self._waiting_on: Dict[int, Set[int]] = defaultdict(set)
+        self._seq = itertools.count()
+
+        # Queued jobs per cluster_id, maintained on every add/remove
+        self._queue_depth: Dict[Optional[int], int] = defaultdict(int)
+
+        # State changed since the last persist (queue_state rows are written
+        # when a job changes, so only clusters and metrics are deferred)
+        self._dirty_clusters: Set[int] = set()
+        self._metrics_dirty = False
+
         # Fair share tracking (user_id -> last scheduled time)
         self._user_last_scheduled: Dict[str, datetime] = {}
 
@@ -190,6 +223,7 @@ class QueueManager:
         # Background worker
         self._scheduler_task: Optional[asyncio.Task] = None
         self._running = False
+        self._wakeup = asyncio.Event()
 
         # Lock for thread-safe operations
         self._lock = asyncio.Lock()
@@ -281,6 +315,7 @@ class QueueManager:
         that exist in queue_state back to QUEUED status. This prevents
         "zombie" jobs that are stuck in RUNNING state after a crash.
         """
+        restored: List[QueuedJob] = []
         with self.db.connection() as conn:
             # CRASH RECOVERY: Reset any RUNNING jobs in queue_state to QUEUED
             # These are jobs that were running when the app crashed/was killed
@@ -321,11 +356,7 @@ class QueueManager:
                     resource_requirements=resource_requirements,
                 )
 
-                self._jobs[job_id] = queued_job
-
-                # Build dependency graph
-                for dep_id in dependencies:
-                    self._dependents[dep_id].add(job_id)
+                restored.append(queued_job)
 
             # Restore cluster state
             cursor = conn.execute("SELECT * FROM cluster_state")
@@ -366,6 +397,12 @@ class QueueManager:
                     last_updated=datetime.fromisoformat(row[8]) if row[8] else None,
                 )
 
+        # Rebuild the scheduling index with one status query for all dependencies
+        dep_ids = {dep_id for queued_job in restored for dep_id in queued_job.dependencies}
+        dep_statuses = self._get_job_statuses_batch(list(dep_ids))
+        for queued_job in restored:
+            self._track_job_locked(queued_job, dep_statuses)
+
         logger.info(
             f"Restored queue state: {len(self._jobs)} queued jobs, {len(self._clusters)} clusters"
         )
@@ -454,11 +491,9 @@ class QueueManager:
                 resource_requirements=resource_requirements or {},
             )
 
-            self._jobs[job_id] = queued_job
-
-            # Update dependency graph
-            for dep_id in deps:
-                self._dependents[dep_id].add(job_id)
+            # Index the job: ready now, or blocked on unfinished dependencies
+            self._untrack_job_locked(job_id)
+            self._track_job_locked(queued_job, self._get_job_statuses_batch(list(deps)))
 
             # Update database status (non-blocking via thread)
             await self._run_db(self.db.update_status, job_id, JobStatus.QUEUED)
@@ -468,6 +503,7 @@ class QueueManager:
             # Persist queue state (non-blocking via thread)
             await self._run_db(self._persist_job_to_database, queued_job)
 
+            self._notify_scheduler()
             logger.info(f"Enqueued job {job_id} with priority {priority} (dependencies: {deps})")
 
     def _validate_dependencies(self, job_id: int, dependencies: Set[int]) -> None:
@@ -536,6 +572,211 @@ class QueueManager:
         else:
             self._status_cache.pop(job_id, None)
 
+    # ==================== Scheduling Index ====================
+
+    def _track_job_locked(self, queued_job: QueuedJob, dep_statuses: Dict[int, str]) -> None:
+        """
+        Add a job to the queue and the scheduling index.
+
+        IMPORTANT: Caller MUST hold self._lock (or be restoring state).
+
+        Args:
+            queued_job: Job to add
+            dep_statuses: Current statuses of (at least) the job's dependencies
+        """
+        job_id = queued_job.job_id
+        self._jobs[job_id] = queued_job
+        self._queue_depth[queued_job.cluster_id] += 1
+
+        for dep_id in queued_job.dependencies:
+            self._dependents[dep_id].add(job_id)
+
+        unmet = {
+            dep_id
+            for dep_id in queued_job.dependencies
+            if dep_statuses.get(dep_id) != JobStatus.COMPLETED
+        }
+        if unmet:
+            self._unmet[job_id] = unmet
+            for dep_id in unmet:
+                self._waiting_on[dep_id].add(job_id)
+        else:
+            self._push_ready_locked(queued_job)
+
+    def _untrack_job_locked(self, job_id: int) -> Optional[QueuedJob]:
+        """
+        Remove a job from the queue and the scheduling index.
+
+        The dependency graph (``_dependents``) is left to the caller.
+
+        Returns:
+            The removed job, or None if it was not queued
+        """
+        queued_job = self._jobs.pop(job_id, None)
+        if queued_job is None:
+            return None
+
+        self._queue_depth[queued_job.cluster_id] -= 1
+        self._discard_ready_locked(job_id)
+
+        for dep_id in self._unmet.pop(job_id, ()):
+            waiting = self._waiting_on.get(dep_id)
+            if waiting is not None:
+                waiting.discard(job_id)
+                if not waiting:
+                    del self._waiting_on[dep_id]
+
+        return queued_job
+
+    def _push_ready_locked(self, queued_job: QueuedJob) -> None:
+        """Insert a job whose dependencies are met into its ready heap."""
+        user_key = queued_job.user_id if self.enable_fair_share else None
+        heap = self._ready[queued_job.runner_type].setdefault(
+            (queued_job.cluster_id or 0, user_key), []
+        )
+        entry = [-self._base_score(queued_job), next(self._seq), queued_job.job_id]
+        self._heap_entries[queued_job.job_id] = entry
+        heapq.heappush(heap, entry)
+
+    def _discard_ready_locked(self, job_id: int) -> None:
+        """Mark a job's heap entry as removed (it is dropped when it surfaces)."""
+        entry = self._heap_entries.pop(job_id, None)
+        if entry is not None:
+            entry[-1] = None
+
+    def _release_dependency_locked(self, dep_id: int) -> None:
+        """Mark a dependency as satisfied, moving jobs it unblocks to the ready heaps."""
+        for job_id in self._waiting_on.pop(dep_id, ()):
+            unmet = self._unmet.get(job_id)
+            if unmet is None:
+                continue
+            unmet.discard(dep_id)
+            if not unmet:
+                del self._unmet[job_id]
+                self._push_ready_locked(self._jobs[job_id])
+
+    def _reconcile_blocked_locked(self) -> None:
+        """
+        Release dependencies that completed without a handle_job_completion event.
+
+        Costs one batch query over the distinct outstanding dependencies, not
+        over the blocked jobs.
+        """
+        if not self._waiting_on:
+            return
+
+        statuses = self._get_job_statuses_batch(list(self._waiting_on))
+        for dep_id, status in statuses.items():
+            if status == JobStatus.COMPLETED:
+                self._release_dependency_locked(dep_id)
+
+    def _peek_ready_locked(self, heap: List[list], cluster: ClusterState) -> Optional[list]:
+        """
+        Return the best live entry of a ready heap that fits the cluster.
+
+        Removed entries at the top are discarded. If the top job needs more
+        resources than the cluster has free, the heap is walked best-first
+        from its root, visiting only the entries ranked above the first job
+        that fits.
+        """
+        while heap and heap[0][-1] is None:
+            heapq.heappop(heap)
+        if not heap:
+            return None
+
+        frontier = [(heap[0], 0)]
+        while frontier:
+            entry, index = heapq.heappop(frontier)
+            job_id = entry[-1]
+            if job_id is not None:
+                requirements = self._jobs[job_id].resource_requirements
+                if not requirements or self._resources_available(cluster, requirements):
+                    return entry
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return None
+
+    def _next_ready_locked(self, runner_type: str) -> Optional[QueuedJob]:
+        """
+        Find the best ready job for a runner type without removing it.
+
+        Compares the top of each (cluster, user) heap, so the cost depends on
+        the number of active clusters and users, not on the queue size.
+        """
+        buckets = self._ready.get(runner_type)
+        if not buckets:
+            return None
+
+        now = datetime.now()
+        best: Optional[Tuple[float, int]] = None
+        best_job_id: Optional[int] = None
+        empty = []
+
+        for (cluster_id, user_id), heap in buckets.items():
+            cluster = self._get_cluster(cluster_id)
+            if not cluster.can_accept_job:
+                continue
+            entry = self._peek_ready_locked(heap, cluster)
+            if entry is None:
+                if not heap:
+                    empty.append((cluster_id, user_id))
+                continue
+
+            # Ready entries share the wait-time term, so only fair share
+            # (which differs per user) has to be added at pick time
+            rank = (-entry[0] + self._fair_share_score(user_id, now), -entry[1])
+            if best is None or rank > best:
+                best, best_job_id = rank, entry[-1]
+
+        for key in empty:
+            del buckets[key]
+
+        return self._jobs[best_job_id] if best_job_id is not None else None
+
+    def _pop_ready_locked(self, runner_type: str) -> Optional[QueuedJob]:
+        """
+        Take the best ready job for a runner type out of the queue.
+
+        The job's database status is checked first; jobs whose status was
+        changed outside the queue manager are skipped and stay queued. Once
+        one job has been skipped, the statuses of the next-best ready entries
+        are fetched together, so a run of skipped jobs costs a few queries
+        rather than one each.
+        """
+        skipped: List[QueuedJob] = []
+        statuses: Dict[int, str] = {}
+        try:
+            while True:
+                queued_job = self._next_ready_locked(runner_type)
+                if queued_job is None:
+                    return None
+
+                job_id = queued_job.job_id
+                if job_id not in statuses:
+                    job_ids = [job_id]
+                    if skipped:
+                        for heap in self._ready[runner_type].values():
+                            job_ids.extend(
+                                entry[-1]
+                                for entry in heap[:_STATUS_PREFETCH]
+                                if entry[-1] is not None and entry[-1] not in statuses
+                            )
+                    statuses.update(self._get_job_statuses_batch(list(dict.fromkeys(job_ids))))
+                status = statuses.get(job_id)
+                if status in (JobStatus.PENDING, JobStatus.QUEUED):
+                    return self._untrack_job_locked(job_id)
+
+                self._discard_ready_locked(job_id)
+                skipped.append(queued_job)
+        finally:
+            for queued_job in skipped:
+                self._push_ready_locked(queued_job)
+
+    def _notify_scheduler(self) -> None:
+        """Wake the background worker after a queue event."""
+        self._wakeup.set()
+
     async def dequeue(self, runner_type: str) -> Optional[int]:
         """
         Get the next job to execute for a specific runner type.
@@ -550,38 +791,39 @@ class QueueManager:
             Job ID if a job is available, None otherwise
         """
         async with self._lock:
-            # Find highest priority job that can run (use locked version to avoid deadlock)
-            schedulable = self._schedule_jobs_locked()
+            queued_job = self._pop_ready_locked(runner_type)
+            if queued_job is None and self._waiting_on:
+                # Dependencies may have completed without a completion event
+                self._reconcile_blocked_locked()
+                queued_job = self._pop_ready_locked(runner_type)
+            if queued_job is None:
+                return None
 
-            for job_id in schedulable:
-                queued_job = self._jobs.get(job_id)
-                if queued_job and queued_job.runner_type == runner_type:
-                    # Remove from queue
-                    del self._jobs[job_id]
+            job_id = queued_job.job_id
 
-                    # Update cluster state
-                    cluster = self._get_cluster(queued_job.cluster_id)
-                    cluster.running_jobs.add(job_id)
-
-                    # Update metrics
-                    wait_time = (datetime.now() - queued_job.enqueued_at).total_seconds()
-                    self._update_wait_time_metric(wait_time)
-                    self.metrics.total_jobs_scheduled += 1
+            # Update cluster state
+            cluster = self._get_cluster(queued_job.cluster_id)
+            cluster.running_jobs.add(job_id)
 
-                    # Update user fair share
-                    if queued_job.user_id:
-                        self._user_last_scheduled[queued_job.user_id] = datetime.now()
+            # Update metrics
+            wait_time = (datetime.now() - queued_job.enqueued_at).total_seconds()
+            self._update_wait_time_metric(wait_time)
+            self.metrics.total_jobs_scheduled += 1
+            self._metrics_dirty = True
 
-                    # Update database
-                    self.db.update_status(job_id, JobStatus.RUNNING)
-                    # Invalidate cache since status changed
-                    self._invalidate_status_cache(job_id)
-                    # DON'T remove from queue_state yet - keep for retry logic
+            # Update user fair share
+            if queued_job.user_id:
+                self._user_last_scheduled[queued_job.user_id] = datetime.now()
 
-                    logger.info(f"Dequeued job {job_id} for {runner_type}")
-                    return job_id
+            # Update database
+            self.db.update_status(job_id, JobStatus.RUNNING)
+            # Invalidate cache since status changed
+            self._invalidate_status_cache(job_id)
+            # DON'T remove from queue_state yet - keep for retry logic
 
-            return None
+            self._notify_scheduler()
+            logger.info(f"Dequeued job {job_id} for {runner_type}")
+            return job_id
 
     async def schedule_jobs(self) -> List[int]:
         """
@@ -594,7 +836,8 @@ class QueueManager:
         - Concurrent job limits
         - Fair share (if enabled)
 
-        Optimized to use batch query instead of N+1 individual queries.
+        Only jobs in the ready heaps are considered; their statuses are
+        checked with a single batch query.
 
         Thread-safe: Acquires lock before reading shared state.
 
@@ -614,40 +857,38 @@ class QueueManager:
         Returns:
             List of job IDs ready to be scheduled (in priority order)
         """
-        schedulable: List[Tuple[QueuedJob, float]] = []
-
-        # OPTIMIZATION: Batch query all job statuses instead of individual queries
-        job_ids = list(self._jobs.keys())
-        job_statuses = self.db.get_job_statuses_batch(job_ids)
+        self._reconcile_blocked_locked()
 
-        for job_id, queued_job in self._jobs.items():
-            # Check job status from batch query cache (O(1) lookup)
-            status = job_statuses.get(job_id)
-            if not status or status not in (JobStatus.PENDING, JobStatus.QUEUED):
-                continue
-
-            # Check if dependencies are satisfied (using locked helper)
-            if not self._dependencies_satisfied_locked(job_id):
-                continue
-
-            # Check cluster capacity
-            cluster = self._get_cluster(queued_job.cluster_id)
-            if not cluster.can_accept_job:
-                continue
-
-            # Check resources available (if resource-aware scheduling)
-            if queued_job.resource_requirements:
-                if not self._resources_available(cluster, queued_job.resource_requirements):
+        candidates: List[Tuple[int, QueuedJob]] = []
+        for buckets in self._ready.values():
+            for (cluster_id, _), heap in buckets.items():
+                cluster = self._get_cluster(cluster_id)
+                if not cluster.can_accept_job:
                     continue
-
-            # Calculate scheduling score
+                for _, seq, job_id in heap:
+                    if job_id is None:
+                        continue
+                    queued_job = self._jobs[job_id]
+                    if queued_job.resource_requirements and not self._resources_available(
+                        cluster, queued_job.resource_requirements
+                    ):
+                        continue
+                    candidates.append((seq, queued_job))
+
+        # OPTIMIZATION: Batch query candidate statuses instead of individual queries
+        job_statuses = self._get_job_statuses_batch([job.job_id for _, job in candidates])
+
+        schedulable: List[Tuple[float, int, int]] = []
+        for seq, queued_job in candidates:
+            if job_statuses.get(queued_job.job_id) not in (JobStatus.PENDING, JobStatus.QUEUED):
+                continue
             score = self._calculate_scheduling_score(queued_job)
-            schedulable.append((queued_job, score))
+            schedulable.append((score, -seq, queued_job.job_id))
 
-        # Sort by score (higher = better)
-        schedulable.sort(key=lambda x: x[1], reverse=True)
+        # Sort by score (higher = better), FIFO among equal scores
+        schedulable.sort(reverse=True)
 
-        return [job.job_id for job, _ in schedulable]
+        return [job_id for _, _, job_id in schedulable]
 
     def _dependencies_satisfied(self, job_id: int) -> bool:
         """Check if all dependencies for a job are satisfied (delegates to locked version)."""
@@ -731,17 +972,31 @@ class QueueManager:
         wait_score = wait_seconds / 60.0
 
         # Fair share bonus (if enabled)
-        fair_share_score = 0.0
-        if self.enable_fair_share and queued_job.user_id:
-            last_scheduled = self._user_last_scheduled.get(queued_job.user_id)
-            if last_scheduled:
-                seconds_since = (datetime.now() - last_scheduled).total_seconds()
-                fair_share_score = seconds_since / 60.0  # 1 point per minute
-            else:
-                fair_share_score = 1000.0  # Never scheduled = high bonus
+        fair_share_score = self._fair_share_score(queued_job.user_id, datetime.now())
 
         return priority_score + wait_score + fair_share_score
 
+    def _base_score(self, queued_job: QueuedJob) -> float:
+        """
+        Time-invariant part of the scheduling score (used as the heap key).
+
+        Every queued job gains wait-time score at the same rate, so the
+        priority score minus the enqueue time in minutes orders jobs exactly
+        like the full score without re-scoring them as they age.
+        """
+        enqueued_minutes = (queued_job.enqueued_at - _SCORE_EPOCH).total_seconds() / 60.0
+        return (4 - queued_job.priority.value) * 1000 - enqueued_minutes
+
+    def _fair_share_score(self, user_id: Optional[str], now: datetime) -> float:
+        """Fair share bonus for a user (0 when fair share is disabled)."""
+        if not self.enable_fair_share or not user_id:
+            return 0.0
+
+        last_scheduled = self._user_last_scheduled.get(user_id)
+        if last_scheduled:
+            return (now - last_scheduled).total_seconds() / 60.0  # 1 point per minute
+        return 1000.0  # Never scheduled = high bonus
+
     def _get_cluster(self, cluster_id: Optional[int]) -> ClusterState:
         """Get or create cluster state."""
         if cluster_id is None or cluster_id == 0:
@@ -751,6 +1006,7 @@ class QueueManager:
             self._clusters[cluster_id] = ClusterState(
                 cluster_id=cluster_id, max_concurrent_jobs=self.default_max_concurrent
             )
+            self._dirty_clusters.add(cluster_id)
 
         return self._clusters[cluster_id]
 
@@ -767,6 +1023,7 @@ class QueueManager:
             cluster = self._get_cluster(cluster_id)
             cluster.paused = True
             await self._run_db(self._persist_cluster_to_database, cluster)
+            self._dirty_clusters.discard(cluster.cluster_id)
             logger.info(f"Paused queue for cluster {cluster_id}")
 
     async def resume_queue(self, cluster_id: int) -> None:
@@ -780,6 +1037,8 @@ class QueueManager:
             cluster = self._get_cluster(cluster_id)
             cluster.paused = False
             await self._run_db(self._persist_cluster_to_database, cluster)
+            self._dirty_clusters.discard(cluster.cluster_id)
+            self._notify_scheduler()
             logger.info(f"Resumed queue for cluster {cluster_id}")
 
     async def reorder_queue(self, job_id: int, new_priority: int) -> None:
@@ -801,6 +1060,11 @@ class QueueManager:
             old_priority = queued_job.priority
             queued_job.priority = Priority(new_priority)
 
+            # Re-key the heap entry; the old one is dropped lazily
+            if job_id in self._heap_entries:
+                self._discard_ready_locked(job_id)
+                self._push_ready_locked(queued_job)
+
             # Persist change (non-blocking via thread)
             await self._run_db(self._persist_job_to_database, queued_job)
 
@@ -839,8 +1103,7 @@ class QueueManager:
                 return False
 
             # Remove from internal queue if present
-            if job_id in self._jobs:
-                del self._jobs[job_id]
+            self._untrack_job_locked(job_id)
 
             # Remove from cluster running jobs
             for cluster in self._clusters.values():
@@ -850,13 +1113,17 @@ class QueueManager:
             else:
                 self._default_cluster.running_jobs.discard(job_id)
 
-            # Remove from dependency graph
-            if job_id in self._dependents:
-                del self._dependents[job_id]
-
             # Remove any dependencies on this job from other jobs
-            for other_job in self._jobs.values():
-                other_job.dependencies.discard(job_id)
+            released: List[QueuedJob] = []
+            for dependent_id in self._dependents.pop(job_id, ()):
+                dependent = self._jobs.get(dependent_id)
+                if dependent is not None:
+                    dependent.dependencies.discard(job_id)
+                    released.append(dependent)
+            self._release_dependency_locked(job_id)
+            if released:
+                # Otherwise a restart restores the CANCELLED dependency as unmet
+                await self._run_db(self._persist_jobs_to_database, released)
 
             # Update database status to CANCELLED (non-blocking via thread)
             await self._run_db(self.db.update_status, job_id, JobStatus.CANCELLED)
@@ -867,6 +1134,7 @@ class QueueManager:
             # Remove from queue_state table (non-blocking via thread)
             await self._run_db(self._remove_job_from_database, job_id)
 
+            self._notify_scheduler()
             logger.info(f"Cancelled job {job_id}")
             return True
 
@@ -893,6 +1161,7 @@ class QueueManager:
                 self.metrics.total_jobs_completed += 1
             else:
                 self.metrics.total_jobs_failed += 1
+            self._metrics_dirty = True
 
             # Find and update cluster state
             for cluster in self._clusters.values():
@@ -913,8 +1182,9 @@ class QueueManager:
                     logger.info(
                         f"Job {job_id} completed, checking {len(dependents)} dependent jobs"
                     )
-                    # Dependent jobs will be picked up by scheduler
                     del self._dependents[job_id]
+                # Jobs waiting only on this one become ready
+                self._release_dependency_locked(job_id)
 
                 # Remove from queue_state on successful completion (non-blocking via thread)
                 await self._run_db(self._remove_job_from_database, job_id)
@@ -922,6 +1192,7 @@ class QueueManager:
             # Update metrics
             self._update_metrics()
             await self._run_db(self._persist_to_database)
+            self._notify_scheduler()
 
     async def _handle_job_failure(self, job_id: int) -> None:
         """
@@ -943,6 +1214,7 @@ class QueueManager:
                 # Re-enqueue with incremented retry count
                 retry_count += 1
                 self.metrics.total_jobs_retried += 1
+                self._metrics_dirty = True
 
                 # Reconstruct QueuedJob and re-add to internal queue
                 priority = Priority(row[1])
@@ -967,7 +1239,8 @@ class QueueManager:
                 )
 
                 # Re-add to internal queue
-                self._jobs[job_id] = queued_job
+                self._untrack_job_locked(job_id)
+                self._track_job_locked(queued_job, self._get_job_statuses_batch(list(dependencies)))
 
                 # Update retry count in database
                 with self.db.connection() as conn:
@@ -988,6 +1261,7 @@ class QueueManager:
 
                 # Remove from queue_state on permanent failure (non-blocking via thread)
                 await self._run_db(self._remove_job_from_database, job_id)
+                self._untrack_job_locked(job_id)
 
                 # Cancel dependent jobs
                 if job_id in self._dependents:
@@ -995,8 +1269,7 @@ class QueueManager:
                         await self._run_db(self.db.update_status, dependent_id, JobStatus.FAILED)
                         # Also remove dependent from queue (non-blocking via thread)
                         await self._run_db(self._remove_job_from_database, dependent_id)
-                        if dependent_id in self._jobs:
-                            del self._jobs[dependent_id]
+                        self._untrack_job_locked(dependent_id)
                         logger.warning(
                             f"Cancelled job {dependent_id} due to failed dependency {job_id}"
                         )
@@ -1004,13 +1277,15 @@ class QueueManager:
 
     async def _scheduler_worker(self) -> None:
         """
-        Background worker that continuously schedules jobs.
+        Background worker that keeps queue bookkeeping up to date.
+
+        Sleeps until a queue event (enqueue, dequeue, completion, cancel,
+        resume) wakes it, or at most ``scheduling_interval`` seconds, then:
+        1. Releases dependencies completed outside handle_job_completion
+        2. Updates queue depth and scheduler metrics
+        3. Persists state that changed since the last cycle
 
-        This runs in a loop and:
-        1. Checks for schedulable jobs
-        2. Updates queue state
-        3. Updates metrics
-        4. Persists state periodically
+        Bursts of events are coalesced into a single cycle.
 
         Thread-safe: All shared state access is properly synchronized.
         """
@@ -1022,31 +1297,26 @@ class QueueManager:
         loop_iteration = 0
 
         while self._running:
-            loop_iteration += 1
-            start_time = time.time()
-
             try:
-                # Schedule jobs (acquires lock internally)
-                schedulable = await self.schedule_jobs()
-
-                if schedulable:
-                    logger.debug(
-                        "Scheduler found schedulable jobs",
-                        extra={
-                            "job_count": len(schedulable),
-                            "job_ids": schedulable[:10],  # Log first 10 to avoid spam
-                        },
-                    )
+                # Wait for an event or the fallback interval (lock-free)
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.scheduling_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+                loop_iteration += 1
+                start_time = time.time()
 
-                # Update queue depth metrics (with lock)
-                total_queued = 0
                 async with self._lock:
-                    for cluster_id, cluster in self._clusters.items():
-                        queue_depth = sum(
-                            1 for job in self._jobs.values() if job.cluster_id == cluster_id
-                        )
-                        self.metrics.queue_depth_by_cluster[cluster_id] = queue_depth
-                        total_queued += queue_depth
+                    self._reconcile_blocked_locked()
+
+                    # Queue depth comes from counters maintained on add/remove
+                    for cluster_id in self._clusters.keys() | self._queue_depth.keys():
+                        if cluster_id:
+                            depth = self._queue_depth.get(cluster_id, 0)
+                            self.metrics.queue_depth_by_cluster[cluster_id] = depth
+                    total_queued = len(self._jobs)
 
                     # Update and persist metrics (non-blocking via thread)
                     self._update_metrics()
@@ -1060,26 +1330,21 @@ class QueueManager:
                         "iteration": loop_iteration,
                         "elapsed_seconds": round(elapsed, 3),
                         "total_queued": total_queued,
-                        "schedulable_count": len(schedulable),
+                        "blocked_count": len(self._unmet),
                         "total_jobs_scheduled": self.metrics.total_jobs_scheduled,
                         "total_jobs_completed": self.metrics.total_jobs_completed,
                         "total_jobs_failed": self.metrics.total_jobs_failed,
                     },
                 )
 
-                # Sleep until next cycle (lock-free, don't hold during sleep)
-                await asyncio.sleep(self.scheduling_interval)
-
             except asyncio.CancelledError:
                 logger.info("Scheduler worker stopped")
                 break
             except Exception as e:
-                elapsed = time.time() - start_time
                 logger.error(
                     "Scheduler worker error",
                     extra={
                         "iteration": loop_iteration,
-                        "elapsed_seconds": round(elapsed, 3),
                         "error": str(e),
                     },
                     exc_info=True,
@@ -1112,16 +1377,23 @@ class QueueManager:
             )
 
     def _persist_to_database(self) -> None:
-        """Persist all queue state to database."""
+        """
+        Persist queue state changed since the last call.
+
+        Queued jobs are written when they change (enqueue, reorder, retry), so
+        only clusters created since the last persist and changed metrics are
+        written here.
+        """
+        if not self._dirty_clusters and not self._metrics_dirty:
+            return
+
         # FIX: Use a single connection context for all persistence operations
         with self.db.connection() as conn:
-            # Persist all queued jobs
-            for queued_job in self._jobs.values():
-                self._persist_job_to_database(queued_job, conn)
-
             # Persist cluster states
-            for cluster in self._clusters.values():
-                self._persist_cluster_to_database(cluster, conn)
+            for cluster_id in self._dirty_clusters:
+                cluster = self._clusters.get(cluster_id)
+                if cluster is not None:
+                    self._persist_cluster_to_database(cluster, conn)
 
             # Persist metrics
             conn.execute(
@@ -1145,6 +1417,9 @@ class QueueManager:
             )
             conn.commit()
 
+        self._dirty_clusters.clear()
+        self._metrics_dirty = False
+
     def _persist_job_to_database(self, queued_job: QueuedJob, conn=None) -> None:
         """Persist a single queued job to database.
 
@@ -1182,6 +1457,13 @@ class QueueManager:
                 _execute(c)
                 c.commit()
 
+    def _persist_jobs_to_database(self, queued_jobs: List[QueuedJob]) -> None:
+        """Persist several queued jobs in one transaction."""
+        with self.db.connection() as conn:
+            for queued_job in queued_jobs:
+                self._persist_job_to_database(queued_job, conn)
+            conn.commit()
+
     def _persist_cluster_to_database(self, cluster: ClusterState, conn=None) -> None:
         """Persist cluster state to database.
 
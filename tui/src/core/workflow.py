@@ -11,6 +11,7 @@ import json
 import os
 import shutil
 import tempfile
+from collections import deque
 from dataclasses import dataclass, field, asdict
 from typing import Optional, List, Dict, Any, Set, Callable, TYPE_CHECKING
 from enum import Enum
@@ -18,6 +19,8 @@ from pathlib import Path
 from datetime import datetime
 import re
 
+from .dag import DAGScheduler, critical_path_priorities
+
 
 # AST node types allowed in safe condition expressions
 _ALLOWED_AST_NODES = (
@@ -244,6 +247,7 @@ class Workflow:
         self._running_nodes: Set[str] = set()
         self._completed_nodes: Set[str] = set()
         self._failed_nodes: Set[str] = set()
+        self._scheduler: Optional[DAGScheduler] = None  # Set while executing
 
         # Runner configuration
         self._runner_factory = runner_factory
@@ -492,46 +496,60 @@ class Workflow:
 
         return errors
 
-    def _has_cycle(self) -> bool:
-        """Detect cycles using DFS."""
-        visited = set()
-        rec_stack = set()
-
-        def dfs(node_id: str) -> bool:
-            visited.add(node_id)
-            rec_stack.add(node_id)
-
-            # Get all dependent nodes
-            for edge in self.edges:
-                if edge.from_node == node_id:
-                    if edge.to_node not in visited:
-                        if dfs(edge.to_node):
-                            return True
-                    elif edge.to_node in rec_stack:
-                        return True
-
-            rec_stack.remove(node_id)
-            return False
-
-        for node_id in self.nodes:
-            if node_id not in visited:
-                if dfs(node_id):
-                    return True
+    def _edge_order(self) -> List[str]:
+        """
+        Order nodes with Kahn's algorithm over the edges.
+
+        Nodes on a cycle are never reached, so the result is shorter than
+        the number of distinct node IDs exactly when the graph has a cycle.
+
+        Returns:
+            Node IDs (including edge endpoints missing from self.nodes)
+            in dependency order
+        """
+        in_degree = {node_id: 0 for node_id in self.nodes}
+        dependents: Dict[str, List[str]] = {node_id: [] for node_id in self.nodes}
+
+        for edge in self.edges:
+            in_degree.setdefault(edge.from_node, 0)
+            in_degree[edge.to_node] = in_degree.get(edge.to_node, 0) + 1
+            dependents.setdefault(edge.from_node, []).append(edge.to_node)
+
+        # Queue of nodes with no dependencies
+        queue = deque(node_id for node_id, degree in in_degree.items() if degree == 0)
+        result = []
 
+        while queue:
+            node_id = queue.popleft()
+            result.append(node_id)
+
+            # Reduce in-degree for dependent nodes
+            for to_node in dependents.get(node_id, ()):
+                in_degree[to_node] -= 1
+                if in_degree[to_node] == 0:
+                    queue.append(to_node)
+
+        if len(result) != len(in_degree):
+            raise ValueError("Graph has cycles - cannot perform topological sort")
+
+        return result
+
+    def _has_cycle(self) -> bool:
+        """Detect cycles in the edge graph."""
+        try:
+            self._edge_order()
+        except ValueError:
+            return True
         return False
 
     def _find_orphaned_nodes(self) -> List[str]:
         """Find nodes with no connections to other nodes."""
-        orphans = []
-
-        for node_id in self.nodes:
-            has_incoming = any(edge.to_node == node_id for edge in self.edges)
-            has_outgoing = any(edge.from_node == node_id for edge in self.edges)
-
-            if not has_incoming and not has_outgoing:
-                orphans.append(node_id)
+        connected = set()
+        for edge in self.edges:
+            connected.add(edge.from_node)
+            connected.add(edge.to_node)
 
-        return orphans
+        return [node_id for node_id in self.nodes if node_id not in connected]
 
     def _validate_parameter_templates(self, node: WorkflowNode) -> List[str]:
         """Validate Jinja2 template references in parameters."""
@@ -567,31 +585,11 @@ class Workflow:
         Raises:
             ValueError: If graph has cycles
         """
-        in_degree = {node_id: 0 for node_id in self.nodes}
-
-        # Calculate in-degrees
-        for edge in self.edges:
-            in_degree[edge.to_node] += 1
-
-        # Queue of nodes with no dependencies
-        queue = [node_id for node_id, degree in in_degree.items() if degree == 0]
-        result = []
-
-        while queue:
-            node_id = queue.pop(0)
-            result.append(node_id)
-
-            # Reduce in-degree for dependent nodes
-            for edge in self.edges:
-                if edge.from_node == node_id:
-                    in_degree[edge.to_node] -= 1
-                    if in_degree[edge.to_node] == 0:
-                        queue.append(edge.to_node)
-
-        if len(result) != len(self.nodes):
-            raise ValueError("Graph has cycles - cannot perform topological sort")
+        return [node_id for node_id in self._edge_order() if node_id in self.nodes]
 
-        return result
+    def _dependency_map(self) -> Dict[str, List[str]]:
+        """Map each node ID to the IDs it depends on, in declaration order."""
+        return {node_id: node.dependencies for node_id, node in self.nodes.items()}
 
     def get_ready_nodes(self) -> List[WorkflowNode]:
         """
@@ -665,12 +663,19 @@ class Workflow:
 
         return resolved
 
-    async def execute(self, max_parallel: int = 4) -> None:
+    async def execute(self, max_parallel: int = 4, critical_path: bool = False) -> None:
         """
         Execute the workflow.
 
+        A node starts as soon as its dependencies have completed and one of
+        the ``max_parallel`` slots is free. Readiness is tracked by a
+        DAGScheduler, so each completion costs O(out-degree) instead of a
+        scan over every node.
+
         Args:
             max_parallel: Maximum number of nodes to run in parallel
+            critical_path: Start the ready nodes with the longest chain of
+                           dependents first (default: declaration order)
 
         Raises:
             ValueError: If workflow is invalid
@@ -684,26 +689,40 @@ class Workflow:
         self.started_at = datetime.now().isoformat()
         self.execution_order = self._topological_sort()
 
+        dependencies = self._dependency_map()
+        priorities = critical_path_priorities(dependencies) if critical_path else None
+        self._scheduler = DAGScheduler(dependencies, priorities)
+        running: Dict["asyncio.Task[None]", WorkflowNode] = {}
+
         try:
-            # Execute nodes in topological order with parallelism
-            while len(self._completed_nodes) + len(self._failed_nodes) < len(self.nodes):
-                ready_nodes = self.get_ready_nodes()
+            while True:
+                # Fill free slots from the ready queue
+                while len(running) < max_parallel:
+                    node_id = self._scheduler.pop_ready()
+                    if node_id is None:
+                        break
+
+                    node = self.nodes[node_id]
+                    if node.status not in (NodeStatus.PENDING, NodeStatus.READY):
+                        # Skipped by a condition node; its dependents never become ready
+                        continue
+
+                    node.status = NodeStatus.READY
+                    running[asyncio.create_task(self._execute_node(node))] = node
 
-                if not ready_nodes and not self._running_nodes:
+                if not running:
                     # No nodes ready and none running - stuck or done
                     break
 
-                # Limit parallelism
-                available_slots = max_parallel - len(self._running_nodes)
-                nodes_to_run = ready_nodes[:available_slots]
-
-                if nodes_to_run:
-                    # Execute ready nodes in parallel
-                    tasks = [self._execute_node(node) for node in nodes_to_run]
-                    await asyncio.gather(*tasks, return_exceptions=True)
-                else:
-                    # Wait a bit before checking again
-                    await asyncio.sleep(0.5)
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    node = running.pop(task)
+                    if node.status == NodeStatus.COMPLETED:
+                        self._scheduler.complete(node.node_id)
+                    elif node.status == NodeStatus.PENDING:
+                        # Failed with retries left
+                        self._scheduler.retry(node.node_id)
+                    # FAILED: _execute_node already skipped the dependents
 
             # Determine final status
             if len(self._completed_nodes) == len(self.nodes):
@@ -721,6 +740,11 @@ class Workflow:
             self.completed_at = datetime.now().isoformat()
             raise
 
+        finally:
+            for task in running:
+                task.cancel()
+            self._scheduler = None
+
     async def _execute_node(self, node: WorkflowNode) -> None:
         """
         Execute a single workflow node.
@@ -1264,18 +1288,9 @@ class Workflow:
 
     def _skip_dependent_nodes(self, failed_node_id: str) -> None:
         """Mark all nodes dependent on a failed node as SKIPPED."""
-        to_skip = set()
-
-        def find_dependents(node_id: str):
-            for edge in self.edges:
-                if edge.from_node == node_id:
-                    if edge.to_node not in to_skip:
-                        to_skip.add(edge.to_node)
-                        find_dependents(edge.to_node)
-
-        find_dependents(failed_node_id)
+        scheduler = self._scheduler or DAGScheduler(self._dependency_map())
 
-        for node_id in to_skip:
+        for node_id in scheduler.fail(failed_node_id):
             self.nodes[node_id].status = NodeStatus.SKIPPED
             self._failed_nodes.add(node_id)
 
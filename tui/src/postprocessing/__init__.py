@@ -48,6 +48,8 @@ from .phonons import (
     check_stability,
     extract_phonons_phonopy,
 )
+from .vasp_text import ProcarData, read_procar
+from .vasprun import VasprunData, read_vasprun
 
 __all__ = [
     # Band structure
@@ -76,6 +78,12 @@ __all__ = [
     "extract_optics_yambo",
     "calculate_absorption",
     "calculate_reflectivity",
+    # vasprun.xml
+    "VasprunData",
+    "read_vasprun",
+    # PROCAR
+    "ProcarData",
+    "read_procar",
     # Born charges
     "BornCharges",
     "extract_born_charges_vasp",
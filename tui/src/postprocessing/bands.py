@@ -15,6 +15,9 @@ from pathlib import Path
 
 import numpy as np
 
+from .vasp_text import read_eigenval
+from .vasprun import VasprunData, read_vasprun
+
 
 @dataclass
 class BandData:
@@ -23,13 +26,14 @@ class BandData:
     # K-point information
     kpoints: np.ndarray  # Shape: (nkpts, 3)
     kpoint_distances: np.ndarray  # Cumulative distance along path
-    kpoint_labels: list[str] = field(default_factory=list)  # High-symmetry labels
-    label_positions: list[float] = field(default_factory=list)  # Label positions
 
     # Eigenvalues
     eigenvalues: np.ndarray  # Shape: (nkpts, nbands) or (nkpts, nbands, 2) for spin
     occupations: np.ndarray | None = None
 
+    kpoint_labels: list[str] = field(default_factory=list)  # High-symmetry labels
+    label_positions: list[float] = field(default_factory=list)  # Label positions
+
     # Reference energies
     fermi_energy: float = 0.0
     vbm: float | None = None
@@ -62,6 +66,8 @@ def extract_bands_vasp(
     vasprun_path: Path | None = None,
     outcar_path: Path | None = None,
     work_dir: Path | None = None,
+    vasprun: VasprunData | None = None,
+    cache: bool = True,
 ) -> BandData:
     """Extract band structure from VASP output files.
 
@@ -70,10 +76,16 @@ def extract_bands_vasp(
         vasprun_path: Path to vasprun.xml file.
         outcar_path: Path to OUTCAR file (for Fermi energy).
         work_dir: Working directory to search for files.
+        vasprun: Already read vasprun.xml (see read_vasprun), so that bands
+            and DOS come from a single pass over the file.
+        cache: Reuse/write the parsed-array sidecar of EIGENVAL.
 
     Returns:
         BandData with extracted band structure.
     """
+    if vasprun is not None:
+        return _bands_from_vasprun(vasprun)
+
     if work_dir:
         eigenval_path = eigenval_path or (work_dir / "EIGENVAL")
         vasprun_path = vasprun_path or (work_dir / "vasprun.xml")
@@ -85,56 +97,29 @@ def extract_bands_vasp(
 
     # Fall back to EIGENVAL
     if eigenval_path and eigenval_path.exists():
-        return _parse_eigenval(eigenval_path, outcar_path)
+        return _parse_eigenval(eigenval_path, outcar_path, cache=cache)
 
     raise FileNotFoundError("No VASP band structure files found")
 
 
 def _parse_vasprun_bands(vasprun_path: Path) -> BandData:
     """Parse band structure from vasprun.xml."""
-    tree = ET.parse(vasprun_path)
-    root = tree.getroot()
+    return _bands_from_vasprun(read_vasprun(vasprun_path, sections=("bands",)))
 
-    # Get Fermi energy
-    fermi = root.find(".//dos/i[@name='efermi']")
-    fermi_energy = float(fermi.text) if fermi is not None else 0.0
 
-    # Get k-points
-    kpoints_elem = root.find(".//kpoints/varray[@name='kpointlist']")
-    kpoints = []
-    if kpoints_elem is not None:
-        for v in kpoints_elem.findall("v"):
-            kpoints.append([float(x) for x in v.text.split()])
-    kpoints = np.array(kpoints)
-
-    # Get eigenvalues
-    eigenvalues_elem = root.find(".//eigenvalues/array/set")
-    nspin = len(eigenvalues_elem.findall("set"))
-
-    all_eigenvalues = []
-    all_occupations = []
-
-    for spin_set in eigenvalues_elem.findall("set"):
-        spin_eigenvalues = []
-        spin_occupations = []
+def _bands_from_vasprun(vasprun: VasprunData) -> BandData:
+    """Build band data from the arrays read by read_vasprun."""
+    vasprun.require("bands")
+    if vasprun.eigenvalues is None:
+        raise ValueError("No eigenvalues found in vasprun.xml")
 
-        for kpt_set in spin_set.findall("set"):
-            kpt_eigenvalues = []
-            kpt_occupations = []
+    fermi_energy = vasprun.fermi_energy if vasprun.fermi_energy is not None else 0.0
+    kpoints = vasprun.kpoints if vasprun.kpoints is not None else np.empty((0, 3))
 
-            for r in kpt_set.findall("r"):
-                values = r.text.split()
-                kpt_eigenvalues.append(float(values[0]))
-                kpt_occupations.append(float(values[1]))
-
-            spin_eigenvalues.append(kpt_eigenvalues)
-            spin_occupations.append(kpt_occupations)
-
-        all_eigenvalues.append(spin_eigenvalues)
-        all_occupations.append(spin_occupations)
-
-    eigenvalues = np.array(all_eigenvalues)
-    occupations = np.array(all_occupations)
+    # (nspin, nkpts, nbands, [energy, occupation])
+    nspin = vasprun.eigenvalues.shape[0]
+    eigenvalues = vasprun.eigenvalues[..., 0]
+    occupations = vasprun.eigenvalues[..., 1]
 
     # Reshape: (nspin, nkpts, nbands) -> (nkpts, nbands, nspin) or (nkpts, nbands)
     if nspin == 1:
@@ -161,13 +146,13 @@ def _parse_vasprun_bands(vasprun_path: Path) -> BandData:
     )
 
 
-def _parse_eigenval(eigenval_path: Path, outcar_path: Path | None = None) -> BandData:
+def _parse_eigenval(
+    eigenval_path: Path, outcar_path: Path | None = None, cache: bool = True
+) -> BandData:
     """Parse band structure from EIGENVAL file."""
-    with open(eigenval_path) as f:
-        lines = f.readlines()
-
-    # Header
-    nelect, nkpts, nbands = map(int, lines[5].split())
+    arrays = read_eigenval(eigenval_path, cache=cache)
+    nspin = int(arrays["ispin"])
+    kpoints = arrays["kpoints"][:, :3]
 
     # Get Fermi energy from OUTCAR if available
     fermi_energy = 0.0
@@ -178,37 +163,24 @@ def _parse_eigenval(eigenval_path: Path, outcar_path: Path | None = None) -> Ban
                     fermi_energy = float(line.split()[2])
                     break
 
-    # Parse k-points and eigenvalues
-    kpoints = []
-    eigenvalues = []
-
-    i = 7  # Start after header
-    for _ in range(nkpts):
-        # K-point line
-        parts = lines[i].split()
-        kpoints.append([float(x) for x in parts[:3]])
-        i += 1
-
-        # Eigenvalue lines
-        kpt_eigenvalues = []
-        for _ in range(nbands):
-            parts = lines[i].split()
-            kpt_eigenvalues.append(float(parts[1]))
-            i += 1
-
-        eigenvalues.append(kpt_eigenvalues)
-        i += 1  # Empty line
-
-    kpoints = np.array(kpoints)
-    eigenvalues = np.array(eigenvalues)
-    kpoint_distances = _calculate_kpoint_distances(kpoints)
+    # Band rows: index, energy per spin, then (VASP >= 5.4) occupation per spin
+    bands = arrays["bands"]
+    nkpts, nbands = bands.shape[:2]
+    eigenvalues = bands[:, :, 1 : 1 + nspin]
+    occupations = bands[:, :, 1 + nspin : 1 + 2 * nspin]
+    if occupations.shape[2] != nspin:
+        occupations = None
+    if nspin == 1:
+        eigenvalues = eigenvalues[:, :, 0]
+        occupations = occupations[:, :, 0] if occupations is not None else None
 
     return BandData(
         kpoints=kpoints,
-        kpoint_distances=kpoint_distances,
+        kpoint_distances=_calculate_kpoint_distances(kpoints),
         eigenvalues=eigenvalues,
+        occupations=occupations,
         fermi_energy=fermi_energy,
-        nspin=1,
+        nspin=nspin,
         nbands=nbands,
         nkpts=nkpts,
     )
@@ -323,11 +295,8 @@ def _parse_qe_bands_dat(bands_path: Path) -> BandData:
 
 def _calculate_kpoint_distances(kpoints: np.ndarray) -> np.ndarray:
     """Calculate cumulative distances along k-point path."""
-    distances = [0.0]
-    for i in range(1, len(kpoints)):
-        dk = np.linalg.norm(kpoints[i] - kpoints[i - 1])
-        distances.append(distances[-1] + dk)
-    return np.array(distances)
+    steps = np.linalg.norm(np.diff(kpoints, axis=0), axis=1) if len(kpoints) > 1 else []
+    return np.concatenate([[0.0], np.cumsum(steps)])
 
 
 def find_band_gap(band_data: BandData) -> tuple[float | None, str]:
@@ -0,0 +1,84 @@
+"""
+Sidecar caches for parsed output files.
+
+Parsing a multi-GB DOSCAR or PROCAR takes seconds even when vectorized, and
+the TUI re-opens the same run many times. :func:`cached_arrays` stores the
+parsed arrays next to the source file as an uncompressed ``.npz`` sidecar
+(``.DOSCAR.npz`` for ``DOSCAR``), keyed by the source's size and mtime, so
+re-opening an unchanged file is a plain bulk read instead of a parse.
+
+If the directory is not writable the arrays are returned uncached.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import zipfile
+import zlib
+from collections.abc import Callable, Mapping
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Bump when a parser changes the arrays it produces
+CACHE_VERSION = 1
+
+_KEY = "__source_key__"
+
+
+def sidecar_path(source: Path) -> Path:
+    """Cache file used for ``source``."""
+    return source.with_name(f".{source.name}.npz")
+
+
+def _source_key(source: Path, kind: str) -> np.ndarray:
+    st = source.stat()
+    return np.array(
+        [CACHE_VERSION, st.st_size, st.st_mtime_ns, zlib.crc32(kind.encode())], np.int64
+    )
+
+
+def cached_arrays(
+    source: Path,
+    kind: str,
+    parse: Callable[[Path], Mapping[str, np.ndarray]],
+    cache: bool = True,
+) -> dict[str, np.ndarray]:
+    """Return ``parse(source)``, reusing a sidecar cache when it is current.
+
+    Args:
+        source: File to parse.
+        kind: Name of the parser; a sidecar written by another parser is
+            ignored.
+        parse: Function returning the arrays to cache.
+        cache: Read and write the sidecar (False parses every time).
+
+    Returns:
+        Dict of array names to arrays.
+    """
+    source = Path(source)
+    if not cache:
+        return dict(parse(source))
+
+    key = _source_key(source, kind)
+    sidecar = sidecar_path(source)
+    try:
+        with np.load(sidecar, allow_pickle=False) as npz:
+            if _KEY in npz.files and np.array_equal(npz[_KEY], key):
+                return {name: npz[name] for name in npz.files if name != _KEY}
+    except (OSError, ValueError, EOFError, zipfile.BadZipFile):
+        pass  # missing, partial or foreign sidecar
+
+    arrays = parse(source)
+    tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            np.savez(f, **arrays, **{_KEY: key})
+        os.replace(tmp, sidecar)
+    except OSError as e:
+        logger.debug(f"Not caching {source} ({e})")
+        tmp.unlink(missing_ok=True)
+    return dict(arrays)
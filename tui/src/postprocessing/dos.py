@@ -10,12 +10,14 @@ Supports extraction from:
 from __future__ import annotations
 
 import re
-import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
 from pathlib import Path
 
 import numpy as np
 
+from .vasp_text import _ORBITAL_LABELS, orbital_labels, read_doscar
+from .vasprun import VasprunData, read_vasprun
+
 
 @dataclass
 class DOSData:
@@ -60,6 +62,8 @@ def extract_dos_vasp(
     doscar_path: Path | None = None,
     vasprun_path: Path | None = None,
     work_dir: Path | None = None,
+    vasprun: VasprunData | None = None,
+    cache: bool = True,
 ) -> tuple[DOSData, ProjectedDOS | None]:
     """Extract DOS from VASP output files.
 
@@ -67,10 +71,16 @@ def extract_dos_vasp(
         doscar_path: Path to DOSCAR file.
         vasprun_path: Path to vasprun.xml file.
         work_dir: Working directory to search for files.
+        vasprun: Already read vasprun.xml (see read_vasprun), so that DOS
+            and bands come from a single pass over the file.
+        cache: Reuse/write the parsed-array sidecar of DOSCAR.
 
     Returns:
         Tuple of (DOSData, ProjectedDOS or None).
     """
+    if vasprun is not None:
+        return _dos_from_vasprun(vasprun)
+
     if work_dir:
         doscar_path = doscar_path or (work_dir / "DOSCAR")
         vasprun_path = vasprun_path or (work_dir / "vasprun.xml")
@@ -81,137 +91,103 @@ def extract_dos_vasp(
 
     # Fall back to DOSCAR
     if doscar_path and doscar_path.exists():
-        return _parse_doscar(doscar_path), None
+        return _parse_doscar(doscar_path, cache=cache)
 
     raise FileNotFoundError("No VASP DOS files found")
 
 
 def _parse_vasprun_dos(vasprun_path: Path) -> tuple[DOSData, ProjectedDOS | None]:
     """Parse DOS from vasprun.xml."""
-    tree = ET.parse(vasprun_path)
-    root = tree.getroot()
-
-    # Get Fermi energy
-    fermi = root.find(".//dos/i[@name='efermi']")
-    fermi_energy = float(fermi.text) if fermi is not None else 0.0
+    return _dos_from_vasprun(read_vasprun(vasprun_path, sections=("dos",)))
 
-    # Get total DOS
-    total_dos_elem = root.find(".//dos/total/array/set/set")
 
-    energies = []
-    total_dos = []
-    integrated_dos = []
-
-    if total_dos_elem is not None:
-        for r in total_dos_elem.findall("r"):
-            values = [float(x) for x in r.text.split()]
-            energies.append(values[0])
-            total_dos.append(values[1])
-            if len(values) > 2:
-                integrated_dos.append(values[2])
+def _dos_from_vasprun(vasprun: VasprunData) -> tuple[DOSData, ProjectedDOS | None]:
+    """Build DOS data from the arrays read by read_vasprun."""
+    vasprun.require("dos")
+    fermi_energy = vasprun.fermi_energy if vasprun.fermi_energy is not None else 0.0
 
-    energy = np.array(energies)
-    total = np.array(total_dos)
-    integrated = np.array(integrated_dos) if integrated_dos else None
+    # Total DOS: (nspin, nedos, [energy, dos, integrated])
+    total = vasprun.total_dos
+    if total is None:
+        total = np.empty((1, 0, 3))
+    nspin = total.shape[0]
+    energy = total[0, :, 0]
+    integrated = total[:, :, 2].sum(axis=0) if total.shape[2] > 2 and len(energy) else None
 
     dos_data = DOSData(
         energy=energy,
-        total_dos=total,
+        total_dos=total[:, :, 1].sum(axis=0),
         integrated_dos=integrated,
+        spin_up=total[0, :, 1] if nspin == 2 else None,
+        spin_down=total[1, :, 1] if nspin == 2 else None,
         fermi_energy=fermi_energy,
         energy_min=energy.min() if len(energy) > 0 else 0.0,
         energy_max=energy.max() if len(energy) > 0 else 0.0,
         nedos=len(energy),
+        is_spin_polarized=nspin == 2,
     )
 
     # Try to get projected DOS
-    pdos = _parse_vasprun_pdos(root, energy, fermi_energy)
+    pdos = _pdos_from_vasprun(vasprun, energy, fermi_energy)
 
     return dos_data, pdos
 
 
-def _parse_vasprun_pdos(
-    root: ET.Element,
+def _pdos_from_vasprun(
+    vasprun: VasprunData,
     energy: np.ndarray,
     fermi_energy: float,
 ) -> ProjectedDOS | None:
-    """Parse projected DOS from vasprun.xml."""
-    partial_elem = root.find(".//dos/partial")
-    if partial_elem is None:
+    """Build projected DOS from the arrays read by read_vasprun."""
+    partial = vasprun.partial_dos  # (nions, nspin, nedos, [energy, orbitals...])
+    if partial is None:
         return None
 
-    pdos = ProjectedDOS(energy=energy, fermi_energy=fermi_energy)
-
-    # Get orbital labels
-    fields = partial_elem.find(".//array/field")
-    if fields is not None:
-        # Parse field names for orbital labels
-        pass
-
-    # Parse per-atom projections
-    ion_sets = partial_elem.findall(".//set/set")
-    for atom_idx, ion_set in enumerate(ion_sets):
-        pdos.atom_projections[atom_idx] = {}
-
-        for spin_set in ion_set.findall("set"):
-            orb_dos = []
-            for r in spin_set.findall("r"):
-                values = [float(x) for x in r.text.split()]
-                orb_dos.append(values[1:])  # Skip energy
+    # Sum spin channels, as for the total DOS
+    orbitals = partial[:, :, :, 1:].sum(axis=1)
+    return _pdos_from_arrays(orbitals, orbital_labels(orbitals.shape[2]), energy, fermi_energy)
 
-            orb_dos = np.array(orb_dos)
-
-            # Map to orbital labels
-            for i, label in enumerate(["s", "py", "pz", "px", "dxy", "dyz", "dz2", "dxz", "dx2"]):
-                if i < orb_dos.shape[1]:
-                    pdos.atom_projections[atom_idx][label] = orb_dos[:, i]
 
+def _pdos_from_arrays(
+    orbitals: np.ndarray,
+    labels: list[str],
+    energy: np.ndarray,
+    fermi_energy: float,
+) -> ProjectedDOS:
+    """Build projected DOS from an (nions, nedos, norbitals) array."""
+    pdos = ProjectedDOS(energy=energy, fermi_energy=fermi_energy, orbital_labels=labels)
+    for atom_idx in range(orbitals.shape[0]):
+        pdos.atom_projections[atom_idx] = {
+            label: orbitals[atom_idx, :, i] for i, label in enumerate(labels)
+        }
     return pdos
 
 
-def _parse_doscar(doscar_path: Path) -> DOSData:
-    """Parse DOS from DOSCAR file."""
-    with open(doscar_path) as f:
-        lines = f.readlines()
-
-    # Header (first 5 lines)
-    # Line 6: EMAX EMIN NEDOS EFERMI
-    header = lines[5].split()
-    emax = float(header[0])
-    emin = float(header[1])
-    nedos = int(header[2])
-    fermi_energy = float(header[3])
-
-    # Parse total DOS (starts at line 7)
-    energies = []
-    total_dos = []
-    integrated_dos = []
-    spin_up = []
-    spin_down = []
-
-    for i in range(6, 6 + nedos):
-        values = [float(x) for x in lines[i].split()]
-        energies.append(values[0])
-
-        if len(values) == 3:
-            # Non-spin-polarized
-            total_dos.append(values[1])
-            integrated_dos.append(values[2])
-        elif len(values) == 5:
-            # Spin-polarized
-            spin_up.append(values[1])
-            spin_down.append(values[2])
-            total_dos.append(values[1] + values[2])
-            integrated_dos.append(values[3] + values[4])
+def _parse_doscar(doscar_path: Path, cache: bool = True) -> tuple[DOSData, ProjectedDOS | None]:
+    """Parse total and (if written) per-site projected DOS from DOSCAR."""
+    arrays = read_doscar(doscar_path, cache=cache)
+    emax, emin, nedos, fermi_energy = arrays["header"]
+    nedos = int(nedos)
+
+    # Total DOS columns: energy, dos, integrated (spin: energy, up, down, int up, int down)
+    total = arrays["total"]
+    energy = total[:, 0]
+    is_spin = total.shape[1] == 5
+    if is_spin:
+        spin_up, spin_down = total[:, 1], total[:, 2]
+        total_dos = spin_up + spin_down
+        integrated = total[:, 3] + total[:, 4]
+    else:
+        spin_up = spin_down = None
+        total_dos = total[:, 1]
+        integrated = total[:, 2]
 
-    is_spin = len(spin_up) > 0
-
-    return DOSData(
-        energy=np.array(energies),
-        total_dos=np.array(total_dos),
-        integrated_dos=np.array(integrated_dos),
-        spin_up=np.array(spin_up) if is_spin else None,
-        spin_down=np.array(spin_down) if is_spin else None,
+    dos_data = DOSData(
+        energy=energy,
+        total_dos=total_dos,
+        integrated_dos=integrated,
+        spin_up=spin_up,
+        spin_down=spin_down,
         fermi_energy=fermi_energy,
         energy_min=emin,
         energy_max=emax,
@@ -219,6 +195,25 @@ def _parse_doscar(doscar_path: Path) -> DOSData:
         is_spin_polarized=is_spin,
     )
 
+    partial = arrays["partial"]  # (nsites, nedos, [energy, orbitals...])
+    if partial.shape[0] == 0:
+        return dos_data, None
+
+    # Each orbital column is repeated per spin channel (up, down) or, for
+    # non-collinear runs, per magnetization component (total, mx, my, mz)
+    ncols = partial.shape[2] - 1
+    if is_spin:
+        ncomponents = 2
+    elif ncols not in _ORBITAL_LABELS and ncols % 4 == 0:
+        ncomponents = 4
+    else:
+        ncomponents = 1
+    orbitals = partial[:, :, 1:].reshape(partial.shape[0], nedos, -1, ncomponents)
+    orbitals = orbitals.sum(axis=3) if is_spin else orbitals[..., 0]
+
+    pdos = _pdos_from_arrays(orbitals, orbital_labels(orbitals.shape[2]), energy, fermi_energy)
+    return dos_data, pdos
+
 
 def extract_dos_qe(
     dos_file: Path | None = None,
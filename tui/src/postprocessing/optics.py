@@ -10,12 +10,13 @@ Supports extraction from:
 from __future__ import annotations
 
 import re
-import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
 
+from .vasprun import VasprunData, read_vasprun
+
 
 @dataclass
 class DielectricFunction:
@@ -63,6 +64,7 @@ def extract_optics_vasp(
     outcar_path: Path | None = None,
     vasprun_path: Path | None = None,
     work_dir: Path | None = None,
+    vasprun: VasprunData | None = None,
 ) -> OpticalData:
     """Extract optical properties from VASP output.
 
@@ -70,6 +72,7 @@ def extract_optics_vasp(
         outcar_path: Path to OUTCAR file.
         vasprun_path: Path to vasprun.xml file.
         work_dir: Working directory to search for files.
+        vasprun: Already read vasprun.xml (see read_vasprun).
 
     Returns:
         OpticalData with extracted properties.
@@ -79,7 +82,9 @@ def extract_optics_vasp(
         vasprun_path = vasprun_path or (work_dir / "vasprun.xml")
 
     # Try vasprun.xml first
-    if vasprun_path and vasprun_path.exists():
+    if vasprun is not None:
+        dielectric = _optics_from_vasprun(vasprun)
+    elif vasprun_path and vasprun_path.exists():
         dielectric = _parse_vasprun_optics(vasprun_path)
     elif outcar_path and outcar_path.exists():
         dielectric = _parse_outcar_optics(outcar_path)
@@ -108,39 +113,19 @@ def extract_optics_vasp(
 
 def _parse_vasprun_optics(vasprun_path: Path) -> DielectricFunction:
     """Parse dielectric function from vasprun.xml."""
-    tree = ET.parse(vasprun_path)
-    root = tree.getroot()
+    return _optics_from_vasprun(read_vasprun(vasprun_path, sections=("optics",)))
 
-    # Find dielectric function data
-    dielectric_elem = root.find(".//dielectricfunction")
 
-    if dielectric_elem is None:
+def _optics_from_vasprun(vasprun: VasprunData) -> DielectricFunction:
+    """Build the dielectric function from the arrays read by read_vasprun."""
+    vasprun.require("optics")
+    if vasprun.dielectric_imag is None or vasprun.dielectric_real is None:
         raise ValueError("No dielectric function found in vasprun.xml")
 
-    # Parse real part
-    real_elem = dielectric_elem.find(".//imag/array/set")
-    imag_elem = dielectric_elem.find(".//real/array/set")
-
-    energies = []
-    eps_real_data = []
-    eps_imag_data = []
-
-    # Parse imaginary part (contains energy grid)
-    if imag_elem is not None:
-        for r in imag_elem.findall("r"):
-            values = [float(x) for x in r.text.split()]
-            energies.append(values[0])
-            eps_imag_data.append(values[1:])  # xx, yy, zz, xy, yz, zx
-
-    # Parse real part
-    if real_elem is not None:
-        for r in real_elem.findall("r"):
-            values = [float(x) for x in r.text.split()]
-            eps_real_data.append(values[1:])
-
-    energy = np.array(energies)
-    eps_imag_data = np.array(eps_imag_data)
-    eps_real_data = np.array(eps_real_data)
+    # Rows: energy, xx, yy, zz, xy, yz, zx
+    energy = vasprun.dielectric_imag[:, 0]
+    eps_imag_data = vasprun.dielectric_imag[:, 1:]
+    eps_real_data = vasprun.dielectric_real[:, 1:]
 
     # Average diagonal components for isotropic approximation
     eps_real = (eps_real_data[:, 0] + eps_real_data[:, 1] + eps_real_data[:, 2]) / 3
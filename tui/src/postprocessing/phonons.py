@@ -9,6 +9,7 @@ Supports extraction from:
 
 from __future__ import annotations
 
+import bisect
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -25,6 +26,7 @@ class PhononData:
     qpoints: np.ndarray | None = None  # Shape: (nqpts, 3)
     qpoint_distances: np.ndarray | None = None
     frequencies: np.ndarray | None = None  # Shape: (nqpts, nmodes), THz
+    eigenvectors: np.ndarray | None = None  # Shape: (nqpts, nmodes, natoms, 3), complex
     qpoint_labels: list[str] = field(default_factory=list)
     label_positions: list[float] = field(default_factory=list)
 
@@ -65,6 +67,7 @@ def extract_phonons_phonopy(
     mesh_yaml: Path | None = None,
     thermal_yaml: Path | None = None,
     work_dir: Path | None = None,
+    eigenvectors: bool = False,
 ) -> tuple[PhononData, ThermalProperties | None]:
     """Extract phonon data from phonopy output files.
 
@@ -73,6 +76,7 @@ def extract_phonons_phonopy(
         mesh_yaml: Path to mesh.yaml file.
         thermal_yaml: Path to thermal_properties.yaml file.
         work_dir: Working directory to search for files.
+        eigenvectors: Also read the mode eigenvectors from band.yaml.
 
     Returns:
         Tuple of (PhononData, ThermalProperties or None).
@@ -86,7 +90,7 @@ def extract_phonons_phonopy(
 
     # Parse band structure
     if band_yaml and band_yaml.exists():
-        _parse_band_yaml(band_yaml, phonon_data)
+        _parse_band_yaml(band_yaml, phonon_data, eigenvectors=eigenvectors)
 
     # Parse DOS
     if mesh_yaml and mesh_yaml.exists():
@@ -100,69 +104,116 @@ def extract_phonons_phonopy(
     return phonon_data, thermal
 
 
-def _parse_band_yaml(band_yaml: Path, phonon_data: PhononData) -> None:
-    """Parse phonon band structure from band.yaml."""
-    with open(band_yaml) as f:
-        content = f.read()
-
-    # Extract q-points and frequencies
-    # Phonopy YAML format uses specific structure
-    qpoints = []
-    frequencies = []
-    current_qpt = None
-    current_freqs = []
-
-    for line in content.split("\n"):
-        line = line.strip()
-
-        # Q-point position
-        if line.startswith("q-position:"):
-            if current_qpt is not None and current_freqs:
-                qpoints.append(current_qpt)
-                frequencies.append(current_freqs)
-            # Parse q-point
-            match = re.search(r"\[\s*([-\d.]+),\s*([-\d.]+),\s*([-\d.]+)\s*\]", line)
-            if match:
-                current_qpt = [float(match.group(i)) for i in (1, 2, 3)]
-            current_freqs = []
-
-        # Frequency
-        elif line.startswith("frequency:"):
-            match = re.search(r"frequency:\s*([-\d.]+)", line)
-            if match:
-                current_freqs.append(float(match.group(1)))
-
-        # Labels
-        elif line.startswith("label:"):
-            match = re.search(r"label:\s*'?([^']+)'?", line)
-            if match:
-                phonon_data.qpoint_labels.append(match.group(1).strip())
-
-    # Add last q-point
-    if current_qpt is not None and current_freqs:
-        qpoints.append(current_qpt)
-        frequencies.append(current_freqs)
-
-    if qpoints:
-        phonon_data.qpoints = np.array(qpoints)
-        phonon_data.frequencies = np.array(frequencies)
-        phonon_data.nqpts = len(qpoints)
-        phonon_data.nmodes = len(frequencies[0]) if frequencies else 0
-
-        # Calculate q-point distances
-        phonon_data.qpoint_distances = _calculate_qpoint_distances(phonon_data.qpoints)
-
-        # Check for imaginary frequencies
-        min_freq = phonon_data.frequencies.min()
-        phonon_data.min_frequency = min_freq
-        phonon_data.has_imaginary = min_freq < -0.01  # THz threshold
-
-        if phonon_data.has_imaginary:
-            # Find imaginary modes
-            for q in range(phonon_data.nqpts):
-                for m in range(phonon_data.nmodes):
-                    if phonon_data.frequencies[q, m] < -0.01:
-                        phonon_data.imaginary_modes.append((q, m))
+# band.yaml is read in chunks of whole lines; only the lines that are needed
+# are picked out with these patterns and converted in bulk. Each pattern
+# starts with a literal so that the regex engine can skip ahead to it.
+_CHUNK_SIZE = 1 << 24
+_BAND_HEADER = re.compile(rb"^(nqpoint|natom): *(\d+)", re.MULTILINE)
+_QPOSITION = re.compile(rb"q-position: *\[([^\]]*)\]")
+_FREQUENCY = re.compile(rb"frequency: *(\S+)")
+_LABEL = re.compile(rb"label: *'?([^'\n]*)'?")
+# Rows of an eigenvector: "- [ real, imag ]"
+_EIGENVECTOR_ROW = re.compile(rb"- \[ *([-+.\deE]+, *[-+.\deE]+) *\]")
+
+
+def _iter_line_chunks(path: Path):
+    """Yield the file in large chunks that end on a line boundary."""
+    with open(path, "rb") as f:
+        rest = b""
+        while chunk := f.read(_CHUNK_SIZE):
+            chunk = rest + chunk
+            cut = chunk.rfind(b"\n") + 1
+            rest = chunk[cut:]
+            yield chunk[:cut]
+        if rest:
+            yield rest
+
+
+def _parse_band_yaml(band_yaml: Path, phonon_data: PhononData, eigenvectors: bool = False) -> None:
+    """Parse phonon band structure from band.yaml.
+
+    The arrays are allocated from the ``nqpoint``/``natom`` header and
+    filled chunk by chunk, so memory does not grow with the number of
+    lines. Eigenvectors, which make up most of a band.yaml written with
+    ``--eigvecs``, are skipped unless requested.
+    """
+    qpoints = frequencies = vectors = None
+    nq = nfreq = nvec = 0  # values filled so far
+    header: dict[bytes, int] = {}
+    labels: list[tuple[str, int]] = []  # (label, q-point index)
+
+    for chunk in _iter_line_chunks(band_yaml):
+        if qpoints is None:
+            # The header (before "phonon:") can span several chunks
+            header.update((key, int(value)) for key, value in _BAND_HEADER.findall(chunk))
+            if b"nqpoint" not in header or b"natom" not in header:
+                if _QPOSITION.search(chunk):
+                    raise ValueError(f"No nqpoint/natom header in {band_yaml}")
+                continue
+            nqpoint, natom = header[b"nqpoint"], header[b"natom"]
+            nmodes = 3 * natom
+            qpoints = np.zeros((nqpoint, 3))
+            frequencies = np.zeros((nqpoint, nmodes))
+            if eigenvectors:
+                vectors = np.zeros((nqpoint, nmodes, natom, 3), dtype=complex)
+
+        positions = list(_QPOSITION.finditer(chunk))
+        starts = [m.start() for m in positions]
+        for label in _LABEL.finditer(chunk):
+            # Label of the last q-point that starts before it
+            q = nq + bisect.bisect(starts, label.start()) - 1
+            labels.append((label.group(1).decode().strip(), q))
+        if positions:
+            values = np.fromstring(b",".join(m.group(1) for m in positions), sep=",")
+            values = values.reshape(-1, 3)[: nqpoint - nq]
+            qpoints[nq : nq + len(values)] = values
+            nq += len(values)
+
+        freqs = _FREQUENCY.findall(chunk)[: frequencies.size - nfreq]
+        if freqs:
+            frequencies.flat[nfreq : nfreq + len(freqs)] = np.array(freqs, dtype=float)
+            nfreq += len(freqs)
+
+        if vectors is not None:
+            rows = np.fromstring(b",".join(_EIGENVECTOR_ROW.findall(chunk)), sep=",")
+            rows = rows.reshape(-1, 2)
+            rows = rows[: vectors.size - nvec]
+            vectors.flat[nvec : nvec + len(rows)] = rows[:, 0] + 1j * rows[:, 1]
+            nvec += len(rows)
+
+    if qpoints is None:
+        return
+
+    # A file still being written ends in a partial q-point
+    nqpts = min(nq, nfreq // nmodes)
+    if nqpts == 0:
+        return
+
+    phonon_data.qpoints = qpoints[:nqpts]
+    phonon_data.frequencies = frequencies[:nqpts]
+    if vectors is not None:
+        phonon_data.eigenvectors = vectors[: min(nqpts, nvec // (nmodes * natom * 3))]
+    phonon_data.nqpts = nqpts
+    phonon_data.nmodes = nmodes
+    phonon_data.natoms = natom
+    phonon_data.qpoint_distances = _calculate_qpoint_distances(phonon_data.qpoints)
+
+    for label, q in labels:
+        if 0 <= q < nqpts:
+            phonon_data.qpoint_labels.append(label)
+            phonon_data.label_positions.append(float(phonon_data.qpoint_distances[q]))
+
+    _find_imaginary_modes(phonon_data)
+
+
+def _find_imaginary_modes(phonon_data: PhononData, threshold: float = -0.01) -> None:
+    """Set min_frequency, has_imaginary and imaginary_modes (THz threshold)."""
+    frequencies = phonon_data.frequencies
+    phonon_data.min_frequency = float(frequencies.min())
+    phonon_data.has_imaginary = phonon_data.min_frequency < threshold
+    phonon_data.imaginary_modes = [
+        (int(q), int(m)) for q, m in np.argwhere(frequencies < threshold)
+    ]
 
 
 def _parse_mesh_yaml(mesh_yaml: Path, phonon_data: PhononData) -> None:
@@ -261,11 +312,8 @@ def _parse_thermal_yaml(thermal_yaml: Path) -> ThermalProperties:
 
 def _calculate_qpoint_distances(qpoints: np.ndarray) -> np.ndarray:
     """Calculate cumulative distances along q-point path."""
-    distances = [0.0]
-    for i in range(1, len(qpoints)):
-        dq = np.linalg.norm(qpoints[i] - qpoints[i - 1])
-        distances.append(distances[-1] + dq)
-    return np.array(distances)
+    steps = np.linalg.norm(np.diff(qpoints, axis=0), axis=1) if len(qpoints) > 1 else []
+    return np.concatenate([[0.0], np.cumsum(steps)])
 
 
 def check_stability(phonon_data: PhononData, threshold: float = -0.01) -> dict[str, Any]:
@@ -278,15 +326,24 @@ def check_stability(phonon_data: PhononData, threshold: float = -0.01) -> dict[s
     Returns:
         Dictionary with stability analysis.
     """
+    if phonon_data.frequencies is not None and phonon_data.frequencies.size:
+        imaginary = np.argwhere(phonon_data.frequencies < threshold)
+        min_frequency = float(phonon_data.frequencies.min())
+        modes = [(int(q), int(m)) for q, m in imaginary]
+    else:
+        min_frequency = phonon_data.min_frequency
+        modes = phonon_data.imaginary_modes
+    has_imaginary = min_frequency < threshold
+
     result = {
-        "is_stable": not phonon_data.has_imaginary,
-        "min_frequency_THz": phonon_data.min_frequency,
-        "min_frequency_cm-1": phonon_data.min_frequency * 33.356,  # THz to cm^-1
-        "num_imaginary_modes": len(phonon_data.imaginary_modes),
-        "imaginary_modes": phonon_data.imaginary_modes,
+        "is_stable": not has_imaginary,
+        "min_frequency_THz": min_frequency,
+        "min_frequency_cm-1": min_frequency * 33.356,  # THz to cm^-1
+        "num_imaginary_modes": len(modes),
+        "imaginary_modes": modes,
     }
 
-    if phonon_data.has_imaginary:
+    if has_imaginary:
         result["recommendation"] = (
             "Structure has imaginary phonon modes indicating dynamical instability. "
             "Consider: (1) Re-relaxing with tighter convergence, "
@@ -315,10 +372,9 @@ def calculate_zpe(phonon_data: PhononData) -> float:
 
     # Get frequencies at Gamma point (q=0)
     gamma_idx = 0
-    for i, q in enumerate(phonon_data.qpoints):
-        if np.allclose(q, [0, 0, 0]):
-            gamma_idx = i
-            break
+    if phonon_data.qpoints is not None:
+        gamma = np.flatnonzero(np.all(np.isclose(phonon_data.qpoints, 0.0), axis=1))
+        gamma_idx = gamma[0] if len(gamma) else 0
 
     freqs_THz = phonon_data.frequencies[gamma_idx]
 
@@ -335,7 +391,7 @@ def calculate_zpe(phonon_data: PhononData) -> float:
 
     zpe = 0.5 * hbar_eV_s * np.sum(freqs_Hz)
 
-    return zpe
+    return float(zpe)
 
 
 __all__ = [
@@ -0,0 +1,244 @@
+"""
+Single-pass streaming reader for vasprun.xml.
+
+``ET.parse`` builds the whole DOM of a vasprun.xml before anything is read
+from it, and converting ``<r>`` rows one ``float()`` at a time is slow; a
+dense PDOS run easily produces a 1 GB file. :func:`read_vasprun` instead
+walks the file once with ``iterparse``, keeps only the arrays of the
+requested sections, clears every element as soon as it has been read, and
+converts each block of rows with one vectorized NumPy call. It stops reading
+as soon as every requested section has been seen.
+
+Several quantities can be taken from one read::
+
+    data = read_vasprun(path, sections=("dos", "bands"))
+    dos, pdos = extract_dos_vasp(vasprun=data)
+    bands = extract_bands_vasp(vasprun=data)
+"""
+
+from __future__ import annotations
+
+import re
+import warnings
+import xml.etree.ElementTree as ET
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+SECTIONS = frozenset({"dos", "bands", "optics"})
+
+# Parts of the file each section needs
+_NEEDS = {
+    "dos": {"efermi", "dos"},
+    "bands": {"efermi", "kpoints", "eigenvalues"},
+    "optics": {"dielectric"},
+}
+
+# (grandparent, parent, tag) of each collected <array> -> (attribute, part)
+_ARRAYS = {
+    ("calculation", "eigenvalues", "array"): ("eigenvalues", "eigenvalues"),
+    ("dos", "total", "array"): ("total_dos", "dos"),
+    ("dos", "partial", "array"): ("partial_dos", "dos"),
+    ("dielectricfunction", "imag", "array"): ("dielectric_imag", "dielectric"),
+    ("dielectricfunction", "real", "array"): ("dielectric_real", "dielectric"),
+}
+
+# (parent, tag) of elements whose end completes a multi-array part
+_PART_ENDS = {
+    ("calculation", "dos"): "dos",
+    ("calculation", "dielectricfunction"): "dielectric",
+}
+
+
+@dataclass
+class VasprunData:
+    """Quantities read from vasprun.xml; None where not requested or absent."""
+
+    sections: frozenset[str] = SECTIONS
+    fermi_energy: float | None = None
+
+    # Bands
+    kpoints: np.ndarray | None = None  # (nkpts, 3)
+    eigenvalues: np.ndarray | None = None  # (nspin, nkpts, nbands, 2): energy, occupation
+
+    # DOS
+    total_dos: np.ndarray | None = None  # (nspin, nedos, 3): energy, dos, integrated
+    partial_dos: np.ndarray | None = None  # (nions, nspin, nedos, 1 + norbitals)
+    partial_dos_fields: list[str] = field(default_factory=list)
+
+    # Optics
+    dielectric_imag: np.ndarray | None = None  # (nedos, 7): energy, xx, yy, zz, xy, yz, zx
+    dielectric_real: np.ndarray | None = None
+
+    def require(self, section: str) -> None:
+        """Raise ValueError if ``section`` was not requested when reading."""
+        if section not in self.sections:
+            raise ValueError(f"vasprun.xml was read without the {section!r} section")
+
+
+class _ArrayReader:
+    """Collects the rows of one <array>/<varray> and shapes them by set nesting."""
+
+    def __init__(self) -> None:
+        self.set_counts: list[int] = []  # sets opened at each nesting depth
+        self.depth = 0
+        self.rows: list[str] = []
+        self.blocks: list[np.ndarray] = []
+
+    def start_set(self) -> None:
+        if len(self.set_counts) <= self.depth:
+            self.set_counts.append(0)
+        self.set_counts[self.depth] += 1
+        self.depth += 1
+
+    def end_set(self) -> None:
+        self.depth -= 1
+        self._flush()
+
+    def result(self) -> np.ndarray | None:
+        self._flush()
+        if not self.blocks:
+            return None
+        data = np.concatenate(self.blocks)
+        # Outermost <set> is a single wrapper; inner levels are spin/k-point/ion
+        dims = [
+            inner // outer
+            for outer, inner in zip(self.set_counts, self.set_counts[1:], strict=False)
+        ]
+        leaves = self.set_counts[-1] if self.set_counts else 1
+        return data.reshape(*dims, len(data) // leaves, data.shape[1])
+
+    def _flush(self) -> None:
+        if self.rows:
+            self.blocks.append(_parse_rows(self.rows))
+            self.rows = []
+
+
+# Fortran drops the E of three-digit exponents: 0.1234-100 means 0.1234E-100
+_SHORT_EXPONENT = re.compile(r"(?<=\d)([+-]\d{3})$")
+
+
+def _to_float(token: str) -> float:
+    try:
+        return float(token)
+    except ValueError:
+        pass
+    try:
+        return float(_SHORT_EXPONENT.sub(r"E\1", token))
+    except ValueError:
+        return float("nan")  # VASP prints ****** on overflow
+
+
+def _parse_rows(rows: list[str]) -> np.ndarray:
+    """Convert whitespace-separated rows into a 2D float array in one call."""
+    ncols = len(rows[0].split())
+    try:
+        with warnings.catch_warnings():
+            # fromstring warns (instead of raising) on unparsable text
+            warnings.simplefilter("error", DeprecationWarning)
+            values = np.fromstring(" ".join(rows), sep=" ")
+    except (DeprecationWarning, ValueError):
+        values = None
+    if values is None or values.size != ncols * len(rows):
+        values = np.array([_to_float(token) for row in rows for token in row.split()])
+    return values.reshape(len(rows), ncols)
+
+
+def read_vasprun(
+    vasprun_path: Path,
+    sections: Iterable[str] = SECTIONS,
+    pdos: bool = True,
+) -> VasprunData:
+    """Read the requested sections of vasprun.xml in one streaming pass.
+
+    The first occurrence of each section is used. A truncated file (from a
+    job that is still running or was killed) is accepted as long as some
+    requested data was read before the truncation.
+
+    Args:
+        vasprun_path: Path to vasprun.xml.
+        sections: Any of "dos", "bands" and "optics".
+        pdos: Also collect the projected DOS when reading "dos".
+
+    Returns:
+        VasprunData with the requested arrays filled in.
+    """
+    sections = frozenset(sections)
+    unknown = sections - SECTIONS
+    if unknown:
+        raise ValueError(f"Unknown vasprun.xml sections: {', '.join(sorted(unknown))}")
+
+    wanted: set[str] = set()
+    for section in sections:
+        wanted |= _NEEDS[section]
+
+    data = VasprunData(sections=sections)
+    done: set[str] = set()
+    stack: list[str] = []
+    reader: _ArrayReader | None = None
+    target: str | None = None
+
+    try:
+        with open(vasprun_path, "rb") as f:
+            for event, elem in ET.iterparse(f, events=("start", "end")):
+                tag = elem.tag
+                if event == "start":
+                    stack.append(tag)
+                    if reader is not None:
+                        if tag == "set":
+                            reader.start_set()
+                        continue
+                    key = tuple(stack[-3:])
+                    if key in _ARRAYS:
+                        target, part = _ARRAYS[key]
+                        skip = part not in wanted or part in done
+                        if not skip and (target != "partial_dos" or pdos):
+                            reader = _ArrayReader()
+                    elif (
+                        tag == "varray"
+                        and elem.get("name") == "kpointlist"
+                        and stack[-2:-1] == ["kpoints"]
+                        and "kpoints" in wanted
+                        and "kpoints" not in done
+                    ):
+                        target, reader = "kpoints", _ArrayReader()
+                    continue
+
+                # end event
+                stack.pop()
+                parent = stack[-1] if stack else None
+                if reader is not None:
+                    if tag in ("r", "v"):
+                        reader.rows.append(elem.text or "")
+                    elif tag == "set":
+                        reader.end_set()
+                    elif tag == "field" and target == "partial_dos":
+                        data.partial_dos_fields.append((elem.text or "").strip())
+                    elif tag in ("array", "varray"):
+                        setattr(data, target, reader.result())
+                        reader = None
+                        if target in ("kpoints", "eigenvalues"):
+                            done.add(target)
+                elif (
+                    tag == "i"
+                    and parent == "dos"
+                    and elem.get("name") == "efermi"
+                    and "efermi" not in done
+                ):
+                    data.fermi_energy = float(elem.text)
+                    done.add("efermi")
+
+                part = _PART_ENDS.get((parent, tag))
+                if part in wanted:
+                    done.add(part)
+                elem.clear()
+                if wanted <= done:
+                    break
+    except ET.ParseError:
+        if not done:
+            raise
+        # Truncated file (job still running or killed): keep the complete parts
+
+    return data
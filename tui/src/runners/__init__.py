@@ -39,6 +39,15 @@ from .slurm_runner import (
     SLURMJobState,
     SLURMSubmissionError,
     SLURMStatusError,
+    SLURMStatusAggregator,
+)
+from .file_watch import FileSubscription, FileWatcher, shared_watcher
+from .remote_stream import JobOutputStream, RemoteTailStream
+from .transfer import (
+    SFTPTransferEngine,
+    TransferError,
+    TransferReport,
+    TransferStats,
 )
 from .container_runner import (
     ContainerRunner,
@@ -86,6 +95,19 @@ __all__ = [
     "SLURMJobState",
     "SLURMSubmissionError",
     "SLURMStatusError",
+    "SLURMStatusAggregator",
+    # Local file watching
+    "FileSubscription",
+    "FileWatcher",
+    "shared_watcher",
+    # Remote output streaming
+    "JobOutputStream",
+    "RemoteTailStream",
+    # SFTP transfers
+    "SFTPTransferEngine",
+    "TransferError",
+    "TransferReport",
+    "TransferStats",
     # Container Runner
     "ContainerRunner",
     "ContainerConfig",
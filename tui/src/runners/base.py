@@ -23,7 +23,8 @@ from typing import AsyncIterator, Any, Dict, Optional, NewType
 import asyncio
 
 from ..core.codes import DFTCode, get_code_config
-
+from .staging import StagingCache
+from .transfer import SFTPTransferEngine, TransferReport
 
 # Type alias for job handles (runner-specific identifiers)
 JobHandle = NewType("JobHandle", str)
@@ -569,6 +570,9 @@ class RemoteBaseRunner(BaseRunner):
         dft_code: DFT code to run (CRYSTAL, QUANTUM_ESPRESSO, VASP)
         code_config: DFTCodeConfig for the selected DFT code
         remote_scratch_dir: Base directory for remote scratch space
+        transfer_engine: SFTPTransferEngine used for all file staging
+        last_transfer: TransferReport of the most recent upload/download
+        staging_cache: Optional StagingCache that deduplicates input uploads
     """
 
     def __init__(
@@ -578,6 +582,7 @@ class RemoteBaseRunner(BaseRunner):
         dft_code: DFTCode = DFTCode.CRYSTAL,
         remote_scratch_dir: Optional[Path] = None,
         config: Optional[RunnerConfig] = None,
+        staging_cache: Optional[StagingCache] = None,
     ):
         """
         Initialize the remote base runner.
@@ -588,6 +593,8 @@ class RemoteBaseRunner(BaseRunner):
             dft_code: DFT code to run (default: CRYSTAL for backwards compatibility)
             remote_scratch_dir: Scratch directory on remote (default: ~/dft_jobs)
             config: Optional runner configuration
+            staging_cache: Content-addressed store for reusing inputs already
+                on the cluster (default: upload everything)
         """
         super().__init__(config)
         self.connection_manager = connection_manager
@@ -595,6 +602,27 @@ class RemoteBaseRunner(BaseRunner):
         self.dft_code = dft_code
         self.code_config = get_code_config(dft_code)
         self.remote_scratch_dir = remote_scratch_dir or Path.home() / "dft_jobs"
+        self.transfer_engine = SFTPTransferEngine()
+        self.last_transfer: Optional[TransferReport] = None
+        self.staging_cache = staging_cache
+
+    async def _upload_inputs(self, conn: Any, files: list[tuple[Path, str]]) -> TransferReport:
+        """
+        Upload (local_path, remote_path) pairs for a job.
+
+        Goes through the staging cache when one is configured, so contents
+        already stored on the cluster are linked in place instead of sent.
+
+        Raises:
+            TransferError: If any file failed to upload
+        """
+        if self.staging_cache is not None:
+            report = await self.staging_cache.stage(conn, self.transfer_engine, files)
+        else:
+            report = await self.transfer_engine.upload(conn, files)
+        self.last_transfer = report
+        report.raise_for_failures()
+        return report
 
     async def _upload_files_sftp(
         self,
@@ -620,6 +648,7 @@ class RemoteBaseRunner(BaseRunner):
 
         Raises:
             FileNotFoundError: If no matching files found
+            TransferError: If any file failed to upload
         """
         import logging
 
@@ -644,17 +673,11 @@ class RemoteBaseRunner(BaseRunner):
 
         logger.info(f"Uploading {len(files_to_upload)} files to {remote_dir}")
 
-        uploaded = []
-        # Note: start_sftp_client() is a coroutine that must be awaited
-        async with await conn.start_sftp_client() as sftp:
-            for local_file in files_to_upload:
-                remote_file = f"{remote_dir}/{local_file.name}"
-                await sftp.put(str(local_file), remote_file)
-                uploaded.append(local_file.name)
-                logger.debug(f"Uploaded: {local_file.name}")
-
-        logger.info("File upload complete")
-        return uploaded
+        report = await self._upload_inputs(
+            conn,
+            [(local_file, f"{remote_dir}/{local_file.name}") for local_file in files_to_upload],
+        )
+        return report.names
 
     async def _download_files_sftp(
         self,
@@ -678,9 +701,7 @@ class RemoteBaseRunner(BaseRunner):
         Returns:
             List of downloaded file names
         """
-        import fnmatch
         import logging
-        import shlex
 
         logger = logging.getLogger(__name__)
 
@@ -702,33 +723,9 @@ class RemoteBaseRunner(BaseRunner):
 
         logger.info(f"Downloading output files from {remote_dir}")
 
-        downloaded = []
-        async with await conn.start_sftp_client() as sftp:
-            # List files in remote directory
-            remote_files = await sftp.listdir(remote_dir)
-
-            for filename in remote_files:
-                # Check if file matches our patterns using proper glob matching
-                should_download = any(fnmatch.fnmatch(filename, pattern) for pattern in patterns)
-
-                if should_download:
-                    # Security: Validate filename to prevent path traversal attacks
-                    if "/" in filename or "\\" in filename or filename in (".", ".."):
-                        logger.warning(f"Skipping file with suspicious name: {filename}")
-                        continue
-
-                    remote_path = f"{remote_dir}/{filename}"
-                    local_path = local_dir / filename
-
-                    try:
-                        await sftp.get(remote_path, str(local_path))
-                        downloaded.append(filename)
-                        logger.debug(f"Downloaded: {filename}")
-                    except Exception as e:
-                        logger.warning(f"Failed to download {filename}: {e}")
-
-        logger.info(f"File download complete ({len(downloaded)} files)")
-        return downloaded
+        report = await self.transfer_engine.download_matching(conn, remote_dir, local_dir, patterns)
+        self.last_transfer = report
+        return report.names
 
     async def _create_remote_directory(
         self,
@@ -0,0 +1,475 @@
+"""
+Shared watching of local job output files.
+
+LocalRunner.get_output used to reopen and re-read each output file every
+0.5 s for every viewer, calling get_status on each pass. FileWatcher instead
+keeps one open descriptor per watched file and wakes subscribers only when
+the file changes: through inotify on Linux (one watch per directory), or
+through a single polling task doing one stat() per file where inotify is
+unavailable or a watch cannot be added.
+
+Each FileSubscription reads the shared descriptor at its own offset with
+pread(), so the file itself is the buffer: a slow consumer queues nothing in
+memory and never holds back the others; it simply reads more at a time when
+it gets round to it. Offsets point just past the last complete line, so they
+can be handed back as resume tokens.
+
+Usage::
+
+    with shared_watcher().subscribe(work_dir / "output.out") as subscription:
+        async for line in subscription.lines(until=job_task):
+            ...
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+import sys
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Dict, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# inotify(7) event bits
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+
+# Events requested on each watched directory
+_DIR_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+)
+# Events after which the path may name a different file
+_REPLACED = IN_CREATE | IN_MOVED_TO | IN_ATTRIB
+
+# struct inotify_event header: wd, mask, cookie, len (name follows)
+_EVENT = struct.Struct("iIII")
+
+DEFAULT_POLL_INTERVAL = 0.5
+# Upper bound on bytes returned by one read_lines() call
+MAX_READ_BYTES = 1024 * 1024
+
+
+@dataclass
+class FileUpdate:
+    """Lines read by one FileSubscription.read_lines() call."""
+
+    lines: List[str] = field(default_factory=list)
+    offset: int = 0
+    reset: bool = False  # file was truncated or replaced; reading restarted at 0
+    has_more: bool = False  # stopped at max_bytes before the end of the file
+
+
+class _Inotify:
+    """Minimal ctypes binding to inotify, read from the event loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, on_events):
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1: {os.strerror(err)}")
+        self.fd = fd
+        self._loop = loop
+        self._on_events = on_events
+        loop.add_reader(fd, self._read)
+
+    def add_watch(self, directory: Path) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), _DIR_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), str(directory))
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        self._libc.inotify_rm_watch(self.fd, wd)
+
+    def close(self) -> None:
+        if not self._loop.is_closed():
+            self._loop.remove_reader(self.fd)
+        os.close(self.fd)
+
+    def _read(self) -> None:
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            logger.warning(f"Reading inotify events failed: {e}")
+            return
+
+        events = []
+        pos = 0
+        while pos + _EVENT.size <= len(data):
+            wd, mask, _cookie, length = _EVENT.unpack_from(data, pos)
+            pos += _EVENT.size
+            name = os.fsdecode(data[pos : pos + length].rstrip(b"\0"))
+            pos += length
+            events.append((wd, mask, name))
+        self._on_events(events)
+
+
+class _WatchedFile:
+    """One watched path: its shared descriptor and subscribers."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.fd: Optional[int] = None
+        self.generation = 0  # bumped whenever a different file is opened at path
+        self.signature: Optional[Tuple[int, int, int]] = None  # polling: ino, size, mtime
+        self.subscribers: Set["FileSubscription"] = set()
+
+    def stat(self) -> Optional[os.stat_result]:
+        try:
+            return os.stat(self.path)
+        except OSError:
+            return None
+
+    def refresh(self) -> None:
+        """Open the file if it appeared or was replaced by a new one."""
+        st = self.stat()
+        if st is None:
+            # Deleted: keep reading the old descriptor until a new file shows up
+            return
+        if self.fd is not None:
+            current = os.fstat(self.fd)
+            if (current.st_dev, current.st_ino) == (st.st_dev, st.st_ino):
+                return
+        try:
+            fd = os.open(self.path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+        except OSError:
+            return
+        self.close()
+        self.fd = fd
+        self.generation += 1
+
+    def notify(self) -> None:
+        for subscription in self.subscribers:
+            subscription._changed.set()
+
+    def close(self) -> None:
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+class FileSubscription:
+    """
+    A consumer's view of a watched file, reading at its own offset.
+
+    Attributes:
+        offset: Byte offset just past the last complete line returned
+        closed: True once :meth:`close` was called
+    """
+
+    def __init__(self, watcher: "FileWatcher", watched: _WatchedFile, offset: int = 0):
+        self.offset = offset
+        self.closed = False
+        self._watcher = watcher
+        self._file = watched
+        self._generation = watched.generation
+        self._changed = asyncio.Event()
+        self._changed.set()  # the first wait() returns at once
+
+    def __enter__(self) -> "FileSubscription":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def path(self) -> Path:
+        return self._file.path
+
+    def exists(self) -> bool:
+        """True once the file has been opened."""
+        return self._file.fd is not None
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the file changed since the previous wait().
+
+        Returns:
+            False on timeout or once the subscription is closed
+        """
+        if not self._changed.is_set():
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                return False
+        self._changed.clear()
+        return not self.closed
+
+    def read_lines(self, max_bytes: int = MAX_READ_BYTES, final: bool = False) -> FileUpdate:
+        """
+        Read the complete lines appended since the last call.
+
+        Args:
+            max_bytes: Upper bound on bytes read (a single longer line is
+                returned whole in slices of this size)
+            final: Also return a trailing line without a newline
+
+        Returns:
+            FileUpdate; ``offset`` is advanced past the returned lines
+        """
+        fd = self._file.fd
+        if fd is None:
+            return FileUpdate(offset=self.offset)
+
+        reset = False
+        if self._generation != self._file.generation:
+            self._generation = self._file.generation
+            self.offset = 0
+            reset = True
+        size = os.fstat(fd).st_size
+        if size < self.offset:
+            self.offset = 0
+            reset = True
+        if size == self.offset:
+            return FileUpdate(offset=self.offset, reset=reset)
+
+        data = os.pread(fd, min(size - self.offset, max_bytes), self.offset)
+        has_more = self.offset + len(data) < size
+        end = data.rfind(b"\n")
+        if (final and not has_more) or (end < 0 and has_more):
+            consumed = data
+        elif end < 0:
+            return FileUpdate(offset=self.offset, reset=reset)
+        else:
+            consumed = data[: end + 1]
+
+        self.offset += len(consumed)
+        raw = consumed.split(b"\n")
+        if consumed.endswith(b"\n"):
+            raw.pop()
+        lines = [line.decode("utf-8", errors="replace").rstrip("\r") for line in raw]
+        return FileUpdate(lines=lines, offset=self.offset, reset=reset, has_more=has_more)
+
+    async def lines(self, until: Optional[Awaitable] = None) -> AsyncIterator[str]:
+        """
+        Yield lines as they are appended to the file.
+
+        Args:
+            until: Awaitable (e.g. the job's task) after whose completion the
+                rest of the file, including an unterminated last line, is
+                yielded and iteration ends. Without it, iteration ends when
+                the subscription is closed.
+        """
+        done = asyncio.ensure_future(until) if until is not None else None
+        while True:
+            finished = self.closed or (done is not None and done.done())
+            update = self.read_lines(final=finished)
+            for line in update.lines:
+                yield line
+            if update.has_more:
+                continue
+            if finished:
+                return
+
+            waiter = asyncio.ensure_future(self.wait())
+            try:
+                await asyncio.wait(
+                    {waiter} if done is None else {waiter, done},
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+            finally:
+                waiter.cancel()
+
+    def close(self) -> None:
+        """Stop watching; a pending wait() returns False."""
+        if not self.closed:
+            self.closed = True
+            self._changed.set()
+            self._watcher._unsubscribe(self)
+
+
+class FileWatcher:
+    """
+    Watches local files for many subscribers with one descriptor per file.
+
+    The watcher binds to the running event loop on first use and releases
+    its inotify descriptor and polling task once nothing is watched.
+    """
+
+    def __init__(
+        self, poll_interval: float = DEFAULT_POLL_INTERVAL, use_inotify: Optional[bool] = None
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            poll_interval: Seconds between stat() passes over files that
+                inotify does not cover
+            use_inotify: Force inotify on or off (default: on for Linux)
+        """
+        self.poll_interval = poll_interval
+        self.use_inotify = sys.platform.startswith("linux") if use_inotify is None else use_inotify
+        self._files: Dict[Path, _WatchedFile] = {}
+        self._inotify: Optional[_Inotify] = None
+        self._watches: Dict[Path, int] = {}  # directory -> inotify watch descriptor
+        self._watch_dirs: Dict[int, Path] = {}
+        self._polled: Set[_WatchedFile] = set()
+        self._poll_task: Optional[asyncio.Task] = None
+
+    @property
+    def watched_paths(self) -> List[Path]:
+        return list(self._files)
+
+    @property
+    def polled_paths(self) -> List[Path]:
+        """Watched paths that fell back to polling."""
+        return [watched.path for watched in self._polled]
+
+    def subscribe(self, path: Union[str, Path], offset: int = 0) -> FileSubscription:
+        """
+        Start watching ``path`` (which need not exist yet).
+
+        Args:
+            path: Local file to watch
+            offset: Byte offset to start reading from
+
+        Returns:
+            FileSubscription; close it (or use it as a context manager) when done
+        """
+        path = Path(os.path.abspath(path))
+        watched = self._files.get(path)
+        if watched is None:
+            watched = self._files[path] = _WatchedFile(path)
+            watched.refresh()
+            self._watch(watched)
+        subscription = FileSubscription(self, watched, offset)
+        watched.subscribers.add(subscription)
+        return subscription
+
+    def close(self) -> None:
+        """Close all subscriptions and release every watch."""
+        for watched in list(self._files.values()):
+            for subscription in list(watched.subscribers):
+                subscription.close()
+
+    # Private methods
+
+    def _watch(self, watched: _WatchedFile) -> None:
+        directory = watched.path.parent
+        if directory in self._watches:
+            return
+        if self.use_inotify:
+            try:
+                if self._inotify is None:
+                    self._inotify = _Inotify(asyncio.get_running_loop(), self._on_events)
+                wd = self._inotify.add_watch(directory)
+                self._watches[directory] = wd
+                self._watch_dirs[wd] = directory
+                return
+            except OSError as e:
+                # Missing directory, watch limit reached, no inotify support...
+                logger.debug(f"inotify unavailable for {directory} ({e}); polling instead")
+        self._start_polling(watched)
+
+    def _start_polling(self, watched: _WatchedFile) -> None:
+        st = watched.stat()
+        watched.signature = (st.st_ino, st.st_size, st.st_mtime_ns) if st else None
+        self._polled.add(watched)
+        if self._poll_task is None:
+            self._poll_task = asyncio.get_running_loop().create_task(self._poll())
+
+    def _unsubscribe(self, subscription: FileSubscription) -> None:
+        watched = subscription._file
+        watched.subscribers.discard(subscription)
+        if watched.subscribers:
+            return
+
+        del self._files[watched.path]
+        self._polled.discard(watched)
+        watched.close()
+        directory = watched.path.parent
+        if directory in self._watches and not any(p.parent == directory for p in self._files):
+            wd = self._watches.pop(directory)
+            self._watch_dirs.pop(wd, None)
+            if self._inotify is not None:
+                self._inotify.rm_watch(wd)
+        if not self._files and self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+            self._watches.clear()
+            self._watch_dirs.clear()
+
+    def _on_events(self, events: List[Tuple[int, int, str]]) -> None:
+        """Wake the subscribers of files touched by a batch of inotify events."""
+        touched: Dict[_WatchedFile, bool] = {}
+        for wd, mask, name in events:
+            if mask & IN_Q_OVERFLOW:
+                for watched in self._files.values():
+                    touched[watched] = True
+                continue
+            directory = self._watch_dirs.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:
+                # Directory removed or unmounted: poll its files from now on
+                del self._watch_dirs[wd]
+                self._watches.pop(directory, None)
+                for watched in list(self._files.values()):
+                    if watched.path.parent == directory:
+                        self._start_polling(watched)
+                        touched[watched] = True
+                continue
+            watched = self._files.get(directory / name) if name else None
+            if watched is not None:
+                touched[watched] = touched.get(watched, False) or bool(
+                    mask & _REPLACED or watched.fd is None
+                )
+
+        for watched, replaced in touched.items():
+            if replaced:
+                watched.refresh()
+            watched.notify()
+
+    async def _poll(self) -> None:
+        """Stat polled files every poll_interval; wake subscribers on change."""
+        while self._polled:
+            await asyncio.sleep(self.poll_interval)
+            for watched in list(self._polled):
+                st = watched.stat()
+                signature = (st.st_ino, st.st_size, st.st_mtime_ns) if st else None
+                if signature != watched.signature:
+                    watched.signature = signature
+                    watched.refresh()
+                    watched.notify()
+        self._poll_task = None
+
+
+_shared: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, FileWatcher]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def shared_watcher() -> FileWatcher:
+    """The FileWatcher shared by every consumer on the running event loop."""
+    loop = asyncio.get_running_loop()
+    watcher = _shared.get(loop)
+    if watcher is None:
+        watcher = _shared[loop] = FileWatcher()
+    return watcher
@@ -17,6 +17,7 @@ from typing import Dict, Any, Optional, AsyncIterator
 from ..core.codes import DFTCode, get_code_config, get_parser, InvocationStyle
 from ..core.environment import get_crystal_config, EnvironmentError as CrystalEnvError
 from .base import BaseRunner, RunnerConfig, JobHandle, JobStatus, JobInfo, JobResult
+from .file_watch import shared_watcher
 from .exceptions import (
     ConfigurationError,
     ResourceError,
@@ -719,7 +720,8 @@ class LocalRunner(BaseRunner):
         Stream job output in real-time (BaseRunner interface).
 
         Reads the output file from the work directory, streaming
-        new lines as they are appended by the running job.
+        new lines as they are appended by the running job. The shared
+        FileWatcher wakes the stream only when the file changes.
 
         Args:
             job_handle: Job handle to stream from
@@ -741,48 +743,33 @@ class LocalRunner(BaseRunner):
         # Determine output file based on DFT code
         # Output file is written as output{ext} by run_job() (see line ~224)
         output_file = work_dir / f"output{self.code_config.output_extension}"
-
-        # Wait for output file to be created (up to 30 seconds)
-        for _ in range(30):
-            if output_file.exists():
-                break
-            await asyncio.sleep(1)
-        else:
-            yield f"⚠ Output file not found: {output_file}"
-            return
-
-        # Stream output file content
-        last_position = 0
-        while True:
-            try:
-                with open(output_file, "r") as f:
-                    f.seek(last_position)
-                    new_content = f.read()
-                    if new_content:
-                        for line in new_content.splitlines():
-                            yield line
-                        last_position = f.tell()
-
-                # Check if job is still running
-                status = await self.get_status(job_handle)
-                if status in (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED):
-                    # Final read to get any remaining content
-                    with open(output_file, "r") as f:
-                        f.seek(last_position)
-                        final_content = f.read()
-                        if final_content:
-                            for line in final_content.splitlines():
-                                yield line
+        task = self._active_jobs.get(job_handle)
+        if task is None:
+            # Job already finished and pruned: read what is there and stop
+            task = asyncio.get_running_loop().create_future()
+            task.set_result(None)
+
+        # One shared descriptor and inotify watch per file, however many viewers
+        with shared_watcher().subscribe(output_file) as subscription:
+            # Wait for output file to be created (up to 30 seconds)
+            deadline = asyncio.get_running_loop().time() + 30
+            while not subscription.exists() and not task.done():
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
                     break
-
-                await asyncio.sleep(0.5)  # Poll interval for local files
-
-            except FileNotFoundError:
-                yield f"⚠ Output file removed: {output_file}"
-                break
-            except Exception as e:
+                waiter = asyncio.ensure_future(subscription.wait(remaining))
+                await asyncio.wait({waiter, task}, return_when=asyncio.FIRST_COMPLETED)
+                waiter.cancel()
+            if not subscription.exists():
+                yield f"⚠ Output file not found: {output_file}"
+                return
+
+            # Stream appended lines until the job task finishes, then the rest
+            try:
+                async for line in subscription.lines(until=task):
+                    yield line
+            except OSError as e:
                 yield f"⚠ Error reading output: {e}"
-                break
 
     async def retrieve_results(
         self, job_handle: JobHandle, dest: Path, cleanup: Optional[bool] = None
@@ -0,0 +1,428 @@
+"""
+Offset-based streaming of remote job files over one SSH channel.
+
+Instead of a ``tail -f`` per viewer plus ``test -f``/``tail``/``ps`` round
+trips for status and progress, each remote job gets one long-lived channel
+running a small POSIX shell loop. Every ``poll_interval`` it sends the bytes
+appended to each watched file (``output.log``, ``OUTCAR``, ...) tagged with
+their offset, and when the job process has exited it drains the files one
+last time and reports the exit code on the same channel.
+
+Wire format (stdout of the remote loop), one header line per event::
+
+    @@data <file index> <offset> <length>\\n<length raw bytes>
+    @@reset <file index>          file shrank (rewritten); offset back to 0
+    @@tick                        one full pass over all files completed
+    @@exit <code | ->             process gone; no more events follow
+
+A file truncated between measuring it and reading it yields fewer bytes
+than announced; the payload is padded with NUL bytes to ``length`` so the
+framing holds, and the next pass reports the shrink with ``@@reset``.
+
+:class:`RemoteTailStream` speaks this protocol for one channel and can be
+started from any offsets, so a dropped connection resumes where it stopped.
+Files without a starting offset begin at their last ``tail_bytes`` bytes
+when that is set, so a viewer of a long-running job does not pull the whole
+file.
+
+:class:`JobOutputStream` keeps one such channel alive per job, reconnecting
+with the last offsets, and serves line subscribers, the retained tail of each
+file and the exit code to the runner.
+"""
+
+import asyncio
+import contextlib
+import logging
+import shlex
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Sequence, Set
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StreamEvent:
+    """One event read from a remote tail channel."""
+
+    kind: str  # "data", "reset", "tick" or "exit"
+    name: Optional[str] = None
+    offset: int = 0
+    data: bytes = b""
+    exit_code: Optional[int] = None
+
+
+class RemoteTailStream:
+    """
+    One SSH channel streaming appended bytes of several files in a directory.
+
+    Attributes:
+        offsets: Next unread byte offset per file name, advanced as data
+            events are yielded; pass it back in to resume after a reconnect
+    """
+
+    def __init__(
+        self,
+        work_dir: str,
+        files: Sequence[str],
+        pid: Optional[int] = None,
+        offsets: Optional[Dict[str, int]] = None,
+        poll_interval: float = 1.0,
+        tail_bytes: Optional[int] = None,
+    ):
+        """
+        Initialize the stream.
+
+        Args:
+            work_dir: Remote directory holding the files
+            files: File names (relative to work_dir) to stream
+            pid: Job process to watch; without it the job is considered
+                finished once ``.exit_code`` exists
+            offsets: Starting offset per file (default: from the beginning,
+                or ``tail_bytes`` before the end)
+            poll_interval: Seconds between passes over the files
+            tail_bytes: Start files without an offset this many bytes
+                before their current end (files that do not exist yet
+                start at 0)
+        """
+        self.work_dir = work_dir
+        self.files = list(files)
+        self.pid = pid
+        self.offsets = {name: offsets[name] for name in self.files if name in (offsets or {})}
+        self.poll_interval = poll_interval
+        self.tail_bytes = tail_bytes
+
+    def build_command(self) -> str:
+        """Remote shell loop implementing the wire format."""
+        if self.pid is not None:
+            alive = f"kill -0 {int(self.pid)} 2>/dev/null"
+        else:
+            alive = "[ ! -f .exit_code ]"
+
+        lines = [f"cd {shlex.quote(self.work_dir)} || exit 1"]
+        for i, name in enumerate(self.files):
+            if name in self.offsets:
+                lines.append(f"o{i}={int(self.offsets[name])}")
+            elif self.tail_bytes is None:
+                lines.append(f"o{i}=0")
+            else:
+                quoted, window = shlex.quote(name), int(self.tail_bytes)
+                lines.append(
+                    f"if [ -f {quoted} ]; then s=$(($(wc -c < {quoted}))); "
+                    f"o{i}=$((s > {window} ? s - {window} : 0)); else o{i}=0; fi"
+                )
+        lines += ["while :; do", f"  if {alive}; then alive=1; else alive=0; fi"]
+        for i, name in enumerate(self.files):
+            quoted = shlex.quote(name)
+            lines += [
+                f"  if [ -f {quoted} ]; then",
+                f"    s=$(($(wc -c < {quoted})))",
+                f'    if [ "$s" -lt "$o{i}" ]; then o{i}=0; echo "@@reset {i}"; fi',
+                f'    if [ "$s" -gt "$o{i}" ]; then',
+                f"      n=$((s - o{i}))",
+                f'      echo "@@data {i} $o{i} $n"',
+                # Pad with NULs if the file was truncated after wc measured it
+                f"      {{ tail -c +$((o{i} + 1)) {quoted} | head -c $n; "
+                "dd if=/dev/zero bs=4096 count=$(( (n + 4095) / 4096 )) 2>/dev/null; } "
+                '| head -c "$n"',
+                f"      o{i}=$s",
+                "    fi",
+                "  fi",
+            ]
+        lines += [
+            '  echo "@@tick"',
+            '  if [ "$alive" = 0 ]; then',
+            "    c=$(cat .exit_code 2>/dev/null)",
+            '    echo "@@exit ${c:--}"',
+            "    exit 0",
+            "  fi",
+            f"  sleep {self.poll_interval:g}",
+            "done",
+        ]
+        return "\n".join(lines)
+
+    async def events(self, conn: Any) -> AsyncIterator[StreamEvent]:
+        """
+        Run the remote loop on ``conn`` and yield its events.
+
+        Ends after the ``exit`` event, or early if the channel closes (the
+        caller may then resume with :attr:`offsets`).
+
+        Args:
+            conn: SSH connection (asyncssh.SSHClientConnection)
+        """
+        async with conn.create_process(self.build_command(), encoding=None) as process:
+            while True:
+                header = await process.stdout.readline()
+                if not header:
+                    return
+                parts = header.decode("ascii", errors="replace").split()
+                if not parts:
+                    continue
+                kind = parts[0]
+
+                if kind == "@@data":
+                    name = self.files[int(parts[1])]
+                    offset, length = int(parts[2]), int(parts[3])
+                    try:
+                        data = await process.stdout.readexactly(length)
+                    except asyncio.IncompleteReadError:
+                        return
+                    self.offsets[name] = offset + length
+                    yield StreamEvent("data", name=name, offset=offset, data=data)
+                elif kind == "@@reset":
+                    name = self.files[int(parts[1])]
+                    self.offsets[name] = 0
+                    yield StreamEvent("reset", name=name)
+                elif kind == "@@tick":
+                    yield StreamEvent("tick")
+                elif kind == "@@exit":
+                    code = parts[1] if len(parts) > 1 else "-"
+                    exit_code = int(code) if code.lstrip("-").isdigit() else None
+                    yield StreamEvent("exit", exit_code=exit_code)
+                    return
+                else:
+                    logger.debug(f"Ignoring unexpected stream line: {header!r}")
+
+
+class JobOutputStream:
+    """
+    Keeps one remote tail channel alive for a job and fans its output out.
+
+    The channel is reconnected from the last offsets if it drops, so no
+    output is lost or repeated. Consumers either subscribe to the lines of a
+    file (:meth:`lines`) or read the retained tail (:meth:`tail`).
+
+    Attributes:
+        exit_code: Job exit code once reported (None if unknown)
+        finished: True once the job exited or the stream gave up
+        error: Last connection error if the stream gave up
+    """
+
+    def __init__(
+        self,
+        connection_manager: Any,
+        cluster_id: int,
+        work_dir: str,
+        files: Sequence[str] = ("output.log",),
+        pid: Optional[int] = None,
+        tail_lines: int = 500,
+        poll_interval: float = 1.0,
+        max_reconnects: int = 5,
+        reconnect_delay: float = 1.0,
+        tail_bytes: Optional[int] = None,
+    ):
+        """
+        Initialize the job stream (call :meth:`start` to open the channel).
+
+        Args:
+            connection_manager: ConnectionManager providing SSH connections
+            cluster_id: Cluster the job runs on
+            work_dir: Remote job directory
+            files: File names to stream
+            pid: Job process ID
+            tail_lines: Complete lines retained per file for :meth:`tail`
+            poll_interval: Seconds between remote passes over the files
+            max_reconnects: Consecutive failed reconnects before giving up
+            reconnect_delay: First reconnect backoff in seconds (doubles,
+                capped at 30s)
+            tail_bytes: Start each file this many bytes before its end
+                instead of at the beginning (the partial first line is
+                dropped)
+        """
+        self.connection_manager = connection_manager
+        self.cluster_id = cluster_id
+        self.work_dir = work_dir
+        self.files = list(files)
+        self.pid = pid
+        self.poll_interval = poll_interval
+        self.max_reconnects = max_reconnects
+        self.reconnect_delay = reconnect_delay
+        self.tail_bytes = tail_bytes
+
+        # Next unread offset per file; absent until the first data event
+        self.offsets: Dict[str, int] = {}
+        self.exit_code: Optional[int] = None
+        self.finished = False
+        self.error: Optional[BaseException] = None
+
+        self._tails: Dict[str, Deque[str]] = {name: deque(maxlen=tail_lines) for name in self.files}
+        self._partial: Dict[str, bytes] = dict.fromkeys(self.files, b"")
+        # Files that started mid-line: drop bytes up to the first newline
+        self._resync: Set[str] = set()
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {name: [] for name in self.files}
+        self._exited = False
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Open the channel in a background task (no-op if already running)."""
+        if self._task is None and not self.finished:
+            self._task = asyncio.create_task(
+                self._run(), name=f"job_stream_{self.cluster_id}_{self.work_dir}"
+            )
+
+    async def stop(self) -> None:
+        """Close the channel and end all subscriptions."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._finish()
+
+    def close(self) -> None:
+        """Like :meth:`stop`, but without waiting for the channel to close."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._finish()
+
+    async def wait_ready(self, timeout: float = 10.0) -> bool:
+        """Wait for the first full pass over the files; False on timeout."""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    @property
+    def has_subscribers(self) -> bool:
+        """True while any :meth:`lines` consumer is attached."""
+        return any(self._subscribers.values())
+
+    def seen(self, name: str) -> bool:
+        """True if any bytes of ``name`` have been received."""
+        return self.offsets.get(name, 0) > 0 or bool(self._partial.get(name))
+
+    def tail(self, name: str, lines: Optional[int] = None) -> str:
+        """Retained last lines of ``name`` (plus any incomplete last line)."""
+        retained = list(self._tails.get(name, ()))
+        partial = self._partial.get(name, b"")
+        if partial:
+            retained.append(partial.decode(errors="replace"))
+        if lines is not None:
+            retained = retained[-lines:]
+        return "\n".join(retained)
+
+    async def lines(self, name: str = "output.log", replay: bool = True) -> AsyncIterator[str]:
+        """
+        Yield lines of ``name`` as they arrive, until the job finishes.
+
+        Args:
+            name: Streamed file name
+            replay: Start with the retained tail instead of only new lines
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        if replay:
+            for line in self._tails[name]:
+                queue.put_nowait(line)
+        if self.finished:
+            partial = self._partial.get(name, b"")
+            if partial:
+                queue.put_nowait(partial.decode(errors="replace"))
+            queue.put_nowait(None)
+        else:
+            self._subscribers[name].append(queue)
+            self.start()
+
+        try:
+            while True:
+                line = await queue.get()
+                if line is None:
+                    return
+                yield line
+        finally:
+            if queue in self._subscribers[name]:
+                self._subscribers[name].remove(queue)
+
+    # Private methods
+
+    async def _run(self) -> None:
+        """Hold the channel open, reconnecting from the last offsets."""
+        failures = 0
+        try:
+            while not self._exited:
+                stream = RemoteTailStream(
+                    self.work_dir,
+                    self.files,
+                    pid=self.pid,
+                    offsets=self.offsets,
+                    poll_interval=self.poll_interval,
+                    tail_bytes=self.tail_bytes,
+                )
+                try:
+                    async with self.connection_manager.get_connection(self.cluster_id) as conn:
+                        async for event in stream.events(conn):
+                            failures = 0
+                            self._handle(event)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    failures += 1
+                    self.error = e
+                    if failures > self.max_reconnects:
+                        logger.error(f"Giving up output stream for {self.work_dir}: {e}")
+                        return
+                    logger.warning(
+                        f"Output stream for {self.work_dir} dropped ({e}); "
+                        f"resuming at {self.offsets}"
+                    )
+                    await asyncio.sleep(self._backoff(failures))
+                    continue
+                if not self._exited:
+                    # Channel closed without an exit report: resume
+                    failures += 1
+                    if failures > self.max_reconnects:
+                        return
+                    await asyncio.sleep(self._backoff(failures))
+            self.error = None
+        finally:
+            self._finish()
+
+    def _backoff(self, failures: int) -> float:
+        return min(self.reconnect_delay * 2.0 ** (failures - 1), 30.0)
+
+    def _handle(self, event: StreamEvent) -> None:
+        """Apply one channel event to the buffers and subscribers."""
+        if event.kind == "data":
+            data = event.data
+            if event.name not in self.offsets and event.offset > 0:
+                self._resync.add(event.name)
+            self.offsets[event.name] = event.offset + len(data)
+            if event.name in self._resync:
+                newline = data.find(b"\n")
+                if newline < 0:
+                    return
+                data = data[newline + 1 :]
+                self._resync.discard(event.name)
+            buffer = self._partial[event.name] + data
+            *complete, self._partial[event.name] = buffer.split(b"\n")
+            for raw in complete:
+                self._emit(event.name, raw.rstrip(b"\r").decode(errors="replace"))
+        elif event.kind == "reset":
+            self.offsets[event.name] = 0
+            self._partial[event.name] = b""
+            self._resync.discard(event.name)
+            self._tails[event.name].clear()
+        elif event.kind == "tick":
+            self._ready.set()
+        elif event.kind == "exit":
+            self.exit_code = event.exit_code
+            self._exited = True
+
+    def _emit(self, name: str, line: str) -> None:
+        self._tails[name].append(line)
+        for queue in self._subscribers[name]:
+            queue.put_nowait(line)
+
+    def _finish(self) -> None:
+        """Mark the stream finished and release waiters and subscribers."""
+        if self.finished:
+            return
+        self.finished = True
+        self._ready.set()
+        for name, queues in self._subscribers.items():
+            partial = self._partial[name]
+            for queue in queues:
+                if partial:
+                    queue.put_nowait(partial.decode(errors="replace"))
+                queue.put_nowait(None)
@@ -28,6 +28,8 @@ from .exceptions import (
     ConnectionError as RunnerConnectionError,
     SSHRunnerError,
 )
+from .remote_stream import JobOutputStream
+from .staging import StagingCache
 from ..core.codes import DFTCode, get_code_config, get_parser, InvocationStyle
 from ..core.connection_manager import ConnectionManager
 
@@ -38,6 +40,13 @@ logger = logging.getLogger(__name__)
 # Prevents command injection when element is used in shell commands
 _ELEMENT_PATTERN = re.compile(r"^[A-Z][a-z]?$")
 
+# Output streams open at once per runner; each holds a pooled SSH channel
+_MAX_STREAMS = 16
+
+# Streams start this far before the end of each file: enough for the
+# 500-line tails the viewers and progress parser use
+_STREAM_TAIL_BYTES = 256 * 1024
+
 
 class SSHRunner(RemoteBaseRunner):
     """
@@ -83,6 +92,7 @@ class SSHRunner(RemoteBaseRunner):
         remote_dft_root: Optional[Path] = None,
         remote_scratch_dir: Optional[Path] = None,
         cleanup_on_success: bool = False,
+        staging_cache: Optional[StagingCache] = None,
     ):
         """
         Initialize the SSH runner.
@@ -94,6 +104,9 @@ class SSHRunner(RemoteBaseRunner):
             remote_dft_root: DFT software root directory on remote (default: ~/CRYSTAL23 for CRYSTAL)
             remote_scratch_dir: Scratch directory on remote (default: ~/dft_jobs)
             cleanup_on_success: Whether to remove remote directory after successful job
+            staging_cache: Content-addressed store for inputs shared between
+                jobs (e.g. EOS or convergence scans); unchanged files are
+                linked from the cluster instead of uploaded again
 
         Raises:
             ValueError: If cluster is not registered
@@ -104,6 +117,7 @@ class SSHRunner(RemoteBaseRunner):
             cluster_id=cluster_id,
             dft_code=dft_code,
             remote_scratch_dir=remote_scratch_dir,
+            staging_cache=staging_cache,
         )
 
         # Set default remote root based on DFT code
@@ -120,6 +134,8 @@ class SSHRunner(RemoteBaseRunner):
         self._active_jobs: Dict[str, Dict[str, Any]] = {}
         # Track slot monitor tasks: job_handle -> asyncio.Task
         self._slot_monitors: Dict[str, asyncio.Task] = {}
+        # Remote output channels: job_handle -> JobOutputStream
+        self._streams: Dict[str, JobOutputStream] = {}
 
         # Validate cluster is registered
         if cluster_id not in connection_manager._configs:
@@ -318,6 +334,12 @@ class SSHRunner(RemoteBaseRunner):
         # Parse job handle
         cluster_id, pid, remote_work_dir = self._parse_job_handle(job_handle)
 
+        # The job's output stream already saw the process exit: no round trip
+        stream = self._streams.get(job_handle)
+        if stream is not None and stream.finished and stream.exit_code is not None:
+            job_info["status"] = JobStatus.COMPLETED if stream.exit_code == 0 else JobStatus.FAILED
+            return job_info["status"]
+
         try:
             async with self.connection_manager.get_connection(cluster_id) as conn:
                 # Validate PID is an integer
@@ -494,7 +516,10 @@ class SSHRunner(RemoteBaseRunner):
         """
         Stream job output in real-time.
 
-        Uses tail -f to stream the output.log file from the remote machine.
+        Lines come from the job's output stream: one long-lived SSH channel
+        that sends appended bytes of output.log by offset and reports the
+        process exit on the same channel, so no status polling is needed.
+        Streaming ends when the job exits.
 
         Args:
             job_handle: Handle returned by submit_job()
@@ -505,63 +530,17 @@ class SSHRunner(RemoteBaseRunner):
         Raises:
             JobNotFoundError: If job_handle is invalid
         """
-        job_info = self._active_jobs.get(job_handle)
-        if not job_info:
-            raise JobNotFoundError(f"Job handle not found: {job_handle}")
+        stream = self._get_stream(job_handle)
 
-        cluster_id, pid, remote_work_dir = self._parse_job_handle(job_handle)
-        # Properly escape the output file path
-        quoted_work_dir = shlex.quote(remote_work_dir)
-        output_file = f"{quoted_work_dir}/output.log"
+        async for line in stream.lines("output.log"):
+            yield line
 
-        try:
-            async with self.connection_manager.get_connection(cluster_id) as conn:
-                # Wait for output file to be created
-                for _ in range(30):  # Wait up to 30 seconds
-                    check_cmd = f"test -f {output_file} && echo exists"
-                    result = await conn.run(check_cmd, check=False)
-                    if "exists" in result.stdout:
-                        break
-                    await asyncio.sleep(1.0)
-                else:
-                    logger.warning(
-                        f"Output file not found after 30 seconds: {remote_work_dir}/output.log"
-                    )
-                    yield "⚠ Output file not created yet\n"
-                    return
-
-                # Stream output using tail -f
-                # Note: tail -f will continue until the process exits
-                tail_cmd = f"tail -f {output_file}"
-                async with conn.create_process(tail_cmd) as process:
-                    if process.stdout:
-                        # Debounce status checks to avoid per-line overhead
-                        # Only check status every 5 seconds, not every line
-                        last_status_check = 0.0
-                        status_check_interval = 5.0  # seconds
-
-                        async for line in process.stdout:
-                            yield line.strip()
-
-                            # Check if job has finished (with debounce)
-                            now = time.time()
-                            if now - last_status_check >= status_check_interval:
-                                last_status_check = now
-                                status = await self.get_status(job_handle)
-                                if status in (
-                                    JobStatus.COMPLETED,
-                                    JobStatus.FAILED,
-                                    JobStatus.CANCELLED,
-                                ):
-                                    # Read any remaining output
-                                    break
-
-        except asyncssh.Error as e:
-            logger.error(f"SSH error while streaming output: {e}")
-            yield f"\n✗ SSH error: {e}\n"
-        except Exception as e:
-            logger.error(f"Error streaming output: {e}")
-            yield f"\n✗ Error: {e}\n"
+        if stream.error is not None:
+            logger.error(f"Error streaming output: {stream.error}")
+            yield f"\n✗ Error: {stream.error}\n"
+        elif not stream.seen("output.log"):
+            logger.warning(f"Output file never appeared: {stream.work_dir}/output.log")
+            yield "⚠ Output file not created yet\n"
 
     async def retrieve_results(self, job_handle: str, work_dir: Path) -> JobResult:
         """
@@ -655,8 +634,9 @@ class SSHRunner(RemoteBaseRunner):
         """
         Get real-time VASP calculation progress by parsing OUTCAR.
 
-        Only applicable for VASP jobs. Downloads the last ~500 lines of OUTCAR
-        and parses current progress (ionic steps, SCF iterations, energies).
+        Only applicable for VASP jobs. Parses the last ~500 lines of OUTCAR
+        kept by the job's output stream (ionic steps, SCF iterations,
+        energies); no SSH round trip is made per call.
 
         Args:
             job_handle: Handle returned by submit_job()
@@ -681,40 +661,26 @@ class SSHRunner(RemoteBaseRunner):
         cluster_id, pid, remote_work_dir = self._parse_job_handle(job_handle)
 
         try:
-            async with self.connection_manager.get_connection(cluster_id) as conn:
-                # OUTCAR path
-                quoted_work_dir = shlex.quote(remote_work_dir)
-                outcar_path = f"{quoted_work_dir}/OUTCAR"
+            stream = self._get_stream(job_handle)
+            if not await stream.wait_ready(timeout=10):
+                logger.warning(f"Timeout while fetching VASP progress for job {pid}")
+                return None
 
-                # Check if OUTCAR exists
-                check_cmd = f"test -f {outcar_path} && echo OK"
-                result = await conn.run(check_cmd, check=False)
+            outcar_tail = stream.tail("OUTCAR", 500)
+            if not outcar_tail:
+                logger.debug(f"OUTCAR not yet created for job {pid}")
+                return None
 
-                if "OK" not in result.stdout:
-                    logger.debug(f"OUTCAR not yet created for job {pid}")
-                    return None
+            # Parse progress
+            parser = VASPProgressParser()
+            progress = parser.parse_outcar_tail(outcar_tail)
 
-                # Download last 500 lines of OUTCAR
-                tail_cmd = f"tail -500 {outcar_path}"
-                result = await conn.run(tail_cmd, check=False, timeout=10)
+            # Store progress in job info for caching
+            job_info["vasp_progress"] = progress.to_dict()
+            job_info["last_progress_update"] = time.time()
 
-                if result.exit_status != 0 or not result.stdout:
-                    logger.warning(f"Failed to read OUTCAR tail for job {pid}")
-                    return None
+            return progress
 
-                # Parse progress
-                parser = VASPProgressParser()
-                progress = parser.parse_outcar_tail(result.stdout)
-
-                # Store progress in job info for caching
-                job_info["vasp_progress"] = progress.to_dict()
-                job_info["last_progress_update"] = time.time()
-
-                return progress
-
-        except asyncio.TimeoutError:
-            logger.warning(f"Timeout while fetching VASP progress for job {pid}")
-            return None
         except Exception as e:
             logger.error(f"Error getting VASP progress: {e}")
             return None
@@ -737,6 +703,10 @@ class SSHRunner(RemoteBaseRunner):
         cluster_id, pid, remote_work_dir = self._parse_job_handle(job_handle)
 
         try:
+            stream = self._streams.pop(job_handle, None)
+            if stream is not None:
+                await stream.stop()
+
             # Cancel slot monitor if running
             monitor_task = self._slot_monitors.pop(job_handle, None)
             if monitor_task and not monitor_task.done():
@@ -779,11 +749,66 @@ class SSHRunner(RemoteBaseRunner):
             await asyncio.gather(*self._slot_monitors.values(), return_exceptions=True)
 
         self._slot_monitors.clear()
+
+        # Close remote output channels
+        await asyncio.gather(
+            *(stream.stop() for stream in self._streams.values()), return_exceptions=True
+        )
+        self._streams.clear()
         self._active_jobs.clear()
         logger.info("SSHRunner cleanup complete")
 
     # Helper methods
 
+    def _get_stream(self, job_handle: str) -> JobOutputStream:
+        """
+        Get (starting if needed) the output stream of a job.
+
+        VASP jobs also stream OUTCAR for progress parsing. A stream that gave
+        up or was stopped without seeing the job exit is replaced. At most
+        ``_MAX_STREAMS`` streams are kept: beyond that, the least recently
+        used streams without subscribers are closed to free their channels.
+
+        Raises:
+            JobNotFoundError: If job_handle is invalid
+        """
+        if job_handle not in self._active_jobs:
+            raise JobNotFoundError(f"Job handle not found: {job_handle}")
+
+        stream = self._streams.pop(job_handle, None)
+        if stream is not None and stream.finished and stream.exit_code is None:
+            stream = None
+        if stream is None:
+            cluster_id, pid, remote_work_dir = self._parse_job_handle(job_handle)
+            files = ["output.log"]
+            if self.dft_code == DFTCode.VASP:
+                files.append("OUTCAR")
+            stream = JobOutputStream(
+                self.connection_manager,
+                cluster_id,
+                remote_work_dir,
+                files=files,
+                pid=pid,
+                tail_bytes=_STREAM_TAIL_BYTES,
+            )
+        # Most recently used last
+        self._streams[job_handle] = stream
+        self._evict_idle_streams(keep=job_handle)
+        stream.start()
+        return stream
+
+    def _evict_idle_streams(self, keep: str) -> None:
+        """Close least recently used streams without subscribers above the cap."""
+        excess = len(self._streams) - _MAX_STREAMS
+        for job_handle, stream in list(self._streams.items()):
+            if excess <= 0:
+                break
+            if job_handle == keep or stream.has_subscribers:
+                continue
+            del self._streams[job_handle]
+            stream.close()
+            excess -= 1
+
     @staticmethod
     def _validate_pid(pid: Any) -> int:
         """
@@ -1000,12 +1025,10 @@ exit $EXIT_CODE
 
         logger.info(f"Uploading {len(files_to_upload)} files to {remote_dir}")
 
-        # Note: start_sftp_client() is a coroutine that must be awaited
-        async with await conn.start_sftp_client() as sftp:
-            for local_file in files_to_upload:
-                remote_file = str(remote_dir / local_file.name)
-                await sftp.put(str(local_file), remote_file)
-                logger.debug(f"Uploaded: {local_file.name}")
+        await self._upload_inputs(
+            conn,
+            [(local_file, str(remote_dir / local_file.name)) for local_file in files_to_upload],
+        )
 
         # VASP-specific: Retrieve POTCAR from cluster
         if self.dft_code == DFTCode.VASP:
@@ -1175,35 +1198,9 @@ exit $EXIT_CODE
 
         logger.info(f"Downloading output files from {remote_dir}")
 
-        async with await conn.start_sftp_client() as sftp:
-            # List files in remote directory
-            remote_files = await sftp.listdir(remote_dir)
-
-            import fnmatch
-
-            for filename in remote_files:
-                # Check if file matches our patterns using proper glob matching
-                should_download = any(
-                    fnmatch.fnmatch(filename, pattern) for pattern in output_files
-                )
-
-                if should_download:
-                    # Security: Validate filename to prevent path traversal attacks
-                    # Only allow filenames without path separators
-                    if "/" in filename or "\\" in filename or filename in (".", ".."):
-                        logger.warning(f"Skipping file with suspicious name: {filename}")
-                        continue
-
-                    # Use PurePosixPath for SFTP paths (not shlex.quote - SFTP is not shell)
-                    remote_file = str(PurePosixPath(remote_dir) / filename)
-                    local_file = local_dir / filename
-                    try:
-                        await sftp.get(remote_file, str(local_file))
-                        logger.debug(f"Downloaded: {filename}")
-                    except Exception as e:
-                        logger.warning(f"Failed to download {filename}: {e}")
-
-        logger.info("File download complete")
+        self.last_transfer = await self.transfer_engine.download_matching(
+            conn, remote_dir, local_dir, output_files
+        )
 
     async def _parse_results(self, output_file: Path, status: str) -> JobResult:
         """
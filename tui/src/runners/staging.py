@@ -0,0 +1,319 @@
+"""
+Content-addressed staging of input files on remote clusters.
+
+Convergence scans and EOS series submit many jobs that share large inputs
+(basis sets, pseudopotentials). StagingCache keeps one copy of each file
+content per cluster in an object directory named by its SHA-256 digest and
+places it into new job directories with a server-side hard link (or copy)
+instead of uploading it again. Restart files (WAVECAR, CHGCAR, fort.9) are
+usually unique to one job, so by default they are uploaded directly and
+never stored.
+
+The local database indexes which digests each cluster holds, and
+:meth:`StagingCache.collect_garbage` removes objects that have not been used
+recently; ``stage`` runs it every ``gc_interval`` seconds. Job directories
+never depend on the store: objects are hard linked or copied, so collecting
+one does not affect jobs that used it.
+
+Remote snippets are run through ``sh -c``, so they do not depend on the
+login shell of the cluster account (csh/tcsh have no ``{ ...; }`` grouping).
+"""
+
+import asyncio
+import logging
+import shlex
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .transfer import MiB, SFTPTransferEngine, TransferReport, TransferStats, _sha256_file
+
+if TYPE_CHECKING:
+    from ..core.database import Database
+
+
+logger = logging.getLogger(__name__)
+
+# Object directory, relative to the remote home directory
+OBJECTS_DIR = ".crystalmath/objects"
+
+# Restart files the DFT codes rewrite in place. They are not stored by
+# default; when a cache is configured to store them, they are copied out of
+# the store on the server rather than hard linked, so the stored object is
+# never modified by a running job.
+REWRITTEN_INPUTS = frozenset({"WAVECAR", "CHGCAR", "CHG", "fort.9"})
+
+
+@dataclass
+class _StagedFile:
+    """A large input file and its content digest."""
+
+    local: Path
+    remote: str
+    digest: str
+    size: int
+
+
+class StagingCache:
+    """
+    Per-cluster content-addressed store for job input files.
+
+    Files smaller than ``min_size`` are always uploaded directly; hashing
+    and indexing them costs more than sending them. So are files named in
+    ``exclude_names``.
+    """
+
+    def __init__(
+        self,
+        database: "Database",
+        cluster_id: int,
+        remote_root: str = OBJECTS_DIR,
+        min_size: int = 64 * 1024,
+        copy_names: Iterable[str] = REWRITTEN_INPUTS,
+        exclude_names: Iterable[str] = REWRITTEN_INPUTS,
+        gc_interval: Optional[float] = 24 * 3600,
+        gc_max_age_days: float = 30.0,
+        gc_max_total_bytes: Optional[int] = None,
+    ):
+        """
+        Initialize the staging cache.
+
+        Args:
+            database: Database holding the staged object index
+            cluster_id: Cluster whose object store this cache manages
+            remote_root: Remote object directory (relative paths are
+                resolved against the remote home directory)
+            min_size: Smallest file size worth deduplicating
+            copy_names: File names staged by server-side copy instead of a
+                hard link, because the job rewrites them in place
+            exclude_names: File names always uploaded directly and never
+                stored (restart files rarely repeat between jobs)
+            gc_interval: Seconds between garbage collections run by
+                ``stage``; None disables them
+            gc_max_age_days: ``max_age_days`` for those collections
+            gc_max_total_bytes: ``max_total_bytes`` for those collections
+        """
+        self.database = database
+        self.cluster_id = cluster_id
+        self.remote_root = PurePosixPath(remote_root)
+        self.min_size = min_size
+        self.copy_names = frozenset(copy_names)
+        self.exclude_names = frozenset(exclude_names)
+        self.gc_interval = gc_interval
+        self.gc_max_age_days = gc_max_age_days
+        self.gc_max_total_bytes = gc_max_total_bytes
+        self._last_gc: Optional[float] = None
+        # (path, size, mtime_ns) -> digest, so scans do not rehash shared files
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+        # digest -> set once the stage() call uploading it has finished
+        self._inflight: Dict[str, asyncio.Event] = {}
+
+    async def stage(
+        self, conn: Any, engine: SFTPTransferEngine, files: Sequence[Tuple[Path, str]]
+    ) -> TransferReport:
+        """
+        Place local files at remote paths, uploading only unseen contents.
+
+        Args:
+            conn: SSH connection (asyncssh.SSHClientConnection)
+            engine: Transfer engine used for the files that must be sent
+            files: (local_path, remote_path) pairs
+
+        Returns:
+            TransferReport; files placed from the store have ``deduplicated``
+            set and no bytes transferred
+        """
+        started = time.perf_counter()
+
+        direct: List[Tuple[Path, str]] = []
+        candidates: List[Tuple[Path, str, int]] = []
+        for local, remote in files:
+            size = local.stat().st_size if local.exists() else 0
+            if size < self.min_size or local.name in self.exclude_names:
+                direct.append((local, remote))
+            else:
+                candidates.append((local, remote, size))
+
+        digests = await asyncio.gather(*(self._digest(local) for local, _, _ in candidates))
+        entries = [
+            _StagedFile(local, remote, digest, size)
+            for (local, remote, size), digest in zip(candidates, digests, strict=True)
+        ]
+
+        known = self.database.get_staged_objects(
+            self.cluster_id, sorted({entry.digest for entry in entries})
+        )
+        hits = [entry for entry in entries if entry.digest in known]
+        linked = await self._link_from_store(conn, hits)
+
+        # Indexed but gone from the cluster (e.g. scratch purge): forget them
+        stale = {entry.digest for entry in hits if entry.remote not in linked}
+        if stale:
+            logger.info(
+                f"Dropping {len(stale)} staged objects missing on cluster {self.cluster_id}"
+            )
+            self.database.delete_staged_objects(self.cluster_id, sorted(stale))
+
+        # Contents another job on this cache is uploading right now (parallel
+        # scan submissions): wait for it instead of sending them again
+        waiting = [e for e in entries if e.remote not in linked and e.digest in self._inflight]
+        if waiting:
+            await asyncio.gather(*(self._inflight[d].wait() for d in {e.digest for e in waiting}))
+            linked |= await self._link_from_store(conn, waiting)
+
+        misses = [entry for entry in entries if entry.remote not in linked]
+        claimed = {entry.digest for entry in misses} - set(self._inflight)
+        for digest in claimed:
+            self._inflight[digest] = asyncio.Event()
+        try:
+            report = await engine.upload(
+                conn, direct + [(entry.local, entry.remote) for entry in misses]
+            )
+            sent = set(report.names)
+            stored = await self._add_to_store(conn, [e for e in misses if e.local.name in sent])
+            reused = [entry for entry in entries if entry.remote in linked]
+            self.database.record_staged_objects(
+                self.cluster_id, {entry.digest: entry.size for entry in reused + stored}
+            )
+        finally:
+            for digest in claimed:
+                self._inflight.pop(digest).set()
+
+        report.files.extend(
+            TransferStats(
+                name=entry.local.name, direction="upload", size=entry.size, deduplicated=True
+            )
+            for entry in reused
+        )
+        report.elapsed = time.perf_counter() - started
+        logger.info(f"Staged inputs on cluster {self.cluster_id}: {report.summary()}")
+
+        if entries:
+            await self._collect_garbage_if_due(conn)
+        return report
+
+    async def collect_garbage(
+        self,
+        conn: Any,
+        max_age_days: float = 30.0,
+        max_total_bytes: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Remove stored objects that were not used recently.
+
+        Objects unused for ``max_age_days`` are removed, then least recently
+        used ones until the store fits in ``max_total_bytes``. Only objects in
+        this database's index are considered.
+
+        Args:
+            conn: SSH connection (asyncssh.SSHClientConnection)
+            max_age_days: Remove objects unused for longer than this
+            max_total_bytes: Optional size budget for the whole store
+
+        Returns:
+            Digests of the removed objects
+        """
+        objects = self.database.list_staged_objects(self.cluster_id)
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=max_age_days)).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+        total = sum(obj.size for obj in objects)
+
+        victims = []
+        for obj in objects:  # least recently used first
+            expired = (obj.last_used_at or "") < cutoff
+            over_budget = max_total_bytes is not None and total > max_total_bytes
+            if not (expired or over_budget):
+                break
+            victims.append(obj.digest)
+            total -= obj.size
+
+        if not victims:
+            return []
+
+        paths = " ".join(shlex.quote(str(self.remote_root / digest)) for digest in victims)
+        result = await conn.run(f"rm -f {paths}", check=False)
+        if result.exit_status != 0:
+            logger.warning(
+                f"Staging cache cleanup failed on cluster {self.cluster_id}: {result.stderr}"
+            )
+            return []
+
+        self.database.delete_staged_objects(self.cluster_id, victims)
+        logger.info(
+            f"Removed {len(victims)} staged objects from cluster {self.cluster_id} "
+            f"({total / MiB:.1f} MiB left)"
+        )
+        return victims
+
+    # Private methods
+
+    async def _collect_garbage_if_due(self, conn: Any) -> None:
+        """Run collect_garbage when gc_interval has passed since the last run."""
+        if self.gc_interval is None:
+            return
+        now = time.monotonic()
+        if self._last_gc is not None and now - self._last_gc < self.gc_interval:
+            return
+        self._last_gc = now
+        try:
+            await self.collect_garbage(conn, self.gc_max_age_days, self.gc_max_total_bytes)
+        except Exception as e:
+            logger.warning(f"Staging cache cleanup failed on cluster {self.cluster_id}: {e}")
+
+    async def _digest(self, path: Path) -> str:
+        """SHA-256 of a local file, memoized on (path, size, mtime)."""
+        st = path.stat()
+        key = (str(path.resolve()), st.st_size, st.st_mtime_ns)
+        digest = self._digests.get(key)
+        if digest is None:
+            digest = await asyncio.to_thread(_sha256_file, path)
+            self._digests[key] = digest
+        return digest
+
+    def _place_cmd(self, source: str, dest: str, name: str) -> str:
+        """Shell snippet placing source at dest by hard link or copy."""
+        if name in self.copy_names:
+            return f"cp -f {source} {dest}"
+        # Hard links fail across filesystems; copying is still server-side
+        return f"{{ ln -f {source} {dest} 2>/dev/null || cp -f {source} {dest}; }}"
+
+    async def _run_indexed(self, conn: Any, lines: List[str]) -> Set[int]:
+        """Run one shell script whose lines echo their index on success."""
+        if not lines:
+            return set()
+        script = "\n".join(lines)
+        result = await conn.run(f"sh -c {shlex.quote(script)}", check=False)
+        done = set()
+        for token in (result.stdout or "").split():
+            if token.isdigit():
+                done.add(int(token))
+        return done
+
+    async def _link_from_store(self, conn: Any, hits: List[_StagedFile]) -> Set[str]:
+        """Place indexed objects into job directories; returns placed remote paths."""
+        lines = []
+        for index, entry in enumerate(hits):
+            obj = shlex.quote(str(self.remote_root / entry.digest))
+            dest = shlex.quote(entry.remote)
+            place = self._place_cmd(obj, dest, entry.local.name)
+            lines.append(f"[ -f {obj} ] && {place} && echo {index}")
+        done = await self._run_indexed(conn, lines)
+        return {hits[index].remote for index in done}
+
+    async def _add_to_store(self, conn: Any, uploaded: List[_StagedFile]) -> List[_StagedFile]:
+        """Copy freshly uploaded files into the object store; returns the stored ones."""
+        if not uploaded:
+            return []
+        lines = [f"mkdir -p {shlex.quote(str(self.remote_root))} || exit 0"]
+        for index, entry in enumerate(uploaded):
+            obj = str(self.remote_root / entry.digest)
+            # Write under a per-shell temporary name so concurrent stagers never
+            # expose a partial object
+            tmp = shlex.quote(obj) + ".tmp.$$"
+            place = self._place_cmd(shlex.quote(entry.remote), tmp, entry.local.name)
+            lines.append(f"{place} && mv -f {tmp} {shlex.quote(obj)} && echo {index}")
+        done = await self._run_indexed(conn, lines)
+        return [uploaded[index] for index in sorted(done)]
@@ -0,0 +1,479 @@
+"""
+Parallel, resumable SFTP file transfers for remote runners.
+
+SSHRunner and SLURMRunner stage inputs and fetch results through
+:class:`SFTPTransferEngine`, which:
+
+- Transfers several files at once over one SFTP session, so a large
+  WAVECAR, CHGCAR or fort.9 no longer holds back every small file
+- Splits files above ``chunked_threshold`` into ranged reads/writes with
+  several requests in flight
+- Writes those large files to ``<name>.part`` and, after a dropped
+  connection, resumes from the partial size on the next attempt, provided
+  the source still has the size and mtime recorded in ``<name>.part.src``
+- Optionally compares SHA-256 checksums of both ends
+- Records bytes, time and throughput for every file
+"""
+
+import asyncio
+import contextlib
+import fnmatch
+import hashlib
+import logging
+import os
+import shlex
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from .exceptions import RunnerError
+
+logger = logging.getLogger(__name__)
+
+# Suffix of partially transferred large files
+PART_SUFFIX = ".part"
+
+# Appended to a .part path for the file recording which source it belongs to
+PART_SOURCE_SUFFIX = ".src"
+
+MiB = 1024 * 1024
+
+
+class TransferError(RunnerError):
+    """
+    Raised when one or more file transfers fail.
+
+    Attributes:
+        failures: Mapping of file name -> error message
+    """
+
+    def __init__(self, message: str, failures: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.failures = failures or {}
+
+
+@dataclass
+class TransferStats:
+    """Outcome of a single file transfer."""
+
+    name: str
+    direction: str  # "upload" or "download"
+    size: int = 0
+    bytes_transferred: int = 0
+    resumed_from: int = 0
+    chunks: int = 0
+    elapsed: float = 0.0
+    deduplicated: bool = False  # placed from a remote staging cache, not sent
+    verified: Optional[bool] = None
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second moved by this transfer."""
+        return self.bytes_transferred / self.elapsed if self.elapsed > 0 else 0.0
+
+
+@dataclass
+class TransferReport:
+    """Per-file statistics and failures of one batch of transfers."""
+
+    files: List[TransferStats] = field(default_factory=list)
+    failures: Dict[str, str] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def names(self) -> List[str]:
+        """Names of the files transferred successfully."""
+        return [stats.name for stats in self.files]
+
+    @property
+    def bytes_transferred(self) -> int:
+        """Total bytes moved across all files."""
+        return sum(stats.bytes_transferred for stats in self.files)
+
+    @property
+    def throughput(self) -> float:
+        """Aggregate bytes per second over the whole batch."""
+        return self.bytes_transferred / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        """One-line human readable summary for logs."""
+        text = (
+            f"{len(self.files)} files, {self.bytes_transferred / MiB:.1f} MiB in "
+            f"{self.elapsed:.2f}s ({self.throughput / MiB:.1f} MiB/s)"
+        )
+        reused = sum(1 for stats in self.files if stats.deduplicated)
+        if reused:
+            text += f", {reused} reused from staging cache"
+        if self.failures:
+            text += f", {len(self.failures)} failed"
+        return text
+
+    def raise_for_failures(self) -> None:
+        """Raise TransferError if any file failed."""
+        if self.failures:
+            names = ", ".join(sorted(self.failures))
+            raise TransferError(f"Transfer failed for: {names}", self.failures)
+
+
+def is_safe_remote_name(filename: str) -> bool:
+    """Check that a remote directory entry cannot escape the local directory."""
+    return not ("/" in filename or "\\" in filename or filename in (".", ".."))
+
+
+class SFTPTransferEngine:
+    """
+    Concurrent, chunked and resumable file transfers over SFTP.
+
+    One engine may be shared by a runner across all of its jobs; each call
+    opens its own SFTP session on the connection it is given.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_files: int = 4,
+        chunk_size: int = 1 * MiB,
+        chunked_threshold: int = 16 * MiB,
+        max_requests_per_file: int = 8,
+        verify_checksums: bool = False,
+    ):
+        """
+        Initialize the transfer engine.
+
+        Args:
+            max_concurrent_files: Files transferred at the same time
+            chunk_size: Size of each ranged read/write for large files
+            chunked_threshold: Files at least this large are transferred in
+                chunks via a ``.part`` file and can be resumed
+            max_requests_per_file: Chunks in flight per large file
+            verify_checksums: Compare SHA-256 of both ends after each transfer
+        """
+        self.max_concurrent_files = max_concurrent_files
+        self.chunk_size = chunk_size
+        self.chunked_threshold = chunked_threshold
+        self.max_requests_per_file = max_requests_per_file
+        self.verify_checksums = verify_checksums
+
+    async def upload(self, conn: Any, files: Sequence[Tuple[Path, str]]) -> TransferReport:
+        """
+        Upload local files to remote paths.
+
+        Args:
+            conn: SSH connection (asyncssh.SSHClientConnection)
+            files: (local_path, remote_path) pairs
+
+        Returns:
+            TransferReport; failed files are listed in ``failures``
+        """
+        return await self._transfer(conn, "upload", files)
+
+    async def download(self, conn: Any, files: Sequence[Tuple[str, Path]]) -> TransferReport:
+        """
+        Download remote files to local paths.
+
+        Args:
+            conn: SSH connection (asyncssh.SSHClientConnection)
+            files: (remote_path, local_path) pairs
+
+        Returns:
+            TransferReport; failed files are listed in ``failures``
+        """
+        return await self._transfer(conn, "download", files)
+
+    async def download_matching(
+        self, conn: Any, remote_dir: str, local_dir: Path, patterns: Sequence[str]
+    ) -> TransferReport:
+        """
+        Download the files in ``remote_dir`` whose names match any glob pattern.
+
+        Entries whose names could escape ``local_dir`` are skipped.
+
+        Args:
+            conn: SSH connection (asyncssh.SSHClientConnection)
+            remote_dir: Remote directory to list
+            local_dir: Local directory to download into
+            patterns: fnmatch-style patterns
+
+        Returns:
+            TransferReport; failed files are listed in ``failures``
+        """
+        return await self._transfer(
+            conn, "download", [], listing=(remote_dir, local_dir, list(patterns))
+        )
+
+    # Private methods
+
+    async def _transfer(
+        self,
+        conn: Any,
+        direction: str,
+        files: Sequence[Tuple[Any, Any]],
+        listing: Optional[Tuple[str, Path, List[str]]] = None,
+    ) -> TransferReport:
+        """Run one batch of transfers on a single SFTP session."""
+        report = TransferReport()
+        started = time.perf_counter()
+
+        # Note: start_sftp_client() is a coroutine that must be awaited
+        async with await conn.start_sftp_client() as sftp:
+            if listing is not None:
+                files = await self._list_matching(sftp, *listing)
+
+            semaphore = asyncio.Semaphore(self.max_concurrent_files)
+            results: List[Optional[TransferStats]] = [None] * len(files)
+
+            async def transfer_one(index: int, source: Any, dest: Any) -> None:
+                name = Path(str(source)).name
+                async with semaphore:
+                    try:
+                        if direction == "upload":
+                            stats = await self._upload_one(sftp, Path(source), str(dest))
+                            local, remote = Path(source), str(dest)
+                        else:
+                            stats = await self._download_one(sftp, str(source), Path(dest))
+                            local, remote = Path(dest), str(source)
+                        if self.verify_checksums:
+                            stats.verified = await self._verify(conn, local, remote)
+                            if stats.verified is False:
+                                raise TransferError(f"Checksum mismatch for {name}")
+                        results[index] = stats
+                        logger.debug(
+                            f"{direction.capitalize()}ed {name}: "
+                            f"{stats.bytes_transferred} bytes in {stats.elapsed:.2f}s"
+                        )
+                    except Exception as e:
+                        logger.warning(f"Failed to {direction} {name}: {e}")
+                        report.failures[name] = str(e)
+
+            await asyncio.gather(
+                *(transfer_one(i, source, dest) for i, (source, dest) in enumerate(files))
+            )
+
+        report.files = [stats for stats in results if stats is not None]
+        report.elapsed = time.perf_counter() - started
+        logger.info(f"SFTP {direction} complete: {report.summary()}")
+        return report
+
+    @staticmethod
+    async def _list_matching(
+        sftp: Any, remote_dir: str, local_dir: Path, patterns: List[str]
+    ) -> List[Tuple[str, Path]]:
+        """(remote_path, local_path) pairs for matching entries of remote_dir."""
+        matches = []
+        for filename in await sftp.listdir(remote_dir):
+            if not any(fnmatch.fnmatch(filename, pattern) for pattern in patterns):
+                continue
+            # Security: Validate filename to prevent path traversal attacks
+            if not is_safe_remote_name(filename):
+                logger.warning(f"Skipping file with suspicious name: {filename}")
+                continue
+            # Use PurePosixPath for SFTP paths (not shlex.quote - SFTP is not shell)
+            matches.append((str(PurePosixPath(remote_dir) / filename), local_dir / filename))
+        return matches
+
+    async def _upload_one(self, sftp: Any, local: Path, remote: str) -> TransferStats:
+        """Upload one file, chunked and resumable when it is large."""
+        local_stat = local.stat()
+        size = local_stat.st_size
+        stats = TransferStats(name=local.name, direction="upload", size=size)
+        started = time.perf_counter()
+
+        if size < self.chunked_threshold:
+            await sftp.put(str(local), remote)
+            stats.bytes_transferred, stats.chunks = size, 1
+        else:
+            part = remote + PART_SUFFIX
+            source_file = part + PART_SOURCE_SUFFIX
+            source_id = _source_id(size, local_stat.st_mtime_ns)
+            offset = 0
+            if await sftp.exists(part) and await _read_remote_text(sftp, source_file) == source_id:
+                partial = (await sftp.stat(part)).size or 0
+                if partial <= size:
+                    offset = self._resume_offset(partial)
+            if not offset:
+                async with sftp.open(source_file, "wb") as f:
+                    await f.write(source_id.encode(), 0)
+            stats.resumed_from = offset
+
+            with open(local, "rb") as source:
+                read_lock = threading.Lock()
+
+                def read_range(pos: int, length: int) -> bytes:
+                    with read_lock:
+                        source.seek(pos)
+                        return source.read(length)
+
+                async def write_chunk(pos: int, length: int) -> Any:
+                    data = await asyncio.to_thread(read_range, pos, length)
+                    return await target.write(data, pos)
+
+                async with sftp.open(part, "r+b" if offset else "wb") as target:
+                    stats.chunks = await self._pipeline(offset, size, write_chunk)
+
+            await self._replace_remote(sftp, part, remote)
+            with contextlib.suppress(Exception):
+                await sftp.remove(source_file)
+            stats.bytes_transferred = size - offset
+
+        stats.elapsed = time.perf_counter() - started
+        return stats
+
+    async def _download_one(self, sftp: Any, remote: str, local: Path) -> TransferStats:
+        """Download one file, chunked and resumable when it is large."""
+        attrs = await sftp.stat(remote)
+        size = attrs.size
+        if not isinstance(size, int):
+            # Server did not report a size: plain sequential download
+            size = -1
+        stats = TransferStats(name=PurePosixPath(remote).name, direction="download")
+        started = time.perf_counter()
+
+        if size < self.chunked_threshold:
+            await sftp.get(remote, str(local))
+            if size < 0:
+                size = local.stat().st_size if local.exists() else 0
+            stats.size = stats.bytes_transferred = size
+            stats.chunks = 1
+        else:
+            stats.size = size
+            part = local.with_name(local.name + PART_SUFFIX)
+            source_file = part.with_name(part.name + PART_SOURCE_SUFFIX)
+            source_id = _source_id(size, attrs.mtime)
+            offset = 0
+            if part.exists() and _read_local_text(source_file) == source_id:
+                partial = part.stat().st_size
+                # Chunks are written strictly in order, so any .part is a valid prefix
+                offset = partial if partial <= size else 0
+            if not offset:
+                source_file.write_text(source_id)
+            stats.resumed_from = offset
+
+            with open(part, "r+b" if offset else "wb") as target:
+                target.truncate(offset)
+
+                def store(pos: int, data: bytes) -> None:
+                    if len(data) != min(self.chunk_size, size - pos):
+                        raise TransferError(f"Short read from {remote} at offset {pos}")
+                    target.seek(pos)
+                    target.write(data)
+
+                async with sftp.open(remote, "rb") as source:
+                    stats.chunks = await self._pipeline(
+                        offset, size, lambda pos, length: source.read(length, pos), store
+                    )
+
+            os.replace(part, local)
+            source_file.unlink(missing_ok=True)
+            stats.bytes_transferred = size - offset
+
+        stats.elapsed = time.perf_counter() - started
+        return stats
+
+    async def _pipeline(
+        self,
+        offset: int,
+        size: int,
+        request: Callable[[int, int], Awaitable[Any]],
+        complete: Optional[Callable[[int, Any], None]] = None,
+    ) -> int:
+        """
+        Issue ``request(pos, length)`` per chunk with a bounded window in flight.
+
+        Chunks are issued in order and completed (``complete(pos, result)``)
+        in order, so at most ``max_requests_per_file`` chunks past the last
+        completed one can be outstanding when a transfer is interrupted.
+
+        Returns:
+            Number of chunks transferred
+        """
+        pending: Deque[Tuple[int, asyncio.Future]] = deque()
+        chunks = 0
+
+        async def finish_oldest() -> None:
+            pos, future = pending.popleft()
+            result = await future
+            if complete is not None:
+                complete(pos, result)
+
+        try:
+            for pos in range(offset, size, self.chunk_size):
+                if len(pending) >= self.max_requests_per_file:
+                    await finish_oldest()
+                length = min(self.chunk_size, size - pos)
+                pending.append((pos, asyncio.ensure_future(request(pos, length))))
+                chunks += 1
+            while pending:
+                await finish_oldest()
+        finally:
+            for _, future in pending:
+                future.cancel()
+        return chunks
+
+    def _resume_offset(self, partial: int) -> int:
+        """
+        Safe restart offset for a remote ``.part`` file of ``partial`` bytes.
+
+        Remote writes may land out of order within the in-flight window, so
+        the last ``max_requests_per_file`` chunks are re-sent.
+        """
+        window = self.max_requests_per_file * self.chunk_size
+        return max(0, (partial - window) // self.chunk_size * self.chunk_size)
+
+    @staticmethod
+    async def _replace_remote(sftp: Any, source: str, dest: str) -> None:
+        """Rename source over dest, falling back to remove+rename."""
+        try:
+            await sftp.posix_rename(source, dest)
+        except Exception:
+            if await sftp.exists(dest):
+                await sftp.remove(dest)
+            await sftp.rename(source, dest)
+
+    @staticmethod
+    async def _verify(conn: Any, local: Path, remote: str) -> Optional[bool]:
+        """
+        Compare SHA-256 of the local and remote file.
+
+        Returns:
+            True/False for match/mismatch, None if the remote could not be hashed
+        """
+        result = await conn.run(f"sha256sum {shlex.quote(remote)}", check=False)
+        if result.exit_status != 0 or not result.stdout:
+            logger.warning(f"Could not checksum remote file {remote}: {result.stderr}")
+            return None
+        remote_digest = result.stdout.split()[0]
+        local_digest = await asyncio.to_thread(_sha256_file, local)
+        return remote_digest == local_digest
+
+
+def _source_id(size: int, mtime: Any) -> str:
+    """Identity of a transfer source, stored next to its ``.part`` file."""
+    return f"{size} {mtime}"
+
+
+async def _read_remote_text(sftp: Any, remote: str) -> Optional[str]:
+    """Contents of a small remote file, or None if it cannot be read."""
+    try:
+        async with sftp.open(remote, "rb") as f:
+            return (await f.read(4096, 0)).decode()
+    except Exception:
+        return None
+
+
+def _read_local_text(path: Path) -> Optional[str]:
+    """Contents of a small local file, or None if it cannot be read."""
+    try:
+        return path.read_text()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _sha256_file(path: Path) -> str:
+    """Hex SHA-256 digest of a local file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(MiB), b""):
+            digest.update(block)
+    return digest.hexdigest()
@@ -20,6 +20,7 @@ from ..core.environment import CrystalConfig, get_crystal_config
 from ..core.connection_manager import ConnectionManager
 from ..runners import LocalRunner, LocalRunnerError, InputFileError
 from ..runners.ssh_runner import SSHRunner
+from ..runners.staging import StagingCache
 from ..core.codes import DFTCode
 from .screens import (
     NewJobScreen,
@@ -133,6 +134,8 @@ class CrystalTUI(App):
         self._active_ssh_jobs: dict[int, tuple[SSHRunner, str]] = {}
         # Track progress monitoring tasks
         self._progress_monitors: dict[int, asyncio.Task] = {}
+        # Input staging caches (cluster_id -> cache), shared by jobs on a cluster
+        self._staging_caches: dict[int, StagingCache] = {}
 
     def compose(self) -> ComposeResult:
         """Compose the UI layout."""
@@ -960,6 +963,9 @@ class CrystalTUI(App):
                 cluster_id=cluster_id,
                 dft_code=DFTCode.VASP,
                 cleanup_on_success=False,
+                staging_cache=self._staging_caches.setdefault(
+                    cluster_id, StagingCache(self.db, cluster_id)
+                ),
             )
 
             # Find input file (POSCAR is the main input for VASP)
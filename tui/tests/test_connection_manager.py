@@ -64,7 +64,8 @@ class TestConnectionConfig:
         assert config.key_file is None
         assert config.use_agent is True
         assert config.timeout == 30
-        assert config.keepalive_interval == 60
+        assert config.keepalive_interval == 30
+        assert config.keepalive_count_max == 3
         assert config.known_hosts_file is None
         assert config.strict_host_key_checking is True
 
@@ -291,6 +292,8 @@ class TestConnectionManager:
     @patch("src.core.connection_manager.asyncssh.connect")
     async def test_get_connection_pool_limit(self, mock_connect, started_manager):
         """Test connection pool size limit."""
+        # One channel per connection, so each holder needs its own connection
+        started_manager.max_channels = 1
         await started_manager.start()
         try:
             mock_conn = mock_ssh_connection()
@@ -405,12 +408,13 @@ class TestConnectionManager:
             # Create connections
             async with started_manager.get_connection(1):
                 async with started_manager.get_connection(1):
-                    # Inside two nested contexts
+                    # Inside two nested contexts, multiplexed on one connection
                     metrics = await started_manager.get_connection_metrics(1)
 
-                    assert metrics["total_connections"] == 2
-                    assert metrics["in_use"] == 2
+                    assert metrics["total_connections"] == 1
+                    assert metrics["in_use"] == 1
                     assert metrics["available"] == 0
+                    assert metrics["active_channels"] == 2
                     assert metrics["avg_age_seconds"] >= 0
         finally:
             await started_manager.stop()
@@ -572,3 +576,120 @@ class TestConnectionManager:
 
         # Empty Path() should return empty tuple
         assert known_hosts == ()
+
+
+class TestLivenessAndMultiplexing:
+    """Test probe-free reuse, channel multiplexing and waiting for channels."""
+
+    @staticmethod
+    def counting_connection():
+        """A mock connection that counts remote commands and can be closed."""
+        conn = mock_ssh_connection()
+        conn.commands = []
+        conn.closed = False
+        run = conn.run
+
+        async def counting_run(command, *args, **kwargs):
+            conn.commands.append(command)
+            return await run(command, *args, **kwargs)
+
+        conn.run = counting_run
+        conn.is_closed = lambda: conn.closed
+        return conn
+
+    @pytest.fixture
+    def connect(self):
+        """Patch asyncssh.connect to hand out fresh counting connections."""
+        created = []
+
+        async def fake_connect(*args, **kwargs):
+            conn = self.counting_connection()
+            created.append(conn)
+            return conn
+
+        with patch("src.core.connection_manager.asyncssh.connect", side_effect=fake_connect):
+            yield created
+
+    @pytest.mark.asyncio
+    async def test_reuse_does_not_probe_recently_used_connection(self, connect):
+        """A connection that just succeeded is reused without a remote command."""
+        manager = ConnectionManager(pool_size=3)
+        manager.register_cluster(1, "test.example.com")
+
+        for _ in range(5):
+            async with manager.get_connection(1):
+                pass
+
+        assert len(connect) == 1
+        assert connect[0].commands == []
+
+    @pytest.mark.asyncio
+    async def test_idle_connection_is_probed(self, connect):
+        """Past the idle threshold a reused connection is probed once."""
+        manager = ConnectionManager(pool_size=3)
+        manager.register_cluster(1, "test.example.com")
+        async with manager.get_connection(1):
+            pass
+
+        manager._pools[1][0].last_success -= manager.PROBE_IDLE_THRESHOLD + 1
+        async with manager.get_connection(1):
+            pass
+        async with manager.get_connection(1):
+            pass
+
+        assert connect[0].commands == ["true"]
+
+    @pytest.mark.asyncio
+    async def test_closed_connection_is_replaced(self, connect):
+        """A connection closed by failed keepalives is dropped, not probed."""
+        manager = ConnectionManager(pool_size=3)
+        manager.register_cluster(1, "test.example.com")
+        async with manager.get_connection(1):
+            pass
+
+        connect[0].closed = True
+        async with manager.get_connection(1) as conn:
+            assert conn is connect[1]
+
+        assert manager._pools[1] == [manager._pools[1][0]]
+        assert manager._pools[1][0].connection is connect[1]
+        assert connect[0].commands == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_connection(self, connect):
+        """Concurrent commands run on channels of a single SSH session."""
+        manager = ConnectionManager(pool_size=3, max_channels=4)
+        manager.register_cluster(1, "test.example.com")
+        holding = asyncio.Event()
+        active = []
+
+        async def hold():
+            async with manager.get_connection(1) as conn:
+                active.append(conn)
+                if len(active) == 4:
+                    holding.set()
+                await holding.wait()
+
+        await asyncio.gather(*(hold() for _ in range(4)))
+
+        assert len(connect) == 1
+        assert manager._pools[1][0].channels == 0
+
+    @pytest.mark.asyncio
+    async def test_waiter_wakes_when_channel_released(self, connect):
+        """With the pool saturated, a waiter is handed the released channel."""
+        manager = ConnectionManager(pool_size=1, max_channels=1)
+        manager.register_cluster(1, "test.example.com")
+
+        ctx = manager.get_connection(1)
+        await ctx.__aenter__()
+        waiter = asyncio.create_task(manager._acquire_connection(1))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await ctx.__aexit__(None, None, None)
+        pooled = await asyncio.wait_for(waiter, timeout=1.0)
+
+        assert pooled.connection is connect[0]
+        assert len(connect) == 1
+        await manager._release_connection(pooled)
@@ -0,0 +1,117 @@
+"""
+Tests for the dependency-counter DAG scheduler.
+"""
+
+import pytest
+from src.core.dag import DAGScheduler, critical_path_priorities
+from src.core.dependency_utils import CircularDependencyError
+
+
+def drain(scheduler: DAGScheduler) -> list:
+    """Pop every ready node."""
+    popped = []
+    while (node_id := scheduler.pop_ready()) is not None:
+        popped.append(node_id)
+    return popped
+
+
+class TestDAGScheduler:
+    """Tests for readiness tracking."""
+
+    def test_roots_ready_in_declaration_order(self):
+        scheduler = DAGScheduler({"b": [], "a": [], "c": ["a"]})
+
+        assert scheduler.ready_count == 2
+        assert drain(scheduler) == ["b", "a"]
+        assert scheduler.pop_ready() is None
+
+    def test_node_ready_after_all_dependencies_complete(self):
+        scheduler = DAGScheduler({"a": [], "b": [], "c": ["a", "b"]})
+        drain(scheduler)
+
+        assert scheduler.complete("a") == []
+        assert scheduler.complete("b") == ["c"]
+        assert drain(scheduler) == ["c"]
+
+    def test_duplicate_dependencies_counted_once(self):
+        scheduler = DAGScheduler({"a": [], "b": ["a", "a"]})
+        drain(scheduler)
+
+        assert scheduler.complete("a") == ["b"]
+
+    def test_unknown_dependency_never_ready(self):
+        scheduler = DAGScheduler({"a": [], "b": ["a", "missing"]})
+        drain(scheduler)
+
+        assert scheduler.complete("a") == []
+        assert scheduler.pop_ready() is None
+
+    def test_fail_blocks_transitive_dependents(self):
+        deps = {"a": [], "b": ["a"], "c": ["b"], "d": ["c"], "e": []}
+        scheduler = DAGScheduler(deps)
+        drain(scheduler)
+
+        assert scheduler.fail("b") == ["c", "d"]
+        # Already blocked nodes are not reported again
+        assert scheduler.fail("c") == []
+
+    def test_blocked_node_not_queued_when_other_dependency_completes(self):
+        scheduler = DAGScheduler({"a": [], "b": [], "c": ["a", "b"]})
+        drain(scheduler)
+
+        scheduler.fail("a")
+        assert scheduler.complete("b") == []
+        assert scheduler.pop_ready() is None
+
+    def test_retry_requeues_node(self):
+        scheduler = DAGScheduler({"a": []})
+        assert scheduler.pop_ready() == "a"
+
+        scheduler.retry("a")
+
+        assert scheduler.pop_ready() == "a"
+
+    def test_priorities_order_ready_queue(self):
+        scheduler = DAGScheduler({"a": [], "b": [], "c": []}, priorities={"b": 2.0, "c": 1.0})
+
+        assert drain(scheduler) == ["b", "c", "a"]
+
+    def test_large_fan_out(self):
+        deps = {"root": []}
+        deps.update({f"n{i}": ["root"] for i in range(10000)})
+        deps["sink"] = [f"n{i}" for i in range(10000)]
+        scheduler = DAGScheduler(deps)
+        drain(scheduler)
+
+        assert len(scheduler.complete("root")) == 10000
+        for node_id in drain(scheduler):
+            scheduler.complete(node_id)
+        assert drain(scheduler) == ["sink"]
+
+
+class TestCriticalPathPriorities:
+    """Tests for critical-path priorities."""
+
+    def test_longest_path_to_sink(self):
+        deps = {"a": [], "b": ["a"], "c": ["b"], "d": ["a"]}
+
+        priorities = critical_path_priorities(deps)
+
+        assert priorities == {"a": 3.0, "b": 2.0, "c": 1.0, "d": 1.0}
+
+    def test_weights(self):
+        deps = {"a": [], "b": ["a"], "c": ["a"]}
+
+        priorities = critical_path_priorities(deps, weights={"b": 10.0})
+
+        assert priorities == {"a": 11.0, "b": 10.0, "c": 1.0}
+
+    def test_cycle_raises(self):
+        with pytest.raises(CircularDependencyError):
+            critical_path_priorities({"a": ["b"], "b": ["a"]})
+
+    def test_critical_chain_scheduled_first(self):
+        deps = {"short": [], "long": [], "long2": ["long"], "long3": ["long2"]}
+        scheduler = DAGScheduler(deps, critical_path_priorities(deps))
+
+        assert drain(scheduler) == ["long", "short"]
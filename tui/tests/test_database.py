@@ -187,6 +187,87 @@ class TestJobRetrieval:
         assert isinstance(job.status, str)
 
 
+class TestJobPagination:
+    """Tests for keyset-paginated, filtered job listing."""
+
+    def test_pages_cover_all_jobs_without_overlap(self, temp_db):
+        """Walking the cursor returns every job exactly once, newest first."""
+        job_ids = [temp_db.create_job(f"job_{i}", f"/tmp/job_{i}", "input") for i in range(7)]
+
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = temp_db.get_jobs_page(limit=3, cursor=cursor)
+            seen.extend(job.id for job in page)
+            if cursor is None:
+                break
+
+        assert seen == sorted(job_ids, reverse=True)
+
+    def test_last_page_has_no_cursor(self, temp_db):
+        """A page that reaches the end returns next_cursor=None."""
+        temp_db.create_job("only", "/tmp/only", "input")
+
+        page, cursor = temp_db.get_jobs_page(limit=5)
+        assert len(page) == 1
+        assert cursor is None
+
+    def test_filters_run_in_query(self, temp_db):
+        """Status, code, runner and workflow filters combine."""
+        a = temp_db.create_job("a", "/tmp/a", "input", dft_code="vasp", workflow_id="wf1")
+        b = temp_db.create_job("b", "/tmp/b", "input", dft_code="vasp", runner_type="slurm")
+        temp_db.create_job("c", "/tmp/c", "input")
+        temp_db.update_status(b, "RUNNING")
+
+        vasp, _ = temp_db.get_jobs_page(dft_code="vasp")
+        assert {job.id for job in vasp} == {a, b}
+
+        running, _ = temp_db.get_jobs_page(status="RUNNING", runner_type="slurm")
+        assert [job.id for job in running] == [b]
+
+        workflow, _ = temp_db.get_jobs_page(workflow_id="wf1")
+        assert [job.id for job in workflow] == [a]
+
+    def test_invalid_cursor_rejected(self, temp_db):
+        """Malformed cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            temp_db.get_jobs_page(cursor="not-a-cursor")
+
+
+class TestJobChangeFeed:
+    """Tests for the trigger-maintained job change sequence."""
+
+    def test_writes_bump_sequence(self, temp_db):
+        """Inserts, status updates and result saves each advance the sequence."""
+        start = temp_db.get_change_seq()
+        job_id = temp_db.create_job("test", "/tmp/test", "input")
+        after_insert = temp_db.get_change_seq()
+        temp_db.update_status(job_id, "RUNNING")
+        after_update = temp_db.get_change_seq()
+        temp_db.save_job_result(job_id, key_results={"energy": -1.0})
+
+        assert start < after_insert < after_update < temp_db.get_change_seq()
+
+    def test_changes_since_returns_only_touched_jobs(self, temp_db):
+        """Each changed job appears once; deletions are reported by id."""
+        a = temp_db.create_job("a", "/tmp/a", "input")
+        b = temp_db.create_job("b", "/tmp/b", "input")
+        since = temp_db.get_change_seq()
+
+        temp_db.update_status(a, "RUNNING")
+        temp_db.update_status(a, "COMPLETED")
+        with temp_db.connection() as conn:
+            with conn:
+                conn.execute("DELETE FROM jobs WHERE id = ?", (b,))
+
+        changed, deleted, seq, has_more = temp_db.get_job_changes(since)
+        assert [job.id for job in changed] == [a]
+        assert changed[0].status == "COMPLETED"
+        assert deleted == [b]
+        assert seq == temp_db.get_change_seq()
+        assert has_more is False
+
+
 class TestStatusUpdates:
     """Tests for updating job status."""
 
@@ -261,6 +342,43 @@ class TestStatusUpdates:
         assert job3.status == "COMPLETED"
         assert job3.completed_at is not None
 
+    def test_update_statuses_batch(self, temp_db):
+        """Test applying several status changes at once."""
+        running = temp_db.create_job("a", "/tmp/a", "input")
+        done = temp_db.create_job("b", "/tmp/b", "input")
+        queued = temp_db.create_job("c", "/tmp/c", "input")
+
+        changed = temp_db.update_statuses_batch(
+            {running: "RUNNING", done: "COMPLETED", queued: "QUEUED"}
+        )
+
+        assert changed == 3
+        assert temp_db.get_job(running).started_at is not None
+        assert temp_db.get_job(done).completed_at is not None
+        job = temp_db.get_job(queued)
+        assert job.status == "QUEUED"
+        assert job.started_at is None
+        assert job.completed_at is None
+
+    def test_update_statuses_batch_skips_unchanged(self, temp_db):
+        """Test that jobs already in the target status are not rewritten."""
+        job_id = temp_db.create_job("test", "/tmp/test", "input")
+        temp_db.update_status(job_id, "RUNNING", pid=42)
+        with temp_db.connection() as conn:
+            with conn:
+                conn.execute(
+                    "UPDATE jobs SET started_at = '2000-01-01 00:00:00' WHERE id = ?", (job_id,)
+                )
+
+        assert temp_db.update_statuses_batch({job_id: "RUNNING"}) == 0
+        job = temp_db.get_job(job_id)
+        assert job.started_at == "2000-01-01 00:00:00"
+        assert job.pid == 42
+
+    def test_update_statuses_batch_empty(self, temp_db):
+        """Test that an empty batch is a no-op."""
+        assert temp_db.update_statuses_batch({}) == 0
+
 
 class TestResultsUpdates:
     """Tests for updating job results."""
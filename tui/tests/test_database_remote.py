@@ -805,5 +805,73 @@ class TestBackwardCompatibility:
         assert remote_job.cluster_id == cluster_id
 
 
+class TestStagedObjects:
+    """Tests for the remote input staging cache index."""
+
+    @pytest.fixture
+    def cluster_id(self, temp_db):
+        return temp_db.create_cluster(
+            name="staging", type="ssh", hostname="hpc.example.com", username="user"
+        )
+
+    def test_record_and_lookup(self, temp_db, cluster_id):
+        """Only recorded digests of the same cluster are reported."""
+        temp_db.record_staged_objects(cluster_id, {"aaa": 100, "bbb": 200})
+        other = temp_db.create_cluster(
+            name="other", type="ssh", hostname="other.example.com", username="user"
+        )
+
+        assert temp_db.get_staged_objects(cluster_id, ["aaa", "ccc"]) == {"aaa": 100}
+        assert temp_db.get_staged_objects(other, ["aaa"]) == {}
+        assert temp_db.get_staged_objects(cluster_id, []) == {}
+
+    def test_list_is_least_recently_used_first(self, temp_db, cluster_id):
+        """Re-recording an object moves it to the end of the LRU order."""
+        temp_db.record_staged_objects(cluster_id, {"old": 1, "new": 2})
+        with temp_db.connection() as conn:
+            with conn:
+                conn.execute(
+                    "UPDATE staged_objects SET last_used_at = '2020-01-01 00:00:00' "
+                    "WHERE digest = 'old'"
+                )
+        assert [obj.digest for obj in temp_db.list_staged_objects(cluster_id)] == ["old", "new"]
+
+        with temp_db.connection() as conn:
+            with conn:
+                conn.execute(
+                    "UPDATE staged_objects SET last_used_at = '2020-01-02 00:00:00' "
+                    "WHERE digest = 'new'"
+                )
+        temp_db.record_staged_objects(cluster_id, {"old": 1})
+
+        objects = temp_db.list_staged_objects(cluster_id)
+        assert [obj.digest for obj in objects] == ["new", "old"]
+        assert objects[1].size == 1
+
+    def test_record_existing_keeps_created_at(self, temp_db, cluster_id):
+        """Re-recording a digest refreshes last use but not creation time."""
+        temp_db.record_staged_objects(cluster_id, {"aaa": 100})
+        with temp_db.connection() as conn:
+            with conn:
+                conn.execute(
+                    "UPDATE staged_objects SET created_at = '2020-01-01 00:00:00', "
+                    "last_used_at = '2020-01-01 00:00:00'"
+                )
+        temp_db.record_staged_objects(cluster_id, {"aaa": 100})
+
+        obj = temp_db.list_staged_objects(cluster_id)[0]
+        assert obj.created_at == "2020-01-01 00:00:00"
+        assert obj.last_used_at > "2020-01-01 00:00:00"
+
+    def test_delete_and_cluster_cascade(self, temp_db, cluster_id):
+        """Objects can be dropped individually and go away with their cluster."""
+        temp_db.record_staged_objects(cluster_id, {"aaa": 1, "bbb": 2})
+        temp_db.delete_staged_objects(cluster_id, ["aaa"])
+        assert [obj.digest for obj in temp_db.list_staged_objects(cluster_id)] == ["bbb"]
+
+        temp_db.delete_cluster(cluster_id)
+        assert temp_db.list_staged_objects(cluster_id) == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
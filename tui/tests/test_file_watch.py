@@ -0,0 +1,188 @@
+"""
+Tests for the shared local file watcher.
+
+Every behaviour is checked against both the inotify backend (on Linux) and
+the polling fallback.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.runners.file_watch import FileWatcher, shared_watcher
+
+BACKENDS = [
+    pytest.param(
+        True,
+        id="inotify",
+        marks=pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only"),
+    ),
+    pytest.param(False, id="polling"),
+]
+
+
+@pytest.fixture(params=BACKENDS)
+def watcher(request):
+    watcher = FileWatcher(poll_interval=0.02, use_inotify=request.param)
+    yield watcher
+    watcher.close()
+
+
+def append(path: Path, text: str) -> None:
+    with open(path, "a") as f:
+        f.write(text)
+
+
+async def next_lines(subscription, timeout: float = 2.0):
+    """Wait for the next change and read the complete lines it added."""
+    assert await subscription.wait(timeout)
+    return subscription.read_lines().lines
+
+
+class TestFileWatcher:
+    """Tests for FileWatcher and FileSubscription."""
+
+    async def test_wakes_on_append_and_holds_partial_line(self, watcher, tmp_path):
+        log = tmp_path / "output.out"
+        log.write_text("SCF 1\n")
+
+        with watcher.subscribe(log) as subscription:
+            assert await next_lines(subscription) == ["SCF 1"]
+            assert not await subscription.wait(timeout=0.1)
+
+            append(log, "SCF 2\nSCF")
+            assert await next_lines(subscription) == ["SCF 2"]
+            assert subscription.offset == len("SCF 1\nSCF 2\n")
+
+            append(log, " 3\n")
+            assert await next_lines(subscription) == ["SCF 3"]
+
+    async def test_file_created_after_subscribe(self, watcher, tmp_path):
+        log = tmp_path / "output.out"
+
+        with watcher.subscribe(log) as subscription:
+            await subscription.wait(0)
+            assert not subscription.exists()
+
+            log.write_text("started\n")
+            assert await next_lines(subscription) == ["started"]
+            assert subscription.exists()
+
+    async def test_subscribers_share_one_descriptor(self, watcher, tmp_path):
+        log = tmp_path / "output.out"
+        log.write_text("a\n")
+
+        subscriptions = [watcher.subscribe(log) for _ in range(3)]
+        assert watcher.watched_paths == [log]
+
+        append(log, "b\n")
+        for subscription in subscriptions:
+            assert await subscription.wait(2)
+        # Each reads at its own offset from the shared descriptor
+        assert subscriptions[0].read_lines().lines == ["a", "b"]
+        append(log, "c\n")
+        await subscriptions[0].wait(2)
+        assert subscriptions[0].read_lines().lines == ["c"]
+        assert subscriptions[1].read_lines().lines == ["a", "b", "c"]
+
+        for subscription in subscriptions:
+            subscription.close()
+        assert watcher.watched_paths == []
+        assert watcher._inotify is None
+
+    async def test_slow_subscriber_reads_in_bounded_chunks(self, watcher, tmp_path):
+        log = tmp_path / "output.out"
+        log.write_text("".join(f"line {i:04d}\n" for i in range(1000)))
+
+        with watcher.subscribe(log) as subscription:
+            update = subscription.read_lines(max_bytes=100)
+            assert update.has_more
+            assert update.lines == [f"line {i:04d}" for i in range(10)]
+
+            lines = update.lines
+            while update.has_more:
+                update = subscription.read_lines(max_bytes=4096)
+                lines += update.lines
+            assert len(lines) == 1000
+
+    async def test_truncated_file_is_read_from_start(self, watcher, tmp_path):
+        log = tmp_path / "output.out"
+        log.write_text("old run\n" * 10)
+
+        with watcher.subscribe(log) as subscription:
+            await next_lines(subscription)
+            log.write_text("new run\n")
+
+            assert await subscription.wait(2)
+            update = subscription.read_lines()
+            assert update.reset
+            assert update.lines == ["new run"]
+
+    async def test_replaced_file_is_reopened(self, watcher, tmp_path):
+        log = tmp_path / "output.out"
+        log.write_text("first file\n")
+
+        with watcher.subscribe(log) as subscription:
+            await next_lines(subscription)
+            replacement = tmp_path / "output.out.new"
+            replacement.write_text("second file\n" * 2)
+            os.replace(replacement, log)
+
+            assert await subscription.wait(2)
+            update = subscription.read_lines()
+            assert update.reset
+            assert update.lines == ["second file", "second file"]
+
+    async def test_lines_until_task_yields_trailing_line(self, watcher, tmp_path):
+        log = tmp_path / "output.out"
+        log.write_text("")
+
+        async def job():
+            for i in range(3):
+                await asyncio.sleep(0.05)
+                append(log, f"step {i}\n")
+            append(log, "no newline")
+
+        task = asyncio.create_task(job())
+        with watcher.subscribe(log) as subscription:
+            lines = [line async for line in subscription.lines(until=task)]
+
+        assert lines == ["step 0", "step 1", "step 2", "no newline"]
+
+    async def test_lines_ends_when_closed(self, watcher, tmp_path):
+        log = tmp_path / "output.out"
+        log.write_text("x\n")
+        subscription = watcher.subscribe(log)
+
+        async def read_all():
+            return [line async for line in subscription.lines()]
+
+        reader = asyncio.create_task(read_all())
+        await asyncio.sleep(0.1)
+        subscription.close()
+
+        assert await asyncio.wait_for(reader, 2) == ["x"]
+
+
+class TestFallback:
+    """Tests for falling back to polling."""
+
+    async def test_missing_directory_is_polled(self, tmp_path):
+        watcher = FileWatcher(poll_interval=0.02)
+        log = tmp_path / "later" / "output.out"
+
+        with watcher.subscribe(log) as subscription:
+            assert watcher.polled_paths == [log]
+            log.parent.mkdir()
+            log.write_text("done\n")
+            await subscription.wait(0)
+            assert await next_lines(subscription) == ["done"]
+
+    async def test_shared_watcher_is_per_loop(self):
+        assert shared_watcher() is shared_watcher()
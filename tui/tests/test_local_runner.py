@@ -446,6 +446,61 @@ class TestMultipleJobExecution:
             assert output_file.exists()
 
 
+class TestOutputStreaming:
+    """Tests for get_output() on running jobs."""
+
+    @pytest.fixture
+    def slow_executable(self, temp_work_dir):
+        exe_path = temp_work_dir / "crystalOMP"
+        exe_path.write_text("""#!/bin/bash
+cat > /dev/null
+for i in 1 2 3; do
+    echo "CYC $i"
+    sleep 0.1
+done
+echo "SCF ENDED"
+exit 0
+""")
+        exe_path.chmod(0o755)
+        return exe_path
+
+    @pytest.mark.asyncio
+    async def test_viewers_share_the_output_watch(
+        self, slow_executable, temp_work_dir, sample_input
+    ):
+        """Concurrent viewers each receive every line and stop with the job."""
+        from src.runners.file_watch import shared_watcher
+
+        runner = LocalRunner(executable_path=slow_executable)
+        (temp_work_dir / "input.d12").write_text(sample_input)
+        handle = await runner.submit_job(1, temp_work_dir / "input.d12", temp_work_dir)
+
+        async def view():
+            return [line async for line in runner.get_output(handle)]
+
+        viewers = [asyncio.create_task(view()) for _ in range(3)]
+        await asyncio.sleep(0.15)
+        assert shared_watcher().watched_paths == [temp_work_dir / "output.out"]
+        results = await asyncio.wait_for(asyncio.gather(*viewers), 10)
+
+        for lines in results:
+            assert lines == ["CYC 1", "CYC 2", "CYC 3", "SCF ENDED"]
+        assert shared_watcher().watched_paths == []
+
+    @pytest.mark.asyncio
+    async def test_output_of_finished_job(self, mock_executable, temp_work_dir, sample_input):
+        """A job that already finished yields its output once and ends."""
+        runner = LocalRunner(executable_path=mock_executable)
+        (temp_work_dir / "input.d12").write_text(sample_input)
+        handle = await runner.submit_job(1, temp_work_dir / "input.d12", temp_work_dir)
+        await runner._active_jobs[handle]
+        await runner.get_status(handle)  # prunes the finished task
+
+        lines = [line async for line in runner.get_output(handle)]
+
+        assert lines[-1] == "SCF ENDED"
+
+
 class TestResultStorage:
     """Tests for storing and retrieving job results."""
 
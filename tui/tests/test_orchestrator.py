@@ -8,7 +8,7 @@ import asyncio
 from pathlib import Path
 from datetime import datetime
 from unittest.mock import Mock, AsyncMock, patch
-from typing import List
+from typing import List, Optional
 
 from src.core.orchestrator import (
     WorkflowOrchestrator,
@@ -1927,6 +1927,171 @@ class TestOutputParsers:
 
         assert results == {}
 
+    @pytest.mark.asyncio
+    async def test_extract_node_results_persists_code_parse(self, orchestrator, temp_db, tmp_path):
+        """Test the job's code parser runs on completion and its result is persisted."""
+        work_dir = tmp_path / "job_work"
+        work_dir.mkdir()
+        (work_dir / "output.out").write_text(
+            "!    total energy              =     -65.45703298 Ry\n"
+            "     convergence has been achieved in   2 iterations\n"
+            "     JOB DONE.\n"
+        )
+        job_id = temp_db.create_job(
+            name="qe_job",
+            work_dir=str(work_dir),
+            input_content="TEST",
+            dft_code="quantum_espresso",
+        )
+        job = temp_db.get_job(job_id)
+        node = WorkflowNode(node_id="qe", job_name="qe_job", template="TEST", parameters={})
+
+        results = await orchestrator._extract_node_results(node, job)
+
+        assert results["final_energy"] == -65.45703298
+        assert results["convergence_status"] == "CONVERGED"
+        assert temp_db.get_parse_cache(job_id)["result"]["final_energy"] == -65.45703298
+        assert temp_db.get_job_result(job_id).convergence_status == "CONVERGED"
+
+
+class TestMonitorBatching:
+    """Tests for batched completion detection in the workflow monitor."""
+
+    @staticmethod
+    def _workflow(workflow_id: int, nodes: List[WorkflowNode]) -> WorkflowDefinition:
+        return WorkflowDefinition(
+            workflow_id=workflow_id,
+            name=f"Monitor Test {workflow_id}",
+            description="Test monitor",
+            nodes=nodes,
+        )
+
+    @staticmethod
+    def _node(node_id: str, dependencies: Optional[List[str]] = None) -> WorkflowNode:
+        return WorkflowNode(
+            node_id=node_id,
+            job_name=f"job_{node_id}",
+            template="CRYSTAL\nEND",
+            parameters={},
+            dependencies=dependencies or [],
+        )
+
+    async def _start(self, orchestrator, tmp_path, workflow: WorkflowDefinition) -> None:
+        orchestrator._scratch_base = tmp_path / "scratch"
+        # Keep the background monitor off so tests drive polls explicitly
+        orchestrator._running = True
+        orchestrator.register_workflow(workflow)
+        await orchestrator.start_workflow(workflow.workflow_id)
+
+    @pytest.mark.asyncio
+    async def test_one_status_query_across_workflows(self, orchestrator, temp_db, tmp_path):
+        """Test all running jobs of all workflows are checked with a single query."""
+        wf1 = self._workflow(1, [self._node("a"), self._node("b")])
+        wf2 = self._workflow(2, [self._node("c")])
+        await self._start(orchestrator, tmp_path, wf1)
+        await self._start(orchestrator, tmp_path, wf2)
+
+        job_ids = [node.job_id for wf in (wf1, wf2) for node in wf.nodes]
+        for job_id in job_ids[:2]:
+            temp_db.update_status(job_id, "COMPLETED")
+
+        batch_query = patch.object(
+            temp_db, "get_job_statuses_batch", wraps=temp_db.get_job_statuses_batch
+        )
+        job_query = patch.object(temp_db, "get_job", wraps=temp_db.get_job)
+        with batch_query as batch, job_query as get_job:
+            await orchestrator._process_workflow_updates()
+
+        batch.assert_called_once()
+        assert sorted(batch.call_args.args[0]) == sorted(job_ids)
+        # Only finished jobs are fetched in full
+        assert get_job.call_count == 2
+        assert orchestrator._workflow_states[1].completed_nodes == {"a", "b"}
+        assert orchestrator._workflow_states[2].running_nodes == {"c"}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_completions_submit_dependent_once(
+        self, orchestrator, temp_db, tmp_path, event_collector
+    ):
+        """Test a node whose dependencies finish in the same poll is submitted once."""
+        workflow = self._workflow(
+            1, [self._node("a"), self._node("b"), self._node("c", dependencies=["a", "b"])]
+        )
+        await self._start(orchestrator, tmp_path, workflow)
+
+        for node in workflow.nodes[:2]:
+            temp_db.update_status(node.job_id, "COMPLETED")
+
+        await orchestrator._process_workflow_updates()
+
+        started = [
+            e for e in event_collector.events if isinstance(e, NodeStarted) and e.node_id == "c"
+        ]
+        assert len(started) == 1
+        assert orchestrator._workflow_states[1].running_nodes == {"c"}
+
+    @pytest.mark.asyncio
+    async def test_completion_processed_once_with_callback(
+        self, orchestrator, temp_db, tmp_path, event_collector
+    ):
+        """Test the monitor skips a job whose completion callback is in progress."""
+        workflow = self._workflow(1, [self._node("a")])
+        await self._start(orchestrator, tmp_path, workflow)
+        node = workflow.nodes[0]
+        temp_db.update_status(node.job_id, "COMPLETED")
+
+        await asyncio.gather(
+            orchestrator._on_node_complete(1, node, "COMPLETED"),
+            orchestrator._process_workflow_updates(),
+        )
+
+        completed = [e for e in event_collector.events if isinstance(e, NodeCompleted)]
+        assert len(completed) == 1
+        assert not orchestrator._completions_in_flight
+
+    @pytest.mark.asyncio
+    async def test_monitor_woken_by_notification(self, temp_db, mock_queue_manager, tmp_path):
+        """Test a notification wakes the monitor without waiting for the poll interval."""
+        orchestrator = WorkflowOrchestrator(
+            database=temp_db,
+            queue_manager=mock_queue_manager,
+            scratch_base=tmp_path / "scratch",
+            monitor_interval=60.0,
+        )
+        workflow = self._workflow(1, [self._node("a"), self._node("b", dependencies=["a"])])
+        orchestrator.register_workflow(workflow)
+        await orchestrator.start_workflow(1)
+        # Let the monitor finish its first poll and go to sleep
+        await asyncio.sleep(0.1)
+
+        try:
+            temp_db.update_status(workflow.nodes[0].job_id, "COMPLETED")
+            orchestrator.notify_job_status_changed()
+
+            async def dependent_submitted() -> None:
+                while workflow.nodes[1].job_id is None:
+                    await asyncio.sleep(0.01)
+
+            await asyncio.wait_for(dependent_submitted(), timeout=2.0)
+        finally:
+            await orchestrator.stop()
+
+        assert workflow.nodes[0].status == NodeStatus.COMPLETED
+        assert workflow.nodes[1].status == NodeStatus.QUEUED
+
+    @pytest.mark.asyncio
+    async def test_monitor_skips_paused_workflows(self, orchestrator, temp_db, tmp_path):
+        """Test jobs of paused workflows are not polled."""
+        workflow = self._workflow(1, [self._node("a")])
+        await self._start(orchestrator, tmp_path, workflow)
+        await orchestrator.pause_workflow(1)
+        temp_db.update_status(workflow.nodes[0].job_id, "COMPLETED")
+
+        with patch.object(temp_db, "get_job_statuses_batch") as batch:
+            await orchestrator._process_workflow_updates()
+
+        batch.assert_not_called()
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,222 @@
+"""
+Tests for the off-loop output parse executor and its result cache.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.codes.parsers.base import OutputParser, ParsingResult
+from src.core.codes.parsers.executor import ParseExecutor, set_parse_executor
+from src.core.codes.parsers.quantum_espresso import QuantumEspressoParser
+from src.core.database import Database
+
+QE_OUTPUT = """
+     iteration #  1     ecut=    60.00 Ry
+     iteration #  2     ecut=    60.00 Ry
+!    total energy              =     -65.45703298 Ry
+     convergence has been achieved in   2 iterations
+     JOB DONE.
+"""
+
+
+class CountingParser(OutputParser):
+    """Reports the file's first line and counts how often it really parsed."""
+
+    def __init__(self, gate=None):
+        self.calls = 0
+        self.gate = gate
+        self._lock = threading.Lock()
+
+    def get_energy_unit(self) -> str:
+        return "eV"
+
+    def parse_sync(self, output_file: Path) -> ParsingResult:
+        with self._lock:
+            self.calls += 1
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        return ParsingResult(
+            success=True,
+            final_energy=-1.0,
+            energy_unit="eV",
+            convergence_status="CONVERGED",
+            scf_cycles=3,
+            metadata={"first_line": output_file.read_text().splitlines()[0]},
+        )
+
+
+@pytest.fixture
+def executor():
+    executor = ParseExecutor(max_workers=2)
+    previous = set_parse_executor(executor)
+    yield executor
+    set_parse_executor(previous)
+    executor.shutdown()
+
+
+@pytest.fixture
+def output_file(tmp_path):
+    path = tmp_path / "output.out"
+    path.write_text("first run\n")
+    return path
+
+
+class TestCaching:
+    """Results are reused while the output file is unchanged."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_file_is_parsed_once(self, executor, output_file):
+        parser = CountingParser()
+
+        first = await executor.parse(parser, output_file)
+        second = await executor.parse(parser, output_file)
+
+        assert parser.calls == 1
+        assert second == first
+        # Callers get private copies
+        second.errors.append("mutated")
+        assert (await executor.parse(parser, output_file)).errors == []
+
+    @pytest.mark.asyncio
+    async def test_rewritten_file_is_parsed_again(self, executor, output_file):
+        parser = CountingParser()
+        await executor.parse(parser, output_file)
+
+        output_file.write_text("second run, longer\n")
+        result = await executor.parse(parser, output_file)
+
+        assert parser.calls == 2
+        assert result.metadata["first_line"] == "second run, longer"
+
+    @pytest.mark.asyncio
+    async def test_parser_version_bump_invalidates(self, executor, output_file):
+        parser = CountingParser()
+        await executor.parse(parser, output_file)
+
+        parser.version = "2"
+        await executor.parse(parser, output_file)
+
+        assert parser.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_file_is_not_cached(self, executor, tmp_path):
+        parser = QuantumEspressoParser()
+
+        result = await executor.parse(parser, tmp_path / "missing.out")
+
+        assert not result.success
+        assert "not found" in result.errors[0]
+
+
+class TestDeduplication:
+    """Concurrent requests for one file share a single parse."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_parse(self, executor, output_file):
+        gate = threading.Event()
+        parser = CountingParser(gate)
+
+        tasks = [asyncio.create_task(executor.parse(parser, output_file)) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        gate.set()
+        results = await asyncio.gather(*tasks)
+
+        assert parser.calls == 1
+        assert all(r == results[0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_loop_stays_responsive_during_parse(self, executor, output_file):
+        gate = threading.Event()
+        task = asyncio.create_task(executor.parse(CountingParser(gate), output_file))
+
+        # The loop keeps running other work while the parse blocks
+        await asyncio.sleep(0.05)
+        assert not task.done()
+        gate.set()
+        assert (await task).success
+
+
+class TestProcessPool:
+    """Large outputs are parsed in worker processes."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_parses_in_processes_match_inline(self, tmp_path):
+        files = []
+        for i in range(4):
+            path = tmp_path / f"pw{i}.out"
+            path.write_text(QE_OUTPUT)
+            files.append(path)
+        parser = QuantumEspressoParser()
+        executor = ParseExecutor(max_workers=2, process_threshold=0)
+        try:
+            results = await asyncio.gather(*(executor.parse(parser, path) for path in files))
+        finally:
+            executor.shutdown(wait=True)
+
+        assert [r.final_energy for r in results] == [-65.45703298] * 4
+        assert results[0] == parser.parse_sync(files[0])
+
+
+class TestPersistence:
+    """Results are stored in job_results and survive a restart."""
+
+    @pytest.mark.asyncio
+    async def test_persisted_result_reused_by_new_executor(self, tmp_path, output_file):
+        db = Database(tmp_path / "jobs.db")
+        job_id = db.create_job("job", str(tmp_path), "input")
+
+        first_parser = CountingParser()
+        first = ParseExecutor()
+        result = await first.parse(first_parser, output_file, job_id=job_id, database=db)
+        first.shutdown()
+
+        stored = db.get_job_result(job_id)
+        assert stored.convergence_status == "CONVERGED"
+        assert stored.scf_cycles == 3
+
+        second_parser = CountingParser()
+        second = ParseExecutor()
+        try:
+            again = await second.parse(second_parser, output_file, job_id=job_id, database=db)
+        finally:
+            second.shutdown()
+
+        assert second_parser.calls == 0
+        assert again == result
+
+    @pytest.mark.asyncio
+    async def test_persisted_result_ignored_after_file_changes(self, tmp_path, output_file):
+        db = Database(tmp_path / "jobs.db")
+        job_id = db.create_job("job", str(tmp_path), "input")
+        await ParseExecutor().parse(CountingParser(), output_file, job_id=job_id, database=db)
+
+        output_file.write_text("restarted job output\n")
+        os.utime(output_file, ns=(0, 0))
+        parser = CountingParser()
+        result = await ParseExecutor().parse(parser, output_file, job_id=job_id, database=db)
+
+        assert parser.calls == 1
+        assert result.metadata["first_line"] == "restarted job output"
+
+
+class TestBuiltinParsers:
+    """Built-in parsers route their async parse through the shared executor."""
+
+    @pytest.mark.asyncio
+    async def test_parse_uses_shared_executor_cache(self, executor, tmp_path):
+        path = tmp_path / "pw.out"
+        path.write_text(QE_OUTPUT)
+        parser = QuantumEspressoParser()
+
+        result = await parser.parse(path)
+
+        assert result.final_energy == -65.45703298
+        assert len(executor._cache) == 1
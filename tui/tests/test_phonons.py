@@ -0,0 +1,139 @@
+"""
+Tests for the phonopy band.yaml reader and phonon stability analysis.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.postprocessing import calculate_zpe, check_stability, extract_phonons_phonopy
+from src.postprocessing import phonons as phonons_module
+
+NQPOINT, NATOM = 5, 2
+NMODES = 3 * NATOM
+
+
+def make_band_yaml(path: Path, nwritten: int = NQPOINT) -> dict:
+    """Write a band.yaml with eigenvectors and return the arrays in it."""
+    rng = np.random.default_rng(4)
+    qpoints = np.column_stack([np.linspace(0, 0.5, NQPOINT), np.zeros(NQPOINT), np.zeros(NQPOINT)])
+    frequencies = np.sort(rng.random((NQPOINT, NMODES)) * 10, axis=1)
+    frequencies[2, 0] = -0.5  # imaginary mode
+    vectors = rng.random((NQPOINT, NMODES, NATOM, 3)) + 1j * rng.random((NQPOINT, NMODES, NATOM, 3))
+
+    lines = [
+        f"nqpoint: {NQPOINT}",
+        "npath: 1",
+        "segment_nqpoint:",
+        f"- {NQPOINT}",
+        "labels:",
+        "- [ '$\\Gamma$', 'X' ]",
+        "reciprocal_lattice:",
+        "- [     0.20000000,     0.00000000,     0.00000000 ] # a*",
+        f"natom: {NATOM}",
+        "phonon:",
+    ]
+    for q in range(nwritten):
+        coords = ", ".join(f"{x:13.7f}" for x in qpoints[q])
+        lines += [f"- q-position: [ {coords} ]", f"  distance: {0.1 * q:12.7f}"]
+        if q in (0, NQPOINT - 1):
+            lines.append(f"  label: '{'G' if q == 0 else 'X'}'")
+        lines.append("  band:")
+        for m in range(NMODES):
+            lines += [f"  - # {m + 1}", f"    frequency: {frequencies[q, m]:15.10f}"]
+            lines.append("    eigenvector:")
+            for a in range(NATOM):
+                lines.append(f"    - # atom {a + 1}")
+                for v in vectors[q, m, a]:
+                    lines.append(f"      - [ {v.real:17.14f}, {v.imag:17.14f} ]")
+        lines.append("")
+    path.write_text("\n".join(lines) + "\n")
+    return {"qpoints": qpoints, "frequencies": frequencies, "eigenvectors": vectors}
+
+
+@pytest.fixture
+def band_yaml(tmp_path):
+    path = tmp_path / "band.yaml"
+    return path, make_band_yaml(path)
+
+
+class TestBandYaml:
+    """Tests for reading band.yaml."""
+
+    def test_frequencies_and_labels(self, band_yaml):
+        path, ref = band_yaml
+
+        phonons, _ = extract_phonons_phonopy(band_yaml=path)
+
+        assert (phonons.nqpts, phonons.nmodes, phonons.natoms) == (NQPOINT, NMODES, NATOM)
+        np.testing.assert_allclose(phonons.qpoints, ref["qpoints"], atol=1e-7)
+        np.testing.assert_allclose(phonons.frequencies, ref["frequencies"], atol=1e-9)
+        assert phonons.eigenvectors is None
+        assert phonons.qpoint_labels == ["G", "X"]
+        assert phonons.label_positions == pytest.approx([0.0, 0.5])
+        assert phonons.has_imaginary
+        assert phonons.imaginary_modes == [(2, 0)]
+        assert phonons.min_frequency == pytest.approx(-0.5)
+
+    def test_eigenvectors_on_request(self, band_yaml):
+        path, ref = band_yaml
+
+        phonons, _ = extract_phonons_phonopy(band_yaml=path, eigenvectors=True)
+
+        assert phonons.eigenvectors.shape == (NQPOINT, NMODES, NATOM, 3)
+        np.testing.assert_allclose(phonons.eigenvectors, ref["eigenvectors"], atol=1e-13)
+
+    def test_small_chunks(self, band_yaml, monkeypatch):
+        path, ref = band_yaml
+        monkeypatch.setattr(phonons_module, "_CHUNK_SIZE", 97)
+
+        phonons, _ = extract_phonons_phonopy(band_yaml=path, eigenvectors=True)
+
+        np.testing.assert_allclose(phonons.frequencies, ref["frequencies"], atol=1e-9)
+        np.testing.assert_allclose(phonons.eigenvectors, ref["eigenvectors"], atol=1e-13)
+        assert phonons.label_positions == pytest.approx([0.0, 0.5])
+
+    def test_partially_written_file(self, tmp_path):
+        path = tmp_path / "band.yaml"
+        ref = make_band_yaml(path, nwritten=3)
+        # Cut the last q-point in the middle of its modes
+        text = path.read_text()
+        path.write_text(text[: text.rindex("frequency")])
+
+        phonons, _ = extract_phonons_phonopy(band_yaml=path)
+
+        assert phonons.nqpts == 2
+        np.testing.assert_allclose(phonons.frequencies, ref["frequencies"][:2], atol=1e-9)
+        assert phonons.qpoint_labels == ["G"]
+
+    def test_missing_header(self, tmp_path):
+        path = tmp_path / "band.yaml"
+        path.write_text("phonon:\n- q-position: [ 0.0, 0.0, 0.0 ]\n")
+
+        with pytest.raises(ValueError, match="nqpoint"):
+            extract_phonons_phonopy(band_yaml=path)
+
+
+class TestStability:
+    """Tests for check_stability() and calculate_zpe()."""
+
+    def test_threshold_is_applied(self, band_yaml):
+        phonons, _ = extract_phonons_phonopy(band_yaml=band_yaml[0])
+
+        assert not check_stability(phonons)["is_stable"]
+        loose = check_stability(phonons, threshold=-1.0)
+        assert loose["is_stable"]
+        assert loose["num_imaginary_modes"] == 0
+
+    def test_zpe_uses_gamma(self, band_yaml):
+        path, ref = band_yaml
+        phonons, _ = extract_phonons_phonopy(band_yaml=path)
+
+        optical = np.sort(ref["frequencies"][0])[3:]
+        expected = 0.5 * 6.582119569e-16 * np.sum(optical[optical > 0] * 1e12)
+        assert calculate_zpe(phonons) == pytest.approx(expected)
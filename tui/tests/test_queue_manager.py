@@ -588,6 +588,25 @@ class TestResourceAwareScheduling:
         schedulable = await queue_manager.schedule_jobs()
         assert job_id in schedulable
 
+    @pytest.mark.asyncio
+    async def test_dequeue_skips_jobs_that_do_not_fit(self, queue_manager, temp_db):
+        """The best job that fits the free resources is dequeued."""
+        big = []
+        for i in range(20):
+            job_id = temp_db.create_job(f"big{i}", f"/tmp/big{i}", "CRYSTAL\n")
+            await queue_manager.enqueue(
+                job_id, priority=Priority.HIGH, cluster_id=1, resource_requirements={"cores": 64}
+            )
+            big.append(job_id)
+        small = temp_db.create_job("small", "/tmp/small", "CRYSTAL\n")
+        await queue_manager.enqueue(
+            small, priority=Priority.LOW, cluster_id=1, resource_requirements={"cores": 4}
+        )
+        queue_manager._get_cluster(1).available_resources = {"cores": 8}
+
+        assert await queue_manager.dequeue("local") == small
+        assert await queue_manager.dequeue("local") is None
+
 
 class TestPersistence:
     """Tests for queue state persistence."""
@@ -909,6 +928,20 @@ class TestJobCancellation:
         # Verify dependency on job1 is removed from job2
         assert job1_id not in queue_manager._jobs[job2_id].dependencies
 
+    @pytest.mark.asyncio
+    async def test_cancel_job_releases_dependents_after_restart(self, queue_manager, temp_db):
+        """Dependents of a cancelled job stay runnable after a restart."""
+        job1_id = temp_db.create_job("job1", "/tmp/job1", "CRYSTAL\n")
+        job2_id = temp_db.create_job("job2", "/tmp/job2", "CRYSTAL\n")
+        await queue_manager.enqueue(job1_id)
+        await queue_manager.enqueue(job2_id, dependencies=[job1_id])
+
+        await queue_manager.cancel_job(job1_id)
+
+        restarted = QueueManager(temp_db)
+        assert restarted._jobs[job2_id].dependencies == set()
+        assert await restarted.dequeue("local") == job2_id
+
     @pytest.mark.asyncio
     async def test_cancel_job_clears_queue_state(self, queue_manager, temp_db):
         """Test that cancelling a job removes it from queue_state table."""
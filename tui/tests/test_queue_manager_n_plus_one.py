@@ -394,6 +394,32 @@ class TestPerformanceWithDependencies:
             f"Scheduling with 50 dependencies took {schedule_time:.2f}s (too slow)"
         )
 
+    @pytest.mark.asyncio
+    async def test_dequeue_checks_stale_jobs_in_one_query(self, queue_manager, temp_db):
+        """Jobs started outside the queue are skipped without one status query each."""
+        stale_ids = []
+        for i in range(10):
+            job_id = temp_db.create_job(name=f"stale{i}", work_dir=f"/tmp/s{i}", input_content="")
+            await queue_manager.enqueue(job_id, priority=Priority.HIGH)
+            temp_db.update_status(job_id, "RUNNING")
+            stale_ids.append(job_id)
+        fresh_id = temp_db.create_job(name="fresh", work_dir="/tmp/fresh", input_content="")
+        await queue_manager.enqueue(fresh_id, priority=Priority.LOW)
+
+        original_batch_query = queue_manager._get_job_statuses_batch
+        batch_calls = []
+
+        def tracked_batch_query(job_ids):
+            batch_calls.append(list(job_ids))
+            return original_batch_query(job_ids)
+
+        queue_manager._get_job_statuses_batch = tracked_batch_query
+
+        assert await queue_manager.dequeue("local") == fresh_id
+        # The first stale job, then every other ready job at once
+        assert len(batch_calls) == 2
+        assert all(job_id in queue_manager._jobs for job_id in stale_ids)
+
     @pytest.mark.asyncio
     async def test_query_count_with_dependencies(self, queue_manager, temp_db):
         """Verify query count is O(1) not O(N) for dependency checking."""
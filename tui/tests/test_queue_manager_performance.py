@@ -395,5 +395,161 @@ class TestRealWorldSchedulingScenario:
         )
 
 
+class TestIncrementalScheduling:
+    """Test the event-driven scheduling index."""
+
+    def _create_jobs(self, temp_db, count):
+        return [
+            temp_db.create_job(name=f"job{i}", work_dir=f"/tmp/job{i}", input_content=f"input{i}")
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_dequeue_checks_only_the_chosen_job(self, queue_manager, temp_db):
+        """Dequeue queries the status of the picked job, not of the whole queue."""
+        job_ids = self._create_jobs(temp_db, 50)
+        for job_id in job_ids:
+            await queue_manager.enqueue(job_id, priority=Priority.NORMAL)
+        await queue_manager.enqueue(job_ids[-1], priority=Priority.CRITICAL)
+
+        queried: List[List[int]] = []
+        original_batch_query = temp_db.get_job_statuses_batch
+
+        def tracked_batch_query(ids):
+            queried.append(list(ids))
+            return original_batch_query(ids)
+
+        temp_db.get_job_statuses_batch = tracked_batch_query
+
+        assert await queue_manager.dequeue("local") == job_ids[-1]
+        assert queried == [[job_ids[-1]]]
+
+    @pytest.mark.asyncio
+    async def test_completion_event_releases_dependents(self, queue_manager, temp_db):
+        """A successful completion makes waiting jobs ready without a rescan."""
+        job1, job2, job3 = self._create_jobs(temp_db, 3)
+        await queue_manager.enqueue(job1)
+        await queue_manager.enqueue(job2, dependencies=[job1])
+        await queue_manager.enqueue(job3, dependencies=[job1, job2])
+
+        assert queue_manager._unmet == {job2: {job1}, job3: {job1, job2}}
+        assert await queue_manager.dequeue("local") == job1
+
+        await queue_manager.handle_job_completion(job1, success=True)
+
+        assert job2 in queue_manager._heap_entries
+        assert queue_manager._unmet == {job3: {job2}}
+        assert set(queue_manager._waiting_on) == {job2}
+
+    @pytest.mark.asyncio
+    async def test_external_completion_is_reconciled(self, queue_manager, temp_db):
+        """Dependencies completed directly in the database are picked up by dequeue."""
+        job1, job2 = self._create_jobs(temp_db, 2)
+        temp_db.update_status(job1, "RUNNING")
+        await queue_manager.enqueue(job2, dependencies=[job1])
+
+        assert await queue_manager.dequeue("local") is None
+
+        temp_db.update_status(job1, "COMPLETED")
+
+        assert await queue_manager.dequeue("local") == job2
+        assert not queue_manager._waiting_on
+
+    @pytest.mark.asyncio
+    async def test_reorder_rekeys_ready_job(self, queue_manager, temp_db):
+        """Reordering replaces the heap entry so the new priority takes effect."""
+        job1, job2 = self._create_jobs(temp_db, 2)
+        await queue_manager.enqueue(job1, priority=Priority.NORMAL)
+        await queue_manager.enqueue(job2, priority=Priority.LOW)
+
+        await queue_manager.reorder_queue(job2, Priority.CRITICAL)
+
+        assert await queue_manager.dequeue("local") == job2
+        assert await queue_manager.dequeue("local") == job1
+        assert await queue_manager.dequeue("local") is None
+
+    @pytest.mark.asyncio
+    async def test_full_cluster_does_not_block_others(self, queue_manager, temp_db):
+        """A paused cluster's jobs are skipped in favour of other clusters."""
+        job1, job2 = self._create_jobs(temp_db, 2)
+        await queue_manager.enqueue(job1, priority=Priority.CRITICAL, cluster_id=1)
+        await queue_manager.enqueue(job2, priority=Priority.LOW, cluster_id=2)
+        await queue_manager.pause_queue(1)
+
+        assert await queue_manager.dequeue("local") == job2
+
+        await queue_manager.resume_queue(1)
+        assert await queue_manager.dequeue("local") == job1
+
+    @pytest.mark.asyncio
+    async def test_fair_share_across_users(self, temp_db):
+        """With fair share, a user who has not run yet goes ahead of one who has."""
+        qm = QueueManager(temp_db, enable_fair_share=True)
+        job1, job2, job3 = self._create_jobs(temp_db, 3)
+        await qm.enqueue(job1, user_id="alice")
+        await qm.enqueue(job2, user_id="alice")
+        await qm.enqueue(job3, user_id="bob")
+
+        assert await qm.dequeue("local") == job1
+        assert await qm.dequeue("local") == job3
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_counters(self, queue_manager, temp_db):
+        """Per-cluster queue depth follows enqueue, dequeue and cancel."""
+        job_ids = self._create_jobs(temp_db, 4)
+        for job_id in job_ids[:3]:
+            await queue_manager.enqueue(job_id, cluster_id=1)
+        await queue_manager.enqueue(job_ids[3], cluster_id=2)
+
+        await queue_manager.dequeue("local")
+        await queue_manager.cancel_job(job_ids[3])
+
+        assert queue_manager._queue_depth[1] == 2
+        assert queue_manager._queue_depth[2] == 0
+
+    @pytest.mark.asyncio
+    async def test_persist_writes_only_dirty_state(self, queue_manager, temp_db):
+        """Periodic persistence skips queued jobs and unchanged state."""
+        for job_id in self._create_jobs(temp_db, 10):
+            await queue_manager.enqueue(job_id, cluster_id=1)
+        await queue_manager.dequeue("local")
+
+        writes = {"jobs": 0, "clusters": 0}
+        queue_manager._persist_job_to_database = lambda *a, **k: writes.__setitem__(
+            "jobs", writes["jobs"] + 1
+        )
+        original_cluster_write = queue_manager._persist_cluster_to_database
+
+        def tracked_cluster_write(cluster, conn=None):
+            writes["clusters"] += 1
+            original_cluster_write(cluster, conn)
+
+        queue_manager._persist_cluster_to_database = tracked_cluster_write
+
+        queue_manager._persist_to_database()
+        queue_manager._persist_to_database()
+
+        assert writes == {"jobs": 0, "clusters": 1}
+        with temp_db.connection() as conn:
+            row = conn.execute("SELECT total_jobs_scheduled FROM scheduler_metrics").fetchone()
+        assert row[0] == 1
+
+    @pytest.mark.asyncio
+    async def test_worker_wakes_on_event(self, temp_db):
+        """Queue events run a worker cycle without waiting for the interval."""
+        qm = QueueManager(temp_db, scheduling_interval=60)
+        await qm.start()
+        try:
+            await asyncio.sleep(0)
+            job_id = self._create_jobs(temp_db, 1)[0]
+            await qm.enqueue(job_id, cluster_id=3)
+            await asyncio.sleep(0.1)
+
+            assert qm.metrics.last_updated is not None
+            assert qm.metrics.queue_depth_by_cluster[3] == 1
+        finally:
+            await qm.stop()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,304 @@
+"""
+Tests for offset-based remote output streaming.
+
+The remote loop generated by RemoteTailStream is run in a real local shell,
+so the wire format, offsets, truncation handling and exit reporting are
+exercised end to end.
+"""
+
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.runners.remote_stream import JobOutputStream, RemoteTailStream
+
+
+class LocalShellConnection:
+    """SSH connection stand-in running create_process() in a local shell."""
+
+    def __init__(self):
+        self.processes = []
+
+    @asynccontextmanager
+    async def create_process(self, command: str, encoding=None):
+        process = await asyncio.create_subprocess_exec(
+            "sh", "-c", command, stdout=asyncio.subprocess.PIPE
+        )
+        self.processes.append(process)
+        try:
+            yield process
+        finally:
+            if process.returncode is None:
+                process.kill()
+            await process.wait()
+
+
+class LocalConnectionManager:
+    """ConnectionManager stand-in handing out local shell connections."""
+
+    def __init__(self):
+        self.conn = LocalShellConnection()
+        self.connections = 0
+
+    @asynccontextmanager
+    async def get_connection(self, cluster_id):
+        self.connections += 1
+        yield self.conn
+
+
+async def collect(stream: RemoteTailStream, conn, until=None):
+    events = []
+    async for event in stream.events(conn):
+        events.append(event)
+        if until is not None and until(events):
+            break
+    return events
+
+
+def data_of(events, name):
+    return b"".join(e.data for e in events if e.kind == "data" and e.name == name)
+
+
+class TestRemoteTailStream:
+    """Tests for the single-channel protocol."""
+
+    async def test_streams_files_and_reports_exit(self, tmp_path):
+        (tmp_path / "output.log").write_text("line 1\nline 2\n")
+        (tmp_path / "OUTCAR").write_text("TOTEN = -1.0\n")
+        (tmp_path / ".exit_code").write_text("3\n")
+
+        stream = RemoteTailStream(str(tmp_path), ["output.log", "OUTCAR"], poll_interval=0.05)
+        events = await collect(stream, LocalShellConnection())
+
+        assert data_of(events, "output.log") == b"line 1\nline 2\n"
+        assert data_of(events, "OUTCAR") == b"TOTEN = -1.0\n"
+        assert events[-1].kind == "exit"
+        assert events[-1].exit_code == 3
+        assert stream.offsets == {"output.log": 14, "OUTCAR": 13}
+
+    async def test_follows_appends_until_process_exits(self, tmp_path):
+        log = tmp_path / "output.log"
+        log.write_text("start\n")
+        job = await asyncio.create_subprocess_exec("sleep", "30")
+
+        stream = RemoteTailStream(str(tmp_path), ["output.log"], pid=job.pid, poll_interval=0.05)
+        conn = LocalShellConnection()
+        events = []
+
+        async def run():
+            async for event in stream.events(conn):
+                events.append(event)
+
+        task = asyncio.create_task(run())
+        await asyncio.sleep(0.3)
+        with open(log, "a") as f:
+            f.write("SCF iteration 1\n")
+        await asyncio.sleep(0.3)
+        (tmp_path / ".exit_code").write_text("0\n")
+        job.kill()
+        await job.wait()
+        await asyncio.wait_for(task, 5)
+
+        assert data_of(events, "output.log") == b"start\nSCF iteration 1\n"
+        offsets = [e.offset for e in events if e.kind == "data"]
+        assert offsets == [0, 6]
+        assert events[-1].exit_code == 0
+
+    async def test_resumes_from_offsets(self, tmp_path):
+        (tmp_path / "output.log").write_text("already seen\nnew line\n")
+        (tmp_path / ".exit_code").write_text("0\n")
+
+        stream = RemoteTailStream(
+            str(tmp_path), ["output.log"], offsets={"output.log": 13}, poll_interval=0.05
+        )
+        events = await collect(stream, LocalShellConnection())
+
+        assert data_of(events, "output.log") == b"new line\n"
+        assert [e.offset for e in events if e.kind == "data"] == [13]
+
+    async def test_truncated_file_is_reset(self, tmp_path):
+        (tmp_path / "output.log").write_text("short\n")
+        (tmp_path / ".exit_code").write_text("0\n")
+
+        stream = RemoteTailStream(
+            str(tmp_path), ["output.log"], offsets={"output.log": 100}, poll_interval=0.05
+        )
+        events = await collect(stream, LocalShellConnection())
+
+        assert [e.kind for e in events][:2] == ["reset", "data"]
+        assert data_of(events, "output.log") == b"short\n"
+
+    async def test_missing_files_and_exit_code(self, tmp_path):
+        job = await asyncio.create_subprocess_exec("true")
+        await job.wait()
+
+        stream = RemoteTailStream(str(tmp_path), ["output.log"], pid=job.pid, poll_interval=0.05)
+        events = await collect(stream, LocalShellConnection())
+
+        assert [e.kind for e in events] == ["tick", "exit"]
+        assert events[-1].exit_code is None
+
+    async def test_binary_safe_framing(self, tmp_path):
+        payload = bytes(range(256)) * 4 + b"@@exit 9\n"
+        (tmp_path / "OUTCAR").write_bytes(payload)
+        (tmp_path / ".exit_code").write_text("0\n")
+
+        stream = RemoteTailStream(str(tmp_path), ["OUTCAR"], poll_interval=0.05)
+        events = await collect(stream, LocalShellConnection())
+
+        assert data_of(events, "OUTCAR") == payload
+        assert events[-1].exit_code == 0
+
+    async def test_tail_bytes_starts_near_the_end(self, tmp_path):
+        log = b"".join(b"line %d\n" % i for i in range(100))
+        (tmp_path / "output.log").write_bytes(log)
+        (tmp_path / ".exit_code").write_text("0\n")
+
+        stream = RemoteTailStream(
+            str(tmp_path), ["output.log", "OUTCAR"], tail_bytes=20, poll_interval=0.05
+        )
+        events = await collect(stream, LocalShellConnection())
+
+        assert [e.offset for e in events if e.kind == "data"] == [len(log) - 20]
+        assert data_of(events, "output.log") == log[-20:]
+
+    async def test_short_read_is_padded(self, tmp_path):
+        """A file truncated mid-read still yields exactly the announced length."""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        # tail that sees the file after it shrank
+        (bin_dir / "tail").write_text("#!/bin/sh\nprintf ab\n")
+        (bin_dir / "tail").chmod(0o755)
+        work = tmp_path / "job"
+        work.mkdir()
+        (work / "output.log").write_bytes(b"0123456789")
+        (work / ".exit_code").write_text("0\n")
+
+        stream = RemoteTailStream(str(work), ["output.log"], poll_interval=0.05)
+        command = f"PATH={bin_dir}:$PATH\n" + stream.build_command()
+        process = await asyncio.create_subprocess_exec(
+            "sh", "-c", command, stdout=asyncio.subprocess.PIPE
+        )
+        stdout, _ = await asyncio.wait_for(process.communicate(), 5)
+
+        assert stdout.startswith(b"@@data 0 0 10\nab" + b"\0" * 8 + b"@@tick\n")
+
+
+class TestJobOutputStream:
+    """Tests for the per-job stream service."""
+
+    async def test_lines_tail_and_exit_code(self, tmp_path):
+        (tmp_path / "output.log").write_text("a\nb\nc")
+        (tmp_path / "OUTCAR").write_text("\n".join(f"step {i}" for i in range(10)) + "\n")
+        (tmp_path / ".exit_code").write_text("1\n")
+        manager = LocalConnectionManager()
+
+        stream = JobOutputStream(
+            manager, 1, str(tmp_path), files=["output.log", "OUTCAR"], poll_interval=0.05
+        )
+        lines = [line async for line in stream.lines("output.log")]
+
+        assert lines == ["a", "b", "c"]
+        assert stream.finished and stream.exit_code == 1
+        assert stream.tail("OUTCAR", 2) == "step 8\nstep 9"
+        assert manager.connections == 1
+
+    async def test_tail_bytes_drops_partial_first_line(self, tmp_path):
+        (tmp_path / "output.log").write_text("".join(f"step {i}\n" for i in range(1000)))
+        (tmp_path / ".exit_code").write_text("0\n")
+
+        stream = JobOutputStream(
+            LocalConnectionManager(), 1, str(tmp_path), tail_bytes=30, poll_interval=0.05
+        )
+        lines = [line async for line in stream.lines("output.log")]
+
+        assert lines == ["step 997", "step 998", "step 999"]
+
+    async def test_several_subscribers_share_one_channel(self, tmp_path):
+        (tmp_path / "output.log").write_text("x\ny\n")
+        job = await asyncio.create_subprocess_exec("sleep", "30")
+        manager = LocalConnectionManager()
+        stream = JobOutputStream(manager, 1, str(tmp_path), pid=job.pid, poll_interval=0.05)
+
+        async def read_all():
+            return [line async for line in stream.lines("output.log", replay=False)]
+
+        readers = [asyncio.create_task(read_all()) for _ in range(3)]
+        await asyncio.sleep(0.2)
+        with open(tmp_path / "output.log", "a") as f:
+            f.write("z\n")
+        await asyncio.sleep(0.2)
+        job.kill()
+        await job.wait()
+        results = await asyncio.wait_for(asyncio.gather(*readers), 5)
+
+        assert all(lines == ["x", "y", "z"] for lines in results)
+        assert manager.connections == 1
+        assert len(manager.conn.processes) == 1
+
+    async def test_reconnects_from_last_offset(self, tmp_path):
+        log = tmp_path / "output.log"
+        log.write_text("first\n")
+        job = await asyncio.create_subprocess_exec("sleep", "30")
+        manager = LocalConnectionManager()
+        stream = JobOutputStream(
+            manager, 1, str(tmp_path), pid=job.pid, poll_interval=0.05, reconnect_delay=0.01
+        )
+
+        lines = []
+
+        async def read_all():
+            async for line in stream.lines("output.log"):
+                lines.append(line)
+
+        reader = asyncio.create_task(read_all())
+        await stream.wait_ready(5)
+        # Drop the channel, then append while disconnected
+        manager.conn.processes[0].kill()
+        with open(log, "a") as f:
+            f.write("second\n")
+        await asyncio.sleep(0.3)
+        job.kill()
+        await job.wait()
+        await asyncio.wait_for(reader, 5)
+
+        assert lines == ["first", "second"]
+        assert manager.connections >= 2
+
+    async def test_gives_up_after_repeated_failures(self):
+        class FailingManager:
+            @asynccontextmanager
+            async def get_connection(self, cluster_id):
+                raise ConnectionError("unreachable")
+                yield
+
+        stream = JobOutputStream(
+            FailingManager(), 1, "/nonexistent", max_reconnects=2, reconnect_delay=0
+        )
+
+        lines = [line async for line in stream.lines()]
+
+        assert lines == []
+        assert stream.finished
+        assert isinstance(stream.error, ConnectionError)
+
+    async def test_stop_ends_subscriptions(self, tmp_path):
+        job = await asyncio.create_subprocess_exec("sleep", "30")
+        stream = JobOutputStream(
+            LocalConnectionManager(), 1, str(tmp_path), pid=job.pid, poll_interval=0.05
+        )
+
+        async def read_all():
+            return [line async for line in stream.lines()]
+
+        reader = asyncio.create_task(read_all())
+        await stream.wait_ready(5)
+        await stream.stop()
+
+        assert await asyncio.wait_for(reader, 5) == []
+        job.kill()
+        await job.wait()
@@ -24,6 +24,7 @@ from src.runners.slurm_runner import (
     SLURMSubmissionError,
     SLURMStatusError,
     SLURMValidationError,
+    SLURMStatusAggregator,
 )
 from src.runners.exceptions import SLURMRunnerError
 from src.core.connection_manager import ConnectionManager
@@ -597,8 +598,8 @@ class TestJobSubmission:
         mock_connection.run.side_effect = [
             Mock(exit_status=0, stdout="", stderr=""),  # mkdir
             Mock(exit_status=0, stdout="Submitted batch job 12345\n", stderr=""),  # sbatch
-            Mock(exit_status=1, stdout="", stderr=""),  # squeue (not found)
-            Mock(exit_status=0, stdout="COMPLETED\n", stderr=""),  # sacct
+            Mock(exit_status=0, stdout='{"jobs": []}', stderr=""),  # squeue (not queued)
+            Mock(exit_status=0, stdout="12345|COMPLETED\n", stderr=""),  # sacct
         ]
 
         # Mock listdir for results download
@@ -803,5 +804,159 @@ class TestSLURMJobConfig:
         assert config.memory == "128GB"
 
 
+class TestSLURMStatusAggregator:
+    """Test batched squeue/sacct status polling."""
+
+    @staticmethod
+    def _aggregator(mock_connection_manager, mock_connection, **kwargs):
+        from contextlib import asynccontextmanager
+
+        @asynccontextmanager
+        async def mock_get_connection(cluster_id):
+            yield mock_connection
+
+        mock_connection_manager.get_connection = mock_get_connection
+        return SLURMStatusAggregator(mock_connection_manager, 1, **kwargs)
+
+    @staticmethod
+    def _squeue_json(*jobs):
+        import json
+
+        return Mock(
+            exit_status=0,
+            stdout=json.dumps(
+                {
+                    "jobs": [
+                        {
+                            "job_id": {"set": True, "number": int(job_id)},
+                            "job_state": [state],
+                            "state_reason": reason,
+                        }
+                        for job_id, state, reason in jobs
+                    ]
+                }
+            ),
+            stderr="",
+        )
+
+    @pytest.mark.asyncio
+    async def test_one_squeue_and_one_sacct_for_all_jobs(
+        self, mock_connection_manager, mock_connection
+    ):
+        """Queued jobs come from squeue, finished ones from a single sacct."""
+        aggregator = self._aggregator(mock_connection_manager, mock_connection)
+        mock_connection.run.side_effect = [
+            self._squeue_json(("101", "RUNNING", "None"), ("102", "PENDING", "Priority")),
+            Mock(exit_status=0, stdout="103|COMPLETED\n104|CANCELLED by 1000\n", stderr=""),
+        ]
+        for job_id in ("101", "102", "103", "104"):
+            aggregator.watch(job_id)
+
+        try:
+            await aggregator.refresh()
+
+            commands = [call.args[0] for call in mock_connection.run.call_args_list]
+            assert commands == [
+                "squeue --me --json",
+                "sacct -j 103,104 -X -n -P -o JobID,State",
+            ]
+            assert await aggregator.get_status("101") == (SLURMJobState.RUNNING, None)
+            assert await aggregator.get_status("102") == (SLURMJobState.PENDING, "Priority")
+            assert await aggregator.get_status("103") == (SLURMJobState.COMPLETED, None)
+            assert (await aggregator.get_status("104"))[0] == SLURMJobState.CANCELLED
+            assert mock_connection.run.call_count == 2
+        finally:
+            await aggregator.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_refresh(
+        self, mock_connection_manager, mock_connection
+    ):
+        """Many get_status calls at once cost a single squeue round trip."""
+        aggregator = self._aggregator(mock_connection_manager, mock_connection)
+        queued = [(str(job_id), "RUNNING", "None") for job_id in range(200, 250)]
+        mock_connection.run.side_effect = [self._squeue_json(*queued)]
+
+        results = await asyncio.gather(*(aggregator.get_status(job_id) for job_id, _, _ in queued))
+
+        assert {state for state, _ in results} == {SLURMJobState.RUNNING}
+        assert mock_connection.run.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_formatted_squeue(self, mock_connection_manager, mock_connection):
+        """Clusters without squeue --json use the formatted output from then on."""
+        aggregator = self._aggregator(mock_connection_manager, mock_connection, min_interval=0)
+        formatted = Mock(exit_status=0, stdout="301|RUNNING|None\n", stderr="")
+        mock_connection.run.side_effect = [
+            Mock(exit_status=1, stdout="", stderr="squeue: unrecognized option '--json'"),
+            formatted,
+            formatted,
+        ]
+
+        assert await aggregator.get_status("301") == (SLURMJobState.RUNNING, None)
+        assert await aggregator.get_status("301") == (SLURMJobState.RUNNING, None)
+
+        commands = [call.args[0] for call in mock_connection.run.call_args_list]
+        assert commands.count("squeue --me --json") == 1
+        assert commands[1] == "squeue -u \"$USER\" -h -o '%i|%T|%r'"
+
+    @pytest.mark.asyncio
+    async def test_unknown_job_reported_as_unknown(self, mock_connection_manager, mock_connection):
+        """A job in neither squeue nor sacct is UNKNOWN with a reason."""
+        aggregator = self._aggregator(mock_connection_manager, mock_connection)
+        mock_connection.run.side_effect = [
+            self._squeue_json(),
+            Mock(exit_status=0, stdout="", stderr=""),
+        ]
+
+        state, reason = await aggregator.get_status("999")
+
+        assert state == SLURMJobState.UNKNOWN
+        assert "not found" in reason
+
+    @pytest.mark.asyncio
+    async def test_interval_adapts_to_job_state(self, mock_connection_manager, mock_connection):
+        """Pending-only queues back off; running jobs use poll_interval."""
+        aggregator = self._aggregator(mock_connection_manager, mock_connection, poll_interval=30)
+        mock_connection.run.side_effect = [
+            self._squeue_json(("401", "PENDING", "Priority")),
+            self._squeue_json(("401", "PENDING", "Priority")),
+            self._squeue_json(("401", "PENDING", "Priority")),
+            self._squeue_json(("401", "RUNNING", "None")),
+        ]
+        aggregator._watched["401"] = 1  # watch without starting the background loop
+
+        await aggregator.refresh()
+        assert aggregator.current_interval() == aggregator.min_interval  # new state
+        await aggregator.refresh()
+        assert aggregator.current_interval() == 60
+        await aggregator.refresh()
+        assert aggregator.current_interval() == 120
+        await aggregator.refresh()
+        assert aggregator.current_interval() == aggregator.min_interval  # state changed
+        aggregator._changed = False
+        assert aggregator.current_interval() == 30
+
+    @pytest.mark.asyncio
+    async def test_watchers_woken_by_background_refresh(
+        self, mock_connection_manager, mock_connection
+    ):
+        """wait_for_update returns after the background loop refreshes."""
+        aggregator = self._aggregator(mock_connection_manager, mock_connection, poll_interval=0.05)
+        mock_connection.run.return_value = self._squeue_json(("501", "RUNNING", "None"))
+
+        aggregator.watch("501")
+        try:
+            assert await aggregator.wait_for_update(timeout=1.0) is True
+            assert aggregator._results["501"].state == SLURMJobState.RUNNING
+        finally:
+            aggregator.unwatch("501")
+        assert aggregator._task is None
+
+    def test_parse_state_ignores_sacct_decoration(self, slurm_runner):
+        """sacct's 'CANCELLED by <uid>' parses as CANCELLED."""
+        assert slurm_runner._parse_state("CANCELLED by 1000") == SLURMJobState.CANCELLED
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -133,7 +133,7 @@ def mock_ssh_connection():
     mock_process.stdout.__aiter__ = lambda self: iter(["line1\n", "line2\n"]).__iter__()
 
     @asynccontextmanager
-    async def mock_create_process(cmd):
+    async def mock_create_process(cmd, **kwargs):
         yield mock_process
 
     conn.create_process = mock_create_process
@@ -402,71 +402,57 @@ class TestJobCancellation:
 class TestOutputStreaming:
     """Test output streaming."""
 
+    @staticmethod
+    def _remote_stream(mock_ssh_connection, payload: bytes):
+        """Make create_process() replay ``payload`` as the remote stream output."""
+        from contextlib import asynccontextmanager
+
+        commands = []
+
+        @asynccontextmanager
+        async def mock_create_process(cmd, **kwargs):
+            commands.append(cmd)
+            reader = asyncio.StreamReader()
+            reader.feed_data(payload)
+            reader.feed_eof()
+            process = Mock()
+            process.stdout = reader
+            yield process
+
+        mock_ssh_connection.create_process = mock_create_process
+        return commands
+
     @pytest.mark.asyncio
     async def test_stream_output(self, ssh_runner, temp_work_dir, mock_ssh_connection):
         """Test streaming job output."""
-        # Mock process with stdout
-        mock_process = AsyncMock()
-        mock_stdout = AsyncMock()
-
-        async def mock_stdout_lines():
-            lines = [
-                "CRYSTAL23 starting...",
-                "SCF iteration 1",
-                "SCF iteration 2",
-                "Convergence reached",
-            ]
-            for line in lines:
-                yield line
-
-        mock_stdout.__aiter__ = mock_stdout_lines
-        mock_process.stdout = mock_stdout
-        mock_ssh_connection.create_process = AsyncMock(
-            return_value=AsyncMock(__aenter__=AsyncMock(return_value=mock_process))
+        log = b"CRYSTAL23 starting...\nSCF iteration 1\nSCF iteration 2\nConvergence reached\n"
+        commands = self._remote_stream(
+            mock_ssh_connection,
+            b"@@data 0 0 %d\n" % len(log) + log + b"@@tick\n@@exit 0\n",
         )
 
-        # Modify get_status to return completed after some lines
-        call_count = 0
-
-        async def mock_get_status(handle):
-            nonlocal call_count
-            call_count += 1
-            return "completed" if call_count > 2 else "running"
-
-        ssh_runner.get_status = mock_get_status
-
         input_file = temp_work_dir / "input.d12"
         job_handle = await ssh_runner.submit_job(
             job_id=1, work_dir=temp_work_dir, input_file=input_file
         )
 
-        # Stream output
-        output_lines = []
-        async for line in ssh_runner.get_output(job_handle):
-            output_lines.append(line)
-            if len(output_lines) >= 4:
-                break
+        output_lines = [line async for line in ssh_runner.get_output(job_handle)]
 
-        assert len(output_lines) > 0
+        assert output_lines == [
+            "CRYSTAL23 starting...",
+            "SCF iteration 1",
+            "SCF iteration 2",
+            "Convergence reached",
+        ]
+        # One channel served the output and the exit status
+        assert len(commands) == 1
+        assert "output.log" in commands[0]
+        assert await ssh_runner.get_status(job_handle) == JobStatus.COMPLETED
 
     @pytest.mark.asyncio
     async def test_stream_output_no_file(self, ssh_runner, temp_work_dir, mock_ssh_connection):
         """Test streaming when output file doesn't exist."""
-
-        # Mock file check to always fail
-        async def mock_run_no_file(cmd, check=False):
-            result = Mock()
-            result.stdout = ""
-            result.exit_status = 0
-
-            if "test -f" in cmd:
-                result.stdout = ""  # File doesn't exist
-            elif "echo $!" in cmd:
-                result.stdout = "12345\n"
-
-            return result
-
-        mock_ssh_connection.run = mock_run_no_file
+        self._remote_stream(mock_ssh_connection, b"@@tick\n@@exit 1\n")
 
         input_file = temp_work_dir / "input.d12"
         job_handle = await ssh_runner.submit_job(
@@ -481,6 +467,75 @@ class TestOutputStreaming:
         # Should get warning message
         assert len(output_lines) > 0
         assert "Output file not created" in output_lines[0]
+        assert await ssh_runner.get_status(job_handle) == JobStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_vasp_progress_uses_streamed_outcar(
+        self, mock_connection_manager, mock_ssh_connection, temp_work_dir
+    ):
+        """VASP progress is parsed from the streamed OUTCAR tail, not a per-call tail."""
+        from contextlib import asynccontextmanager
+
+        from src.core.codes import DFTCode
+
+        @asynccontextmanager
+        async def mock_get_connection(cluster_id):
+            yield mock_ssh_connection
+
+        mock_connection_manager.get_connection = mock_get_connection
+        runner = SSHRunner(
+            connection_manager=mock_connection_manager, cluster_id=1, dft_code=DFTCode.VASP
+        )
+        outcar = b"   NSW    =     10\n   1 F= -0.10000000E+02 E0= -0.10000000E+02\n"
+        commands = TestOutputStreaming._remote_stream(
+            mock_ssh_connection, b"@@data 1 0 %d\n" % len(outcar) + outcar + b"@@tick\n"
+        )
+        job_handle = "1:12345:/home/user/dft_jobs/job_1"
+        runner._active_jobs[job_handle] = {"pid": 12345, "status": JobStatus.RUNNING}
+
+        first = await runner.get_vasp_progress(job_handle)
+        second = await runner.get_vasp_progress(job_handle)
+
+        assert first.ionic_step == 1
+        assert second.ionic_step == 1
+        assert len(commands) >= 1
+        assert all("OUTCAR" in cmd for cmd in commands)
+        await runner.cleanup_all()
+
+    @pytest.mark.asyncio
+    async def test_stream_without_exit_code_is_replaced(self, ssh_runner, mock_ssh_connection):
+        """A stream that stopped before the job exited is not reused."""
+        self._remote_stream(mock_ssh_connection, b"@@tick\n")
+        job_handle = "1:12345:/home/user/dft_jobs/job_1"
+        ssh_runner._active_jobs[job_handle] = {"pid": 12345, "status": JobStatus.RUNNING}
+
+        first = ssh_runner._get_stream(job_handle)
+        await first.stop()
+        second = ssh_runner._get_stream(job_handle)
+
+        assert second is not first
+        assert not second.finished
+        await ssh_runner.cleanup_all()
+
+    @pytest.mark.asyncio
+    async def test_idle_streams_are_capped(self, ssh_runner, mock_ssh_connection, monkeypatch):
+        """Beyond the cap, the least recently used idle stream is closed."""
+        from src.runners import ssh_runner as ssh_runner_module
+
+        monkeypatch.setattr(ssh_runner_module, "_MAX_STREAMS", 2)
+        self._remote_stream(mock_ssh_connection, b"@@tick\n")
+        handles = [f"1:{pid}:/home/user/dft_jobs/job_{pid}" for pid in (101, 102, 103)]
+        for handle in handles:
+            ssh_runner._active_jobs[handle] = {"pid": 1, "status": JobStatus.RUNNING}
+
+        first = ssh_runner._get_stream(handles[0])
+        ssh_runner._get_stream(handles[1])
+        ssh_runner._get_stream(handles[0])  # now most recently used
+        ssh_runner._get_stream(handles[2])
+
+        assert list(ssh_runner._streams) == [handles[0], handles[2]]
+        assert ssh_runner._streams[handles[0]] is first
+        await ssh_runner.cleanup_all()
 
 
 class TestResultRetrieval:
@@ -0,0 +1,325 @@
+"""
+Tests for the content-addressed input staging cache.
+
+Remote commands run in a real local shell whose working directory stands in
+for the remote home, so hard links, copies and cleanup are exercised for real.
+Uploads go through an SFTP stand-in that counts what was actually sent.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.database import Database
+from src.runners.staging import OBJECTS_DIR, StagingCache
+from src.runners.transfer import SFTPTransferEngine
+
+
+class FakeSFTP:
+    """SFTP stand-in that records every uploaded file."""
+
+    def __init__(self):
+        self.puts = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def put(self, local: str, remote: str):
+        await asyncio.sleep(0.01)
+        self.puts.append(Path(remote).name)
+        Path(remote).write_bytes(Path(local).read_bytes())
+
+
+class LocalShellConnection:
+    """SSH connection stand-in running commands in a local shell."""
+
+    def __init__(self, home: Path):
+        self.home = home
+        self.sftp = FakeSFTP()
+        self.commands = []
+
+    async def start_sftp_client(self):
+        return self.sftp
+
+    async def run(self, command: str, check: bool = False):
+        self.commands.append(command)
+        process = await asyncio.create_subprocess_exec(
+            "sh",
+            "-c",
+            command,
+            cwd=self.home,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate()
+        return SimpleNamespace(
+            exit_status=process.returncode, stdout=stdout.decode(), stderr=stderr.decode()
+        )
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = Database(tmp_path / "staging.db")
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def cluster_id(db):
+    return db.create_cluster(name="hpc", type="ssh", hostname="hpc.example.com", username="user")
+
+
+@pytest.fixture
+def home(tmp_path):
+    path = tmp_path / "remote_home"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def conn(home):
+    return LocalShellConnection(home)
+
+
+@pytest.fixture
+def cache(db, cluster_id):
+    return StagingCache(db, cluster_id, min_size=1024)
+
+
+@pytest.fixture
+def store_all_cache(db, cluster_id):
+    """Cache that also stores restart files and never collects on its own."""
+    return StagingCache(db, cluster_id, min_size=1024, exclude_names=(), gc_interval=None)
+
+
+@pytest.fixture
+def engine():
+    return SFTPTransferEngine()
+
+
+@pytest.fixture
+def shared_inputs(tmp_path):
+    """Large inputs shared by every point of a scan."""
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    (shared / "POTCAR").write_bytes(b"PAW_PBE Si\n" * 2000)
+    (shared / "WAVECAR").write_bytes(os.urandom(8192))
+    return shared
+
+
+def make_job(tmp_path: Path, home: Path, shared: Path, index: int):
+    """Local job directory plus its remote counterpart and upload list."""
+    local = tmp_path / "jobs" / f"eos_{index:02d}"
+    local.mkdir(parents=True)
+    (local / "POSCAR").write_text(f"Si scale {0.95 + index * 0.005:.3f}\n")
+    for name in ("POTCAR", "WAVECAR"):
+        (local / name).write_bytes((shared / name).read_bytes())
+    remote = home / "dft_jobs" / local.name
+    remote.mkdir(parents=True)
+    files = [(path, str(remote / path.name)) for path in sorted(local.iterdir())]
+    return remote, files
+
+
+class TestStaging:
+    """Tests for StagingCache.stage()."""
+
+    async def test_eos_scan_uploads_shared_files_once(
+        self, tmp_path, home, conn, cache, engine, shared_inputs
+    ):
+        """A 20-point scan sends POTCAR once and every POSCAR and WAVECAR."""
+        remotes = []
+        for index in range(20):
+            remote, files = make_job(tmp_path, home, shared_inputs, index)
+            report = await cache.stage(conn, engine, files)
+            assert sorted(report.names) == ["POSCAR", "POTCAR", "WAVECAR"]
+            remotes.append(remote)
+
+        assert conn.sftp.puts.count("POTCAR") == 1
+        assert conn.sftp.puts.count("WAVECAR") == 20
+        assert conn.sftp.puts.count("POSCAR") == 20
+        # Restart files are not kept in the store
+        assert len(list((home / OBJECTS_DIR).iterdir())) == 1
+
+        for remote in remotes:
+            for name in ("POTCAR", "WAVECAR"):
+                assert (remote / name).read_bytes() == (shared_inputs / name).read_bytes()
+
+    async def test_report_marks_reused_files(
+        self, tmp_path, home, conn, cache, engine, shared_inputs
+    ):
+        """Files placed from the store are flagged and cost no bytes."""
+        _, files = make_job(tmp_path, home, shared_inputs, 0)
+        await cache.stage(conn, engine, files)
+        _, files = make_job(tmp_path, home, shared_inputs, 1)
+        report = await cache.stage(conn, engine, files)
+
+        reused = {stats.name: stats for stats in report.files if stats.deduplicated}
+        assert set(reused) == {"POTCAR"}
+        assert all(stats.bytes_transferred == 0 for stats in reused.values())
+        assert "1 reused from staging cache" in report.summary()
+
+    async def test_read_only_inputs_are_hard_linked_restart_files_copied(
+        self, tmp_path, home, conn, store_all_cache, engine, shared_inputs
+    ):
+        """WAVECAR is rewritten by VASP, so it must not share the stored inode."""
+        cache = store_all_cache
+        _, files = make_job(tmp_path, home, shared_inputs, 0)
+        await cache.stage(conn, engine, files)
+        remote, files = make_job(tmp_path, home, shared_inputs, 1)
+        await cache.stage(conn, engine, files)
+        assert conn.sftp.puts.count("WAVECAR") == 1
+
+        objects = home / OBJECTS_DIR
+        by_inode = {path.stat().st_ino: path.name for path in objects.iterdir()}
+        assert (remote / "POTCAR").stat().st_ino in by_inode
+        assert (remote / "WAVECAR").stat().st_ino not in by_inode
+
+        # Rewriting the job's WAVECAR leaves the stored copy intact
+        (remote / "WAVECAR").write_bytes(b"new wavefunction")
+        _, files = make_job(tmp_path, home, shared_inputs, 2)
+        await cache.stage(conn, engine, files)
+        assert (home / "dft_jobs" / "eos_02" / "WAVECAR").read_bytes() == (
+            shared_inputs / "WAVECAR"
+        ).read_bytes()
+
+    async def test_changed_contents_are_uploaded(
+        self, tmp_path, home, conn, cache, engine, shared_inputs
+    ):
+        """A modified file has a new digest and is sent again."""
+        _, files = make_job(tmp_path, home, shared_inputs, 0)
+        await cache.stage(conn, engine, files)
+
+        (shared_inputs / "POTCAR").write_bytes(b"PAW_PBE Ge\n" * 2000)
+        remote, files = make_job(tmp_path, home, shared_inputs, 1)
+        await cache.stage(conn, engine, files)
+
+        assert conn.sftp.puts.count("POTCAR") == 2
+        assert (remote / "POTCAR").read_bytes().startswith(b"PAW_PBE Ge")
+
+    async def test_missing_remote_object_is_reuploaded(
+        self, tmp_path, home, conn, cache, engine, shared_inputs, db, cluster_id
+    ):
+        """Objects purged on the cluster are dropped from the index and resent."""
+        _, files = make_job(tmp_path, home, shared_inputs, 0)
+        await cache.stage(conn, engine, files)
+        for path in (home / OBJECTS_DIR).iterdir():
+            path.unlink()
+
+        remote, files = make_job(tmp_path, home, shared_inputs, 1)
+        await cache.stage(conn, engine, files)
+
+        assert conn.sftp.puts.count("POTCAR") == 2
+        assert (remote / "POTCAR").read_bytes() == (shared_inputs / "POTCAR").read_bytes()
+        assert len(db.list_staged_objects(cluster_id)) == 1
+        assert len(list((home / OBJECTS_DIR).iterdir())) == 1
+
+    async def test_concurrent_submissions_upload_once(
+        self, tmp_path, home, conn, cache, engine, shared_inputs
+    ):
+        """Parallel submissions of the same inputs wait for the first upload."""
+        jobs = [make_job(tmp_path, home, shared_inputs, index) for index in range(5)]
+
+        await asyncio.gather(*(cache.stage(conn, engine, files) for _, files in jobs))
+
+        assert conn.sftp.puts.count("POTCAR") == 1
+        for remote, _ in jobs:
+            assert (remote / "POTCAR").read_bytes() == (shared_inputs / "POTCAR").read_bytes()
+
+    async def test_small_files_bypass_the_store(
+        self, tmp_path, home, conn, cache, engine, shared_inputs, db, cluster_id
+    ):
+        """Files below min_size are neither hashed into the store nor indexed."""
+        _, files = make_job(tmp_path, home, shared_inputs, 0)
+        await cache.stage(conn, engine, [f for f in files if f[0].name == "POSCAR"])
+
+        assert db.list_staged_objects(cluster_id) == []
+        assert conn.commands == []
+
+
+class TestGarbageCollection:
+    """Tests for StagingCache.collect_garbage()."""
+
+    @pytest.fixture
+    def cache(self, store_all_cache):
+        return store_all_cache
+
+    async def _stage_two_jobs(self, tmp_path, home, conn, cache, engine, shared_inputs):
+        remotes = []
+        for index in range(2):
+            remote, files = make_job(tmp_path, home, shared_inputs, index)
+            await cache.stage(conn, engine, files)
+            remotes.append(remote)
+        return remotes
+
+    def _age(self, db, digest=None, when="2000-01-01 00:00:00"):
+        with db.connection() as conn, conn:
+            if digest is None:
+                conn.execute("UPDATE staged_objects SET last_used_at = ?", (when,))
+            else:
+                conn.execute(
+                    "UPDATE staged_objects SET last_used_at = ? WHERE digest = ?",
+                    (when, digest),
+                )
+
+    async def test_recent_objects_are_kept(
+        self, tmp_path, home, conn, cache, engine, shared_inputs
+    ):
+        await self._stage_two_jobs(tmp_path, home, conn, cache, engine, shared_inputs)
+
+        assert await cache.collect_garbage(conn) == []
+        assert len(list((home / OBJECTS_DIR).iterdir())) == 2
+
+    async def test_expired_objects_are_removed_without_breaking_jobs(
+        self, tmp_path, home, conn, cache, engine, shared_inputs, db, cluster_id
+    ):
+        remotes = await self._stage_two_jobs(tmp_path, home, conn, cache, engine, shared_inputs)
+        self._age(db)
+
+        removed = await cache.collect_garbage(conn, max_age_days=30)
+
+        assert len(removed) == 2
+        assert list((home / OBJECTS_DIR).iterdir()) == []
+        assert db.list_staged_objects(cluster_id) == []
+        for remote in remotes:
+            assert (remote / "POTCAR").read_bytes() == (shared_inputs / "POTCAR").read_bytes()
+
+    async def test_size_budget_removes_least_recently_used(
+        self, tmp_path, home, conn, cache, engine, shared_inputs, db, cluster_id
+    ):
+        await self._stage_two_jobs(tmp_path, home, conn, cache, engine, shared_inputs)
+        objects = {obj.size: obj.digest for obj in db.list_staged_objects(cluster_id)}
+        potcar_size = (shared_inputs / "POTCAR").stat().st_size
+        self._age(db, objects[potcar_size], when="2001-01-01 00:00:00")
+
+        removed = await cache.collect_garbage(conn, max_age_days=36500, max_total_bytes=10000)
+
+        assert removed == [objects[potcar_size]]
+        assert [obj.size for obj in db.list_staged_objects(cluster_id)] == [8192]
+
+    async def test_stage_collects_expired_objects(
+        self, tmp_path, home, conn, engine, shared_inputs, db, cluster_id
+    ):
+        """stage() runs the collection itself once gc_interval has passed."""
+        cache = StagingCache(db, cluster_id, min_size=1024, gc_interval=0)
+        _, files = make_job(tmp_path, home, shared_inputs, 0)
+        await cache.stage(conn, engine, files)
+        (old,) = [obj.digest for obj in db.list_staged_objects(cluster_id)]
+        self._age(db)
+
+        (shared_inputs / "POTCAR").write_bytes(b"PAW_PBE Ge\n" * 2000)
+        _, files = make_job(tmp_path, home, shared_inputs, 1)
+        await cache.stage(conn, engine, files)
+
+        digests = [obj.digest for obj in db.list_staged_objects(cluster_id)]
+        assert len(digests) == 1 and old not in digests
+        assert [path.name for path in (home / OBJECTS_DIR).iterdir()] == digests
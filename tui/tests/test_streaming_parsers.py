@@ -0,0 +1,247 @@
+"""
+Tests for the chunked streaming and tail-first modes of the QE and VASP parsers.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.codes.parsers import streaming
+from src.core.codes.parsers.quantum_espresso import QuantumEspressoParser
+from src.core.codes.parsers.vasp import VASPParser
+
+QE_HEADER = """
+     Program PWSCF v.7.2 starts on 15Dec2024 at 10:30:15
+
+     BFGS Geometry Optimization
+"""
+
+QE_STEP = """
+     iteration #  1     ecut=    60.00 Ry
+     iteration #  2     ecut=    60.00 Ry
+     Warning: step {step} took long
+!    total energy              =     {energy:.8f} Ry
+     convergence has been achieved in   2 iterations
+
+     Total force =     0.{step:06d}
+"""
+
+QE_FOOTER = """
+     bfgs converged in   5 scf cycles and   4 bfgs steps
+     End of BFGS Geometry Optimization
+
+     JOB DONE.
+"""
+
+OUTCAR_HEADER = """
+ running on    8 total cores
+ IBRION = 2
+ NSW = 100
+   NPAR = 4
+"""
+
+OUTCAR_STEP = """
+   FREE ENERGIE OF THE ION-ELECTRON SYSTEM (eV)
+   ---------------------------------------------------
+
+       1       -10.12345       0.12E-02
+       2       -10.45678       0.45E-03
+
+------------------------ aborting loop because EDIFF is reached ----------------------
+
+  free  energy   TOTEN  =       {energy:.8f} eV
+
+  energy  without entropy =       {energy:.8f}
+
+  TOTAL-FORCE (eV/Angst)
+  total drift  RMS 0.0{step:04d}
+     POTLOK:  cpu time    1.50: real time    1.60
+     LOOP+:  cpu time   12.00: real time   13.00
+"""
+
+OUTCAR_FOOTER = """
+ reached required accuracy - stopping structural energy minimisation
+
+ General timing and accounting informance:
+
+  Total CPU time used (sec):       120.456
+  Elapsed time (sec):       130.000
+"""
+
+
+def write_qe(path: Path, steps: int) -> Path:
+    body = "".join(QE_STEP.format(step=i, energy=-65.0 - i * 1e-4) for i in range(steps))
+    path.write_text(QE_HEADER + body + QE_FOOTER)
+    return path
+
+
+def write_outcar(path: Path, steps: int) -> Path:
+    body = "".join(OUTCAR_STEP.format(step=i, energy=-85.0 - i * 1e-4) for i in range(steps))
+    path.write_text(OUTCAR_HEADER + body + OUTCAR_FOOTER)
+    return path
+
+
+class TestIterChunks:
+    """Chunks end on line boundaries and cover the file exactly."""
+
+    def test_chunks_split_on_newlines(self, tmp_path):
+        path = tmp_path / "out"
+        data = b"".join(b"line %d\n" % i for i in range(100)) + b"x" * 50 + b"\nlast"
+        path.write_bytes(data)
+
+        with open(path, "rb") as f:
+            chunks = list(streaming.iter_chunks(f, chunk_size=16))
+
+        assert b"".join(chunk for _, chunk in chunks) == data
+        assert all(chunk.endswith(b"\n") for _, chunk in chunks[:-1])
+        assert [offset for offset, _ in chunks] == [
+            sum(len(c) for _, c in chunks[:i]) for i in range(len(chunks))
+        ]
+
+    def test_last_match_searches_back_past_first_window(self, monkeypatch):
+        monkeypatch.setattr(streaming, "_LAST_MATCH_WINDOW", 8)
+        pattern = re.compile(rb"E = (\d+)")
+        data = b"E = 1\nE = 2\n" + b"padding\n" * 20
+
+        assert streaming.last_match(pattern, data).group(1) == b"2"
+        assert streaming.last_match(pattern, b"padding\n" * 20) is None
+
+
+class TestQuantumEspressoStreaming:
+    """Streaming QE results do not depend on how the file is chunked."""
+
+    def test_small_chunks_match_single_chunk(self, tmp_path, monkeypatch):
+        path = write_qe(tmp_path / "pw.out", 50)
+        parser = QuantumEspressoParser()
+        whole = parser.parse_sync(path)
+
+        monkeypatch.setattr(streaming, "DEFAULT_CHUNK_SIZE", 97)
+        chunked = parser.parse_sync(path)
+
+        assert chunked == whole
+        assert whole.final_energy == pytest.approx(-65.0049)
+        assert whole.scf_cycles == 2
+        assert whole.convergence_status == "CONVERGED"
+        assert whole.geometry_converged is True
+        assert whole.metadata["total_force"] == pytest.approx(0.000049)
+        assert len(whole.warnings) == 5
+
+    def test_undecodable_bytes_are_replaced(self, tmp_path):
+        path = tmp_path / "pw.out"
+        path.write_bytes(b"  Error in routine cdiaghg \xff\xfe\n     JOB DONE.\n")
+
+        result = QuantumEspressoParser().parse_sync(path)
+
+        assert result.success is False
+        assert result.errors == ["Error in routine cdiaghg ��"]
+
+
+class TestQuantumEspressoTail:
+    """parse_tail_sync answers energy and convergence from the end when it can."""
+
+    def test_tail_matches_full_parse(self, tmp_path):
+        path = write_qe(tmp_path / "pw.out", 2000)
+        parser = QuantumEspressoParser()
+
+        full = parser.parse_sync(path)
+        tail = parser.parse_tail_sync(path, tail_bytes=1024)
+
+        assert tail.metadata["tail_only"] is True
+        assert tail.final_energy == full.final_energy
+        assert tail.convergence_status == full.convergence_status == "CONVERGED"
+        assert tail.errors == [] and tail.scf_cycles is None
+
+    def test_inconclusive_tail_parses_whole_file(self, tmp_path):
+        path = write_qe(tmp_path / "pw.out", 200)
+        # The last SCF did not converge; earlier ones did, so only the whole
+        # file gives the full parse's status
+        with open(path, "a") as f:
+            f.write("     convergence NOT achieved after 100 iterations: stopping\n" * 50)
+        parser = QuantumEspressoParser()
+
+        result = parser.parse_tail_sync(path, tail_bytes=1024)
+
+        assert "tail_only" not in result.metadata
+        assert result == parser.parse_sync(path)
+
+    def test_small_file_gives_full_result(self, tmp_path):
+        path = write_qe(tmp_path / "pw.out", 2)
+        parser = QuantumEspressoParser()
+
+        assert parser.parse_tail_sync(path) == parser.parse_sync(path)
+
+    @pytest.mark.asyncio
+    async def test_async_tail(self, tmp_path):
+        path = write_qe(tmp_path / "pw.out", 2000)
+
+        result = await QuantumEspressoParser().parse_tail(path, tail_bytes=1024)
+
+        assert result.final_energy == pytest.approx(-65.1999)
+        assert result.metadata["tail_only"] is True
+
+
+class TestVASPStreaming:
+    """Streaming OUTCAR results do not depend on how the file is chunked."""
+
+    def test_small_chunks_match_single_chunk(self, tmp_path, monkeypatch):
+        path = write_outcar(tmp_path / "OUTCAR", 30)
+        parser = VASPParser()
+        whole = parser.parse_sync(path)
+
+        monkeypatch.setattr(streaming, "DEFAULT_CHUNK_SIZE", 97)
+        chunked = parser.parse_sync(path)
+
+        assert chunked == whole
+        assert whole.final_energy == pytest.approx(-85.0029)
+        assert whole.scf_cycles == 2
+        assert whole.convergence_status == "CONVERGED"
+        assert whole.metadata["rms_force"] == pytest.approx(0.0)
+        benchmark = whole.metadata["benchmark"]
+        assert benchmark["loop_plus_count"] == 30
+        assert benchmark["routine_timings"]["POTLOK"]["count"] == 30
+        assert benchmark["npar"] == 4
+        assert benchmark["parallel_efficiency"] == pytest.approx(120.456 / (130.0 * 8))
+
+    def test_extract_timing_data_matches_parse(self, tmp_path):
+        path = write_outcar(tmp_path / "OUTCAR", 5)
+        parser = VASPParser()
+
+        expected = parser.parse_sync(path).metadata["benchmark"]
+        assert parser.extract_timing_data(path.read_text()) == expected
+
+
+class TestVASPTail:
+    """parse_tail_sync answers energy and convergence from the end when it can."""
+
+    def test_tail_matches_full_parse(self, tmp_path):
+        path = write_outcar(tmp_path / "OUTCAR", 1000)
+        parser = VASPParser()
+
+        full = parser.parse_sync(path)
+        tail = parser.parse_tail_sync(tmp_path, tail_bytes=1024)
+
+        assert tail.metadata == {"parser": "vasp", "tail_only": True}
+        assert tail.final_energy == full.final_energy
+        assert tail.convergence_status == full.convergence_status == "CONVERGED"
+
+    def test_unfinished_run_parses_whole_file(self, tmp_path):
+        path = write_outcar(tmp_path / "OUTCAR", 1000)
+        path.write_text(path.read_text().replace(OUTCAR_FOOTER, ""))
+        parser = VASPParser()
+
+        result = parser.parse_tail_sync(path, tail_bytes=1024)
+
+        assert "tail_only" not in result.metadata
+        assert result == parser.parse_sync(path)
+        assert result.metadata["benchmark"]["loop_plus_count"] == 1000
+
+    def test_missing_outcar(self, tmp_path):
+        result = VASPParser().parse_tail_sync(tmp_path / "OUTCAR")
+
+        assert result.success is False
+        assert "not found" in result.errors[0]
@@ -0,0 +1,393 @@
+"""
+Tests for the SFTP transfer engine shared by SSHRunner and SLURMRunner.
+
+The engine is exercised against an in-memory SFTP stand-in that maps remote
+paths onto a temporary directory, so chunking, resume and concurrency are
+tested on real file contents.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.runners.transfer import (
+    PART_SOURCE_SUFFIX,
+    PART_SUFFIX,
+    SFTPTransferEngine,
+    TransferError,
+    TransferReport,
+    TransferStats,
+    is_safe_remote_name,
+)
+
+
+class FakeRemoteFile:
+    """Ranged reads/writes on a file below the fake remote root."""
+
+    def __init__(self, sftp: "FakeSFTP", handle):
+        self.sftp = sftp
+        self.handle = handle
+
+    async def read(self, length: int, offset: int) -> bytes:
+        await asyncio.sleep(0)
+        self.sftp.reads += 1
+        if self.sftp.fail_after_reads is not None and self.sftp.reads > self.sftp.fail_after_reads:
+            raise ConnectionError("connection lost")
+        self.handle.seek(offset)
+        return self.handle.read(length)
+
+    async def write(self, data: bytes, offset: int) -> int:
+        await asyncio.sleep(0)
+        self.sftp.writes += 1
+        if (
+            self.sftp.fail_after_writes is not None
+            and self.sftp.writes > self.sftp.fail_after_writes
+        ):
+            raise ConnectionError("connection lost")
+        self.handle.seek(offset)
+        return self.handle.write(data)
+
+
+class FakeSFTP:
+    """Minimal asyncssh.SFTPClient stand-in rooted at a local directory."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.reads = 0
+        self.writes = 0
+        self.fail_after_writes = None
+        self.fail_after_reads = None
+        self.active = 0
+        self.peak_active = 0
+        self.puts = []
+        self.gets = []
+
+    def _path(self, remote: str) -> Path:
+        return self.root / remote.lstrip("/")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def listdir(self, remote_dir: str):
+        return [".", ".."] + sorted(os.listdir(self._path(remote_dir)))
+
+    async def stat(self, remote: str):
+        st = self._path(remote).stat()
+        return SimpleNamespace(size=st.st_size, mtime=int(st.st_mtime))
+
+    async def exists(self, remote: str) -> bool:
+        return self._path(remote).exists()
+
+    async def _track(self):
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+
+    async def put(self, local: str, remote: str):
+        await self._track()
+        self.puts.append(remote)
+        self._path(remote).write_bytes(Path(local).read_bytes())
+
+    async def get(self, remote: str, local: str):
+        await self._track()
+        self.gets.append(remote)
+        Path(local).write_bytes(self._path(remote).read_bytes())
+
+    @contextlib.asynccontextmanager
+    async def open(self, remote: str, mode: str):
+        with open(self._path(remote), mode) as handle:
+            yield FakeRemoteFile(self, handle)
+
+    async def posix_rename(self, source: str, dest: str):
+        os.replace(self._path(source), self._path(dest))
+
+    async def rename(self, source: str, dest: str):
+        os.rename(self._path(source), self._path(dest))
+
+    async def remove(self, remote: str):
+        self._path(remote).unlink()
+
+
+class FakeConnection:
+    """SSH connection stand-in exposing SFTP and ``sha256sum``."""
+
+    def __init__(self, root: Path):
+        self.sftp = FakeSFTP(root)
+        self.corrupt_checksums = False
+
+    async def start_sftp_client(self):
+        return self.sftp
+
+    async def run(self, command: str, check: bool = False):
+        path = self.sftp._path(command.split(" ", 1)[1].strip("'"))
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        if self.corrupt_checksums:
+            digest = "0" * 64
+        return SimpleNamespace(exit_status=0, stdout=f"{digest}  {path}\n", stderr="")
+
+
+@pytest.fixture
+def remote_root(tmp_path):
+    root = tmp_path / "remote"
+    (root / "job").mkdir(parents=True)
+    return root
+
+
+@pytest.fixture
+def conn(remote_root):
+    return FakeConnection(remote_root)
+
+
+@pytest.fixture
+def engine():
+    # Tiny chunks so "large" files stay small in tests
+    return SFTPTransferEngine(chunk_size=1024, chunked_threshold=8 * 1024, max_requests_per_file=4)
+
+
+def payload(size: int) -> bytes:
+    return bytes(i % 251 for i in range(size))
+
+
+class TestReport:
+    """Tests for TransferReport bookkeeping."""
+
+    def test_totals_and_summary(self):
+        report = TransferReport(
+            files=[
+                TransferStats(name="a", direction="upload", bytes_transferred=1024),
+                TransferStats(name="b", direction="upload", bytes_transferred=2048),
+            ],
+            elapsed=2.0,
+        )
+        assert report.names == ["a", "b"]
+        assert report.bytes_transferred == 3072
+        assert report.throughput == 1536
+        assert "2 files" in report.summary()
+
+    def test_raise_for_failures(self):
+        report = TransferReport(failures={"WAVECAR": "connection lost"})
+        with pytest.raises(TransferError) as exc_info:
+            report.raise_for_failures()
+        assert exc_info.value.failures == {"WAVECAR": "connection lost"}
+
+    def test_no_failures_does_not_raise(self):
+        TransferReport().raise_for_failures()
+
+    @pytest.mark.parametrize(
+        "name,safe",
+        [("OUTCAR", True), ("..", False), (".", False), ("a/b", False), ("a\\b", False)],
+    )
+    def test_is_safe_remote_name(self, name, safe):
+        assert is_safe_remote_name(name) is safe
+
+
+class TestUpload:
+    """Tests for uploads."""
+
+    async def test_small_files_use_put(self, engine, conn, remote_root, tmp_path):
+        local = tmp_path / "INCAR"
+        local.write_text("ENCUT = 520\n")
+
+        report = await engine.upload(conn, [(local, "/job/INCAR")])
+
+        assert report.names == ["INCAR"]
+        assert conn.sftp.puts == ["/job/INCAR"]
+        assert (remote_root / "job" / "INCAR").read_text() == "ENCUT = 520\n"
+
+    async def test_large_file_is_chunked(self, engine, conn, remote_root, tmp_path):
+        data = payload(20 * 1024 + 17)
+        local = tmp_path / "WAVECAR"
+        local.write_bytes(data)
+
+        report = await engine.upload(conn, [(local, "/job/WAVECAR")])
+
+        stats = report.files[0]
+        assert stats.chunks == 21
+        assert stats.bytes_transferred == len(data)
+        assert conn.sftp.puts == []
+        assert (remote_root / "job" / "WAVECAR").read_bytes() == data
+        assert not (remote_root / "job" / ("WAVECAR" + PART_SUFFIX)).exists()
+
+    async def test_interrupted_upload_resumes_from_part(self, engine, conn, remote_root, tmp_path):
+        data = payload(40 * 1024)
+        local = tmp_path / "CHGCAR"
+        local.write_bytes(data)
+
+        conn.sftp.fail_after_writes = 20
+        report = await engine.upload(conn, [(local, "/job/CHGCAR")])
+        assert "CHGCAR" in report.failures
+        assert (remote_root / "job" / ("CHGCAR" + PART_SUFFIX)).exists()
+
+        conn.sftp.fail_after_writes = None
+        conn.sftp.writes = 0
+        report = await engine.upload(conn, [(local, "/job/CHGCAR")])
+
+        stats = report.files[0]
+        assert stats.resumed_from > 0
+        assert stats.bytes_transferred == len(data) - stats.resumed_from
+        assert conn.sftp.writes < 40
+        assert (remote_root / "job" / "CHGCAR").read_bytes() == data
+        assert not (remote_root / "job" / ("CHGCAR" + PART_SUFFIX + PART_SOURCE_SUFFIX)).exists()
+
+    async def test_upload_restarts_when_local_file_changed(
+        self, engine, conn, remote_root, tmp_path
+    ):
+        local = tmp_path / "CHGCAR"
+        local.write_bytes(payload(40 * 1024))
+        conn.sftp.fail_after_writes = 20
+        await engine.upload(conn, [(local, "/job/CHGCAR")])
+
+        data = bytes(reversed(payload(40 * 1024)))
+        local.write_bytes(data)
+        os.utime(local, ns=(local.stat().st_atime_ns, local.stat().st_mtime_ns + 10**9))
+        conn.sftp.fail_after_writes = None
+        report = await engine.upload(conn, [(local, "/job/CHGCAR")])
+
+        assert report.files[0].resumed_from == 0
+        assert (remote_root / "job" / "CHGCAR").read_bytes() == data
+
+    async def test_failures_do_not_stop_other_files(self, engine, conn, tmp_path):
+        good = tmp_path / "POSCAR"
+        good.write_text("Si\n")
+
+        report = await engine.upload(
+            conn, [(tmp_path / "missing", "/job/missing"), (good, "/job/POSCAR")]
+        )
+
+        assert report.names == ["POSCAR"]
+        assert set(report.failures) == {"missing"}
+
+    async def test_files_transfer_concurrently(self, conn, tmp_path):
+        files = []
+        for i in range(6):
+            local = tmp_path / f"file{i}"
+            local.write_text(str(i))
+            files.append((local, f"/job/file{i}"))
+
+        report = await SFTPTransferEngine(max_concurrent_files=3).upload(conn, files)
+
+        assert report.names == [f"file{i}" for i in range(6)]
+        assert conn.sftp.peak_active == 3
+
+
+class TestDownload:
+    """Tests for downloads."""
+
+    async def test_download_matching_filters_patterns(self, engine, conn, remote_root, tmp_path):
+        job = remote_root / "job"
+        (job / "OUTCAR").write_text("outcar")
+        (job / "vasprun.xml").write_text("<xml/>")
+        (job / "POTCAR").write_text("potcar")
+        local_dir = tmp_path / "results"
+        local_dir.mkdir()
+
+        report = await engine.download_matching(conn, "/job", local_dir, ["OUTCAR", "*.xml"])
+
+        assert sorted(report.names) == ["OUTCAR", "vasprun.xml"]
+        assert (local_dir / "OUTCAR").read_text() == "outcar"
+        assert not (local_dir / "POTCAR").exists()
+
+    async def test_large_download_is_chunked(self, engine, conn, remote_root, tmp_path):
+        data = payload(30 * 1024 + 5)
+        (remote_root / "job" / "WAVECAR").write_bytes(data)
+
+        report = await engine.download(conn, [("/job/WAVECAR", tmp_path / "WAVECAR")])
+
+        stats = report.files[0]
+        assert stats.chunks == 31
+        assert conn.sftp.gets == []
+        assert (tmp_path / "WAVECAR").read_bytes() == data
+        assert not (tmp_path / ("WAVECAR" + PART_SUFFIX)).exists()
+
+    async def test_download_resumes_from_part(self, engine, conn, remote_root, tmp_path):
+        data = payload(30 * 1024)
+        (remote_root / "job" / "fort.9").write_bytes(data)
+
+        conn.sftp.fail_after_reads = 12
+        report = await engine.download(conn, [("/job/fort.9", tmp_path / "fort.9")])
+        assert "fort.9" in report.failures
+        assert (tmp_path / ("fort.9" + PART_SUFFIX)).stat().st_size == 12 * 1024
+
+        conn.sftp.fail_after_reads = None
+        conn.sftp.reads = 0
+        report = await engine.download(conn, [("/job/fort.9", tmp_path / "fort.9")])
+
+        stats = report.files[0]
+        assert stats.resumed_from == 12 * 1024
+        assert stats.bytes_transferred == 18 * 1024
+        assert conn.sftp.reads == 18
+        assert (tmp_path / "fort.9").read_bytes() == data
+        assert not (tmp_path / ("fort.9" + PART_SUFFIX + PART_SOURCE_SUFFIX)).exists()
+
+    async def test_part_of_changed_source_is_discarded(self, engine, conn, remote_root, tmp_path):
+        remote = remote_root / "job" / "fort.9"
+        remote.write_bytes(payload(30 * 1024))
+        conn.sftp.fail_after_reads = 12
+        await engine.download(conn, [("/job/fort.9", tmp_path / "fort.9")])
+
+        # Rewritten by a restarted job: same size, new contents and mtime
+        data = bytes(reversed(payload(30 * 1024)))
+        remote.write_bytes(data)
+        os.utime(remote, (remote.stat().st_atime, remote.stat().st_mtime + 60))
+        conn.sftp.fail_after_reads = None
+        report = await engine.download(conn, [("/job/fort.9", tmp_path / "fort.9")])
+
+        assert report.files[0].resumed_from == 0
+        assert (tmp_path / "fort.9").read_bytes() == data
+
+    async def test_part_without_source_record_is_discarded(
+        self, engine, conn, remote_root, tmp_path
+    ):
+        data = payload(30 * 1024)
+        (remote_root / "job" / "fort.9").write_bytes(data)
+        (tmp_path / ("fort.9" + PART_SUFFIX)).write_bytes(payload(12 * 1024))
+
+        report = await engine.download(conn, [("/job/fort.9", tmp_path / "fort.9")])
+
+        assert report.files[0].resumed_from == 0
+        assert (tmp_path / "fort.9").read_bytes() == data
+
+    async def test_oversized_part_is_discarded(self, engine, conn, remote_root, tmp_path):
+        data = payload(10 * 1024)
+        (remote_root / "job" / "fort.9").write_bytes(data)
+        (tmp_path / ("fort.9" + PART_SUFFIX)).write_bytes(payload(11 * 1024))
+
+        report = await engine.download(conn, [("/job/fort.9", tmp_path / "fort.9")])
+
+        assert report.files[0].resumed_from == 0
+        assert (tmp_path / "fort.9").read_bytes() == data
+
+
+class TestChecksums:
+    """Tests for optional SHA-256 verification."""
+
+    async def test_matching_checksum_is_verified(self, conn, remote_root, tmp_path):
+        (remote_root / "job" / "OUTCAR").write_text("done")
+        engine = SFTPTransferEngine(verify_checksums=True)
+
+        report = await engine.download(conn, [("/job/OUTCAR", tmp_path / "OUTCAR")])
+
+        assert report.files[0].verified is True
+
+    async def test_mismatch_is_reported_as_failure(self, conn, remote_root, tmp_path):
+        (remote_root / "job" / "OUTCAR").write_text("done")
+        conn.corrupt_checksums = True
+        engine = SFTPTransferEngine(verify_checksums=True)
+
+        report = await engine.download(conn, [("/job/OUTCAR", tmp_path / "OUTCAR")])
+
+        assert report.files == []
+        assert "Checksum mismatch" in report.failures["OUTCAR"]
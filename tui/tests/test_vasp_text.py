@@ -0,0 +1,262 @@
+"""
+Tests for the vectorized DOSCAR, EIGENVAL and PROCAR readers and their
+sidecar cache.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.postprocessing import extract_bands_vasp, extract_dos_vasp, read_procar, vasp_text
+from src.postprocessing.cache import cached_arrays, sidecar_path
+
+NEDOS, NSITES, NKPTS, NBANDS, NIONS = 6, 2, 3, 4, 2
+FERMI = 1.25
+LM = ["s", "py", "pz", "px", "dxy", "dyz", "dz2", "dxz", "x2-y2"]
+
+
+def _row(values) -> str:
+    return " ".join(f"{x:12.8f}" for x in values)
+
+
+def make_doscar(path: Path, spin: bool = False, norb: int = 9) -> dict:
+    """Write a DOSCAR with per-site blocks and return the arrays in it."""
+    rng = np.random.default_rng(1)
+    nspin = 2 if spin else 1
+    energy = np.linspace(-4.0, 6.0, NEDOS)
+    dos = rng.random((NEDOS, nspin))
+    integrated = np.cumsum(dos, axis=0)
+    partial = rng.random((NSITES, NEDOS, norb, nspin))
+
+    header_line = f"{6.0:12.8f}{-4.0:12.8f}{NEDOS:6d}{FERMI:12.8f}{1.0:12.8f}"
+    lines = [f"{NSITES:4d}{NSITES:4d}   1   0", "  0.1E+02", "  1.0E-09", "  CAR ", " test"]
+    lines.append(header_line)
+    lines += [_row([e, *dos[i], *integrated[i]]) for i, e in enumerate(energy)]
+    for site in range(NSITES):
+        lines.append(header_line)
+        lines += [_row([e, *partial[site, i].ravel()]) for i, e in enumerate(energy)]
+    path.write_text("\n".join(lines) + "\n")
+    return {"energy": energy, "dos": dos, "integrated": integrated, "partial": partial}
+
+
+def make_eigenval(path: Path, spin: bool = False, occupations: bool = True) -> dict:
+    """Write an EIGENVAL and return the arrays in it."""
+    rng = np.random.default_rng(2)
+    nspin = 2 if spin else 1
+    kpoints = rng.random((NKPTS, 3))
+    energies = np.sort(rng.random((NKPTS, NBANDS, nspin)) * 10 - 5, axis=1)
+    occ = (energies < 0).astype(float)
+
+    lines = [f"    2    2    1    {nspin}", "  0.1E+02", "  1.0E-09", "  CAR ", " test"]
+    lines += [f"     8  {NKPTS}  {NBANDS}", ""]
+    for k in range(NKPTS):
+        lines.append(_row([*kpoints[k], 1.0 / NKPTS]))
+        for b in range(NBANDS):
+            values = [*energies[k, b]] + ([*occ[k, b]] if occupations else [])
+            lines.append(f"{b + 1:5d} " + _row(values))
+        lines.append("")
+    path.write_text("\n".join(lines) + "\n")
+    return {"kpoints": kpoints, "energies": energies, "occupations": occ}
+
+
+def make_procar(path: Path, nspin: int = 1) -> dict:
+    """Write an lm-decomposed PROCAR and return the arrays in it."""
+    rng = np.random.default_rng(3)
+    # The second k-point has run-together negative coordinates
+    kpoints = np.array([[0.0, 0.0, 0.0], [0.5, -0.25, -0.125], [0.25, 0.25, 0.0]])
+    energies = rng.random((nspin, NKPTS, NBANDS))
+    proj = rng.random((nspin, NKPTS, NBANDS, NIONS, len(LM))).round(3)
+
+    lines = ["PROCAR lm decomposed"]
+    for s in range(nspin):
+        lines.append(
+            f"# of k-points:  {NKPTS}         # of bands:  {NBANDS}         # of ions:  {NIONS}"
+        )
+        for k in range(NKPTS):
+            coords = "".join(f"{x:11.8f}" for x in kpoints[k])
+            lines += ["", f" k-point    {k + 1} :   {coords}     weight = 0.33333333", ""]
+            for b in range(NBANDS):
+                lines += [f"band     {b + 1} # energy  {energies[s, k, b]:12.8f} # occ.  1.00", ""]
+                lines.append("ion      " + "  ".join(LM) + "    tot")
+                for i in range(NIONS):
+                    values = proj[s, k, b, i]
+                    lines.append(f"    {i + 1} " + " ".join(f"{x:6.3f}" for x in values))
+                    lines[-1] += f" {values.sum():6.3f}"
+                lines.append("tot   " + " ".join(f"{x:6.3f}" for x in proj[s, k, b].sum(0)))
+                lines.append("")
+    path.write_text("\n".join(lines) + "\n")
+    return {"kpoints": kpoints, "energies": energies, "projections": proj}
+
+
+class TestDoscar:
+    """Tests for reading DOSCAR."""
+
+    def test_total_and_site_projected_dos(self, tmp_path):
+        path = tmp_path / "DOSCAR"
+        ref = make_doscar(path)
+
+        dos, pdos = extract_dos_vasp(doscar_path=path)
+
+        assert dos.nedos == NEDOS and dos.fermi_energy == pytest.approx(FERMI)
+        assert not dos.is_spin_polarized
+        np.testing.assert_allclose(dos.energy, ref["energy"], atol=1e-7)
+        np.testing.assert_allclose(dos.total_dos, ref["dos"][:, 0], atol=1e-7)
+        assert sorted(pdos.atom_projections) == list(range(NSITES))
+        assert pdos.orbital_labels[:4] == ["s", "py", "pz", "px"]
+        np.testing.assert_allclose(
+            pdos.atom_projections[1]["dz2"], ref["partial"][1, :, 6, 0], atol=1e-7
+        )
+
+    def test_spin_channels_are_summed(self, tmp_path):
+        path = tmp_path / "DOSCAR"
+        ref = make_doscar(path, spin=True, norb=3)
+
+        dos, pdos = extract_dos_vasp(doscar_path=path)
+
+        assert dos.is_spin_polarized
+        np.testing.assert_allclose(dos.spin_down, ref["dos"][:, 1], atol=1e-7)
+        np.testing.assert_allclose(dos.total_dos, ref["dos"].sum(axis=1), atol=1e-7)
+        np.testing.assert_allclose(dos.integrated_dos, ref["integrated"].sum(axis=1), atol=1e-7)
+        assert pdos.orbital_labels == ["s", "p", "d"]
+        np.testing.assert_allclose(
+            pdos.atom_projections[0]["p"], ref["partial"][0, :, 1].sum(axis=1), atol=1e-7
+        )
+
+    def test_without_site_blocks(self, tmp_path):
+        path = tmp_path / "DOSCAR"
+        make_doscar(path)
+        lines = path.read_text().splitlines()
+        path.write_text("\n".join(lines[: 6 + NEDOS]) + "\n")
+
+        dos, pdos = extract_dos_vasp(doscar_path=path)
+
+        assert dos.nedos == NEDOS
+        assert pdos is None
+
+    def test_fortran_three_digit_exponent(self, tmp_path):
+        path = tmp_path / "DOSCAR"
+        make_doscar(path)
+        lines = path.read_text().splitlines()
+        lines[7] = "  -2.00000000   0.1234-100   0.50000000"
+        path.write_text("\n".join(lines) + "\n")
+
+        arrays = vasp_text.read_doscar(path, cache=False)
+
+        assert arrays["total"][1, 1] == pytest.approx(1.234e-101)
+        assert arrays["partial"].shape == (NSITES, NEDOS, 10)
+
+
+class TestEigenval:
+    """Tests for reading EIGENVAL."""
+
+    def test_bands_and_occupations(self, tmp_path):
+        path = tmp_path / "EIGENVAL"
+        ref = make_eigenval(path)
+
+        bands = extract_bands_vasp(eigenval_path=path)
+
+        assert (bands.nspin, bands.nkpts, bands.nbands) == (1, NKPTS, NBANDS)
+        np.testing.assert_allclose(bands.kpoints, ref["kpoints"], atol=1e-7)
+        np.testing.assert_allclose(bands.eigenvalues, ref["energies"][..., 0], atol=1e-7)
+        np.testing.assert_allclose(bands.occupations, ref["occupations"][..., 0])
+        steps = np.linalg.norm(np.diff(ref["kpoints"], axis=0), axis=1)
+        np.testing.assert_allclose(bands.kpoint_distances[1:], np.cumsum(steps), atol=1e-6)
+
+    def test_spin_polarized_without_occupations(self, tmp_path):
+        path = tmp_path / "EIGENVAL"
+        ref = make_eigenval(path, spin=True, occupations=False)
+
+        bands = extract_bands_vasp(eigenval_path=path)
+
+        assert bands.nspin == 2
+        assert bands.eigenvalues.shape == (NKPTS, NBANDS, 2)
+        np.testing.assert_allclose(bands.eigenvalues, ref["energies"], atol=1e-7)
+        assert bands.occupations is None
+
+
+class TestProcar:
+    """Tests for reading PROCAR."""
+
+    def test_projections(self, tmp_path):
+        path = tmp_path / "PROCAR"
+        ref = make_procar(path)
+
+        procar = read_procar(path)
+
+        assert procar.nspin == 1 and procar.nions == NIONS
+        assert procar.orbitals == LM
+        np.testing.assert_allclose(procar.kpoints, ref["kpoints"])
+        np.testing.assert_allclose(procar.eigenvalues, ref["energies"], atol=1e-7)
+        np.testing.assert_allclose(procar.projections, ref["projections"])
+
+    def test_spin_polarized(self, tmp_path):
+        path = tmp_path / "PROCAR"
+        ref = make_procar(path, nspin=2)
+
+        procar = read_procar(path)
+
+        assert procar.projections.shape == (2, NKPTS, NBANDS, NIONS, len(LM))
+        np.testing.assert_allclose(procar.projections[1], ref["projections"][1])
+
+    def test_phase_factors_are_rejected(self, tmp_path):
+        path = tmp_path / "PROCAR"
+        make_procar(path)
+        path.write_text("PROCAR lm decomposed + phase\n" + path.read_text().split("\n", 1)[1])
+
+        with pytest.raises(ValueError, match="phase"):
+            read_procar(path)
+
+
+class TestSidecarCache:
+    """Tests for the .npz sidecar cache."""
+
+    def test_second_read_does_not_parse(self, tmp_path, monkeypatch):
+        path = tmp_path / "DOSCAR"
+        make_doscar(path)
+        first = vasp_text.read_doscar(path)
+        assert sidecar_path(path).exists()
+
+        def fail(path):
+            raise AssertionError("parsed again")
+
+        monkeypatch.setattr(vasp_text, "_parse_doscar", fail)
+        second = vasp_text.read_doscar(path)
+
+        for name in first:
+            np.testing.assert_array_equal(first[name], second[name])
+
+    def test_changed_source_is_parsed_again(self, tmp_path):
+        path = tmp_path / "PROCAR"
+        make_procar(path)
+        assert read_procar(path).nspin == 1
+
+        make_procar(path, nspin=2)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert read_procar(path).nspin == 2
+
+    def test_sidecar_of_another_parser_is_ignored(self, tmp_path):
+        path = tmp_path / "data"
+        path.write_text("x")
+        cached_arrays(path, "first", lambda p: {"a": np.zeros(1)})
+
+        arrays = cached_arrays(path, "second", lambda p: {"b": np.ones(1)})
+
+        assert list(arrays) == ["b"]
+
+    def test_unwritable_sidecar_still_returns_arrays(self, tmp_path):
+        path = tmp_path / "EIGENVAL"
+        make_eigenval(path)
+        sidecar_path(path).mkdir()  # cannot be replaced by a file
+
+        bands = extract_bands_vasp(eigenval_path=path)
+
+        assert bands.nkpts == NKPTS
+        assert not list(tmp_path.glob("*.tmp"))
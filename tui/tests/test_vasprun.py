@@ -0,0 +1,229 @@
+"""
+Tests for the streaming vasprun.xml reader and the postprocessing
+extractors built on it.
+"""
+
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.postprocessing import (
+    extract_bands_vasp,
+    extract_dos_vasp,
+    extract_optics_vasp,
+    read_vasprun,
+)
+from src.postprocessing import vasprun as vasprun_module
+
+NSPIN, NKPTS, NBANDS, NEDOS, NIONS, NORB = 2, 3, 4, 5, 2, 9
+FERMI = 5.4321
+
+
+def _rows(array: np.ndarray, tag: str = "r") -> str:
+    return "\n".join(
+        f"<{tag}>" + " ".join(f"{x:12.6f}" for x in row) + f"</{tag}>" for row in array
+    )
+
+
+def make_vasprun(path: Path, tail: str = "</modeling>\n") -> dict:
+    """Write a small spin-polarized vasprun.xml and return the arrays in it."""
+    rng = np.random.default_rng(0)
+    kpoints = rng.random((NKPTS, 3))
+    eigen = rng.random((NSPIN, NKPTS, NBANDS, 2))
+    energy = np.linspace(-5, 5, NEDOS)
+    total = rng.random((NSPIN, NEDOS, 2))
+    partial = rng.random((NIONS, NSPIN, NEDOS, NORB))
+    eps_imag = rng.random((NEDOS, 6))
+    eps_real = rng.random((NEDOS, 6))
+
+    def spin_sets(blocks):
+        return "".join(f'<set comment="spin {s + 1}">{blocks(s)}</set>' for s in range(NSPIN))
+
+    eigen_xml = spin_sets(
+        lambda s: "".join(
+            f'<set comment="kpoint {k + 1}">{_rows(eigen[s, k])}</set>' for k in range(NKPTS)
+        )
+    )
+    total_xml = spin_sets(lambda s: _rows(np.column_stack([energy, total[s]])))
+    partial_xml = "".join(
+        f'<set comment="ion {i + 1}">'
+        + spin_sets(lambda s, i=i: _rows(np.column_stack([energy, partial[i, s]])))
+        + "</set>"
+        for i in range(NIONS)
+    )
+    fields = "".join(
+        f"<field>{name}</field>"
+        for name in ["energy", "s", "py", "pz", "px", "dxy", "dyz", "dz2", "dxz", "x2-y2"]
+    )
+    # Each ionic step of a relaxation writes a <calculation>; only the last has
+    # eigenvalues and DOS. A <projected> block repeats the eigenvalues.
+    path.write_text(f"""<?xml version="1.0" encoding="ISO-8859-1"?>
+<modeling>
+ <kpoints>
+  <varray name="kpointlist">{_rows(kpoints, "v")}</varray>
+  <varray name="weights"><v>0.3</v><v>0.3</v><v>0.4</v></varray>
+ </kpoints>
+ <calculation><energy><i name="e_fr_energy">-10.0</i></energy></calculation>
+ <calculation>
+  <eigenvalues><array><field>eigene</field><field>occ</field>
+   <set>{eigen_xml}</set></array></eigenvalues>
+  <dos>
+   <i name="efermi">{FERMI}</i>
+   <total><array><field>energy</field><field>total</field><field>integrated</field>
+    <set>{total_xml}</set></array></total>
+   <partial><array>{fields}<set>{partial_xml}</set></array></partial>
+  </dos>
+  <projected><eigenvalues><array><set>{spin_sets(lambda s: "<r>99 99</r>")}</set>
+   </array></eigenvalues></projected>
+  <dielectricfunction>
+   <imag><array><set>{_rows(np.column_stack([energy, eps_imag]))}</set></array></imag>
+   <real><array><set>{_rows(np.column_stack([energy, eps_real]))}</set></array></real>
+  </dielectricfunction>
+ </calculation>
+{tail}""")
+    return {
+        "kpoints": kpoints,
+        "eigen": eigen,
+        "energy": energy,
+        "total": total,
+        "partial": partial,
+        "eps_imag": eps_imag,
+        "eps_real": eps_real,
+    }
+
+
+@pytest.fixture
+def vasprun(tmp_path):
+    path = tmp_path / "vasprun.xml"
+    return path, make_vasprun(path)
+
+
+class TestReadVasprun:
+    """Tests for read_vasprun()."""
+
+    def test_reads_all_sections_in_one_pass(self, vasprun):
+        path, ref = vasprun
+
+        data = read_vasprun(path)
+
+        assert data.fermi_energy == pytest.approx(FERMI)
+        np.testing.assert_allclose(data.kpoints, ref["kpoints"], atol=1e-6)
+        assert data.eigenvalues.shape == (NSPIN, NKPTS, NBANDS, 2)
+        np.testing.assert_allclose(data.eigenvalues, ref["eigen"], atol=1e-6)
+        assert data.total_dos.shape == (NSPIN, NEDOS, 3)
+        assert data.partial_dos.shape == (NIONS, NSPIN, NEDOS, 1 + NORB)
+        np.testing.assert_allclose(data.partial_dos[..., 1:], ref["partial"], atol=1e-6)
+        assert data.partial_dos_fields[1:4] == ["s", "py", "pz"]
+        assert data.dielectric_imag.shape == (NEDOS, 7)
+
+    def test_unrequested_sections_are_skipped(self, vasprun):
+        path, _ = vasprun
+
+        data = read_vasprun(path, sections=("dos",), pdos=False)
+
+        assert data.total_dos is not None
+        assert data.partial_dos is None
+        assert data.eigenvalues is None and data.dielectric_imag is None
+        with pytest.raises(ValueError, match="bands"):
+            extract_bands_vasp(vasprun=data)
+
+    def test_stops_once_requested_sections_are_read(self, vasprun, monkeypatch):
+        path, _ = vasprun
+        seen = []
+        iterparse = vasprun_module.ET.iterparse
+
+        def recording_iterparse(*args, **kwargs):
+            for event, elem in iterparse(*args, **kwargs):
+                seen.append(elem.tag)
+                yield event, elem
+
+        monkeypatch.setattr(vasprun_module.ET, "iterparse", recording_iterparse)
+        data = read_vasprun(path, sections=("dos", "bands"))
+
+        assert data.eigenvalues is not None and data.total_dos is not None
+        assert "projected" not in seen
+        assert "dielectricfunction" not in seen
+
+    def test_truncated_file_keeps_complete_sections(self, tmp_path):
+        path = tmp_path / "vasprun.xml"
+        make_vasprun(path, tail="<calculation><eigenvalues><array><set><r>1 2")
+
+        data = read_vasprun(path)
+
+        assert data.eigenvalues.shape == (NSPIN, NKPTS, NBANDS, 2)
+        assert data.dielectric_real is not None
+
+    def test_truncated_file_without_requested_data_raises(self, tmp_path):
+        path = tmp_path / "vasprun.xml"
+        path.write_text("<modeling><calculation><eigenvalues><array><set><r>1 2")
+
+        with pytest.raises(ET.ParseError):
+            read_vasprun(path, sections=("bands",))
+
+    def test_overflowed_values_become_nan(self, tmp_path):
+        path = tmp_path / "vasprun.xml"
+        path.write_text(
+            "<modeling><calculation><dos><i name='efermi'>1.0</i><total><array><set>"
+            "<set><r>-1.0 0.5 0.1</r><r>0.0 ******** 0.2</r></set>"
+            "</set></array></total></dos></calculation></modeling>"
+        )
+
+        data = read_vasprun(path, sections=("dos",))
+
+        assert np.isnan(data.total_dos[0, 1, 1])
+        assert data.total_dos[0, 1, 2] == pytest.approx(0.2)
+
+    def test_unknown_section(self, vasprun):
+        with pytest.raises(ValueError, match="phonons"):
+            read_vasprun(vasprun[0], sections=("phonons",))
+
+
+class TestExtractors:
+    """Tests for the DOS, band and optics extractors on vasprun.xml."""
+
+    def test_dos_and_bands_from_one_read(self, vasprun):
+        path, ref = vasprun
+        data = read_vasprun(path, sections=("dos", "bands"))
+
+        dos, pdos = extract_dos_vasp(vasprun=data)
+        bands = extract_bands_vasp(vasprun=data)
+
+        np.testing.assert_allclose(dos.energy, ref["energy"], atol=1e-6)
+        assert dos.is_spin_polarized
+        np.testing.assert_allclose(dos.spin_up, ref["total"][0, :, 0], atol=1e-6)
+        np.testing.assert_allclose(dos.total_dos, ref["total"][:, :, 0].sum(axis=0), atol=1e-5)
+        assert sorted(pdos.atom_projections) == list(range(NIONS))
+        np.testing.assert_allclose(
+            pdos.atom_projections[1]["pz"], ref["partial"][1, :, :, 2].sum(axis=0), atol=1e-5
+        )
+
+        assert (bands.nspin, bands.nkpts, bands.nbands) == (NSPIN, NKPTS, NBANDS)
+        assert bands.fermi_energy == pytest.approx(FERMI)
+        np.testing.assert_allclose(
+            bands.eigenvalues, np.transpose(ref["eigen"][..., 0], (1, 2, 0)), atol=1e-6
+        )
+
+    def test_extractors_read_vasprun_from_work_dir(self, vasprun):
+        path, ref = vasprun
+
+        dos, _ = extract_dos_vasp(work_dir=path.parent)
+        bands = extract_bands_vasp(work_dir=path.parent)
+
+        assert dos.nedos == NEDOS and dos.fermi_energy == pytest.approx(FERMI)
+        assert bands.kpoints.shape == (NKPTS, 3)
+
+    def test_optics_real_and_imaginary_parts(self, vasprun):
+        path, ref = vasprun
+
+        optics = extract_optics_vasp(vasprun_path=path)
+
+        eps = optics.dielectric
+        np.testing.assert_allclose(eps.eps_imag, ref["eps_imag"][:, :3].mean(axis=1), atol=1e-6)
+        np.testing.assert_allclose(eps.eps_real, ref["eps_real"][:, :3].mean(axis=1), atol=1e-6)
+        np.testing.assert_allclose(eps.eps_xx.real, ref["eps_real"][:, 0], atol=1e-6)
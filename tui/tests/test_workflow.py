@@ -663,6 +663,100 @@ class TestWorkflowExecution:
         assert "aggregated_value" in agg.result_data
         assert agg.result_data["count"] == 2
 
+    @pytest.mark.asyncio
+    async def test_execute_refills_slots_as_nodes_finish(self, monkeypatch):
+        """Test a slow node does not hold back nodes that become ready meanwhile."""
+        wf = create_test_workflow()
+        wf.add_node("slow", {}, node_id="slow")
+        wf.add_node("fast", {}, node_id="fast")
+        wf.add_node("next", {}, node_id="next")
+        wf.add_dependency("fast", "next")
+        wf.add_dependency("slow", "next")
+        wf.add_node("after_fast", {}, node_id="after_fast")
+        wf.add_dependency("fast", "after_fast")
+        finished = []
+
+        async def run(node, resolved_params):
+            await asyncio.sleep(0.2 if node.node_id == "slow" else 0)
+            finished.append(node.node_id)
+
+        monkeypatch.setattr(wf, "_execute_calculation_node_stub", run)
+
+        await wf.execute(max_parallel=2)
+
+        assert wf.status == WorkflowStatus.COMPLETED
+        assert finished.index("after_fast") < finished.index("slow")
+        assert finished[-1] == "next"
+
+    @pytest.mark.asyncio
+    async def test_execute_critical_path_first(self, monkeypatch):
+        """Test critical_path starts the longest chain before independent nodes."""
+        wf = create_test_workflow()
+        for node_id in ["leaf", "chain1", "chain2", "chain3", "chain4"]:
+            wf.add_node("opt", {}, node_id=node_id)
+        wf.add_dependency("chain1", "chain2")
+        wf.add_dependency("chain2", "chain3")
+        wf.add_dependency("chain3", "chain4")
+        wf.add_dependency("leaf", "chain4")
+        started = []
+
+        async def run(node, resolved_params):
+            started.append(node.node_id)
+
+        monkeypatch.setattr(wf, "_execute_calculation_node_stub", run)
+
+        await wf.execute(max_parallel=1, critical_path=True)
+
+        # Declaration order would start with "leaf"
+        assert started == ["chain1", "chain2", "leaf", "chain3", "chain4"]
+
+    @pytest.mark.asyncio
+    async def test_execute_retries_failed_node(self, monkeypatch):
+        """Test a failing node with retries left is run again."""
+        wf = create_test_workflow()
+        wf.add_node("a", {}, node_id="a", max_retries=1)
+        wf.add_node("b", {}, node_id="b")
+        wf.add_dependency("a", "b")
+        attempts = []
+
+        async def run(node, resolved_params):
+            attempts.append(node.node_id)
+            if attempts == ["a"]:
+                raise RuntimeError("transient")
+
+        monkeypatch.setattr(wf, "_execute_calculation_node_stub", run)
+
+        await wf.execute()
+
+        assert attempts == ["a", "a", "b"]
+        assert wf.status == WorkflowStatus.COMPLETED
+        assert wf.nodes["a"].retry_count == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_failure_skips_dependents(self, monkeypatch):
+        """Test a failed node skips its dependents and independent nodes still run."""
+        wf = create_test_workflow()
+        wf.add_node("a", {}, node_id="a")
+        wf.add_node("b", {}, node_id="b")
+        wf.add_node("c", {}, node_id="c")
+        wf.add_node("d", {}, node_id="d")
+        wf.add_dependency("a", "b")
+        wf.add_dependency("b", "c")
+        wf.add_dependency("a", "d")
+
+        async def run(node, resolved_params):
+            if node.node_id == "b":
+                raise RuntimeError("boom")
+
+        monkeypatch.setattr(wf, "_execute_calculation_node_stub", run)
+
+        await wf.execute()
+
+        assert wf.nodes["b"].status == NodeStatus.FAILED
+        assert wf.nodes["c"].status == NodeStatus.SKIPPED
+        assert wf.nodes["d"].status == NodeStatus.COMPLETED
+        assert wf.status == WorkflowStatus.PARTIAL
+
 
 class TestWorkflowSerialization:
     """Test workflow serialization and deserialization."""